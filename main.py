@@ -1,34 +1,21 @@
+import importlib
 import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from src.database.connection import initialize_firebase
-from src.api.auth.routes import auth_router
-from src.api.categories.routes import categories_router
-from src.api.ecommerce_categories.routes import ecommerce_categories_router
-from src.api.inventory.routes import inventory_router
-from src.api.orders.routes import orders_router
-from src.api.pricing.routes import pricing_router
-from src.api.products.routes import products_router
-from src.api.promotions.routes import promotions_router
-from src.api.search.routes import search_router
-from src.api.search.service import SearchService
-from src.api.stores.routes import stores_router
-from src.api.tags.routes import tags_router
-from src.api.riders.routes import riders_router
-from src.api.tiers.routes import router as tiers_router
-from src.api.users.routes import users_router
-from src.api.payments.routes import payments_router
+from src.config.settings import settings
+from src.middleware.edge import EdgeMiddleware
 from src.middleware.error import http_exception_handler
-from src.middleware.rate_limit import limiter
-from src.middleware.security import TrustedSourceMiddleware
-from src.middleware.timing import add_process_time_header
+from src.middleware.rate_limit import rate_limiter
+from src.shared.background_tasks import spawn
+from src.shared.cache_warmup import cache_warmup
 from src.shared.utils import get_logger
 from fastapi.openapi.utils import get_openapi
-from slowapi import _rate_limit_exceeded_handler
-from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
 
-initialize_firebase()
+# Eager mode keeps Firebase ready for anything that imports main; lazy mode
+# leaves it to the lifespan
+if not settings.LAZY_STARTUP:
+    initialize_firebase()
 
 logger = get_logger(__name__)
 
@@ -39,7 +26,46 @@ async def lifespan(app: FastAPI):
     Application lifespan events.
     """
     logger.info("Starting application...")
+    if settings.LAZY_STARTUP:
+        initialize_firebase()
+    hold_sweeper = None
+    if settings.INVENTORY_HOLD_SWEEPER_ENABLED:
+        from src.api.inventory.services import hold_sweeper
+
+        hold_sweeper.start()
+    popularity_rollup = None
+    if settings.POPULARITY_ROLLUP_ENABLED:
+        from src.api.products.services.popularity_rollup import popularity_rollup
+
+        popularity_rollup.start()
+    catalog_change_listener = None
+    if settings.CATALOG_CHANGE_LISTENER_ENABLED:
+        from src.integrations.odoo.catalog_changes import catalog_change_listener
+
+        catalog_change_listener.start()
+    rate_limiter.start()
+    warmup = None
+    if settings.CACHE_WARMUP_ENABLED:
+        # Serve right away; requests that beat a loader fill the cache themselves
+        warmup = spawn(
+            "cache_warmup",
+            cache_warmup.run(
+                settings.CACHE_WARMUP_TIMEOUT_SECONDS,
+                snapshot_path=settings.CACHE_SNAPSHOT_PATH or None,
+            ),
+        )
     yield
+    if warmup is not None:
+        warmup.cancel()
+    if settings.CACHE_SNAPSHOT_PATH:
+        await cache_warmup.save_snapshot(settings.CACHE_SNAPSHOT_PATH)
+    await rate_limiter.stop()
+    if hold_sweeper is not None:
+        await hold_sweeper.stop()
+    if popularity_rollup is not None:
+        await popularity_rollup.stop()
+    if catalog_change_listener is not None:
+        await catalog_change_listener.stop()
     logger.info("Application shutdown")
 
 
@@ -50,31 +76,41 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-# Register SlowAPI Limiter
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)  # type: ignore
-app.add_middleware(SlowAPIMiddleware)
-
-# Register Security Middleware
-app.add_middleware(TrustedSourceMiddleware)
-
-app.include_router(auth_router)
-app.include_router(users_router)
-app.include_router(categories_router)
-app.include_router(ecommerce_categories_router)
-# IMPORTANT: Register search_router BEFORE products_router
-# to prevent /products/{id} from catching /products/search
-app.include_router(search_router)
-app.include_router(products_router)
-app.include_router(promotions_router)
-app.include_router(orders_router)
-app.include_router(inventory_router)
-app.include_router(stores_router)
-app.include_router(pricing_router)
-app.include_router(tiers_router)
-app.include_router(tags_router)
-app.include_router(riders_router)
-app.include_router(payments_router)
+# Trusted-source check, rate limiting and timing header in one layer
+app.add_middleware(EdgeMiddleware)
+
+# (name, module, router attribute) in mount order. Routers named in
+# DISABLED_ROUTERS are never imported, so their services are never built.
+# IMPORTANT: search is mounted BEFORE products to prevent /products/{id}
+# from catching /products/search
+ROUTERS = [
+    ("auth", "src.api.auth.routes", "auth_router"),
+    ("users", "src.api.users.routes", "users_router"),
+    ("categories", "src.api.categories.routes", "categories_router"),
+    (
+        "ecommerce_categories",
+        "src.api.ecommerce_categories.routes",
+        "ecommerce_categories_router",
+    ),
+    ("search", "src.api.search.routes", "search_router"),
+    ("products", "src.api.products.routes", "products_router"),
+    ("promotions", "src.api.promotions.routes", "promotions_router"),
+    ("orders", "src.api.orders.routes", "orders_router"),
+    ("inventory", "src.api.inventory.routes", "inventory_router"),
+    ("stores", "src.api.stores.routes", "stores_router"),
+    ("pricing", "src.api.pricing.routes", "pricing_router"),
+    ("tiers", "src.api.tiers.routes", "router"),
+    ("tags", "src.api.tags.routes", "tags_router"),
+    ("riders", "src.api.riders.routes", "riders_router"),
+    ("payments", "src.api.payments.routes", "payments_router"),
+    ("metrics", "src.api.metrics.routes", "metrics_router"),
+]
+
+for name, module, attribute in ROUTERS:
+    if name in settings.DISABLED_ROUTERS:
+        logger.info(f"Router disabled: {name}")
+        continue
+    app.include_router(getattr(importlib.import_module(module), attribute))
 
 # Include dev router only in development environment
 if os.getenv("ENVIRONMENT") == "development":
@@ -110,9 +146,6 @@ def custom_openapi():
 app.openapi = custom_openapi
 
 
-app.middleware("http")(add_process_time_header)
-
-
 @app.get("/", tags=["App"])
 async def read_root():
     return "Hello World!"
@@ -0,0 +1,11 @@
+-- Migration: Add Odoo pull-sync watermarks
+-- Description: Keyset position (write_date, id) of the last Odoo record applied
+--              by the incremental product / stock pull sync, one row per Odoo model
+
+CREATE TABLE IF NOT EXISTS odoo_sync_watermarks (
+    odoo_model VARCHAR(100) PRIMARY KEY,
+    last_write_date TIMESTAMP WITH TIME ZONE,
+    last_odoo_id INTEGER NOT NULL DEFAULT 0,
+    records_synced INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
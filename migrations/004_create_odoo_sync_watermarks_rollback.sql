@@ -0,0 +1,4 @@
+-- Rollback: Remove Odoo pull-sync watermarks
+-- Running the next pull sync after this rollback performs a full re-import
+
+DROP TABLE IF EXISTS odoo_sync_watermarks;
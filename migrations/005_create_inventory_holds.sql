@@ -0,0 +1,22 @@
+-- Migration: Add inventory hold records
+-- Description: Per-order stock holds with an expiry, so holds left behind by
+--              abandoned checkouts can be released by the hold sweeper
+
+CREATE TABLE IF NOT EXISTS inventory_holds (
+    id SERIAL PRIMARY KEY,
+    order_id INTEGER NOT NULL REFERENCES orders(id) ON DELETE CASCADE,
+    product_id INTEGER NOT NULL,
+    store_id INTEGER NOT NULL,
+    quantity INTEGER NOT NULL,
+    expires_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    released_at TIMESTAMP WITH TIME ZONE,
+    release_reason VARCHAR(20),
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_inventory_holds_order
+    ON inventory_holds (order_id);
+
+CREATE INDEX IF NOT EXISTS idx_inventory_holds_active_expiry
+    ON inventory_holds (expires_at)
+    WHERE released_at IS NULL;
@@ -0,0 +1,5 @@
+-- Rollback: Remove inventory hold records
+-- Stock still on hold stays in inventory.quantity_on_hold; it is then only
+-- released when the owning order is cancelled
+
+DROP TABLE IF EXISTS inventory_holds;
@@ -0,0 +1,15 @@
+-- Migration: Incremental search suggestion aggregation
+-- Description: Watermarks for incremental aggregation jobs (last source row
+--              id applied, one row per job) and the time-decayed search
+--              weight behind search_suggestions.is_trending
+
+CREATE TABLE IF NOT EXISTS aggregation_watermarks (
+    job VARCHAR(100) PRIMARY KEY,
+    last_id BIGINT NOT NULL DEFAULT 0,
+    rows_processed BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+-- Searches decayed to last_searched; see src/api/search/suggestions.py
+ALTER TABLE search_suggestions
+    ADD COLUMN IF NOT EXISTS trending_score DOUBLE PRECISION NOT NULL DEFAULT 0;
@@ -0,0 +1,7 @@
+-- Rollback: Remove incremental search suggestion aggregation
+-- Existing suggestion counts are kept; the next aggregation run after
+-- re-applying the migration starts again from the first search interaction
+
+ALTER TABLE search_suggestions DROP COLUMN IF EXISTS trending_score;
+
+DROP TABLE IF EXISTS aggregation_watermarks;
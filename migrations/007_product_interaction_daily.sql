@@ -0,0 +1,24 @@
+-- Migration: Daily product interaction rollup
+-- Description: Per product, interaction type and UTC day interaction counts
+--              and weighted scores, maintained incrementally from
+--              product_interactions. Backs time-windowed popularity
+--              rankings, optionally filtered by category.
+
+CREATE TABLE IF NOT EXISTS product_interaction_daily (
+    product_id INTEGER NOT NULL REFERENCES products(id) ON DELETE CASCADE,
+    interaction_type VARCHAR(50) NOT NULL,
+    day DATE NOT NULL,
+    interaction_count INTEGER NOT NULL DEFAULT 0,
+    weighted_score DOUBLE PRECISION NOT NULL DEFAULT 0,
+    last_interaction TIMESTAMP WITH TIME ZONE NOT NULL,
+    PRIMARY KEY (product_id, interaction_type, day)
+);
+
+-- Covers windowed rankings without touching the table
+CREATE INDEX IF NOT EXISTS idx_product_interaction_daily_day
+    ON product_interaction_daily (day, product_id)
+    INCLUDE (interaction_type, interaction_count, weighted_score, last_interaction);
+
+-- The rollup job reads product_interactions in id order from its watermark
+-- in aggregation_watermarks (created by 006); run it with --rebuild once to
+-- fold in existing interactions
@@ -0,0 +1,7 @@
+-- Rollback: Remove the daily product interaction rollup
+-- The rollup's watermark is removed too, so re-applying the migration starts
+-- again from the first product interaction
+
+DELETE FROM aggregation_watermarks WHERE job = 'product_interaction_daily';
+
+DROP TABLE IF EXISTS product_interaction_daily;
@@ -0,0 +1,15 @@
+-- Migration: Add the catalog change feed
+-- Description: Products changed by the Odoo catalog sync job, which runs
+--              outside the API servers. Each server polls the rows after the
+--              last id it has seen and invalidates its own caches for them.
+
+CREATE TABLE IF NOT EXISTS catalog_changes (
+    id BIGSERIAL PRIMARY KEY,
+    product_id INTEGER NOT NULL,
+    price_changed BOOLEAN NOT NULL DEFAULT FALSE,
+    changed_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+-- The sync prunes rows older than a day
+CREATE INDEX IF NOT EXISTS idx_catalog_changes_changed_at
+    ON catalog_changes (changed_at);
@@ -0,0 +1,4 @@
+-- Rollback: Remove the catalog change feed
+-- API servers then only see Odoo catalog changes once their cache entries expire
+
+DROP TABLE IF EXISTS catalog_changes;
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Script to fold new search interactions into search suggestions.
+
+Only search_interactions rows inserted since the previous run are read
+(tracked in the aggregation_watermarks table). They are aggregated per
+normalized query and upserted in batches, then the trending flags are
+refreshed. Intended to run periodically (e.g. every 15 minutes) as a Cloud
+Run job.
+
+Usage:
+    # Incremental run
+    python scripts/db/aggregate_search_suggestions.py
+
+    # Drop existing suggestions and rebuild them from every interaction
+    python scripts/db/aggregate_search_suggestions.py --rebuild
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# Add the project root to the Python path
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from src.database.connection import engine
+
+# Import all database models to ensure SQLAlchemy relationships are properly registered
+import src.database.models  # noqa: F401
+
+from src.api.search.suggestions import SearchSuggestionAggregator
+from src.config.constants import SEARCH_SUGGESTION_BATCH_SIZE
+
+
+async def main(rebuild: bool, batch_size: int):
+    """
+    Main function to run the search suggestion aggregation.
+
+    Args:
+        rebuild: Clear suggestions and the watermark before aggregating.
+        batch_size: search_interactions rows per batch.
+    """
+    print("=" * 80)
+    print(
+        "SEARCH SUGGESTION AGGREGATION"
+        + (" (REBUILD)" if rebuild else " (INCREMENTAL)")
+    )
+    print("=" * 80)
+    print()
+
+    aggregator = SearchSuggestionAggregator(batch_size=batch_size)
+    start = time.perf_counter()
+
+    try:
+        if rebuild:
+            await aggregator.reset()
+            print("🗑  Cleared search suggestions and watermark")
+
+        result = await aggregator.run()
+        print(f"    Batches:               {result.batches}")
+        print(f"    Interactions read:     {result.interactions}")
+        print(f"    Queries upserted:      {result.queries_upserted}")
+        print(f"    Trending flags changed: {result.trending_changed}")
+        print(f"    Watermark:             {result.last_id}")
+        print()
+        print(f"⏱  Completed in {time.perf_counter() - start:.1f}s")
+
+    except Exception as e:
+        print(f"❌ An unexpected error occurred: {e}")
+        import traceback
+
+        traceback.print_exc()
+        sys.exit(1)
+
+    finally:
+        # Properly dispose of the engine to close all connections
+        await engine.dispose()
+
+    print("=" * 80)
+    print("SEARCH SUGGESTION AGGREGATION COMPLETE")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Incrementally aggregate search interactions into suggestions."
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Clear suggestions and re-read every interaction.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=SEARCH_SUGGESTION_BATCH_SIZE,
+        help=f"Interactions per batch (default {SEARCH_SUGGESTION_BATCH_SIZE}).",
+    )
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(main(args.rebuild, args.batch_size))
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Search suggestion aggregation interrupted by user")
+        sys.exit(1)
@@ -42,9 +42,14 @@ from src.database.models.favorite import Favorite
 from src.database.models.user_preference import UserPreference
 from src.database.models.product_interaction import ProductInteraction
 from src.database.models.product_popularity import ProductPopularity
+from src.database.models.product_interaction_daily import ProductInteractionDaily
 from src.database.models.product_vector import ProductVector
 from src.database.models.search_interaction import SearchInteraction
 from src.database.models.search_suggestion import SearchSuggestion
+from src.database.models.odoo_sync_watermark import OdooSyncWatermark
+from src.database.models.aggregation_watermark import AggregationWatermark
+from src.database.models.catalog_change import CatalogChange
+from src.database.models.inventory_hold import InventoryHold
 
 # Avoid unused import issues
 _ = (
@@ -78,9 +83,14 @@ _ = (
     UserPreference,
     ProductInteraction,
     ProductPopularity,
+    ProductInteractionDaily,
     ProductVector,
     SearchInteraction,
     SearchSuggestion,
+    OdooSyncWatermark,
+    AggregationWatermark,
+    CatalogChange,
+    InventoryHold,
 )
 
 
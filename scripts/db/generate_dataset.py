@@ -0,0 +1,899 @@
+#!/usr/bin/env python3
+"""
+Deterministic bulk data generator for benchmarks and EXPLAIN checks.
+
+Fills an existing schema (see db_init.py) with catalog, store, pricing,
+interaction and order data at production-like volumes, loaded with COPY.
+Every table is generated from its own random stream seeded by ``--seed``, so
+the same seed, scale and anchor date always give the same rows, and loading
+a subset of tables does not change the others.
+
+Volumes at ``--scale 1`` (multiply by the scale factor):
+
+    products                1,000 (categories and 1-4 tags each)
+    stores                  20 x sqrt(scale)  ->  20 / 63 / 200
+    inventory               ~90% of products x stores (18M rows at 100x)
+    users / addresses       2,000
+    product_interactions    20,000 (skewed towards popular products)
+    search_interactions     10,000
+    orders (+ carts)        2,000, 1-6 items each, over the last year
+
+Categories (20 x 10), 20 tiers and 60 overlapping price lists do not scale.
+Tag 1 is the next-day-delivery-only tag, as in src/config/constants.py.
+
+The target tables are truncated first (``TRUNCATE ... CASCADE``), which also
+empties tables referencing them (cart items, holds, favorites, ...). It
+refuses to run with ENVIRONMENT=production.
+
+Usage:
+    python scripts/db/generate_dataset.py --scale 1
+    python scripts/db/generate_dataset.py --scale 100 --seed 7 --anchor 2025-01-01
+    python scripts/db/generate_dataset.py --scale 10 --tables search_interactions
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Callable, Iterator, List, Sequence, Tuple
+
+# Add the project root to the Python path
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from src.config.settings import settings
+from src.database.connection import engine
+
+BASE_VOLUMES = {
+    "products": 1_000,
+    "users": 2_000,
+    "product_interactions": 20_000,
+    "search_interactions": 10_000,
+    "orders": 2_000,
+}
+BASE_STORES = 20
+INVENTORY_COVERAGE = 0.9
+PARENT_CATEGORIES = 20
+SUBCATEGORIES_PER_PARENT = 10
+ECOMMERCE_PARENTS = 15
+ECOMMERCE_CHILDREN = 5
+TAG_COUNT = 200
+TIER_COUNT = 20
+PRICE_LIST_COUNT = 60
+NEXT_DAY_TAG_ID = 1
+
+# (city, latitude, longitude); stores and addresses are scattered around them
+CITIES = [
+    ("Colombo", 6.9271, 79.8612),
+    ("Dehiwala", 6.8511, 79.8659),
+    ("Negombo", 7.2083, 79.8358),
+    ("Kandy", 7.2906, 80.6337),
+    ("Galle", 6.0535, 80.2210),
+    ("Kurunegala", 7.4863, 80.3647),
+    ("Jaffna", 9.6615, 80.0255),
+    ("Matara", 5.9549, 80.5550),
+    ("Anuradhapura", 8.3114, 80.4037),
+    ("Batticaloa", 7.7310, 81.6747),
+]
+BRANDS = [
+    "Anchor",
+    "Maliban",
+    "Munchee",
+    "Elephant House",
+    "Keells",
+    "Highland",
+    "Prima",
+    "Kotmale",
+    "Harischandra",
+    "Dilmah",
+    "MD",
+    "Raigam",
+    "Wijaya",
+    "Ambewela",
+    "Pelwatte",
+    "Bairaha",
+    "Crysbro",
+    "Edinborough",
+    "Sunquick",
+]
+ADJECTIVES = [
+    "Fresh",
+    "Organic",
+    "Classic",
+    "Premium",
+    "Spicy",
+    "Sweet",
+    "Crispy",
+    "Creamy",
+    "Roasted",
+    "Salted",
+    "Natural",
+    "Golden",
+    "Family",
+    "Lite",
+]
+NOUNS = [
+    "Milk",
+    "Bread",
+    "Rice",
+    "Biscuits",
+    "Tea",
+    "Coffee",
+    "Butter",
+    "Cheese",
+    "Yoghurt",
+    "Chicken",
+    "Sausages",
+    "Noodles",
+    "Flour",
+    "Sugar",
+    "Dhal",
+    "Coconut Oil",
+    "Soap",
+    "Shampoo",
+    "Detergent",
+    "Juice",
+    "Jam",
+    "Chocolate",
+    "Ice Cream",
+    "Eggs",
+    "Curry Powder",
+    "Chilli Powder",
+    "Sardines",
+    "Papadam",
+]
+UNITS = [
+    ("g", (100, 250, 400, 500)),
+    ("kg", (1, 2, 5)),
+    ("l", (1, 2)),
+    ("pcs", (6, 10, 12)),
+]
+INTERACTIONS = [
+    ("view", 2.0, 70),
+    ("search_click", 1.0, 15),
+    ("cart_add", 5.0, 10),
+    ("wishlist_add", 3.0, 3),
+    ("order", 10.0, 2),
+]
+ORDER_STATUSES = [
+    ("delivered", 80),
+    ("cancelled", 6),
+    ("confirmed", 4),
+    ("processing", 3),
+    ("packed", 2),
+    ("shipped", 3),
+    ("pending", 2),
+]
+
+
+@dataclass(frozen=True)
+class Volumes:
+    products: int
+    stores: int
+    users: int
+    product_interactions: int
+    search_interactions: int
+    orders: int
+
+    @classmethod
+    def for_scale(cls, scale: float) -> "Volumes":
+        return cls(
+            **{
+                name: max(1, int(count * scale)) for name, count in BASE_VOLUMES.items()
+            },
+            stores=max(1, round(BASE_STORES * math.sqrt(scale))),
+        )
+
+
+@dataclass
+class Product:
+    base_price: Decimal
+    category_id: int
+    brand: str
+    name: str
+
+
+class Dataset:
+    """Row generators for one seed, scale and anchor date"""
+
+    def __init__(self, seed: int, scale: float, anchor: datetime):
+        self.seed = seed
+        self.volumes = Volumes.for_scale(scale)
+        self.anchor = anchor
+        self.leaf_categories = [
+            PARENT_CATEGORIES + index + 1
+            for index in range(PARENT_CATEGORIES * SUBCATEGORIES_PER_PARENT)
+        ]
+        self.products = self._catalog()
+        # Popularity rank -> product id; low ranks are drawn far more often
+        self.by_popularity = list(range(1, self.volumes.products + 1))
+        self.rng("popularity").shuffle(self.by_popularity)
+
+    def rng(self, stream: str) -> random.Random:
+        return random.Random(f"{self.seed}:{stream}")
+
+    def ago(self, rng: random.Random, days: float) -> datetime:
+        """A timestamp within ``days`` before the anchor, denser towards it."""
+        return self.anchor - timedelta(seconds=days * 86400 * rng.random() ** 1.5)
+
+    def popular_product(self, rng: random.Random) -> int:
+        return self.by_popularity[int(len(self.by_popularity) * rng.random() ** 3)]
+
+    def user_id(self, index: int) -> str:
+        return f"gen-user-{index:07d}"
+
+    def active_user(self, rng: random.Random) -> int:
+        return 1 + int(self.volumes.users * rng.random() ** 2)
+
+    def _catalog(self) -> List[Product]:
+        rng = self.rng("catalog")
+        products = []
+        for _ in range(self.volumes.products):
+            unit, sizes = rng.choice(UNITS)
+            brand = rng.choice(BRANDS)
+            name = (
+                f"{brand} {rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} "
+                f"{rng.choice(sizes)}{unit}"
+            )
+            price = Decimal(int(rng.lognormvariate(6, 0.9)) + 20)
+            category_id = rng.choice(self.leaf_categories)
+            products.append(Product(price, category_id, brand, name))
+        return products
+
+    # Catalog
+
+    def categories(self) -> Iterator[tuple]:
+        rng = self.rng("categories")
+        for parent in range(1, PARENT_CATEGORIES + 1):
+            yield (parent, f"Category {parent}", None, parent, None)
+        for leaf in self.leaf_categories:
+            parent = (leaf - PARENT_CATEGORIES - 1) // SUBCATEGORIES_PER_PARENT + 1
+            yield (leaf, f"{rng.choice(NOUNS)} {leaf}", None, leaf, parent)
+
+    def ecommerce_categories(self) -> Iterator[tuple]:
+        for parent in range(1, ECOMMERCE_PARENTS + 1):
+            yield (parent, f"Aisle {parent}", None)
+        child_id = ECOMMERCE_PARENTS
+        for parent in range(1, ECOMMERCE_PARENTS + 1):
+            for _ in range(ECOMMERCE_CHILDREN):
+                child_id += 1
+                yield (child_id, f"Aisle {parent}.{child_id}", parent)
+
+    def tags(self) -> Iterator[tuple]:
+        yield (
+            NEXT_DAY_TAG_ID,
+            "product_delivery",
+            "Next Day Delivery Only",
+            "next-day-delivery-only",
+            True,
+        )
+        kinds = ("product_dietary", "product_origin", "product_promo", "product_brand")
+        for tag_id in range(2, TAG_COUNT + 1):
+            kind = kinds[tag_id % len(kinds)]
+            yield (tag_id, kind, f"Tag {tag_id}", f"tag-{tag_id}-{kind}", True)
+
+    def products_rows(self) -> Iterator[tuple]:
+        rng = self.rng("products")
+        count = self.volumes.products
+        for product_id, product in enumerate(self.products, start=1):
+            created = self.ago(rng, 730)
+            parent = rng.randint(1, ECOMMERCE_PARENTS)
+            child = ECOMMERCE_PARENTS + (parent - 1) * ECOMMERCE_CHILDREN
+            yield (
+                product_id,
+                f"GEN-{product_id:07d}",
+                product.name,
+                f"{product.name}. Generated product {product_id}.",
+                product.brand,
+                product.base_price,
+                product.name.rsplit(" ", 1)[1].lstrip("0123456789"),
+                [f"https://cdn.example.com/products/{product_id}.jpg"],
+                parent,
+                child + rng.randint(1, ECOMMERCE_CHILDREN),
+                [rng.randint(1, count) for _ in range(rng.randint(0, 3))],
+                created,
+                created + timedelta(days=rng.randint(0, 60)),
+            )
+
+    def product_categories(self) -> Iterator[tuple]:
+        rng = self.rng("product_categories")
+        for product_id, product in enumerate(self.products, start=1):
+            yield (product_id, product.category_id)
+            if rng.random() < 0.25:
+                extra = rng.choice(self.leaf_categories)
+                if extra != product.category_id:
+                    yield (product_id, extra)
+
+    def product_tags(self) -> Iterator[tuple]:
+        rng = self.rng("product_tags")
+        for product_id in range(1, self.volumes.products + 1):
+            tag_ids = set(rng.sample(range(2, TAG_COUNT + 1), rng.randint(1, 4)))
+            if rng.random() < 0.02:
+                tag_ids.add(NEXT_DAY_TAG_ID)
+            for tag_id in sorted(tag_ids):
+                yield (product_id, tag_id, None, "generator")
+
+    # Stores and stock
+
+    def stores(self) -> Iterator[tuple]:
+        rng = self.rng("stores")
+        for store_id in range(1, self.volumes.stores + 1):
+            city, lat, lng = CITIES[(store_id - 1) % len(CITIES)]
+            yield (
+                store_id,
+                f"{city} Store {store_id}",
+                f"{store_id} Main Street, {city}",
+                round(lat + rng.gauss(0, 0.05), 6),
+                round(lng + rng.gauss(0, 0.05), 6),
+                f"store{store_id}@example.com",
+                f"+9411{store_id:07d}",
+                rng.random() > 0.03,
+                store_id,
+            )
+
+    def inventory(self) -> Iterator[tuple]:
+        rng = self.rng("inventory")
+        row_id = 0
+        for product_id in range(1, self.volumes.products + 1):
+            for store_id in range(1, self.volumes.stores + 1):
+                if rng.random() >= INVENTORY_COVERAGE:
+                    continue
+                row_id += 1
+                # About one in eight rows is out of stock
+                available = 0 if rng.random() < 0.125 else int(rng.expovariate(1 / 60))
+                yield (row_id, product_id, store_id, available, 0, 0, rng.randint(0, 5))
+
+    # Tiers and pricing
+
+    def tiers(self) -> Iterator[tuple]:
+        for tier_id in range(1, TIER_COUNT + 1):
+            spent = Decimal(5000 * (tier_id - 1) ** 2)
+            yield (
+                tier_id,
+                f"Tier {tier_id:02d}",
+                tier_id,
+                True,
+                spent,
+                (tier_id - 1) * 3,
+                Decimal(0),
+                0,
+            )
+
+    def price_lists(self) -> Iterator[tuple]:
+        rng = self.rng("price_lists")
+        for list_id in range(1, PRICE_LIST_COUNT + 1):
+            valid_from = self.anchor - timedelta(days=rng.randint(1, 365))
+            # A few lists have expired and a few only start in the future
+            roll = rng.random()
+            if roll < 0.1:
+                valid_until = self.anchor - timedelta(days=rng.randint(1, 30))
+            elif roll < 0.15:
+                valid_from = self.anchor + timedelta(days=rng.randint(1, 30))
+                valid_until = valid_from + timedelta(days=30)
+            else:
+                valid_until = None
+            yield (
+                list_id,
+                f"Price List {list_id}",
+                rng.randint(0, 10),
+                valid_from,
+                valid_until,
+                rng.random() > 0.05,
+            )
+
+    def price_list_lines(self) -> Iterator[tuple]:
+        rng = self.rng("price_list_lines")
+        line_id = 0
+        per_list = max(1, self.volumes.products // 50)
+        for list_id in range(1, PRICE_LIST_COUNT + 1):
+            targets: List[Tuple] = [
+                (product_id, None)
+                for product_id in rng.sample(
+                    range(1, self.volumes.products + 1), per_list
+                )
+            ]
+            targets += [(None, rng.choice(self.leaf_categories)) for _ in range(3)]
+            if list_id % 10 == 0:
+                targets.append((None, None))
+            for product_id, category_id in targets:
+                line_id += 1
+                discount_type = rng.choice(
+                    ("percentage", "percentage", "flat", "fixed_price")
+                )
+                if discount_type == "percentage":
+                    value = Decimal(rng.choice((5, 10, 15, 20, 25)))
+                    cap = (
+                        Decimal(rng.choice((100, 250, 500)))
+                        if rng.random() < 0.3
+                        else None
+                    )
+                elif discount_type == "flat":
+                    value, cap = Decimal(rng.randint(5, 100)), None
+                elif product_id is not None:
+                    price = self.products[product_id - 1].base_price
+                    value, cap = (
+                        (price * Decimal("0.85")).quantize(Decimal("0.01")),
+                        None,
+                    )
+                else:
+                    # A fixed price only makes sense for one product
+                    discount_type, value, cap = "percentage", Decimal(10), None
+                yield (
+                    line_id,
+                    list_id,
+                    product_id,
+                    category_id,
+                    discount_type,
+                    value,
+                    cap,
+                    rng.choice((1, 1, 1, 3, 6)),
+                    None,
+                    True,
+                )
+
+    def tier_price_lists(self) -> Iterator[tuple]:
+        rng = self.rng("tier_price_lists")
+        row_id = 0
+        for tier_id in range(1, TIER_COUNT + 1):
+            # Higher tiers get more lists; neighbouring tiers share most of them
+            start = (tier_id - 1) * 2
+            lists = range(
+                start + 1, min(start + 4 + tier_id // 3, PRICE_LIST_COUNT) + 1
+            )
+            for list_id in lists:
+                if rng.random() < 0.9:
+                    row_id += 1
+                    yield (row_id, tier_id, list_id)
+
+    # Users and activity
+
+    def users(self) -> Iterator[tuple]:
+        rng = self.rng("users")
+        for index in range(1, self.volumes.users + 1):
+            tier_id = min(TIER_COUNT, 1 + int(rng.expovariate(0.5)))
+            yield (
+                self.user_id(index),
+                f"User {index}",
+                f"+9477{index:07d}",
+                "CUSTOMER",
+                f"{self.user_id(index)}@example.com",
+                tier_id,
+                0,
+                0.0,
+                self.ago(rng, 730),
+            )
+
+    def addresses(self) -> Iterator[tuple]:
+        rng = self.rng("addresses")
+        for index in range(1, self.volumes.users + 1):
+            city, lat, lng = rng.choice(CITIES)
+            yield (
+                index,
+                self.user_id(index),
+                f"{index} Lane, {city}",
+                round(lat + rng.gauss(0, 0.04), 6),
+                round(lng + rng.gauss(0, 0.04), 6),
+                True,
+            )
+
+    def product_interactions(self) -> Iterator[tuple]:
+        rng = self.rng("product_interactions")
+        kinds = [(name, score) for name, score, _ in INTERACTIONS]
+        weights = [weight for _, _, weight in INTERACTIONS]
+        for row_id in range(1, self.volumes.product_interactions + 1):
+            kind, score = rng.choices(kinds, weights)[0]
+            yield (
+                row_id,
+                self.user_id(self.active_user(rng)),
+                self.popular_product(rng),
+                kind,
+                score,
+                self.ago(rng, 180),
+                None,
+            )
+
+    def search_interactions(self) -> Iterator[tuple]:
+        rng = self.rng("search_interactions")
+        for row_id in range(1, self.volumes.search_interactions + 1):
+            product_id = self.popular_product(rng)
+            product = self.products[product_id - 1]
+            words = product.name[len(product.brand) + 1 :].split()
+            query = " ".join(words[: rng.randint(1, 2)]).lower()
+            mode = "dropdown" if rng.random() < 0.6 else "full"
+            # Dropdown searches are often abandoned prefixes
+            if mode == "dropdown" and rng.random() < 0.5:
+                query = query[: max(2, rng.randint(2, len(query)))]
+            clicked = [product_id] if rng.random() < 0.35 else []
+            yield (
+                row_id,
+                self.user_id(self.active_user(rng)),
+                query,
+                mode,
+                rng.randint(0, 40),
+                clicked,
+                self.ago(rng, 180),
+                json.dumps({"generated": True}),
+            )
+
+    def _order(self, order_id: int):
+        """One order's header and items; regenerated identically per table."""
+        rng = self.rng(f"order:{order_id}")
+        user = self.active_user(rng)
+        created = self.ago(rng, 365)
+        items = [
+            (self.popular_product(rng), rng.randint(1, 4))
+            for _ in range(rng.randint(1, 6))
+        ]
+        mode = rng.choice(("delivery", "delivery", "pickup", "far_delivery"))
+        status = rng.choices(*zip(*ORDER_STATUSES))[0]
+        store_id = rng.randint(1, self.volumes.stores)
+        return rng, user, created, items, mode, status, store_id
+
+    def carts(self) -> Iterator[tuple]:
+        for order_id in range(1, self.volumes.orders + 1):
+            _, user, created, *_ = self._order(order_id)
+            yield (
+                order_id,
+                "Cart",
+                "ordered",
+                self.user_id(user),
+                created,
+                created,
+                created,
+            )
+
+    def cart_users(self) -> Iterator[tuple]:
+        for order_id in range(1, self.volumes.orders + 1):
+            _, user, created, *_ = self._order(order_id)
+            yield (order_id, self.user_id(user), "owner", created)
+
+    def orders(self) -> Iterator[tuple]:
+        for order_id in range(1, self.volumes.orders + 1):
+            rng, user, created, items, mode, status, store_id = self._order(order_id)
+            subtotal = sum(
+                self.products[pid - 1].base_price * qty for pid, qty in items
+            )
+            delivery = (
+                Decimal("0.00") if mode == "pickup" else Decimal(rng.randint(50, 300))
+            )
+            yield (
+                order_id,
+                self.user_id(user),
+                store_id,
+                user if mode != "pickup" else None,
+                subtotal + delivery,
+                delivery,
+                mode,
+                "standard",
+                rng.choice(("web", "android", "ios")),
+                status,
+                "synced" if status == "delivered" else "pending",
+                created,
+                created + timedelta(hours=rng.randint(1, 72)),
+            )
+
+    def order_items(self) -> Iterator[tuple]:
+        row_id = 0
+        for order_id in range(1, self.volumes.orders + 1):
+            _, _, created, items, _, _, store_id = self._order(order_id)
+            for product_id, quantity in items:
+                row_id += 1
+                price = self.products[product_id - 1].base_price
+                yield (
+                    row_id,
+                    order_id,
+                    order_id,
+                    product_id,
+                    store_id,
+                    quantity,
+                    price,
+                    price * quantity,
+                    created,
+                )
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    name: str
+    columns: Sequence[str]
+    rows: Callable[[Dataset], Iterator[tuple]]
+    # Serial primary key whose sequence is moved past the loaded ids
+    serial: bool = True
+
+
+# In load order; truncation runs in reverse
+TABLES = [
+    TableSpec(
+        "categories",
+        ("id", "name", "description", "sort_order", "parent_category_id"),
+        Dataset.categories,
+    ),
+    TableSpec(
+        "ecommerce_categories",
+        ("id", "name", "parent_category_id"),
+        Dataset.ecommerce_categories,
+    ),
+    TableSpec("tags", ("id", "tag_type", "name", "slug", "is_active"), Dataset.tags),
+    TableSpec(
+        "products",
+        (
+            "id",
+            "ref",
+            "name",
+            "description",
+            "brand",
+            "base_price",
+            "unit_measure",
+            "image_urls",
+            "ecommerce_category_id",
+            "ecommerce_subcategory_id",
+            "alternative_product_ids",
+            "created_at",
+            "updated_at",
+        ),
+        Dataset.products_rows,
+    ),
+    TableSpec(
+        "product_categories",
+        ("product_id", "category_id"),
+        Dataset.product_categories,
+        serial=False,
+    ),
+    TableSpec(
+        "product_tags",
+        ("product_id", "tag_id", "value", "created_by"),
+        Dataset.product_tags,
+        serial=False,
+    ),
+    TableSpec(
+        "stores",
+        (
+            "id",
+            "name",
+            "address",
+            "latitude",
+            "longitude",
+            "email",
+            "phone",
+            "is_active",
+            "odoo_warehouse_id",
+        ),
+        Dataset.stores,
+    ),
+    TableSpec(
+        "inventory",
+        (
+            "id",
+            "product_id",
+            "store_id",
+            "quantity_available",
+            "quantity_reserved",
+            "quantity_on_hold",
+            "safety_stock",
+        ),
+        Dataset.inventory,
+    ),
+    TableSpec(
+        "tiers",
+        (
+            "id",
+            "name",
+            "sort_order",
+            "is_active",
+            "min_total_spent",
+            "min_orders_count",
+            "min_monthly_spent",
+            "min_monthly_orders",
+        ),
+        Dataset.tiers,
+    ),
+    TableSpec(
+        "price_lists",
+        ("id", "name", "priority", "valid_from", "valid_until", "is_active"),
+        Dataset.price_lists,
+    ),
+    TableSpec(
+        "price_list_lines",
+        (
+            "id",
+            "price_list_id",
+            "product_id",
+            "category_id",
+            "discount_type",
+            "discount_value",
+            "max_discount_amount",
+            "min_quantity",
+            "min_order_amount",
+            "is_active",
+        ),
+        Dataset.price_list_lines,
+    ),
+    TableSpec(
+        "tier_price_lists", ("id", "tier_id", "price_list_id"), Dataset.tier_price_lists
+    ),
+    TableSpec(
+        "users",
+        (
+            "firebase_uid",
+            "name",
+            "phone",
+            "role",
+            "email",
+            "tier_id",
+            "total_orders",
+            "lifetime_value",
+            "created_at",
+        ),
+        Dataset.users,
+        serial=False,
+    ),
+    TableSpec(
+        "addresses",
+        ("id", "user_id", "address", "latitude", "longitude", "is_default"),
+        Dataset.addresses,
+    ),
+    TableSpec(
+        "product_interactions",
+        (
+            "id",
+            "user_id",
+            "product_id",
+            "interaction_type",
+            "interaction_score",
+            "timestamp",
+            "extra_data",
+        ),
+        Dataset.product_interactions,
+    ),
+    TableSpec(
+        "search_interactions",
+        (
+            "id",
+            "user_id",
+            "query",
+            "mode",
+            "results_count",
+            "clicked_product_ids",
+            "timestamp",
+            "extra_data",
+        ),
+        Dataset.search_interactions,
+    ),
+    TableSpec(
+        "carts",
+        (
+            "id",
+            "name",
+            "status",
+            "created_by",
+            "created_at",
+            "updated_at",
+            "ordered_at",
+        ),
+        Dataset.carts,
+    ),
+    TableSpec(
+        "cart_users",
+        ("cart_id", "user_id", "role", "shared_at"),
+        Dataset.cart_users,
+        serial=False,
+    ),
+    TableSpec(
+        "orders",
+        (
+            "id",
+            "user_id",
+            "store_id",
+            "address_id",
+            "total_amount",
+            "delivery_charge",
+            "fulfillment_mode",
+            "delivery_service_level",
+            "platform",
+            "status",
+            "odoo_sync_status",
+            "created_at",
+            "updated_at",
+        ),
+        Dataset.orders,
+    ),
+    TableSpec(
+        "order_items",
+        (
+            "id",
+            "order_id",
+            "source_cart_id",
+            "product_id",
+            "store_id",
+            "quantity",
+            "unit_price",
+            "total_price",
+            "created_at",
+        ),
+        Dataset.order_items,
+    ),
+]
+
+
+async def load(dataset: Dataset, tables: List[TableSpec]) -> None:
+    async with engine.connect() as conn:
+        # COPY goes through asyncpg directly; each statement commits on its own
+        pg = (await conn.get_raw_connection()).driver_connection
+        if pg is None:
+            raise RuntimeError("No asyncpg connection behind the engine")
+
+        names = ", ".join(table.name for table in reversed(tables))
+        print(f"Truncating {names}")
+        await pg.execute(f"TRUNCATE {names} RESTART IDENTITY CASCADE")
+
+        for table in tables:
+            start = time.perf_counter()
+            status = await pg.copy_records_to_table(
+                table.name, records=table.rows(dataset), columns=list(table.columns)
+            )
+            if table.serial:
+                await pg.execute(
+                    f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                    f"COALESCE((SELECT MAX(id) FROM {table.name}), 0) + 1, false)"
+                )
+            print(
+                f"{table.name:<22} {status.split()[-1]:>12} rows "
+                f"{time.perf_counter() - start:>8.1f}s"
+            )
+
+        print("Analyzing")
+        for table in tables:
+            await pg.execute(f"ANALYZE {table.name}")
+
+
+async def main(args: argparse.Namespace) -> None:
+    if settings.ENVIRONMENT == "production":
+        print("Refusing to generate data with ENVIRONMENT=production")
+        sys.exit(1)
+
+    selected = set(args.tables or [table.name for table in TABLES])
+    unknown = selected - {table.name for table in TABLES}
+    if unknown:
+        print(f"Unknown tables: {', '.join(sorted(unknown))}")
+        sys.exit(1)
+
+    anchor = datetime.combine(
+        date.fromisoformat(args.anchor) if args.anchor else date.today(),
+        datetime.min.time(),
+        tzinfo=timezone.utc,
+    )
+    dataset = Dataset(args.seed, args.scale, anchor)
+    print(
+        f"Generating scale {args.scale:g} (seed {args.seed}, anchor "
+        f"{anchor.date()}): {dataset.volumes}"
+    )
+    try:
+        await load(dataset, [table for table in TABLES if table.name in selected])
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Bulk-load deterministic benchmark data with COPY"
+    )
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="Scale factor, e.g. 1, 10 or 100"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--anchor",
+        help="Date (YYYY-MM-DD) that generated timestamps lead up to; default today",
+    )
+    parser.add_argument(
+        "--tables", nargs="+", help="Only (re)load these tables, in load order"
+    )
+    asyncio.run(main(parser.parse_args()))
@@ -12,6 +12,10 @@ Usage:
 
     # Retry a specific order
     python scripts/db/retry_failed_odoo_syncs.py --order-id 123
+
+    # Drain a large backlog concurrently, throttled and resumable
+    python scripts/db/retry_failed_odoo_syncs.py --bulk --concurrency 8 \
+        --rate-limit 20 --checkpoint odoo_retry.checkpoint.json
 """
 
 import argparse
@@ -51,6 +55,11 @@ from src.database.models.payment_token import UserPaymentToken
 from src.database.models.webhook_notification import WebhookNotification
 from src.database.models.rider import RiderProfile, StoreRider
 
+from src.integrations.odoo.bulk_retry import (
+    BulkRetryConfig,
+    BulkRetryProgress,
+    OdooBulkRetryEngine,
+)
 from src.integrations.odoo.order_sync import OdooOrderSync
 
 
@@ -146,6 +155,61 @@ async def main(order_id: Optional[int] = None):
     print("=" * 80)
 
 
+async def main_bulk(config: BulkRetryConfig):
+    """
+    Retry all failed Odoo syncs concurrently using the bulk retry engine.
+
+    Args:
+        config: Concurrency, rate limit, chunking and checkpoint settings.
+    """
+    print("=" * 80)
+    print(
+        "BULK RETRY FAILED ODOO ORDER SYNCS" + (" (DRY RUN)" if config.dry_run else "")
+    )
+    print("=" * 80)
+    print(
+        f"Concurrency: {config.concurrency} | "
+        f"Rate limit: {config.rate_limit or 'unlimited'} RPC/s | "
+        f"Chunk size: {config.chunk_size} | "
+        f"Checkpoint: {config.checkpoint_path or 'none'}"
+    )
+    print()
+
+    def report(progress: BulkRetryProgress) -> None:
+        print(f"    {progress.format()}")
+
+    try:
+        bulk_engine = OdooBulkRetryEngine(config=config, on_progress=report)
+        progress = await bulk_engine.run()
+
+        print()
+        print("=" * 80)
+        print("BULK SYNC RETRY RESULTS")
+        print("=" * 80)
+        if config.dry_run:
+            print(f"🔎 Would retry:        {progress.processed} orders")
+        else:
+            print(f"✅ Successfully synced: {progress.succeeded} orders")
+            print(f"❌ Failed to sync:      {progress.failed} orders")
+            for failed_order_id, error in list(progress.errors.items())[:20]:
+                print(f"    Order {failed_order_id}: {error}")
+        print(
+            f"⏱  Elapsed: {progress.elapsed_seconds:.1f}s "
+            f"({progress.orders_per_second:.1f} orders/s)"
+        )
+        print()
+
+    except Exception as e:
+        print(f"❌ An unexpected error occurred during the script execution: {e}")
+        import traceback
+
+        traceback.print_exc()
+        sys.exit(1)
+
+    finally:
+        await engine.dispose()
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="Retry failed Odoo order synchronizations.",
@@ -157,6 +221,15 @@ Examples:
 
   # Retry only a specific order by its ID
   python scripts/db/retry_failed_odoo_syncs.py --order-id 123
+
+  # Bulk mode: 8 concurrent syncs, at most 20 Odoo RPCs per second
+  python scripts/db/retry_failed_odoo_syncs.py --bulk --concurrency 8 --rate-limit 20
+
+  # Preview what a bulk run would pick up
+  python scripts/db/retry_failed_odoo_syncs.py --bulk --dry-run
+
+  # Resumable bulk run (re-run the same command after an interruption)
+  python scripts/db/retry_failed_odoo_syncs.py --bulk --checkpoint odoo_retry.json
         """,
     )
 
@@ -166,10 +239,65 @@ Examples:
         help="A specific order ID to retry, ignoring all others.",
     )
 
+    parser.add_argument(
+        "--bulk",
+        action="store_true",
+        help="Retry all failed orders concurrently with rate limiting.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Bulk mode: orders synced in parallel (keep below the DB pool size).",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=20.0,
+        help="Bulk mode: max Odoo RPC calls per second, 0 to disable.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=200,
+        help="Bulk mode: orders claimed per chunk (checkpoint granularity).",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=str,
+        default=None,
+        help="Bulk mode: JSON file used to resume an interrupted run.",
+    )
+    parser.add_argument(
+        "--max-orders",
+        type=int,
+        default=None,
+        help="Bulk mode: stop after this many orders.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Bulk mode: only count the orders that would be retried.",
+    )
+
     args = parser.parse_args()
 
     try:
-        asyncio.run(main(order_id=args.order_id))
+        if args.bulk:
+            asyncio.run(
+                main_bulk(
+                    BulkRetryConfig(
+                        concurrency=args.concurrency,
+                        rate_limit=args.rate_limit or None,
+                        chunk_size=args.chunk_size,
+                        dry_run=args.dry_run,
+                        checkpoint_path=args.checkpoint,
+                        max_orders=args.max_orders,
+                    )
+                )
+            )
+        else:
+            asyncio.run(main(order_id=args.order_id))
     except KeyboardInterrupt:
         print("\n\n⚠️  Odoo sync retry interrupted by user")
         sys.exit(1)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Script to roll new product interactions up into daily popularity buckets.
+
+Only product_interactions rows inserted since the previous run are read
+(tracked in the aggregation_watermarks table). They are grouped per product,
+interaction type and day and upserted into product_interaction_daily in
+batches, then days past retention are pruned. Popular products over a time
+window are ranked from this table. The API already runs the rollup on an
+interval (POPULARITY_ROLLUP_ENABLED); this script runs it once, e.g. as a
+scheduled Cloud Run job when the in-process rollup is disabled, or to rebuild.
+
+Usage:
+    # Incremental run
+    python scripts/db/rollup_product_interactions.py
+
+    # Drop the rollup and rebuild it from every interaction
+    python scripts/db/rollup_product_interactions.py --rebuild
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# Add the project root to the Python path
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from src.database.connection import engine
+
+# Import all database models to ensure SQLAlchemy relationships are properly registered
+import src.database.models  # noqa: F401
+
+from src.api.products.services.popularity_rollup import PopularityRollup
+from src.config.constants import POPULARITY_ROLLUP_BATCH_SIZE
+
+
+async def main(rebuild: bool, batch_size: int):
+    """
+    Main function to run the product interaction rollup.
+
+    Args:
+        rebuild: Clear the rollup and the watermark before rolling up.
+        batch_size: product_interactions rows per batch.
+    """
+    print("=" * 80)
+    print(
+        "PRODUCT INTERACTION ROLLUP" + (" (REBUILD)" if rebuild else " (INCREMENTAL)")
+    )
+    print("=" * 80)
+    print()
+
+    rollup = PopularityRollup(batch_size=batch_size)
+    start = time.perf_counter()
+
+    try:
+        if rebuild:
+            await rollup.reset()
+            print("🗑  Cleared product interaction rollup and watermark")
+
+        result = await rollup.run()
+        print(f"    Batches:            {result.batches}")
+        print(f"    Interactions read:  {result.interactions}")
+        print(f"    Daily rows upserted: {result.rows_upserted}")
+        print(f"    Daily rows pruned:  {result.rows_pruned}")
+        print(f"    Watermark:          {result.last_id}")
+        print()
+        print(f"⏱  Completed in {time.perf_counter() - start:.1f}s")
+
+    except Exception as e:
+        print(f"❌ An unexpected error occurred: {e}")
+        import traceback
+
+        traceback.print_exc()
+        sys.exit(1)
+
+    finally:
+        # Properly dispose of the engine to close all connections
+        await engine.dispose()
+
+    print("=" * 80)
+    print("PRODUCT INTERACTION ROLLUP COMPLETE")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Incrementally roll product interactions up into daily buckets."
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Clear the rollup and re-read every interaction.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=POPULARITY_ROLLUP_BATCH_SIZE,
+        help=f"Interactions per batch (default {POPULARITY_ROLLUP_BATCH_SIZE}).",
+    )
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(main(args.rebuild, args.batch_size))
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Product interaction rollup interrupted by user")
+        sys.exit(1)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Script to pull product, price and stock changes from Odoo.
+
+Only Odoo records written since the previous run are fetched (tracked per
+Odoo model in the odoo_sync_watermarks table), diffed against local rows and
+applied as batched upserts. Intended to run periodically as a Cloud Run job
+instead of full re-imports through the admin bulk endpoints. The changed
+products are published to catalog_changes, which every API server polls to
+drop its cached copies (CATALOG_CHANGE_LISTENER_ENABLED).
+
+Usage:
+    # Incremental pull of products/prices and stock
+    python scripts/db/sync_odoo_catalog.py
+
+    # Only products and prices
+    python scripts/db/sync_odoo_catalog.py --products
+
+    # Ignore watermarks and re-read everything (first run / recovery)
+    python scripts/db/sync_odoo_catalog.py --full
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# Add the project root to the Python path
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from src.database.connection import engine
+
+# Import all database models to ensure SQLAlchemy relationships are properly registered
+import src.database.models  # noqa: F401
+
+from src.integrations.odoo.catalog_sync import (
+    DEFAULT_PAGE_SIZE,
+    OdooCatalogSync,
+    PullSyncResult,
+)
+
+
+def print_result(title: str, result: PullSyncResult) -> None:
+    print(f"{title}")
+    print(f"    Pages fetched:   {result.pages}")
+    print(f"    Records fetched: {result.fetched}")
+    print(f"    ➕ Created:       {result.created}")
+    print(f"    ✏️  Updated:       {result.updated}")
+    print(f"    ⏸  Unchanged:     {result.unchanged}")
+    print(f"    ⚠️  Skipped:       {result.skipped}")
+    print(f"    Products published as changed: {len(result.changed_product_ids)}")
+    print()
+
+
+async def main(products: bool, stock: bool, full: bool, page_size: int):
+    """
+    Main function to run the incremental Odoo pull sync.
+
+    Args:
+        products: Pull products and list prices.
+        stock: Pull stock levels.
+        full: Ignore stored watermarks.
+        page_size: Records per Odoo search_read page.
+    """
+    print("=" * 80)
+    print("ODOO CATALOG PULL SYNC" + (" (FULL)" if full else " (INCREMENTAL)"))
+    print("=" * 80)
+    print()
+
+    sync = OdooCatalogSync(page_size=page_size)
+    start = time.perf_counter()
+
+    try:
+        if products:
+            print_result("📦 Products & prices", await sync.sync_products(reset=full))
+        if stock:
+            print_result("🏬 Stock", await sync.sync_stock(reset=full))
+
+        print(f"⏱  Completed in {time.perf_counter() - start:.1f}s")
+
+    except Exception as e:
+        print(f"❌ An unexpected error occurred: {e}")
+        import traceback
+
+        traceback.print_exc()
+        sys.exit(1)
+
+    finally:
+        # Properly dispose of the engine to close all connections
+        await engine.dispose()
+
+    print("=" * 80)
+    print("ODOO CATALOG PULL SYNC COMPLETE")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Incrementally pull products, prices and stock from Odoo."
+    )
+    parser.add_argument(
+        "--products", action="store_true", help="Pull products and prices only."
+    )
+    parser.add_argument("--stock", action="store_true", help="Pull stock only.")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore watermarks and re-read every record.",
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=DEFAULT_PAGE_SIZE,
+        help=f"Records per Odoo page (default {DEFAULT_PAGE_SIZE}).",
+    )
+    args = parser.parse_args()
+
+    # Neither flag means both
+    run_products = args.products or not args.stock
+    run_stock = args.stock or not args.products
+
+    try:
+        asyncio.run(main(run_products, run_stock, args.full, args.page_size))
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Odoo catalog sync interrupted by user")
+        sys.exit(1)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Script to report where application startup time goes.
+
+Imports a module (main by default) in a fresh interpreter with
+``python -X importtime`` and summarises the timings:
+
+- total import time, and the module's own top-level code (app and route setup)
+- the slowest modules by cumulative time (including their imports)
+- the slowest modules by self time (their own top-level code)
+- cumulative time per package: third-party top-level packages, and
+  src.<area>.<name> for application code
+
+Each module is only imported once per process, so a package's total is the
+cost of the modules it was first to import.
+
+Usage:
+    python scripts/profile_startup.py
+    python scripts/profile_startup.py --top 30 --env LAZY_STARTUP=false
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+# (module, self_us, cumulative_us, depth)
+ImportRow = Tuple[str, int, int, int]
+
+
+def run_importtime(module: str, env: Dict[str, str]) -> Tuple[List[ImportRow], float]:
+    """Import module in a subprocess; returns the parsed rows and wall time"""
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"import {module}; "
+        "print(time.perf_counter() - start)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT,
+        env={**os.environ, **env},
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr[-4000:])
+        raise SystemExit(f"Importing {module} failed")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    wall = float(result.stdout.strip().splitlines()[-1])
+    return rows, wall
+
+
+def package_of(module: str) -> str:
+    parts = module.split(".")
+    return ".".join(parts[:3]) if parts[0] == "src" else parts[0]
+
+
+def print_table(title: str, rows: List[Tuple[str, int]], top: int) -> None:
+    print(f"\n{title}")
+    print(f"{'ms':>9}  module")
+    for name, us in rows[:top]:
+        print(f"{us / 1000:>9.1f}  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile application import time")
+    parser.add_argument("--module", default="main", help="Module to import")
+    parser.add_argument("--top", type=int, default=20, help="Rows per table")
+    parser.add_argument(
+        "--env",
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="Environment variable for the import (repeatable)",
+    )
+    args = parser.parse_args()
+
+    env = dict(item.split("=", 1) for item in args.env)
+    rows, wall = run_importtime(args.module, env)
+
+    # Top-level imports of the -c snippet have depth 0; their cumulative times
+    # add up to the whole import
+    total_us = sum(cumulative for _, _, cumulative, depth in rows if depth == 0)
+    module_self = next((s for name, s, _, _ in rows if name == args.module), 0)
+
+    packages: Dict[str, int] = defaultdict(int)
+    for name, self_us, _, _ in rows:
+        packages[package_of(name)] += self_us
+
+    print("=" * 80)
+    print(f"STARTUP PROFILE: import {args.module}")
+    print("=" * 80)
+    print(f"Wall time:        {wall * 1000:.0f} ms")
+    print(f"Import time:      {total_us / 1000:.0f} ms over {len(rows)} modules")
+    print(f"{args.module} top-level:  {module_self / 1000:.0f} ms")
+
+    print_table(
+        "Slowest modules (cumulative)",
+        sorted(((n, c) for n, _, c, _ in rows), key=lambda r: -r[1]),
+        args.top,
+    )
+    print_table(
+        "Slowest modules (self)",
+        sorted(((n, s) for n, s, _, _ in rows), key=lambda r: -r[1]),
+        args.top,
+    )
+    print_table(
+        "Packages (sum of self time)",
+        sorted(packages.items(), key=lambda r: -r[1]),
+        args.top,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -23,7 +23,6 @@ from src.shared.responses import success_response
 
 dev_router = APIRouter(prefix="/dev", tags=["Development"])
 auth_service = AuthService()
-odoo_service = OdooService()
 interaction_service = InteractionService()
 popularity_service = PopularityService()
 personalization_service = PersonalizationService()
@@ -513,6 +512,9 @@ async def test_odoo_connection(request: OdooTestRequest):
     ```
     """
     try:
+        # Created per request: OdooService requires the Odoo settings, which
+        # the other dev endpoints do not
+        odoo_service = OdooService()
         timestamp = datetime.utcnow().isoformat()
 
         if request.test_type == "connection":
@@ -1,7 +1,6 @@
 from typing import Optional
 
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
 
 from src.api.categories.models import (
     CategorySchema,
@@ -21,6 +20,7 @@ from src.shared.performance_utils import QueryOptimizer, async_timer
 from src.shared.sqlalchemy_utils import safe_model_validate, safe_model_validate_list
 
 from .cache import categories_cache
+from .tree import category_tree
 
 
 class CategoryService:
@@ -40,115 +40,26 @@ class CategoryService:
         subcategories_only: Optional[bool] = False,
     ) -> list[CategorySchema]:
         """Get categories with flexible filtering options"""
-        # Generate cache key based on filter parameters
-        filter_type = None
-        filter_value = None
+        tree = await category_tree.get()
+        with_subs = bool(include_subcategories)
 
         if parent_only:
-            filter_type = "parent_only" + (
-                "_with_subs" if include_subcategories else ""
-            )
-        elif parent_id is not None:
-            filter_type = "parent"
-            filter_value = str(parent_id) + (
-                "_with_subs" if include_subcategories else ""
-            )
-        elif subcategories_only:
-            filter_type = "subcategories_only" + (
-                "_with_subs" if include_subcategories else ""
-            )
-        else:
-            # Default 'all' case
-            if include_subcategories:
-                cached_categories = categories_cache.get_all_categories()
-                if cached_categories is not None:
-                    return [CategorySchema.model_validate(c) for c in cached_categories]
-
-        # Check cache for filtered results
-        if filter_type:
-            cached_categories = categories_cache.get_filtered_categories(
-                filter_type, filter_value
-            )
-            if cached_categories is not None:
-                return [CategorySchema.model_validate(c) for c in cached_categories]
-
-        async with AsyncSessionLocal() as session:
-            # Build query with filters
-            stmt = select(Category)
-
-            # Apply filtering conditions
-            if parent_only:
-                stmt = stmt.filter(Category.parent_category_id.is_(None))
-            elif parent_id is not None:
-                stmt = stmt.filter(Category.parent_category_id == parent_id)
-            elif subcategories_only:
-                stmt = stmt.filter(Category.parent_category_id.is_not(None))
-
-            # Add subcategories loading if requested
-            if include_subcategories:
-                stmt = stmt.options(selectinload(Category.subcategories))
-
-            # Order by sort_order
-            stmt = stmt.order_by(Category.sort_order)
-
-            result = await session.execute(stmt)
-            categories = result.scalars().unique().all()
-
-            if categories:
-                # Convert SQLAlchemy models to Pydantic schemas using safe converter
-                include_relationships = (
-                    {"subcategories"} if include_subcategories else set()
-                )
-                pydantic_categories = safe_model_validate_list(
-                    CategorySchema,
-                    categories,
-                    include_relationships=include_relationships,
-                )
-
-                # Cache results based on filter type
-                category_dicts = [
-                    cat.model_dump(mode="json") for cat in pydantic_categories
-                ]
-
-                if filter_type:
-                    # Cache filtered results
-                    categories_cache.set_filtered_categories(
-                        category_dicts, filter_type, filter_value
-                    )
-                else:
-                    # Default 'all categories' case
-                    if include_subcategories:
-                        categories_cache.set_all_categories(category_dicts)
-
-                return pydantic_categories
-
-            return []
+            return tree.roots(with_subs)
+        if parent_id is not None:
+            return tree.children(parent_id, with_subs)
+        if subcategories_only:
+            return tree.non_roots(with_subs)
+        return tree.all(with_subs)
 
     async def get_category_by_id(self, category_id: int) -> CategorySchema | None:
-        """Get category by ID with caching"""
-        cached_category = categories_cache.get_category(category_id)
-        if cached_category is not None:
-            return CategorySchema.model_validate(cached_category)
+        """Get category by ID with its direct subcategories"""
+        tree = await category_tree.get()
+        return tree.get(category_id)
 
-        async with AsyncSessionLocal() as session:
-            stmt = (
-                select(Category)
-                .options(selectinload(Category.subcategories))
-                .filter(Category.id == category_id)
-            )
-            result = await session.execute(stmt)
-            category = result.scalars().first()
-            if category:
-                # Convert SQLAlchemy model to Pydantic schema using safe converter
-                pydantic_category = safe_model_validate(
-                    CategorySchema, category, include_relationships={"subcategories"}
-                )
-                if pydantic_category.id:
-                    categories_cache.set_category(
-                        pydantic_category.id, pydantic_category.model_dump(mode="json")
-                    )
-                return pydantic_category
-        return None
+    async def expand_category_ids(self, category_ids: list[int]) -> list[int]:
+        """The given categories plus all of their descendants"""
+        tree = await category_tree.get()
+        return tree.expand(category_ids)
 
     @handle_service_errors("creating category")
     @async_timer("create_category")
@@ -216,9 +127,6 @@ class CategoryService:
             assert pydantic_category.id is not None, (
                 "Category ID should be present after database commit"
             )
-            categories_cache.set_category(
-                pydantic_category.id, pydantic_category.model_dump(mode="json")
-            )
             cache_invalidation_manager.invalidate_category()  # Invalidate all categories cache
 
             return pydantic_category
@@ -254,9 +162,6 @@ class CategoryService:
             assert pydantic_category.id is not None, (
                 "Category ID should be present after database commit"
             )
-            categories_cache.set_category(
-                pydantic_category.id, pydantic_category.model_dump(mode="json")
-            )
             cache_invalidation_manager.invalidate_category(
                 pydantic_category.id
             )  # Invalidate specific category cache
@@ -356,9 +261,6 @@ class CategoryService:
                 assert pydantic_category.id is not None, (
                     "Category ID should be present after database commit"
                 )
-                categories_cache.set_category(
-                    pydantic_category.id, pydantic_category.model_dump(mode="json")
-                )
 
             cache_invalidation_manager.invalidate_category()
 
@@ -371,16 +273,5 @@ class CategoryService:
         if not category_ids:
             return []
 
-        async with AsyncSessionLocal() as session:
-            stmt = (
-                select(Category)
-                .options(selectinload(Category.subcategories))
-                .filter(Category.id.in_(category_ids))
-                .order_by(Category.sort_order)
-            )
-            result = await session.execute(stmt)
-            categories = result.scalars().unique().all()
-
-            return safe_model_validate_list(
-                CategorySchema, categories, include_relationships={"subcategories"}
-            )
+        tree = await category_tree.get()
+        return tree.get_many(category_ids)
@@ -0,0 +1,45 @@
+"""
+Category tree snapshot shared by every CategoryService read
+"""
+
+from sqlalchemy import select
+
+from src.api.categories.models import CategorySchema
+from src.config.cache_config import CacheConfig
+from src.config.constants import Collections
+from src.database.connection import AsyncSessionLocal
+from src.database.models.category import Category
+from src.shared.cache_invalidation import cache_invalidation_manager
+from src.shared.cache_warmup import cache_warmup
+from src.shared.category_tree import CategoryTree
+from src.shared.snapshot import SnapshotIndex
+
+
+async def load_category_tree() -> CategoryTree[CategorySchema]:
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(
+                Category.id,
+                Category.name,
+                Category.sort_order,
+                Category.description,
+                Category.image_url,
+                Category.parent_category_id,
+            )
+        )
+        rows = [dict(row) for row in result.mappings()]
+    return CategoryTree(rows, CategorySchema, sort_key=lambda row: row["sort_order"])
+
+
+# Invalidation hooks only run in the writing process; max_age bounds how long
+# other instances serve the old tree
+category_tree = SnapshotIndex(
+    "categories", load_category_tree, max_age=CacheConfig.CATEGORY_DATA_TTL
+)
+
+# Any category write can move a subtree, so every invalidation drops the tree
+cache_invalidation_manager.register_invalidation_hook(
+    Collections.CATEGORIES, category_tree.invalidate
+)
+
+cache_warmup.register("categories", category_tree.get)
@@ -2,7 +2,6 @@ from typing import List, Optional
 
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import selectinload
 
 from src.api.ecommerce_categories.models import (
     CreateEcommerceCategorySchema,
@@ -14,55 +13,26 @@ from src.database.models.ecommerce_category import EcommerceCategory
 from src.shared.exceptions import ConflictException, ResourceNotFoundException
 from src.shared.sqlalchemy_utils import safe_model_validate, safe_model_validate_list
 
+from .tree import ecommerce_category_tree
+
 
 class EcommerceCategoryService:
     async def get_all_categories(
         self, include_subcategories: bool = True
     ) -> List[EcommerceCategorySchema]:
         """Get all ecommerce categories, optionally including subcategories"""
-        async with AsyncSessionLocal() as session:
-            if include_subcategories:
-                stmt = (
-                    select(EcommerceCategory)
-                    .options(selectinload(EcommerceCategory.subcategories))
-                    .where(EcommerceCategory.parent_category_id.is_(None))
-                )
-            else:
-                stmt = select(EcommerceCategory)
-
-            result = await session.execute(stmt)
-            categories = result.scalars().all()
-
-            include_relationships = (
-                {"subcategories"} if include_subcategories else set()
-            )
-            return safe_model_validate_list(
-                EcommerceCategorySchema,
-                categories,
-                include_relationships=include_relationships,
-            )
+        tree = await ecommerce_category_tree.get()
+        # With subcategories only the roots are listed, each holding its children
+        if include_subcategories:
+            return tree.roots()
+        return tree.all(include_subcategories=False)
 
     async def get_category_by_id(
         self, category_id: int
     ) -> Optional[EcommerceCategorySchema]:
         """Get an ecommerce category by ID"""
-        async with AsyncSessionLocal() as session:
-            stmt = (
-                select(EcommerceCategory)
-                .options(selectinload(EcommerceCategory.subcategories))
-                .where(EcommerceCategory.id == category_id)
-            )
-
-            result = await session.execute(stmt)
-            category = result.scalar_one_or_none()
-
-            if category:
-                return safe_model_validate(
-                    EcommerceCategorySchema,
-                    category,
-                    include_relationships={"subcategories"},
-                )
-            return None
+        tree = await ecommerce_category_tree.get()
+        return tree.get(category_id)
 
     async def create_categories(
         self, categories_data: List[CreateEcommerceCategorySchema]
@@ -105,6 +75,7 @@ class EcommerceCategoryService:
 
             try:
                 await session.commit()
+                ecommerce_category_tree.invalidate()
 
                 # Refresh to get the generated IDs and relationships
                 for category in created_categories:
@@ -155,6 +126,7 @@ class EcommerceCategoryService:
 
             try:
                 await session.commit()
+                ecommerce_category_tree.invalidate()
                 await session.refresh(category, ["subcategories"])
                 return safe_model_validate(
                     EcommerceCategorySchema,
@@ -177,4 +149,5 @@ class EcommerceCategoryService:
 
             await session.delete(category)
             await session.commit()
+            ecommerce_category_tree.invalidate()
             return True
@@ -0,0 +1,39 @@
+"""
+Ecommerce category tree snapshot shared by every EcommerceCategoryService read
+"""
+
+from sqlalchemy import select
+
+from src.api.ecommerce_categories.models import EcommerceCategorySchema
+from src.config.cache_config import CacheConfig
+from src.database.connection import AsyncSessionLocal
+from src.database.models.ecommerce_category import EcommerceCategory
+from src.shared.cache_warmup import cache_warmup
+from src.shared.category_tree import CategoryTree
+from src.shared.snapshot import SnapshotIndex
+
+
+async def load_ecommerce_category_tree() -> CategoryTree[EcommerceCategorySchema]:
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(
+            select(
+                EcommerceCategory.id,
+                EcommerceCategory.name,
+                EcommerceCategory.description,
+                EcommerceCategory.image_url,
+                EcommerceCategory.parent_category_id,
+            )
+        )
+        rows = [dict(row) for row in result.mappings()]
+    return CategoryTree(rows, EcommerceCategorySchema)
+
+
+# Ecommerce categories have no cache domain; the service invalidates after
+# writes in this process, and max_age picks up writes made by other instances
+ecommerce_category_tree = SnapshotIndex(
+    "ecommerce categories",
+    load_ecommerce_category_tree,
+    max_age=CacheConfig.CATEGORY_DATA_TTL,
+)
+
+cache_warmup.register("ecommerce_categories", ecommerce_category_tree.get)
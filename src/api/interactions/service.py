@@ -1,4 +1,3 @@
-import asyncio
 import logging
 from datetime import datetime
 from typing import Optional
@@ -8,6 +7,7 @@ from sqlalchemy.future import select
 from src.config.constants import INTERACTION_SCORES, InteractionType
 from src.database.connection import AsyncSessionLocal
 from src.database.models.product_interaction import ProductInteraction
+from src.shared.background_tasks import spawn
 from src.shared.error_handler import ErrorHandler
 
 
@@ -73,10 +73,12 @@ class InteractionService:
 
                 # Trigger background updates if requested
                 if auto_update_popularity:
-                    asyncio.create_task(self._update_popularity_async(product_id))
+                    spawn(
+                        "update_popularity", self._update_popularity_async(product_id)
+                    )
 
                 if auto_update_preferences:
-                    asyncio.create_task(self._update_preferences_async(user_id))
+                    spawn("update_preferences", self._update_preferences_async(user_id))
 
                 return True
 
@@ -243,7 +245,7 @@ class InteractionService:
 
         # Trigger single update for user preferences after all items
         if auto_update and results["success"] > 0:
-            asyncio.create_task(self._update_preferences_async(user_id))
+            spawn("update_preferences", self._update_preferences_async(user_id))
 
         self.logger.info(
             f"Tracked bulk order {order_id}: {results['success']} products"
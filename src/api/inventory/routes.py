@@ -9,6 +9,7 @@ from src.api.inventory.models import (
     UpdateInventorySchema,
 )
 from src.api.inventory.service import InventoryService
+from src.api.inventory.services import hold_sweeper
 from src.config.constants import UserRole
 from src.dependencies.auth import RoleChecker, get_current_user
 from src.shared.exceptions import ResourceNotFoundException
@@ -128,6 +129,28 @@ async def adjust_inventory(adjustment_data: AdjustInventorySchema):
         return success_response(updated_inventory.model_dump(mode="json"))
 
 
+@inventory_router.get(
+    "/holds/metrics",
+    summary="Held vs. sellable inventory units",
+    dependencies=[Depends(RoleChecker([UserRole.ADMIN]))],
+)
+async def get_hold_metrics():
+    """
+    Totals across all stores:
+    - `held_units` / `reserved_units` / `sellable_units` (available minus safety stock)
+    - `active_holds`: open hold records of pending orders
+    - `expired_holds`: open hold records past expiry, awaiting the next sweep
+    """
+    metrics = await hold_sweeper.get_hold_metrics()
+    return success_response(
+        {
+            **metrics,
+            "swept_orders_cancelled": hold_sweeper.total_orders_cancelled,
+            "swept_units_released": hold_sweeper.total_units_released,
+        }
+    )
+
+
 @inventory_router.delete(
     "/{inventory_id}",
     summary="Delete an inventory item",
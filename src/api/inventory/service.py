@@ -203,10 +203,20 @@ class InventoryService:
         )
 
     async def place_holds_bulk(
-        self, holds: list[dict], session
+        self,
+        holds: list[dict],
+        session,
+        order_id: Optional[int] = None,
+        hold_ttl_seconds: Optional[int] = None,
     ) -> list[InventorySchema]:
-        """Place multiple inventory holds in a single optimized operation."""
-        return await self.transaction_service.place_holds_bulk(holds, session)
+        """Atomically place multiple inventory holds (all or nothing)."""
+        return await self.transaction_service.place_holds_bulk(
+            holds, session, order_id=order_id, hold_ttl_seconds=hold_ttl_seconds
+        )
+
+    async def close_holds(self, order_id: int, reason: str, session) -> None:
+        """Mark an order's hold records released once its stock moved on."""
+        await self.transaction_service.close_holds(order_id, reason, session)
 
     async def release_holds_bulk(
         self, holds: list[dict], session
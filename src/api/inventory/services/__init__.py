@@ -1,5 +1,9 @@
+from .hold_sweeper import HoldSweepResult, InventoryHoldSweeper, hold_sweeper
 from .transaction_service import InventoryTransactionService
 
 __all__ = [
+    "HoldSweepResult",
+    "InventoryHoldSweeper",
     "InventoryTransactionService",
+    "hold_sweeper",
 ]
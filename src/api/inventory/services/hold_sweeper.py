@@ -0,0 +1,238 @@
+"""
+Inventory hold sweeper
+
+Releases stock held by orders that were never paid. A checkout places holds
+with an expiry (see InventoryTransactionService.place_holds_bulk); once the
+expiry passes and the order is still pending, the sweeper cancels the order,
+returns its held units to quantity_available and closes the hold records.
+A payment that still arrives for such an order reopens it with fresh holds
+when the stock is there (see OrderService.confirm_orders_by_cart_ids).
+Each batch is a single set-based statement, and orders are claimed with
+SKIP LOCKED so several app instances can sweep at the same time.
+"""
+
+import asyncio
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+
+from src.config.constants import OrderStatus
+from src.config.settings import settings
+from src.database.connection import AsyncSessionLocal
+from src.shared.metrics import metrics
+from src.shared.error_handler import ErrorHandler
+
+SWEEP_EXPIRED_HOLDS_SQL = text(
+    """
+    WITH expired_orders AS (
+        SELECT o.id
+        FROM orders o
+        WHERE o.id IN (
+                SELECT h.order_id
+                FROM inventory_holds h
+                WHERE h.released_at IS NULL AND h.expires_at <= NOW()
+            )
+          AND o.status = CAST(:pending AS orderstatus)
+        ORDER BY o.id
+        LIMIT :batch_size
+        FOR UPDATE OF o SKIP LOCKED
+    ),
+    released AS (
+        UPDATE inventory_holds h
+        SET released_at = NOW(), release_reason = 'expired'
+        FROM expired_orders e
+        WHERE h.order_id = e.id AND h.released_at IS NULL
+        RETURNING h.product_id, h.store_id, h.quantity
+    ),
+    totals AS (
+        SELECT product_id, store_id, SUM(quantity) AS quantity
+        FROM released
+        GROUP BY product_id, store_id
+    ),
+    locked AS (
+        SELECT i.id, t.quantity
+        FROM inventory i
+        JOIN totals t
+          ON i.product_id = t.product_id AND i.store_id = t.store_id
+        ORDER BY i.id
+        FOR UPDATE OF i
+    ),
+    restocked AS (
+        UPDATE inventory inv
+        SET quantity_available = inv.quantity_available
+                + LEAST(l.quantity, inv.quantity_on_hold),
+            quantity_on_hold = inv.quantity_on_hold
+                - LEAST(l.quantity, inv.quantity_on_hold),
+            updated_at = NOW()
+        FROM locked l
+        WHERE inv.id = l.id
+        RETURNING inv.product_id, inv.store_id
+    ),
+    cancelled AS (
+        UPDATE orders o
+        SET status = CAST(:cancelled AS orderstatus)
+        FROM expired_orders e
+        WHERE o.id = e.id
+        RETURNING o.id
+    )
+    SELECT
+        (SELECT COUNT(*) FROM cancelled) AS orders_cancelled,
+        (SELECT COUNT(*) FROM released) AS holds_released,
+        (SELECT COALESCE(SUM(quantity), 0) FROM released) AS units_released,
+        (SELECT array_agg(product_id) FROM restocked) AS restocked_product_ids,
+        (SELECT array_agg(store_id) FROM restocked) AS restocked_store_ids
+    """
+)
+
+HOLD_METRICS_SQL = text(
+    """
+    SELECT
+        COALESCE(SUM(quantity_on_hold), 0) AS held_units,
+        COALESCE(SUM(quantity_reserved), 0) AS reserved_units,
+        COALESCE(SUM(GREATEST(quantity_available - safety_stock, 0)), 0)
+            AS sellable_units,
+        (SELECT COUNT(*) FROM inventory_holds WHERE released_at IS NULL)
+            AS active_holds,
+        (SELECT COUNT(*) FROM inventory_holds
+         WHERE released_at IS NULL AND expires_at <= NOW()) AS expired_holds
+    FROM inventory
+    """
+)
+
+
+@dataclass
+class HoldSweepResult:
+    """Totals of one sweep (all batches until nothing expired was left)"""
+
+    batches: int = 0
+    orders_cancelled: int = 0
+    holds_released: int = 0
+    units_released: int = 0
+    restocked_keys: List[Tuple[int, int]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["restocked_keys"] = len(self.restocked_keys)
+        return data
+
+
+class InventoryHoldSweeper:
+    """Periodically releases expired holds of unpaid orders"""
+
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        interval_seconds: Optional[int] = None,
+    ):
+        self._error_handler = ErrorHandler(__name__)
+        self.batch_size = batch_size or settings.INVENTORY_HOLD_SWEEP_BATCH_SIZE
+        self.interval_seconds = (
+            interval_seconds or settings.INVENTORY_HOLD_SWEEP_INTERVAL_SECONDS
+        )
+        self.last_metrics: Dict[str, int] = {}
+        self.total_orders_cancelled = 0
+        self.total_units_released = 0
+        self._task: Optional[asyncio.Task] = None
+
+    async def sweep_once(self) -> HoldSweepResult:
+        """Release expired holds batch by batch until none are left."""
+        result = HoldSweepResult()
+        while True:
+            async with AsyncSessionLocal() as session:
+                async with session.begin():
+                    row = (
+                        await session.execute(
+                            SWEEP_EXPIRED_HOLDS_SQL,
+                            {
+                                "pending": OrderStatus.PENDING.value,
+                                "cancelled": OrderStatus.CANCELLED.value,
+                                "batch_size": self.batch_size,
+                            },
+                        )
+                    ).one()
+
+            if not row.orders_cancelled:
+                break
+
+            keys = list(
+                zip(row.restocked_product_ids or [], row.restocked_store_ids or [])
+            )
+
+            result.batches += 1
+            result.orders_cancelled += row.orders_cancelled
+            result.holds_released += row.holds_released
+            result.units_released += int(row.units_released)
+            result.restocked_keys.extend(keys)
+
+            if row.orders_cancelled < self.batch_size:
+                break
+
+        self.total_orders_cancelled += result.orders_cancelled
+        self.total_units_released += result.units_released
+        return result
+
+    async def get_hold_metrics(self) -> Dict[str, int]:
+        """Held vs. sellable units across all stores, plus hold record counts."""
+        async with AsyncSessionLocal() as session:
+            row = (await session.execute(HOLD_METRICS_SQL)).one()
+        self.last_metrics = {key: int(value) for key, value in row._mapping.items()}
+        return self.last_metrics
+
+    async def run_forever(self) -> None:
+        """Sweep every interval until cancelled; errors are logged, not raised."""
+        while True:
+            try:
+                result = await self.sweep_once()
+                metrics = await self.get_hold_metrics()
+                if result.orders_cancelled:
+                    self._error_handler.logger.info(
+                        f"Hold sweep released expired holds | {result.to_dict()}"
+                    )
+                self._error_handler.logger.info(
+                    "Inventory holds | "
+                    f"held {metrics['held_units']} | "
+                    f"sellable {metrics['sellable_units']} | "
+                    f"reserved {metrics['reserved_units']} | "
+                    f"active holds {metrics['active_holds']} | "
+                    f"expired holds {metrics['expired_holds']}"
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._error_handler.logger.error(f"Inventory hold sweep failed: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run_forever())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# Global sweeper instance, started from the application lifespan
+hold_sweeper = InventoryHoldSweeper()
+
+# Last values read by the sweeper loop; scraping never queries the database
+metrics.gauge(
+    "inventory_hold_units",
+    "Inventory units by hold state, as of the last sweep",
+    ("state",),
+    collect=lambda: {
+        ("held",): hold_sweeper.last_metrics.get("held_units", 0),
+        ("reserved",): hold_sweeper.last_metrics.get("reserved_units", 0),
+        ("sellable",): hold_sweeper.last_metrics.get("sellable_units", 0),
+    },
+)
+metrics.counter(
+    "inventory_hold_sweeper_orders_cancelled_total",
+    "Unpaid orders cancelled by the hold sweeper",
+    collect=lambda: {(): hold_sweeper.total_orders_cancelled},
+)
@@ -1,4 +1,4 @@
-from sqlalchemy import tuple_
+from sqlalchemy import text, tuple_
 from sqlalchemy.future import select
 
 from src.api.inventory.models import (
@@ -6,10 +6,86 @@ from src.api.inventory.models import (
     InventorySchema,
 )
 from src.config.constants import DELIVERY_PRODUCT_ODOO_ID
+from src.config.settings import settings
 from src.database.models.inventory import Inventory
 from src.shared.error_handler import ErrorHandler, handle_service_errors
 from src.shared.exceptions import ResourceNotFoundException, ValidationException
 
+# Locks the requested rows in id order (deadlock-free across concurrent
+# multi-item orders), then decrements them in one UPDATE. Rows that lack
+# sellable stock are left untouched and missing from RETURNING. When an
+# order id is given, the hold records are written by the same statement.
+PLACE_HOLDS_SQL = text(
+    """
+    WITH requested AS (
+        SELECT *
+        FROM unnest(
+            CAST(:product_ids AS INTEGER[]),
+            CAST(:store_ids AS INTEGER[]),
+            CAST(:quantities AS INTEGER[])
+        ) AS r(product_id, store_id, quantity)
+    ),
+    locked AS (
+        SELECT i.id, r.quantity
+        FROM inventory i
+        JOIN requested r
+          ON i.product_id = r.product_id AND i.store_id = r.store_id
+        ORDER BY i.id
+        FOR UPDATE OF i
+    ),
+    placed AS (
+        UPDATE inventory AS inv
+        SET quantity_available = inv.quantity_available - l.quantity,
+            quantity_on_hold = inv.quantity_on_hold + l.quantity,
+            updated_at = NOW()
+        FROM locked l
+        WHERE inv.id = l.id
+          AND inv.quantity_available - inv.safety_stock >= l.quantity
+        RETURNING inv.id, inv.product_id, inv.store_id, inv.quantity_available,
+                  inv.quantity_reserved, inv.quantity_on_hold, inv.safety_stock,
+                  inv.updated_at, l.quantity AS held_quantity
+    ),
+    recorded AS (
+        INSERT INTO inventory_holds
+            (order_id, product_id, store_id, quantity, expires_at)
+        SELECT CAST(:order_id AS INTEGER), p.product_id, p.store_id,
+               p.held_quantity,
+               NOW() + CAST(:ttl_seconds AS INTEGER) * INTERVAL '1 second'
+        FROM placed p
+        WHERE CAST(:order_id AS INTEGER) IS NOT NULL
+    )
+    SELECT id, product_id, store_id, quantity_available, quantity_reserved,
+           quantity_on_hold, safety_stock, updated_at
+    FROM placed
+    """
+)
+
+CLOSE_HOLDS_SQL = text(
+    """
+    UPDATE inventory_holds
+    SET released_at = NOW(), release_reason = :reason
+    WHERE order_id = :order_id AND released_at IS NULL
+    """
+)
+
+
+def merge_hold_requests(holds: list[dict]) -> dict[tuple[int, int], int]:
+    """
+    Validate hold requests and sum quantities per (product_id, store_id).
+
+    The same product can appear on several cart lines; a set-based UPDATE
+    touches each row once, so the quantities have to be combined first.
+    """
+    requested: dict[tuple[int, int], int] = {}
+    for hold in holds:
+        if hold["quantity"] <= 0:
+            raise ValidationException(
+                f"Quantity must be positive for product {hold['product_id']}"
+            )
+        key = (hold["product_id"], hold["store_id"])
+        requested[key] = requested.get(key, 0) + hold["quantity"]
+    return requested
+
 
 class InventoryTransactionService:
     """Handles inventory stock transactions (holds, reservations, fulfillment)"""
@@ -127,20 +203,31 @@ class InventoryTransactionService:
         return await self.adjust_inventory_stock(adjustment, session)
 
     async def place_holds_bulk(
-        self, holds: list[dict], session
+        self,
+        holds: list[dict],
+        session,
+        order_id: int | None = None,
+        hold_ttl_seconds: int | None = None,
     ) -> list[InventorySchema]:
         """
-        Place multiple inventory holds in a single optimized operation.
+        Place multiple inventory holds in a single atomic statement.
 
         Args:
             holds: List of dicts with keys: product_id, store_id, quantity
             session: Database session
+            order_id: Pending order owning the holds; when given, expiring
+                hold records are written so the hold sweeper can release them
+            hold_ttl_seconds: Hold lifetime, defaults to
+                settings.INVENTORY_HOLD_TTL_MINUTES
 
         Returns:
             List of updated inventory records
 
-        This method locks all required inventory rows in deterministic order
-        to prevent deadlocks, validates all holds, then applies all updates.
+        All rows are locked in id order and decremented by one set-based
+        UPDATE guarded by ``quantity_available - safety_stock >= quantity``.
+        Either every hold is placed or a ValidationException /
+        ResourceNotFoundException is raised and the caller's transaction
+        must be rolled back (the default for ``session.begin()`` blocks).
         """
         if not holds:
             return []
@@ -153,60 +240,64 @@ class InventoryTransactionService:
         if not holds:
             return []
 
-        # Validate all quantities first
-        for hold in holds:
-            if hold["quantity"] <= 0:
-                raise ValidationException(
-                    f"Quantity must be positive for product {hold['product_id']}"
-                )
-
-        # Build unique (product_id, store_id) pairs for the query
-        inventory_keys = list(set((h["product_id"], h["store_id"]) for h in holds))
+        requested = merge_hold_requests(holds)
+        product_ids = [key[0] for key in requested]
+        store_ids = [key[1] for key in requested]
+        quantities = list(requested.values())
 
-        # Lock and fetch all required inventory rows at once
         result = await session.execute(
-            select(Inventory)
-            .filter(
-                tuple_(Inventory.product_id, Inventory.store_id).in_(inventory_keys)
-            )
-            .with_for_update()
+            PLACE_HOLDS_SQL,
+            {
+                "product_ids": product_ids,
+                "store_ids": store_ids,
+                "quantities": quantities,
+                "order_id": order_id,
+                "ttl_seconds": hold_ttl_seconds
+                if hold_ttl_seconds is not None
+                else settings.INVENTORY_HOLD_TTL_MINUTES * 60,
+            },
         )
-        inventory_items = result.scalars().all()
-        inventory_records = {(i.product_id, i.store_id): i for i in inventory_items}
+        rows = result.mappings().all()
 
-        # Check if all inventory records were found
-        if len(inventory_records) != len(inventory_keys):
-            found_keys = set(inventory_records.keys())
-            missing_keys = [key for key in inventory_keys if key not in found_keys]
-            raise ResourceNotFoundException(
-                f"Inventory not found for the following (product, store) pairs: {missing_keys}"
+        if len(rows) != len(requested):
+            placed = {(row["product_id"], row["store_id"]) for row in rows}
+            await self._raise_hold_failure(
+                {key: qty for key, qty in requested.items() if key not in placed},
+                session,
             )
 
-        # Validate all holds before applying any changes
-        for hold in holds:
-            key = (hold["product_id"], hold["store_id"])
-            inventory = inventory_records[key]
-
-            new_available = inventory.quantity_available - hold["quantity"]
-
-            if new_available < 0:
-                raise ValidationException(
-                    f"Insufficient stock for product {hold['product_id']} at store {hold['store_id']}. "
-                    f"Available: {inventory.quantity_available}, Requested: {hold['quantity']}"
-                )
+        return [InventorySchema.model_validate(dict(row)) for row in rows]
 
-        # Apply all changes
-        results = []
-        for hold in holds:
-            key = (hold["product_id"], hold["store_id"])
-            inventory = inventory_records[key]
+    async def close_holds(self, order_id: int, reason: str, session) -> None:
+        """Mark an order's active hold records as released (stock untouched)."""
+        await session.execute(CLOSE_HOLDS_SQL, {"order_id": order_id, "reason": reason})
 
-            inventory.quantity_available -= hold["quantity"]
-            inventory.quantity_on_hold += hold["quantity"]
+    async def _raise_hold_failure(
+        self, failed: dict[tuple[int, int], int], session
+    ) -> None:
+        """Explain why a set-based hold placement did not cover every row."""
+        result = await session.execute(
+            select(Inventory).filter(
+                tuple_(Inventory.product_id, Inventory.store_id).in_(list(failed))
+            )
+        )
+        inventory_records = {
+            (i.product_id, i.store_id): i for i in result.scalars().all()
+        }
 
-            results.append(InventorySchema.model_validate(inventory))
+        missing_keys = [key for key in failed if key not in inventory_records]
+        if missing_keys:
+            raise ResourceNotFoundException(
+                f"Inventory not found for the following (product, store) pairs: {missing_keys}"
+            )
 
-        return results
+        (product_id, store_id), quantity = next(iter(failed.items()))
+        inventory = inventory_records[(product_id, store_id)]
+        raise ValidationException(
+            f"Insufficient stock for product {product_id} at store {store_id}. "
+            f"Available: {max(0, inventory.quantity_available - inventory.safety_stock)}, "
+            f"Requested: {quantity}"
+        )
 
     async def release_holds_bulk(
         self, holds: list[dict], session
@@ -0,0 +1,48 @@
+import hmac
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Request, Security
+from fastapi.responses import PlainTextResponse
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from src.config.settings import settings
+from src.shared.exceptions import UnauthorizedException
+from src.shared.metrics import metrics
+
+metrics_router = APIRouter(tags=["Metrics"])
+
+metrics_security = HTTPBearer(auto_error=False)
+
+
+async def verify_scraper(
+    request: Request,
+    credentials: Optional[HTTPAuthorizationCredentials] = Security(metrics_security),
+) -> None:
+    """Admit scrapes with the METRICS_TOKEN bearer token or from METRICS_ALLOWED_IPS"""
+    token = settings.METRICS_TOKEN
+    if (
+        token
+        and credentials is not None
+        and hmac.compare_digest(credentials.credentials.encode(), token.encode())
+    ):
+        return
+    if (
+        request.client is not None
+        and request.client.host in settings.METRICS_ALLOWED_IPS
+    ):
+        return
+    raise UnauthorizedException(detail="Metrics scrape requires a valid bearer token")
+
+
+@metrics_router.get(
+    "/metrics",
+    summary="Prometheus scrape endpoint",
+    response_class=PlainTextResponse,
+    include_in_schema=False,
+    dependencies=[Depends(verify_scraper)],
+)
+async def scrape_metrics():
+    """Process metrics in the Prometheus text exposition format."""
+    return PlainTextResponse(
+        metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
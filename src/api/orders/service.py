@@ -38,6 +38,7 @@ from src.config.constants import (
 )
 from src.database.connection import AsyncSessionLocal
 from src.database.models.cart import Cart
+from src.database.models.inventory_hold import InventoryHold
 from src.database.models.order import Order, OrderItem
 from src.database.models.product import Product
 from src.database.models.user import User
@@ -45,6 +46,13 @@ from src.database.models.rider import RiderProfile
 from src.integrations.odoo.order_sync import OdooOrderSync
 from src.shared.error_handler import ErrorHandler, handle_service_errors
 from src.shared.exceptions import ResourceNotFoundException, ValidationException
+from src.shared.metrics import metrics
+
+LATE_PAYMENTS = metrics.counter(
+    "orders_paid_after_hold_expiry_total",
+    "Orders paid after the hold sweeper cancelled them, by outcome",
+    ("outcome",),
+)
 
 
 class OrderService:
@@ -128,7 +136,9 @@ class OrderService:
                 session.add_all(order_items_to_create)
 
                 # 4. Place inventory holds
-                await self.inventory_service.place_holds_bulk(holds_to_place, session)
+                await self.inventory_service.place_holds_bulk(
+                    holds_to_place, session, order_id=new_order.id
+                )
 
                 # 5. Update cart statuses
                 await session.execute(
@@ -711,18 +721,9 @@ class OrderService:
                 total_amount = Decimal(0)
                 order_items_to_create = []
 
-                # 2. Place holds on inventory for each item
                 for item_data in order_data.items:
                     product = product_map[item_data.product_id]
 
-                    # Place hold - this will raise an error if stock is insufficient
-                    await self.inventory_service.place_hold(
-                        product_id=item_data.product_id,
-                        store_id=order_data.store_id,
-                        quantity=item_data.quantity,
-                        session=session,
-                    )
-
                     unit_price = Decimal(str(product.base_price))
                     total_price = unit_price * item_data.quantity
                     total_amount += total_price
@@ -736,7 +737,7 @@ class OrderService:
                         )
                     )
 
-                # 3. Create the order
+                # 2. Create the order
                 new_order = Order(
                     user_id=user_id,
                     store_id=order_data.store_id,
@@ -751,6 +752,22 @@ class OrderService:
                 session.add(new_order)
                 await session.flush()
 
+                # 3. Place holds on inventory for all items in one statement -
+                # this will raise (rolling back the order) if any item lacks
+                # sellable stock
+                await self.inventory_service.place_holds_bulk(
+                    [
+                        {
+                            "product_id": item_data.product_id,
+                            "store_id": order_data.store_id,
+                            "quantity": item_data.quantity,
+                        }
+                        for item_data in order_data.items
+                    ],
+                    session,
+                    order_id=new_order.id,
+                )
+
                 # Re-query with eager loading of items
                 result = await session.execute(
                     select(Order)
@@ -788,6 +805,8 @@ class OrderService:
                         selectinload(Order.rider),
                     )
                     .filter(Order.id == order_id)
+                    # Lock the order so the hold sweeper skips it mid-transition
+                    .with_for_update(of=Order)
                 )
                 order = result.scalars().first()
 
@@ -854,6 +873,9 @@ class OrderService:
                             quantity=item.quantity,
                             session=session,
                         )
+                    await self.inventory_service.close_holds(
+                        order.id, "confirmed", session
+                    )
 
                 elif new_status == OrderStatus.PROCESSING.value:
                     if current_status != OrderStatus.CONFIRMED.value:
@@ -923,6 +945,9 @@ class OrderService:
                                 quantity=item.quantity,
                                 session=session,
                             )
+                        await self.inventory_service.close_holds(
+                            order.id, "cancelled", session
+                        )
                     elif current_status in [
                         OrderStatus.CONFIRMED.value,
                         OrderStatus.PROCESSING.value,
@@ -995,6 +1020,12 @@ class OrderService:
         confirmed_ids = []
         # Update each order status
         for order in orders:
+            if order.status == OrderStatus.CANCELLED.value:
+                # Paid after the hold sweeper cancelled it for non-payment
+                if not await self._reopen_expired_order(order.id):
+                    continue
+                order.status = OrderStatus.PENDING.value
+
             if order.status == OrderStatus.PENDING.value:
                 try:
                     await self.update_order_status(
@@ -1040,6 +1071,69 @@ class OrderService:
 
         return confirmed_ids
 
+    async def _reopen_expired_order(self, order_id: int) -> bool:
+        """
+        Return an order cancelled by the hold sweeper to PENDING with fresh holds.
+
+        Only orders whose holds were released as expired are reopened; an
+        order the customer or an admin cancelled stays cancelled. When the
+        stock was sold in the meantime the order stays cancelled and is
+        logged and counted as paid without stock, so it can be refunded.
+        """
+        async with AsyncSessionLocal() as session:
+            try:
+                async with session.begin():
+                    result = await session.execute(
+                        select(Order)
+                        .options(selectinload(Order.items))
+                        .filter(
+                            Order.id == order_id,
+                            Order.status == OrderStatus.CANCELLED.value,
+                        )
+                        .with_for_update(of=Order)
+                    )
+                    order = result.scalars().first()
+                    if order is None:
+                        return False
+
+                    expired = await session.execute(
+                        select(InventoryHold.id)
+                        .filter(
+                            InventoryHold.order_id == order_id,
+                            InventoryHold.release_reason == "expired",
+                        )
+                        .limit(1)
+                    )
+                    if expired.first() is None:
+                        return False
+
+                    await self.inventory_service.place_holds_bulk(
+                        [
+                            {
+                                "product_id": item.product_id,
+                                "store_id": item.store_id,
+                                "quantity": item.quantity,
+                            }
+                            for item in order.items
+                        ],
+                        session,
+                        order_id=order.id,
+                    )
+                    order.status = OrderStatus.PENDING.value
+            except (ValidationException, ResourceNotFoundException) as e:
+                LATE_PAYMENTS.inc(("refund_needed",))
+                self._error_handler.logger.error(
+                    f"Order {order_id} was paid after its holds expired and the "
+                    f"stock is gone; it needs a refund: {e}"
+                )
+                return False
+
+        LATE_PAYMENTS.inc(("reopened",))
+        self._error_handler.logger.info(
+            f"Order {order_id} reopened after a payment arrived past its hold expiry"
+        )
+        return True
+
     @handle_service_errors("assigning rider to order")
     async def assign_rider(self, order_id: int, rider_id: int) -> OrderSchema:
         """Assign a rider to a PACKED order"""
@@ -2,9 +2,11 @@ import logging
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
 
+import numpy as np
 from sqlalchemy import desc
 from sqlalchemy.future import select
 
+from src.api.search.semantic import semantic_index
 from src.config.constants import (
     INTERACTION_DECAY_DAYS,
     MAX_USER_INTERACTIONS,
@@ -181,10 +183,60 @@ class PersonalizationService:
         self, interactions: List, session
     ) -> Optional[List[float]]:
         """
-        Calculates user interest vector.
-        (Disabled for Vercel deployment to remove numpy dependency)
+        Calculate the user interest vector.
+
+        The interaction-score weighted sum of the interacted products' vectors
+        in the semantic index, normalized to unit length.
+
+        Args:
+            interactions: List of interactions
+            session: Database session
+
+        Returns:
+            Interest vector, or None if no interacted product is indexed
         """
-        return None
+        try:
+            weights: Dict[int, float] = {}
+            for interaction in interactions:
+                weights[interaction.product_id] = weights.get(
+                    interaction.product_id, 0.0
+                ) + float(interaction.interaction_score or 0)
+
+            index = await semantic_index.get()
+            product_ids, vectors = index.vectors_for(list(weights))
+            if not product_ids:
+                return None
+
+            interest = (
+                np.asarray([weights[pid] for pid in product_ids], dtype=np.float32)
+                @ vectors
+            )
+            norm = float(np.linalg.norm(interest))
+            if norm == 0:
+                return None
+            return [round(float(x), 5) for x in interest / norm]
+
+        except Exception as e:
+            self.logger.error(f"Error calculating interest vector: {e}", exc_info=True)
+            return None
+
+    async def _vector_similarities(
+        self, interest_vector: Optional[List[float]], product_ids: List[int]
+    ) -> Dict[int, float]:
+        """Cosine similarity of each indexed product to the interest vector"""
+        if not interest_vector:
+            return {}
+        try:
+            index = await semantic_index.get()
+            # Vectors from an index of another dimension are stale
+            if len(interest_vector) != index.dim:
+                return {}
+            found, vectors = index.vectors_for(product_ids)
+            similarities = vectors @ np.asarray(interest_vector, dtype=np.float32)
+            return dict(zip(found, similarities.tolist()))
+        except Exception as e:
+            self.logger.error(f"Error scoring interest vector: {e}", exc_info=True)
+            return {}
 
     async def _calculate_category_scores(
         self, interactions: List, session
@@ -411,14 +463,22 @@ class PersonalizationService:
                 )
                 products = result.fetchall()
 
+                vector_scores = await self._vector_similarities(
+                    preferences.interest_vector,  # type: ignore[arg-type]
+                    [product.id for product in products],
+                )
+
                 scores = {}
 
                 for product in products:
                     score = 0.0
                     components = 0
 
-                    # 1. Vector similarity (semantic) - DISABLED for Vercel
-                    # (Removes numpy/pytorch dependency)
+                    # 1. Vector similarity (semantic)
+                    if product.id in vector_scores:
+                        vector_score = max(vector_scores[product.id], 0.0)
+                        score += vector_score * PERSONALIZATION_VECTOR_WEIGHT
+                        components += 1
 
                     # 2. Category affinity
                     if preferences.category_scores and product.category_ids:
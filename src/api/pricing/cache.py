@@ -3,7 +3,7 @@ Pricing-specific cache operations
 """
 
 import hashlib
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from src.api.pricing.models import PriceListLineSchema, PriceListSchema
 from src.config.cache_config import cache_config
@@ -113,7 +113,7 @@ class PricingCache:
         """Get cached price lists"""
         key = self.get_price_lists_key(active_only)
         cached_data = self.cache.get(key)
-        if cached_data:
+        if cached_data is not None:
             return [PriceListSchema(**item) for item in cached_data]
         return None
 
@@ -133,7 +133,7 @@ class PricingCache:
         """Get cached price list lines"""
         key = self.get_price_list_lines_key(price_list_id)
         cached_data = self.cache.get(key)
-        if cached_data:
+        if cached_data is not None:
             return [PriceListLineSchema(**item) for item in cached_data]
         return None
 
@@ -181,13 +181,13 @@ class PricingCache:
 
         if price_list_id:
             # Invalidate specific price list lines
-            lines_pattern = f"{self.prefix}_lines:{price_list_id}*"
-            deleted += self.cache.delete_pattern(lines_pattern)
+            deleted += self.cache.delete(self.get_price_list_lines_key(price_list_id))
         else:
-            # Invalidate all price list related caches
-            deleted += self.cache.delete_pattern(f"{self.prefix}_lists:*")
             deleted += self.cache.delete_pattern(f"{self.prefix}_lines:*")
 
+        # The cached price list views hold every list's fields
+        deleted += self.cache.delete_pattern(f"{self.prefix}_lists:*")
+
         # Always invalidate pricing calculations when price lists change
         deleted += self.cache.delete_pattern(f"{self.prefix}_product:*")
         deleted += self.cache.delete_pattern(f"{self.prefix}_bulk:*")
@@ -199,6 +199,36 @@ class PricingCache:
 
         return deleted
 
+    def invalidate_product_pricing(self, product_ids: Iterable[int]) -> int:
+        """Invalidate computed prices of specific products"""
+        wanted = set(product_ids)
+        if not wanted:
+            return 0
+
+        product_prefix = f"{self.prefix}_product:"
+        wanted_ids = {str(product_id) for product_id in wanted}
+
+        # One pass over the pricing keys; bulk keys hash the product set, so
+        # those are matched on the cached rows instead
+        stale = []
+        for key, value, _ in self.cache.entries(
+            [product_prefix, f"{self.prefix}_bulk:"]
+        ):
+            if key.startswith(product_prefix):
+                if key[len(product_prefix) :].split(":", 1)[0] in wanted_ids:
+                    stale.append(key)
+            elif any(row.get("product_id") in wanted for row in value):
+                stale.append(key)
+
+        deleted = sum(1 for key in stale if self.cache.delete(key))
+
+        if deleted > 0:
+            logger.info(
+                f"Invalidated {deleted} pricing cache keys for {len(wanted)} products"
+            )
+
+        return deleted
+
 
 # Global pricing cache instance
 pricing_cache = PricingCache()
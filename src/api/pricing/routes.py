@@ -2,6 +2,7 @@ from typing import List, Optional, Union
 
 from fastapi import APIRouter, HTTPException, status
 
+from src.api.pricing.cache import pricing_cache
 from src.api.pricing.models import (
     CreatePriceListLineSchema,
     CreatePriceListSchema,
@@ -11,12 +12,20 @@ from src.api.pricing.models import (
     UpdatePriceListSchema,
 )
 from src.api.pricing.service import PricingService
+from src.shared.cache_warmup import cache_warmup
 from src.shared.exceptions import ResourceNotFoundException
 from src.shared.responses import success_response
 
 pricing_router = APIRouter(prefix="/pricing", tags=["Pricing"])
 pricing_service = PricingService()
 
+cache_warmup.register(
+    "price_lists",
+    pricing_service.preload_active_price_lists,
+    cache_prefixes=(f"{pricing_cache.prefix}_lists:", f"{pricing_cache.prefix}_lines:"),
+    tables=("price_lists", "price_list_lines"),
+)
+
 
 # Price List Management (Admin Only)
 @pricing_router.get(
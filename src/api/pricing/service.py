@@ -8,6 +8,7 @@ from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
 from src.api.pricing.cache import pricing_cache
+from src.api.tiers.cache import tiers_cache
 from src.api.pricing.models import (
     CreatePriceListLineSchema,
     CreatePriceListSchema,
@@ -106,20 +107,48 @@ class PricingService:
     async def get_all_price_lists(
         self, active_only: bool = False
     ) -> List[PriceListSchema]:
-        """Get all price lists"""
+        """Get all price lists, cached in pricing_cache"""
+        cached = pricing_cache.get_price_lists(active_only)
+        if cached is not None:
+            return cached
+
         async with AsyncSessionLocal() as session:
-            query = (
-                select(PriceList)
-                .options(selectinload(PriceList.lines))
-                .order_by(PriceList.priority.desc())
-            )
+            query = select(PriceList).order_by(PriceList.priority.desc())
             if active_only:
                 query = query.where(PriceList.is_active)
 
             result = await session.execute(query)
             price_lists = result.scalars().all()
 
-            return [await self._price_list_to_schema(pl) for pl in price_lists]
+            schemas = [await self._price_list_to_schema(pl) for pl in price_lists]
+
+        pricing_cache.set_price_lists(schemas, active_only)
+        return schemas
+
+    async def preload_active_price_lists(self) -> int:
+        """Cache the active price lists and their lines; returns the line count"""
+        price_lists = await self.get_all_price_lists(active_only=True)
+        price_list_ids = [pl.id for pl in price_lists if pl.id is not None]
+        if not price_list_ids:
+            return 0
+
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                select(PriceListLine)
+                .where(PriceListLine.price_list_id.in_(price_list_ids))
+                .order_by(PriceListLine.id)
+            )
+            lines_by_list: Dict[int, List[PriceListLineSchema]] = {
+                price_list_id: [] for price_list_id in price_list_ids
+            }
+            for line in result.scalars().all():
+                lines_by_list[line.price_list_id].append(
+                    await self._price_list_line_to_schema(line)
+                )
+
+        for price_list_id, lines in lines_by_list.items():
+            pricing_cache.set_price_list_lines(str(price_list_id), lines)
+        return sum(len(lines) for lines in lines_by_list.values())
 
     async def update_price_list(
         self, price_list_id: int, price_list_data: UpdatePriceListSchema
@@ -143,6 +172,8 @@ class PricingService:
 
             # Invalidate cache when price list is updated
             pricing_cache.invalidate_price_list_cache(str(price_list_id))
+            # Cached tiers embed their price lists
+            tiers_cache.invalidate_tier_cache()
 
             return await self._price_list_to_schema(price_list)
 
@@ -162,6 +193,8 @@ class PricingService:
 
             # Invalidate cache when price list is deleted
             pricing_cache.invalidate_price_list_cache(str(price_list_id))
+            # Cached tiers embed their price lists
+            tiers_cache.invalidate_tier_cache()
 
             return True
 
@@ -244,16 +277,23 @@ class PricingService:
     async def get_price_list_lines(
         self, price_list_id: int
     ) -> List[PriceListLineSchema]:
-        """Get all lines for a price list"""
+        """Get all lines for a price list, cached in pricing_cache"""
+        cached = pricing_cache.get_price_list_lines(str(price_list_id))
+        if cached is not None:
+            return cached
+
         async with AsyncSessionLocal() as session:
             result = await session.execute(
-                select(PriceListLine).where(
-                    PriceListLine.price_list_id == price_list_id
-                )
+                select(PriceListLine)
+                .where(PriceListLine.price_list_id == price_list_id)
+                .order_by(PriceListLine.id)
             )
             lines = result.scalars().all()
 
-            return [await self._price_list_line_to_schema(line) for line in lines]
+            schemas = [await self._price_list_line_to_schema(line) for line in lines]
+
+        pricing_cache.set_price_list_lines(str(price_list_id), schemas)
+        return schemas
 
     async def update_price_list_line(
         self, line_id: int, line_data: UpdatePriceListLineSchema
@@ -381,6 +421,8 @@ class PricingService:
 
                 # Invalidate cache when tier-price list association is added
                 pricing_cache.invalidate_price_list_cache(str(price_list_id))
+                # Cached tiers embed their price lists
+                tiers_cache.invalidate_tier_cache()
 
                 return True
 
@@ -424,6 +466,8 @@ class PricingService:
 
             # Invalidate cache when tier-price list association is removed
             pricing_cache.invalidate_price_list_cache(str(price_list_id))
+            # Cached tiers embed their price lists
+            tiers_cache.invalidate_tier_cache()
 
             return True
 
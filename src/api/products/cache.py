@@ -2,7 +2,7 @@
 Products-specific cache operations
 """
 
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from src.config.cache_config import cache_config
 from src.shared.cache_invalidation import cache_invalidation_manager
@@ -31,6 +31,22 @@ class ProductsCache:
         """Generate cache key for the delivery product"""
         return self.cache.generate_key(self.prefix, "delivery_product")
 
+    def get_popular_key(
+        self,
+        mode: str,
+        time_window_days: Optional[int],
+        category_ids: Optional[List[int]],
+        min_interactions: int,
+    ) -> str:
+        """Generate cache key for a popular products ranking"""
+        return self.cache.generate_key(
+            f"{self.prefix}:popular",
+            mode,
+            time_window_days,
+            sorted(category_ids) if category_ids else None,
+            min_interactions,
+        )
+
     # Cache operations with domain-specific TTL
     def get_product(self, product_id: str) -> Optional[dict]:
         """Get cached product data"""
@@ -54,6 +70,15 @@ class ProductsCache:
         ttl = cache_config.get_ttl("static")
         return self.cache.set(key, product_data, ttl_seconds=ttl)
 
+    def get_popular(self, key: str) -> Optional[List[Tuple[int, dict]]]:
+        """Get a cached popular products ranking"""
+        return self.cache.get(key)
+
+    def set_popular(self, key: str, ranking: List[Tuple[int, dict]]) -> bool:
+        """Cache a popular products ranking with the popularity TTL"""
+        ttl = cache_config.get_ttl("popularity")
+        return self.cache.set(key, ranking, ttl_seconds=ttl)
+
     # Cache invalidation methods
     def invalidate_product_cache(self, product_id: Optional[str] = None) -> int:
         """Invalidate cache for specific product or all products"""
@@ -76,6 +101,10 @@ class ProductsCache:
 
         return deleted
 
+    def invalidate_popular_cache(self) -> int:
+        """Invalidate every cached popular products ranking"""
+        return self.cache.delete_pattern(f"{self.prefix}:popular:*")
+
 
 # Global products cache instance
 products_cache = ProductsCache()
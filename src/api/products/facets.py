@@ -0,0 +1,134 @@
+"""
+Facet counts for product listings and search results
+
+All facets of a result set come from one statement: the matching products
+are materialized once, the single-valued facets (brand, ecommerce category,
+price bucket) are counted with one GROUPING SETS aggregate over them, and
+the many-to-many facets (categories, tag type:value) are counted by joining
+the same rows to their association tables. Price buckets use the final
+price of the caller's tier when pricing CTEs are supplied.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.config.constants import FACET_PRICE_BUCKET_EDGES
+
+
+def build_facet_sql(
+    where_conditions: Sequence[str],
+    params: Dict[str, Any],
+    pricing_components: Optional[Dict[str, Any]] = None,
+    price_edges: Sequence[float] = FACET_PRICE_BUCKET_EDGES,
+) -> Tuple[str, Dict[str, Any]]:
+    """Facet query over the products matching where_conditions
+
+    where_conditions and params are what the listing or search query would
+    use; pricing_components come from PricingService.get_pricing_sql_components.
+    """
+    params = {**params, "facet_price_edges": list(price_edges)}
+    ctes = []
+    joins = []
+    final_price = "p.base_price"
+    if pricing_components:
+        ctes.extend(pricing_components["ctes"])
+        joins.extend(pricing_components["joins"])
+        params.update(pricing_components["params"])
+        final_price = "COALESCE(pricing.final_price, p.base_price)"
+
+    where_clause = f"WHERE {' AND '.join(where_conditions)}" if where_conditions else ""
+    ctes.append(
+        f"""
+        matched AS MATERIALIZED (
+            SELECT
+                p.id,
+                p.brand,
+                p.ecommerce_category_id,
+                WIDTH_BUCKET({final_price}, CAST(:facet_price_edges AS numeric[])) AS price_bucket
+            FROM products p
+            {" ".join(joins)}
+            {where_clause}
+        )
+        """
+    )
+
+    sql = f"""
+    WITH {", ".join(ctes)}
+    SELECT
+        CASE
+            WHEN GROUPING(m.brand) = 0 THEN 'brand'
+            WHEN GROUPING(m.ecommerce_category_id) = 0 THEN 'ecommerce_category'
+            ELSE 'price'
+        END AS facet,
+        CASE
+            WHEN GROUPING(m.brand) = 0 THEN m.brand
+            WHEN GROUPING(m.ecommerce_category_id) = 0 THEN m.ecommerce_category_id::text
+            ELSE m.price_bucket::text
+        END AS value,
+        NULL AS tag_type,
+        COUNT(*) AS count
+    FROM matched m
+    GROUP BY GROUPING SETS ((m.brand), (m.ecommerce_category_id), (m.price_bucket))
+    UNION ALL
+    SELECT 'category', pc.category_id::text, NULL, COUNT(*)
+    FROM matched m
+    JOIN product_categories pc ON pc.product_id = m.id
+    GROUP BY pc.category_id
+    UNION ALL
+    SELECT 'tag', pt.value, t.tag_type, COUNT(DISTINCT m.id)
+    FROM matched m
+    JOIN product_tags pt ON pt.product_id = m.id
+    JOIN tags t ON t.id = pt.tag_id
+    GROUP BY t.tag_type, pt.value
+    """
+    return sql, params
+
+
+def price_bucket_range(
+    bucket: int, price_edges: Sequence[float] = FACET_PRICE_BUCKET_EDGES
+) -> Tuple[float, Optional[float]]:
+    """[min, max) of a WIDTH_BUCKET result; max is None for the last bucket"""
+    lower = 0.0 if bucket == 0 else float(price_edges[bucket - 1])
+    upper = float(price_edges[bucket]) if bucket < len(price_edges) else None
+    return lower, upper
+
+
+def decode_facet_rows(
+    rows: Sequence[Any], price_edges: Sequence[float] = FACET_PRICE_BUCKET_EDGES
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Facet rows to the response shape, each facet sorted by count"""
+    facets: Dict[str, List[Dict[str, Any]]] = {
+        "categories": [],
+        "ecommerce_categories": [],
+        "brands": [],
+        "tags": [],
+        "price": [],
+    }
+    for row in rows:
+        if row.facet == "category":
+            facets["categories"].append({"id": int(row.value), "count": row.count})
+        elif row.facet == "tag":
+            facets["tags"].append(
+                {"tag_type": row.tag_type, "value": row.value, "count": row.count}
+            )
+        elif row.value is None:
+            # Products without a brand or ecommerce category; prices are never null
+            continue
+        elif row.facet == "brand":
+            facets["brands"].append({"value": row.value, "count": row.count})
+        elif row.facet == "ecommerce_category":
+            facets["ecommerce_categories"].append(
+                {"id": int(row.value), "count": row.count}
+            )
+        else:
+            lower, upper = price_bucket_range(int(row.value), price_edges)
+            facets["price"].append({"min": lower, "max": upper, "count": row.count})
+
+    # Row order from the aggregate is arbitrary; keep cached responses stable
+    facets["categories"].sort(key=lambda f: (-f["count"], f["id"]))
+    facets["ecommerce_categories"].sort(key=lambda f: (-f["count"], f["id"]))
+    facets["brands"].sort(key=lambda f: (-f["count"], f["value"]))
+    facets["tags"].sort(
+        key=lambda f: (-f["count"], f["tag_type"] or "", f["value"] or "")
+    )
+    facets["price"].sort(key=lambda f: f["min"])
+    return facets
@@ -0,0 +1,197 @@
+"""
+In-process inverted index for product category and tag filters
+
+Listing filters become ``p.id IN (SELECT ...)`` subqueries over
+product_categories and product_tags, one per facet. The index maps each
+category id, tag id and (tag id, association value) to the sorted ids of
+the products carrying it, so a filter expression is evaluated in memory and
+narrows those subqueries to a ``p.id = ANY(:ids)`` list, usually just the
+next page. The subqueries stay the source of truth: another instance may
+have written since this index was built, and a page that comes back short
+is re-read from the subqueries alone (see ProductQueryService).
+
+Posting lists are sorted ``array("q")`` rather than sets: 8 bytes per entry
+instead of a boxed int in a hash table, and intersections gallop through
+the longer list with bisect.
+
+Tag expressions keep the SQL semantics: the terms of an AND group must hold
+for the same product tag row, groups are ORed, and the result is ANDed with
+the category filter.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import text
+
+from src.config.cache_config import CacheConfig
+from src.config.constants import Collections
+from src.database.connection import AsyncSessionLocal
+from src.shared.cache_invalidation import cache_invalidation_manager
+from src.shared.snapshot import SnapshotIndex
+
+PostingList = array  # sorted, unique product ids
+
+_EMPTY = array("q")
+
+
+def _posting_list(product_ids: Iterable[int]) -> PostingList:
+    return array("q", sorted(set(product_ids)))
+
+
+def union(lists: Iterable[PostingList]) -> PostingList:
+    lists = [posting for posting in lists if posting]
+    if not lists:
+        return _EMPTY
+    if len(lists) == 1:
+        return lists[0]
+    return _posting_list(product_id for posting in lists for product_id in posting)
+
+
+def intersect(a: PostingList, b: PostingList) -> PostingList:
+    """Galloping intersection: walk the shorter list, bisect into the longer"""
+    if len(a) > len(b):
+        a, b = b, a
+    result = array("q")
+    lo, hi = 0, len(b)
+    for product_id in a:
+        lo = bisect_left(b, product_id, lo, hi)
+        if lo == hi:
+            break
+        if b[lo] == product_id:
+            result.append(product_id)
+            lo += 1
+    return result
+
+
+class ProductFilterIndex:
+    """One immutable snapshot of product category and tag assignments"""
+
+    def __init__(
+        self,
+        category_rows: Iterable[Tuple[int, int]],
+        tag_rows: Iterable[Tuple[int, int, Optional[str], str, str, str]],
+    ):
+        by_category: Dict[int, List[int]] = {}
+        for product_id, category_id in category_rows:
+            by_category.setdefault(category_id, []).append(product_id)
+
+        by_tag: Dict[int, List[int]] = {}
+        by_tag_value: Dict[Tuple[int, str], List[int]] = {}
+        # Term value -> tag ids, for the tag attribute keys and value
+        self._tag_ids: Dict[str, Dict[Any, Set[int]]] = {
+            "name": {},
+            "slug": {},
+            "type": {},
+            "value": {},
+        }
+        for product_id, tag_id, value, name, slug, tag_type in tag_rows:
+            by_tag.setdefault(tag_id, []).append(product_id)
+            self._tag_ids["name"].setdefault(name, set()).add(tag_id)
+            self._tag_ids["slug"].setdefault(slug, set()).add(tag_id)
+            self._tag_ids["type"].setdefault(tag_type, set()).add(tag_id)
+            if value is not None:
+                by_tag_value.setdefault((tag_id, value), []).append(product_id)
+                self._tag_ids["value"].setdefault(value, set()).add(tag_id)
+
+        self._by_category = {k: _posting_list(v) for k, v in by_category.items()}
+        self._by_tag = {k: _posting_list(v) for k, v in by_tag.items()}
+        self._by_tag_value = {k: _posting_list(v) for k, v in by_tag_value.items()}
+
+    def __len__(self) -> int:
+        return len(self._by_category) + len(self._by_tag) + len(self._by_tag_value)
+
+    def categories(self, category_ids: Iterable[int]) -> PostingList:
+        """Products in any of the categories"""
+        return union(self._by_category.get(c, _EMPTY) for c in category_ids)
+
+    def _tag_group(self, terms: List[Tuple[str, Any]]) -> PostingList:
+        """Products with one tag row satisfying every term"""
+        tag_ids: Optional[Set[int]] = None
+        values = set()
+        for key, term_value in terms:
+            if key == "value":
+                values.add(term_value)
+                matching = self._tag_ids["value"].get(term_value, set())
+            elif key == "id":
+                matching = {term_value} if term_value in self._by_tag else set()
+            else:
+                matching = self._tag_ids[key].get(term_value, set())
+            tag_ids = matching if tag_ids is None else tag_ids & matching
+            if not tag_ids:
+                return _EMPTY
+        if tag_ids is None:
+            return _EMPTY
+
+        # One row holds one value, so two different values never match
+        if len(values) > 1:
+            return _EMPTY
+        if values:
+            (value,) = values
+            return union(self._by_tag_value.get((t, value), _EMPTY) for t in tag_ids)
+        return union(self._by_tag[t] for t in tag_ids)
+
+    def tags(self, groups: List[List[Tuple[str, Any]]]) -> PostingList:
+        """Products matching any group of TagService.parse_tag_expression"""
+        return union(self._tag_group(terms) for terms in groups)
+
+    def match(
+        self,
+        category_ids: Optional[List[int]],
+        tag_groups: Optional[List[List[Tuple[str, Any]]]],
+    ) -> Optional[PostingList]:
+        """Products passing both filters, or None when neither is set"""
+        result = None
+        if category_ids:
+            result = self.categories(category_ids)
+        if tag_groups:
+            tagged = self.tags(tag_groups)
+            result = tagged if result is None else intersect(result, tagged)
+        return result
+
+
+def page_candidates(
+    product_ids: PostingList, cursor: Optional[int], limit: Optional[int] = None
+) -> List[int]:
+    """The ids after cursor, at most limit of them"""
+    start = bisect_right(product_ids, cursor) if cursor is not None else 0
+    end = len(product_ids) if limit is None else start + limit
+    return product_ids[start:end].tolist()
+
+
+async def load_product_filter_index() -> ProductFilterIndex:
+    async with AsyncSessionLocal() as session:
+        categories = await session.execute(
+            text("SELECT product_id, category_id FROM product_categories")
+        )
+        category_rows = categories.tuples().all()
+        tags = await session.execute(
+            text(
+                """
+                SELECT pt.product_id, pt.tag_id, pt.value, t.name, t.slug, t.tag_type
+                FROM product_tags pt
+                JOIN tags t ON t.id = pt.tag_id
+                """
+            )
+        )
+        tag_rows = tags.tuples().all()
+    return ProductFilterIndex(category_rows, tag_rows)
+
+
+product_filter_index = SnapshotIndex(
+    "product filter index",
+    load_product_filter_index,
+    max_age=CacheConfig.PRODUCT_DATA_TTL,
+)
+
+# Product writes (including tag and category assignment) and category deletes
+# change the postings; tag edits are reported by TagService. The hooks only
+# run in the writing process, so max_age bounds how long other instances
+# filter on old postings to the lifetime of a cached listing.
+cache_invalidation_manager.register_invalidation_hook(
+    Collections.PRODUCTS, product_filter_index.invalidate
+)
+cache_invalidation_manager.register_invalidation_hook(
+    Collections.CATEGORIES, product_filter_index.invalidate
+)
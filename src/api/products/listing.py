@@ -0,0 +1,140 @@
+"""
+Pre-encoded product listings
+
+Listing pages are cached as JSON bytes rather than dicts, so a cache hit
+never rebuilds EnhancedProductSchema models. Each cached product is stored
+with its ``inventory`` key stripped and the closing brace cut off; the
+per-request inventory overlay is appended to those bytes when the response
+is written.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import orjson
+from fastapi import Response, status
+
+from src.api.products.models import (
+    EnhancedProductSchema,
+    InventoryInfoSchema,
+    PaginatedProductsResponse,
+    ProductFacetsSchema,
+)
+
+_INVENTORY_KEY = b',"inventory":'
+_NULL = b"null"
+
+
+class ListingProduct:
+    """One product of a cached listing page plus its per-request inventory
+
+    Exposes the attributes the inventory overlay and personalization read
+    (``id``, ``categories``, ``inventory``); everything else stays encoded.
+    Instances are created per request, so setting ``inventory`` never
+    touches the cached entry.
+    """
+
+    __slots__ = ("id", "categories", "head", "inventory")
+
+    def __init__(
+        self,
+        id: Optional[int],
+        categories: Optional[List[Dict[str, Any]]],
+        head: bytes,
+    ):
+        self.id = id
+        self.categories = categories
+        self.head = head
+        self.inventory: Optional[InventoryInfoSchema] = None
+
+    @staticmethod
+    def cache_entry(product: Dict[str, Any]) -> tuple:
+        """Encode a product dict once, for storing in the listing cache
+
+        ``product`` is JSON-ready (see ProductRowProjector.to_dict); any
+        ``inventory`` key is left out since the overlay supplies it.
+        """
+        if "inventory" in product:
+            product = {k: v for k, v in product.items() if k != "inventory"}
+        head = orjson.dumps(product, option=orjson.OPT_UTC_Z)[:-1]
+        return (product["id"], product["categories"], head)
+
+    @classmethod
+    def from_cache_entry(cls, entry: Sequence[Any]) -> "ListingProduct":
+        product_id, categories, head = entry
+        return cls(product_id, categories, head)
+
+    def encode(self) -> bytes:
+        inventory = (
+            self.inventory.model_dump_json().encode()
+            if self.inventory is not None
+            else _NULL
+        )
+        return self.head + _INVENTORY_KEY + inventory + b"}"
+
+    def to_model(self) -> EnhancedProductSchema:
+        return EnhancedProductSchema.model_validate_json(self.encode())
+
+
+class ProductListing:
+    """A listing page of pre-encoded products, with facet counts if requested"""
+
+    __slots__ = ("products", "pagination", "facets")
+
+    def __init__(
+        self,
+        products: List[ListingProduct],
+        pagination: Dict[str, Any],
+        facets: Optional[Dict[str, Any]] = None,
+    ):
+        self.products = products
+        self.pagination = pagination
+        self.facets = facets
+
+    def to_response_model(self) -> PaginatedProductsResponse:
+        return PaginatedProductsResponse(
+            products=[p.to_model() for p in self.products],
+            pagination=self.pagination,
+            facets=(
+                ProductFacetsSchema.model_validate(self.facets)
+                if self.facets is not None
+                else None
+            ),
+        )
+
+    def encode(self) -> bytes:
+        return b"".join(
+            (
+                b'{"products":[',
+                b",".join([p.encode() for p in self.products]),
+                b'],"pagination":',
+                orjson.dumps(self.pagination),
+                b',"facets":',
+                orjson.dumps(self.facets),
+                b"}",
+            )
+        )
+
+
+class ProductListingResponse(Response):
+    """Success envelope around a ProductListing, written without Pydantic"""
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        listing: ProductListing,
+        message: str = "Success",
+        status_code: int = status.HTTP_200_OK,
+    ):
+        body = b"".join(
+            (
+                b'{"statusCode":',
+                str(status_code).encode(),
+                b',"message":',
+                orjson.dumps(message),
+                b',"data":',
+                listing.encode(),
+                b"}",
+            )
+        )
+        super().__init__(content=body, status_code=status_code)
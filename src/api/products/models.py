@@ -153,16 +153,16 @@ class EnhancedProductSchema(BaseModel):
 
     # Enhanced fields
     pricing: Optional[PricingInfoSchema] = Field(
-        None, description="Pricing information with applied discounts"
+        default=None, description="Pricing information with applied discounts"
     )
     inventory: Optional[InventoryInfoSchema] = Field(
-        None, description="Aggregated inventory availability information"
+        default=None, description="Aggregated inventory availability information"
     )
     alternatives: Optional[List["EnhancedProductSchema"]] = Field(
-        None, description="List of alternative products"
+        default=None, description="List of alternative products"
     )
     future_pricing: Optional[List[FuturePricingSchema]] = Field(
-        None, description="Quantity-based pricing tiers for future promotions"
+        default=None, description="Quantity-based pricing tiers for future promotions"
     )
 
     model_config = ConfigDict(from_attributes=True)
@@ -173,10 +173,10 @@ class ProductQuerySchema(BaseModel):
         default=20, le=100, description="Number of products to return (max 100)"
     )
     cursor: Optional[int] = Field(
-        None, description="Cursor for pagination (product ID to start from)"
+        default=None, description="Cursor for pagination (product ID to start from)"
     )
     store_id: Optional[List[int]] = Field(
-        None, description="Store IDs for multi-store inventory data"
+        default=None, description="Store IDs for multi-store inventory data"
     )
     include_pricing: Optional[bool] = Field(
         default=True, description="Whether to include pricing calculations"
@@ -205,22 +205,60 @@ class ProductQuerySchema(BaseModel):
         default=None,
         description="Filter products with available inventory (quantity > safety_stock)",
     )
+    include_facets: Optional[bool] = Field(
+        default=False,
+        description="Whether to include facet counts for the whole filtered result",
+    )
 
     # Location-based store finding parameters
     latitude: Optional[float] = Field(
-        None,
+        default=None,
         ge=-90,
         le=90,
         description="User latitude for location-based store finding",
     )
     longitude: Optional[float] = Field(
-        None,
+        default=None,
         ge=-180,
         le=180,
         description="User longitude for location-based store finding",
     )
 
 
+class FacetIdCountSchema(BaseModel):
+    id: int
+    count: int
+
+
+class FacetValueCountSchema(BaseModel):
+    value: str
+    count: int
+
+
+class TagFacetCountSchema(BaseModel):
+    tag_type: str
+    value: Optional[str] = None
+    count: int
+
+
+class PriceFacetBucketSchema(BaseModel):
+    min: float
+    max: Optional[float] = Field(None, description="Exclusive; None for the top bucket")
+    count: int
+
+
+class ProductFacetsSchema(BaseModel):
+    """Product counts per facet value over the whole filtered result"""
+
+    categories: List[FacetIdCountSchema] = Field(default_factory=list)
+    ecommerce_categories: List[FacetIdCountSchema] = Field(default_factory=list)
+    brands: List[FacetValueCountSchema] = Field(default_factory=list)
+    tags: List[TagFacetCountSchema] = Field(default_factory=list)
+    price: List[PriceFacetBucketSchema] = Field(
+        default_factory=list, description="Final-price buckets for the caller's tier"
+    )
+
+
 class PaginatedProductsResponse(BaseModel):
     """Response model for paginated product listings"""
 
@@ -237,3 +275,4 @@ class PaginatedProductsResponse(BaseModel):
             }
         ],
     )
+    facets: Optional[ProductFacetsSchema] = None
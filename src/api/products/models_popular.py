@@ -41,7 +41,7 @@ class PopularProductsQuerySchema(BaseModel):
         None,
         ge=1,
         le=365,
-        description="Limit to products popular in last N days (1-365)",
+        description="Rank by interactions in the last N days (1-365)",
     )
     category_ids: Optional[List[int]] = Field(
         None, description="Filter by category IDs"
@@ -4,6 +4,8 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from src.api.auth.models import DecodedToken
 from src.api.pricing.service import PricingService
+from src.api.products.cache import products_cache
+from src.api.products.listing import ProductListingResponse
 from src.api.products.models import (
     CreateProductSchema,
     EnhancedProductSchema,
@@ -26,6 +28,7 @@ from src.config.constants import UserRole
 from src.database.connection import AsyncSessionLocal
 from src.dependencies.auth import RoleChecker, get_current_user, get_optional_user
 from src.dependencies.tiers import get_user_tier
+from src.shared.cache_warmup import cache_warmup
 from src.shared.exceptions import ResourceNotFoundException
 from src.shared.responses import success_response
 
@@ -37,6 +40,14 @@ personalization_service = PersonalizationService()
 vector_service = VectorService()
 store_service = StoreService()
 
+# Rankings are read from the popularity scores and the daily rollup
+cache_warmup.register(
+    "popular_products",
+    popularity_service.get_popular_products_with_metrics,
+    cache_prefixes=(f"{products_cache.prefix}:popular:",),
+    tables=("product_popularity", "product_interaction_daily"),
+)
+
 
 @products_router.get(
     "/recents",
@@ -103,7 +114,7 @@ async def get_popular_products(
     mode: str = Query("trending", description="Popularity mode"),
     limit: int = Query(20, ge=1, le=100, description="Number of products to return"),
     time_window_days: Optional[int] = Query(
-        None, ge=1, le=365, description="Limit to last N days"
+        None, ge=1, le=365, description="Rank by interactions in the last N days"
     ),
     category_ids: Optional[str] = Query(
         None, description="Comma-separated category IDs"
@@ -133,7 +144,8 @@ async def get_popular_products(
     - `overall`: Overall popularity score
 
     **Filters:**
-    - Time window: Limit to products popular in last N days
+    - Time window: Rank by interactions in the last N days only (metrics
+      then cover that window)
     - Categories: Filter by category IDs
     - Min interactions: Minimum interactions required to be considered
 
@@ -163,14 +175,16 @@ async def get_popular_products(
             detail=f"Invalid mode. Must be one of: {[m.value for m in PopularityMode]}",
         )
 
-    # Get popular product IDs from popularity service
-    product_ids = await popularity_service.get_popular_products(
+    # Popular product IDs and their metrics come from one (cached) ranking
+    ranking = await popularity_service.get_popular_products_with_metrics(
         mode=popularity_mode,
         limit=limit,
         time_window_days=time_window_days,
         category_ids=parsed_category_ids,
         min_interactions=min_interactions,
     )
+    product_ids = [product_id for product_id, _ in ranking]
+    metrics_by_id = dict(ranking)
 
     if not product_ids:
         return success_response(
@@ -217,7 +231,7 @@ async def get_popular_products(
 
         # Add popularity metrics if requested
         if include_popularity_metrics and product.id:
-            metrics = await popularity_service.get_popularity_metrics(product.id)
+            metrics = metrics_by_id.get(product.id)
             if metrics:
                 product_dict["popularity_metrics"] = metrics
 
@@ -283,6 +297,10 @@ async def get_all_products(
         True,
         description="Include inventory information (requires store_id or location)",
     ),
+    include_facets: Optional[bool] = Query(
+        False,
+        description="Include counts per category, ecommerce category, brand, tag and price bucket over all matching products",
+    ),
     latitude: Optional[float] = Query(
         None,
         ge=-90,
@@ -328,6 +346,7 @@ async def get_all_products(
         max_price=max_price,
         only_discounted=only_discounted,
         has_inventory=has_inventory,
+        include_facets=include_facets,
         store_id=store_id,
         include_inventory=include_inventory,
         latitude=latitude,
@@ -345,7 +364,7 @@ async def get_all_products(
         store_ids = store_id
 
     # Always use the comprehensive method for best performance
-    result = await product_service.get_products_with_criteria(
+    result = await product_service.get_product_listing(
         query_params=query_params,
         customer_tier=user_tier,
         store_ids=store_ids,
@@ -369,7 +388,7 @@ async def get_all_products(
                 # If personalization scores exist, rerank and apply diversity
                 if personalization_scores:
                     # Create a mapping of product id to personalization score
-                    # We'll use this for sorting without modifying the Pydantic model
+                    # We'll use this for sorting without touching the encoded products
                     product_scores = {}
                     for product in result.products:
                         if product.id is not None:
@@ -396,7 +415,8 @@ async def get_all_products(
             logger = logging.getLogger(__name__)
             logger.error(f"Error applying personalization: {e}", exc_info=True)
 
-    return success_response(result.model_dump(mode="json"))
+    # Cached products are already JSON; only the inventory overlay is encoded
+    return ProductListingResponse(result)
 
 
 # ===== PRODUCT TAG CRUD ROUTES =====
@@ -745,8 +765,8 @@ async def get_similar_products(
     """
     Get products similar to a given product using AI-powered vector similarity.
 
-    Uses cosine similarity on 384-dimension embeddings to find semantically
-    similar products based on name, description, categories, brand, and tags.
+    Uses cosine similarity on hashed word and trigram embeddings of the product
+    name, brand and description to find semantically similar products.
 
     Similar products are enriched with:
     - Tier-based pricing (if include_pricing=true)
@@ -1,5 +1,6 @@
 from typing import List, Optional, cast
 
+from src.api.products.listing import ProductListing
 from src.api.products.models import (
     CreateProductSchema,
     EnhancedProductSchema,
@@ -235,6 +236,16 @@ class ProductService:
         store_ids: Optional[List[int]] = None,
     ) -> PaginatedProductsResponse:
         """Product query with comprehensive criteria and caching"""
+        listing = await self.get_product_listing(query_params, customer_tier, store_ids)
+        return listing.to_response_model()
+
+    async def get_product_listing(
+        self,
+        query_params: ProductQuerySchema,
+        customer_tier: Optional[int] = None,
+        store_ids: Optional[List[int]] = None,
+    ) -> ProductListing:
+        """Product listing as pre-encoded products, for ProductListingResponse"""
 
         # Determine store_ids if inventory requested with location
         effective_store_ids = store_ids
@@ -254,7 +265,7 @@ class ProductService:
             effective_store_ids = cast(List[int], effective_store_ids)
 
         # Single comprehensive query with all data
-        return await self.query_service.get_products_with_criteria(
+        return await self.query_service.get_product_listing(
             query_params, customer_tier, effective_store_ids, is_nearby_store
         )
 
@@ -1,12 +1,16 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, TypeVar
 
 from sqlalchemy import text
 
+from src.api.products.listing import ListingProduct
 from src.api.products.models import EnhancedProductSchema, InventoryInfoSchema
 from src.config.constants import NEXT_DAY_DELIVERY_ONLY_TAG_ID
 from src.database.connection import AsyncSessionLocal
 from src.shared.error_handler import ErrorHandler
 
+# Full models or pre-encoded listing products; only id and inventory are used
+ProductT = TypeVar("ProductT", EnhancedProductSchema, ListingProduct)
+
 
 class ProductInventoryService:
     """Product inventory service with aggregated availability logic"""
@@ -16,12 +20,12 @@ class ProductInventoryService:
 
     async def add_inventory_to_products_bulk(
         self,
-        products: List[EnhancedProductSchema],
+        products: List[ProductT],
         store_ids: Optional[List[int]],
         is_nearby_store: bool = True,
         latitude: Optional[float] = None,
         longitude: Optional[float] = None,
-    ) -> List[EnhancedProductSchema]:
+    ) -> List[ProductT]:
         """Add aggregated inventory to multiple products"""
         if not products:
             return products
@@ -0,0 +1,182 @@
+"""
+Product Interaction Rollup
+
+Folds product_interactions into product_interaction_daily, one row per
+product, interaction type and UTC day, as an incremental WatermarkJob (see
+src/shared/watermark_job.py). Each batch is grouped and upserted by a single
+statement in the database. Days older than the retention period are pruned
+after each run.
+
+The application lifespan runs the rollup every
+POPULARITY_ROLLUP_INTERVAL_SECONDS; scripts/db/rollup_product_interactions.py
+runs it once.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple, cast
+
+from sqlalchemy import CursorResult, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.constants import (
+    POPULARITY_ROLLUP_BATCH_SIZE,
+    POPULARITY_ROLLUP_RETENTION_DAYS,
+    POPULARITY_ROLLUP_SETTLE_MINUTES,
+)
+from src.config.settings import settings
+from src.database.connection import AsyncSessionLocal
+from src.shared.watermark_job import WatermarkJob
+
+PRODUCT_INTERACTION_DAILY_JOB = "product_interaction_daily"
+
+# Groups the next batch of interactions by (product, type, day) and adds it to
+# the rollup; returns (interactions read, last id read, rollup rows upserted).
+# Interactions already past retention are read (to move the watermark) but
+# not rolled up.
+_ROLLUP_BATCH_SQL = text(
+    """
+    WITH batch AS (
+        SELECT id, product_id, interaction_type, interaction_score, timestamp
+        FROM product_interactions
+        WHERE id > :after_id AND id <= :upper_id
+        ORDER BY id
+        LIMIT :batch_size
+    ),
+    rolled AS (
+        INSERT INTO product_interaction_daily
+            (product_id, interaction_type, day, interaction_count, weighted_score, last_interaction)
+        SELECT
+            product_id,
+            interaction_type,
+            CAST(timestamp AT TIME ZONE 'UTC' AS date),
+            COUNT(*),
+            SUM(interaction_score),
+            MAX(timestamp)
+        FROM batch
+        WHERE CAST(timestamp AT TIME ZONE 'UTC' AS date)
+            > CAST(NOW() AT TIME ZONE 'UTC' AS date) - CAST(:retention_days AS integer)
+        GROUP BY 1, 2, 3
+        ON CONFLICT (product_id, interaction_type, day) DO UPDATE SET
+            interaction_count = product_interaction_daily.interaction_count + EXCLUDED.interaction_count,
+            weighted_score = product_interaction_daily.weighted_score + EXCLUDED.weighted_score,
+            last_interaction = GREATEST(product_interaction_daily.last_interaction, EXCLUDED.last_interaction)
+        RETURNING 1
+    )
+    SELECT
+        (SELECT COUNT(*) FROM batch),
+        (SELECT MAX(id) FROM batch),
+        (SELECT COUNT(*) FROM rolled)
+    """
+)
+
+_PRUNE_SQL = text(
+    """
+    DELETE FROM product_interaction_daily
+    WHERE day <= CAST(NOW() AT TIME ZONE 'UTC' AS date) - CAST(:retention_days AS integer)
+    """
+)
+
+
+@dataclass
+class RollupResult:
+    """Outcome of one rollup run"""
+
+    batches: int = 0
+    interactions: int = 0
+    rows_upserted: int = 0
+    rows_pruned: int = 0
+    last_id: int = 0
+
+
+class PopularityRollup(WatermarkJob):
+    """Incremental product_interactions -> product_interaction_daily job"""
+
+    job = PRODUCT_INTERACTION_DAILY_JOB
+    source_table = "product_interactions"
+    target_table = "product_interaction_daily"
+
+    def __init__(
+        self,
+        batch_size: int = POPULARITY_ROLLUP_BATCH_SIZE,
+        settle_minutes: int = POPULARITY_ROLLUP_SETTLE_MINUTES,
+        retention_days: int = POPULARITY_ROLLUP_RETENTION_DAYS,
+        interval_seconds: Optional[int] = None,
+    ):
+        super().__init__(batch_size, settle_minutes)
+        self.retention_days = retention_days
+        self.interval_seconds = (
+            interval_seconds or settings.POPULARITY_ROLLUP_INTERVAL_SECONDS
+        )
+        self._task: Optional[asyncio.Task] = None
+
+    async def run(self, max_batches: Optional[int] = None) -> RollupResult:
+        """Roll up every settled interaction since the watermark, then prune"""
+        run = await self.run_batches(max_batches)
+        result = RollupResult(
+            batches=run.batches,
+            interactions=run.rows,
+            rows_upserted=run.written,
+            last_id=run.last_id,
+        )
+
+        async with AsyncSessionLocal() as session:
+            async with session.begin():
+                pruned = await session.execute(
+                    _PRUNE_SQL, {"retention_days": self.retention_days}
+                )
+                # text() statements are typed as Result, which has no rowcount
+                result.rows_pruned = cast(CursorResult[Any], pruned).rowcount
+
+        self._error_handler.logger.info(
+            f"Product interaction rollup: {result.interactions} interactions in "
+            f"{result.batches} batches, {result.rows_upserted} daily rows upserted, "
+            f"{result.rows_pruned} pruned, watermark {result.last_id}"
+        )
+        return result
+
+    async def apply_batch(
+        self, session: AsyncSession, after_id: int, upper_id: int
+    ) -> Tuple[int, int, int]:
+        rows, last_id, upserted = (
+            await session.execute(
+                _ROLLUP_BATCH_SQL,
+                {
+                    "after_id": after_id,
+                    "upper_id": upper_id,
+                    "batch_size": self.batch_size,
+                    "retention_days": self.retention_days,
+                },
+            )
+        ).one()
+        return rows, upserted, last_id
+
+    async def run_forever(self) -> None:
+        """Roll up every interval until cancelled; errors are logged, not raised."""
+        while True:
+            try:
+                await self.run()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._error_handler.logger.error(
+                    f"Product interaction rollup failed: {e}"
+                )
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run_forever())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# Global rollup instance, started from the application lifespan
+popularity_rollup = PopularityRollup()
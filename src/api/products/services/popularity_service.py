@@ -1,12 +1,14 @@
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from sqlalchemy import desc, text
 from sqlalchemy.future import select
 
+from src.api.products.cache import products_cache
 from src.config.constants import (
     INTERACTION_SCORES,
+    POPULARITY_MAX_LIMIT,
     POPULARITY_MIN_INTERACTIONS,
     POPULARITY_TIME_DECAY_HOURS,
     TRENDING_RECENT_DAYS,
@@ -14,11 +16,62 @@ from src.config.constants import (
     PopularityMode,
 )
 from src.database.connection import AsyncSessionLocal
+from src.database.models.associations import product_categories
 from src.database.models.product_interaction import ProductInteraction
 from src.database.models.product_popularity import ProductPopularity
 from src.shared.error_handler import ErrorHandler
 
 
+# Windowed rankings aggregate product_interaction_daily; trending weighs each
+# day by the same half-life decay as the all-time trending score
+_WINDOW_RANKING_SQL = """
+    SELECT
+        product_id,
+        COALESCE(SUM(interaction_count) FILTER (WHERE interaction_type = :view), 0) AS view_count,
+        COALESCE(SUM(interaction_count) FILTER (WHERE interaction_type = :cart), 0) AS cart_add_count,
+        COALESCE(SUM(interaction_count) FILTER (WHERE interaction_type = :order), 0) AS order_count,
+        COALESCE(SUM(interaction_count) FILTER (WHERE interaction_type = :search), 0) AS search_count,
+        SUM(weighted_score) AS popularity_score,
+        SUM(
+            weighted_score * POWER(
+                0.5,
+                (CAST(NOW() AT TIME ZONE 'UTC' AS date) - day) * 24.0
+                / CAST(:half_life_hours AS double precision)
+            )
+        ) AS trending_score,
+        MAX(last_interaction) AS last_interaction
+    FROM product_interaction_daily
+    WHERE day > CAST(NOW() AT TIME ZONE 'UTC' AS date) - CAST(:days AS integer)
+        {category_filter}
+    GROUP BY product_id
+    HAVING {having}
+    ORDER BY {order_by} DESC, product_id
+    LIMIT :limit
+"""
+
+# mode -> (ranking column, HAVING condition) of _WINDOW_RANKING_SQL
+_WINDOW_RANKINGS = {
+    PopularityMode.TRENDING: ("trending_score", "SUM(weighted_score) > 0"),
+    PopularityMode.MOST_VIEWED: (
+        "view_count",
+        "COALESCE(SUM(interaction_count) FILTER (WHERE interaction_type = :view), 0) >= :min_interactions",
+    ),
+    PopularityMode.MOST_CARTED: (
+        "cart_add_count",
+        "COALESCE(SUM(interaction_count) FILTER (WHERE interaction_type = :cart), 0) >= :min_interactions",
+    ),
+    PopularityMode.MOST_ORDERED: (
+        "order_count",
+        "COALESCE(SUM(interaction_count) FILTER (WHERE interaction_type = :order), 0) >= :min_interactions",
+    ),
+    PopularityMode.MOST_SEARCHED: (
+        "search_count",
+        "COALESCE(SUM(interaction_count) FILTER (WHERE interaction_type = :search), 0) >= :min_interactions",
+    ),
+    PopularityMode.OVERALL: ("popularity_score", "SUM(weighted_score) > 0"),
+}
+
+
 class PopularityService:
     """
     Service for managing product popularity and trending products.
@@ -55,10 +108,70 @@ class PopularityService:
         Returns:
             List of product IDs sorted by popularity
         """
+        ranking = await self.get_popular_products_with_metrics(
+            mode=mode,
+            limit=limit,
+            time_window_days=time_window_days,
+            category_ids=category_ids,
+            min_interactions=min_interactions,
+        )
+        return [product_id for product_id, _ in ranking]
+
+    async def get_popular_products_with_metrics(
+        self,
+        mode: PopularityMode = PopularityMode.TRENDING,
+        limit: int = 20,
+        time_window_days: Optional[int] = None,
+        category_ids: Optional[List[int]] = None,
+        min_interactions: int = POPULARITY_MIN_INTERACTIONS,
+    ) -> List[Tuple[int, dict]]:
+        """
+        Get popular products with their popularity metrics.
+
+        The ranking and the metrics are read from the same product_popularity
+        rows in one query. The top POPULARITY_MAX_LIMIT products of each mode
+        and filter combination are cached, and smaller limits are served from
+        that cached ranking.
+
+        Returns:
+            List of (product_id, metrics) sorted by popularity
+        """
+        key = products_cache.get_popular_key(
+            mode.value, time_window_days, category_ids, min_interactions
+        )
+        ranking = products_cache.get_popular(key)
+        if ranking is None:
+            ranking = await self._rank_popular_products(
+                mode, time_window_days, category_ids, min_interactions
+            )
+            if ranking is None:
+                return []
+            products_cache.set_popular(key, ranking)
+        return ranking[:limit]
+
+    async def _rank_popular_products(
+        self,
+        mode: PopularityMode,
+        time_window_days: Optional[int],
+        category_ids: Optional[List[int]],
+        min_interactions: int,
+    ) -> Optional[List[Tuple[int, dict]]]:
+        """
+        Top POPULARITY_MAX_LIMIT (product_id, metrics), or None on error.
+
+        Rankings over a time window are computed from the daily rollup, so
+        their metrics count only the window's interactions. Without a window
+        they come from the all-time product_popularity scores.
+        """
         try:
             async with AsyncSessionLocal() as session:
+                if time_window_days:
+                    return await self._rank_window(
+                        session, mode, time_window_days, category_ids, min_interactions
+                    )
+
                 # Base query
-                query = select(ProductPopularity.product_id)
+                query = select(ProductPopularity)
 
                 # Apply minimum interactions filter
                 if mode == PopularityMode.TRENDING:
@@ -86,32 +199,74 @@ class PopularityService:
                         ProductPopularity.popularity_score > 0
                     ).order_by(desc(ProductPopularity.popularity_score))
 
-                # Apply time window filter if specified
-                if time_window_days:
-                    cutoff_date = datetime.now(timezone.utc) - timedelta(
-                        days=time_window_days
-                    )
+                # Apply category filter
+                if category_ids:
                     query = query.where(
-                        ProductPopularity.last_interaction >= cutoff_date
+                        ProductPopularity.product_id.in_(
+                            select(product_categories.c.product_id).where(
+                                product_categories.c.category_id.in_(category_ids)
+                            )
+                        )
                     )
 
-                # Apply category filter using join (if needed)
-                # For now, we'll get all products and filter in product service layer
-
                 # Limit results
-                query = query.limit(limit)
+                query = query.limit(POPULARITY_MAX_LIMIT)
 
                 result = await session.execute(query)
-                product_ids = [row[0] for row in result.fetchall()]
+                ranking = [
+                    (popularity.product_id, self._metrics(popularity))
+                    for popularity in result.scalars().all()
+                ]
 
                 self.logger.debug(
-                    f"Retrieved {len(product_ids)} popular products (mode: {mode.value})"
+                    f"Retrieved {len(ranking)} popular products (mode: {mode.value})"
                 )
-                return product_ids
+                return ranking
 
         except Exception as e:
             self.logger.error(f"Error getting popular products: {e}", exc_info=True)
-            return []
+            return None
+
+    async def _rank_window(
+        self,
+        session,
+        mode: PopularityMode,
+        time_window_days: int,
+        category_ids: Optional[List[int]],
+        min_interactions: int,
+    ) -> List[Tuple[int, dict]]:
+        """Top products by their daily rollup rows in the last N days"""
+        order_by, having = _WINDOW_RANKINGS[mode]
+        category_filter = (
+            "AND product_id IN (SELECT product_id FROM product_categories "
+            "WHERE category_id = ANY(:category_ids))"
+            if category_ids
+            else ""
+        )
+        result = await session.execute(
+            text(
+                _WINDOW_RANKING_SQL.format(
+                    category_filter=category_filter, having=having, order_by=order_by
+                )
+            ),
+            {
+                "days": time_window_days,
+                "category_ids": list(category_ids or []),
+                "min_interactions": min_interactions,
+                "half_life_hours": POPULARITY_TIME_DECAY_HOURS,
+                "limit": POPULARITY_MAX_LIMIT,
+                "view": InteractionType.VIEW.value,
+                "cart": InteractionType.CART_ADD.value,
+                "order": InteractionType.ORDER.value,
+                "search": InteractionType.SEARCH_CLICK.value,
+            },
+        )
+        ranking = [(row.product_id, self._window_metrics(row)) for row in result]
+        self.logger.debug(
+            f"Retrieved {len(ranking)} popular products "
+            f"(mode: {mode.value}, last {time_window_days} days)"
+        )
+        return ranking
 
     async def update_product_popularity(self, product_id: int) -> bool:
         """
@@ -317,11 +472,38 @@ class PopularityService:
         except Exception as e:
             self.logger.error(f"Error in bulk popularity update: {e}", exc_info=True)
 
+        products_cache.invalidate_popular_cache()
         self.logger.info(
             f"Popularity update complete: {results['success']} success, {results['failed']} failed"
         )
         return results
 
+    @staticmethod
+    def _metrics(popularity: ProductPopularity) -> dict:
+        return {
+            "view_count": popularity.view_count,
+            "cart_add_count": popularity.cart_add_count,
+            "order_count": popularity.order_count,
+            "search_count": popularity.search_count,
+            "popularity_score": float(popularity.popularity_score),
+            "trending_score": float(popularity.trending_score),
+            "last_interaction": popularity.last_interaction.isoformat()
+            if popularity.last_interaction
+            else None,
+        }
+
+    @staticmethod
+    def _window_metrics(row) -> dict:
+        return {
+            "view_count": row.view_count,
+            "cart_add_count": row.cart_add_count,
+            "order_count": row.order_count,
+            "search_count": row.search_count,
+            "popularity_score": round(float(row.popularity_score), 2),
+            "trending_score": round(float(row.trending_score), 2),
+            "last_interaction": row.last_interaction.isoformat(),
+        }
+
     async def get_popularity_metrics(self, product_id: int) -> Optional[dict]:
         """
         Get popularity metrics for a specific product.
@@ -332,33 +514,38 @@ class PopularityService:
         Returns:
             dict with popularity metrics or None if not found
         """
+        metrics = await self.get_popularity_metrics_bulk([product_id])
+        return metrics.get(product_id)
+
+    async def get_popularity_metrics_bulk(
+        self, product_ids: List[int]
+    ) -> Dict[int, dict]:
+        """
+        Get popularity metrics for many products in one query.
+
+        Args:
+            product_ids: Product IDs
+
+        Returns:
+            dict of product ID to metrics; products without metrics are omitted
+        """
+        if not product_ids:
+            return {}
         try:
             async with AsyncSessionLocal() as session:
                 result = await session.execute(
                     select(ProductPopularity).where(
-                        ProductPopularity.product_id == product_id
+                        ProductPopularity.product_id.in_(set(product_ids))
                     )
                 )
-                popularity = result.scalars().first()
-
-                if not popularity:
-                    return None
-
                 return {
-                    "view_count": popularity.view_count,
-                    "cart_add_count": popularity.cart_add_count,
-                    "order_count": popularity.order_count,
-                    "search_count": popularity.search_count,
-                    "popularity_score": float(popularity.popularity_score),
-                    "trending_score": float(popularity.trending_score),
-                    "last_interaction": popularity.last_interaction.isoformat()
-                    if popularity.last_interaction
-                    else None,
+                    popularity.product_id: self._metrics(popularity)
+                    for popularity in result.scalars().all()
                 }
 
         except Exception as e:
             self.logger.error(
-                f"Error getting popularity metrics for product {product_id}: {e}",
+                f"Error getting popularity metrics for products {product_ids}: {e}",
                 exc_info=True,
             )
-            return None
+            return {}
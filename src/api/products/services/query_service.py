@@ -1,29 +1,69 @@
-import asyncio
-import json
 from typing import Any, Dict, List, Optional, Sequence
 
 from sqlalchemy import text
 
+from src.api.categories.service import CategoryService
+from src.api.products.facets import build_facet_sql, decode_facet_rows
+from src.api.products.filter_index import page_candidates, product_filter_index
+from src.api.products.listing import ListingProduct, ProductListing
 from src.api.products.models import (
     EnhancedProductSchema,
-    FuturePricingSchema,
     PaginatedProductsResponse,
     ProductQuerySchema,
 )
+from src.api.products.services.row_projection import (
+    ProductRowProjector,
+    project_product_rows,
+    row_projector_for,
+)
 from src.api.pricing.service import PricingService
 from src.api.tags.service import TagService
 from src.config.cache_config import CacheConfig
+from src.config.constants import NEXT_DAY_DELIVERY_ONLY_TAG_ID
 from src.database.connection import AsyncSessionLocal
 from src.shared.cache_service import cache_service
 from src.shared.error_handler import ErrorHandler
 
 
+# Categories and tags are aggregated per product in correlated subqueries, so
+# including them neither multiplies product rows through joins nor needs the
+# outer GROUP BY to fold them back. Rows decode to lists of dicts.
+CATEGORIES_JSON_SELECT = """(
+            SELECT COALESCE(JSON_AGG(JSON_BUILD_OBJECT(
+                'id', c.id,
+                'name', c.name,
+                'description', c.description,
+                'sort_order', c.sort_order,
+                'image_url', c.image_url,
+                'parent_category_id', c.parent_category_id
+            ) ORDER BY c.id), '[]'::json)
+            FROM product_categories pc
+            JOIN categories c ON c.id = pc.category_id
+            WHERE pc.product_id = p.id
+        ) AS categories_data"""
+
+TAGS_JSON_SELECT = """(
+            SELECT COALESCE(JSON_AGG(JSON_BUILD_OBJECT(
+                'id', t.id,
+                'tag_type', t.tag_type,
+                'name', t.name,
+                'slug', t.slug,
+                'description', t.description,
+                'value', pt.value
+            ) ORDER BY t.id), '[]'::json)
+            FROM product_tags pt
+            JOIN tags t ON t.id = pt.tag_id
+            WHERE pt.product_id = p.id
+        ) AS tags_data"""
+
+
 class ProductQueryService:
     """Product query service with advanced SQL optimization and caching"""
 
     def __init__(self):
         self._error_handler = ErrorHandler(__name__)
         self.tag_service = TagService(entity_type="product")
+        self.category_service = CategoryService()
         self.pricing_service = PricingService()
         self.cache = cache_service
         # Import here to avoid circular dependency
@@ -41,47 +81,99 @@ class ProductQueryService:
         is_nearby_store: bool = True,
     ) -> PaginatedProductsResponse:
         """Execute comprehensive product query with integrated pricing and inventory data"""
+        listing = await self.get_product_listing(
+            query_params, customer_tier, store_ids, is_nearby_store
+        )
+        return listing.to_response_model()
+
+    async def get_product_listing(
+        self,
+        query_params: ProductQuerySchema,
+        customer_tier: Optional[int] = None,
+        store_ids: Optional[List[int]] = None,
+        is_nearby_store: bool = True,
+    ) -> ProductListing:
+        """Product listing page as pre-encoded products with the inventory overlay"""
 
         # Create a query without inventory for caching
         query_without_inventory = ProductQuerySchema(
             **{**query_params.model_dump(), "include_inventory": False}
         )
 
+        # With stores to check, has_inventory is applied inside the SQL so
+        # LIMIT counts only matching products and pages come back full.
+        # Those results depend on live stock, so they are keyed by store set
+        # and cached only as long as inventory rows are.
+        inventory_store_ids = (
+            store_ids if query_params.has_inventory is not None and store_ids else None
+        )
+
         # Generate cache key for products without inventory
         cache_key = self._generate_cache_key(
-            query_without_inventory, customer_tier, None, is_nearby_store
+            query_without_inventory, customer_tier, inventory_store_ids, is_nearby_store
         )
 
-        # Try cache first for product data
+        # Try cache first for product data. Entries hold each product already
+        # encoded as JSON, so a hit builds no Pydantic models.
         cached_result = await self.cache.get(cache_key)
-        if cached_result:
-            products = [EnhancedProductSchema(**p) for p in cached_result["products"]]
-            pagination = cached_result["pagination"]
-        else:
-            async with AsyncSessionLocal() as session:
-                # Build comprehensive SQL query without inventory
-                sql_query, params = self._build_comprehensive_sql(
-                    query_without_inventory, customer_tier, None
+        if not cached_result:
+            candidate_ids = await self._filter_candidates(
+                query_without_inventory, inventory_store_ids
+            )
+            if candidate_ids == []:
+                # Nothing passes the category/tag filters; skip the query
+                rows = []
+            else:
+                rows = await self._fetch_listing_rows(
+                    query_without_inventory,
+                    customer_tier,
+                    inventory_store_ids,
+                    is_nearby_store,
+                    candidate_ids,
                 )
+                if (
+                    candidate_ids is not None
+                    and len(rows) < len(candidate_ids)
+                    and self._candidates_are_page(
+                        query_without_inventory, inventory_store_ids
+                    )
+                ):
+                    # Some candidates no longer match: this instance's index
+                    # predates a write made elsewhere. Rebuild it and page
+                    # from the SQL filters alone.
+                    product_filter_index.invalidate()
+                    rows = await self._fetch_listing_rows(
+                        query_without_inventory,
+                        customer_tier,
+                        inventory_store_ids,
+                        is_nearby_store,
+                    )
 
-                # Execute single query
-                result = await session.execute(text(sql_query), params)
-                rows = result.fetchall()
-
-                # Process results efficiently
-                products, pagination = await self._process_results_fast(
-                    rows, query_without_inventory, is_nearby_store
-                )
+            # Process results efficiently
+            products, pagination = self._process_results_fast(
+                rows, query_without_inventory
+            )
 
             # Cache product data (without inventory)
-            cache_data = {
-                "products": [p.model_dump(mode="json") for p in products],
+            cached_result = {
+                "products": [ListingProduct.cache_entry(p) for p in products],
                 "pagination": pagination,
             }
             await self.cache.set(
-                cache_key, cache_data, ttl=CacheConfig.PRODUCT_DATA_TTL
+                cache_key,
+                cached_result,
+                ttl=CacheConfig.INVENTORY_TTL
+                if inventory_store_ids
+                else CacheConfig.PRODUCT_DATA_TTL,
             )
 
+        # Fresh per-request views; the cached entry itself is never mutated
+        listing_products = [
+            ListingProduct.from_cache_entry(entry)
+            for entry in cached_result["products"]
+        ]
+        pagination = dict(cached_result["pagination"])
+
         # Add real-time inventory if requested OR if filters require it
         needs_inventory = query_params.include_inventory or query_params.has_inventory
 
@@ -89,19 +181,22 @@ class ProductQueryService:
         has_inventory_filter = query_params.has_inventory is not None
 
         if needs_inventory and store_ids:
-            products = await self.inventory_service.add_inventory_to_products_bulk(
-                products=products,
-                store_ids=store_ids,
-                is_nearby_store=is_nearby_store,
-                latitude=query_params.latitude,
-                longitude=query_params.longitude,
+            listing_products = (
+                await self.inventory_service.add_inventory_to_products_bulk(
+                    products=listing_products,
+                    store_ids=store_ids,
+                    is_nearby_store=is_nearby_store,
+                    latitude=query_params.latitude,
+                    longitude=query_params.longitude,
+                )
             )
 
-            # Apply inventory filters only if we're filtering by has_inventory
+            # The SQL already filtered on stock; re-checking drops products
+            # whose stock moved since the page was cached
             if has_inventory_filter:
-                products = [
+                listing_products = [
                     p
-                    for p in products
+                    for p in listing_products
                     if p.inventory
                     and (
                         p.inventory.can_order
@@ -111,24 +206,166 @@ class ProductQueryService:
                 ]
 
             # Update pagination total_returned after filtering
-            pagination["total_returned"] = len(products)
+            pagination["total_returned"] = len(listing_products)
 
         # Remove inventory from response if not explicitly requested
         if not query_params.include_inventory:
-            for product in products:
+            for product in listing_products:
                 product.inventory = None
 
-        response = PaginatedProductsResponse(products=products, pagination=pagination)
+        facets = None
+        if query_params.include_facets:
+            facets = await self.get_facets(
+                query_params, customer_tier, inventory_store_ids, is_nearby_store
+            )
+
+        return ProductListing(listing_products, pagination, facets)
+
+    async def get_facets(
+        self,
+        query_params: ProductQuerySchema,
+        customer_tier: Optional[int] = None,
+        store_ids: Optional[List[int]] = None,
+        is_nearby_store: bool = True,
+    ) -> Dict[str, Any]:
+        """Facet counts over every product matching the listing filters
 
-        return response
+        Independent of the cursor and page size, so one cached entry per
+        filter signature serves every page. store_ids only matter together
+        with has_inventory.
+        """
+        cache_key = self._generate_facets_cache_key(
+            query_params, customer_tier, store_ids, is_nearby_store
+        )
+        cached_facets = await self.cache.get(cache_key)
+        if cached_facets is not None:
+            return cached_facets
+
+        candidate_ids = await self._filter_candidates(
+            query_params, store_ids, paged=False
+        )
+        if candidate_ids == []:
+            facets = decode_facet_rows([])
+        else:
+            params: Dict[str, Any] = {}
+            where_conditions = self._build_filter_conditions(
+                query_params,
+                params,
+                customer_tier,
+                store_ids,
+                is_nearby_store,
+                candidate_ids,
+            )
+            pricing_components = (
+                self.pricing_service.get_pricing_sql_components(customer_tier)
+                if customer_tier
+                else None
+            )
+            sql_query, params = build_facet_sql(
+                where_conditions, params, pricing_components
+            )
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(text(sql_query), params)
+                facets = decode_facet_rows(result.fetchall())
+
+        inventory_filtered = query_params.has_inventory is not None and store_ids
+        await self.cache.set(
+            cache_key,
+            facets,
+            ttl=CacheConfig.INVENTORY_TTL
+            if inventory_filtered
+            else CacheConfig.PRODUCT_DATA_TTL,
+        )
+        return facets
+
+    async def _fetch_listing_rows(
+        self,
+        query_params: ProductQuerySchema,
+        customer_tier: Optional[int],
+        store_ids: Optional[List[int]],
+        is_nearby_store: bool,
+        candidate_ids: Optional[List[int]] = None,
+    ) -> Sequence[Any]:
+        async with AsyncSessionLocal() as session:
+            sql_query, params = self._build_comprehensive_sql(
+                query_params,
+                customer_tier,
+                store_ids,
+                is_nearby_store,
+                candidate_ids,
+            )
+            result = await session.execute(text(sql_query), params)
+            return result.fetchall()
+
+    def _candidates_are_page(
+        self,
+        query_params: ProductQuerySchema,
+        inventory_store_ids: Optional[List[int]] = None,
+    ) -> bool:
+        """Whether no WHERE condition besides category and tag can drop rows"""
+        return not (
+            query_params.min_price is not None
+            or query_params.max_price is not None
+            or bool(inventory_store_ids)
+            or bool(query_params.only_discounted)
+        )
+
+    async def _filter_candidates(
+        self,
+        query_params: ProductQuerySchema,
+        inventory_store_ids: Optional[List[int]] = None,
+        paged: bool = True,
+    ) -> Optional[List[int]]:
+        """Ids passing the category and tag filters, from the filter index
+
+        None when the query has neither filter. A category matches the
+        products of its whole subtree. When paged, only ids after the cursor
+        are returned, and when no other WHERE condition can drop rows (see
+        _candidates_are_page) only the first limit + 1 of them.
+        """
+        tag_groups = self.tag_service.parse_tag_expression(query_params.tags)
+        if not query_params.category_ids and not tag_groups:
+            return None
+
+        category_ids = query_params.category_ids
+        if category_ids:
+            category_ids = await self.category_service.expand_category_ids(category_ids)
+            if not category_ids:
+                # None of the requested categories exist
+                return []
+
+        index = await product_filter_index.get()
+        matched = index.match(category_ids, tag_groups)
+        if matched is None:
+            return None
+
+        if not paged:
+            return matched.tolist()
+
+        if not self._candidates_are_page(query_params, inventory_store_ids):
+            return page_candidates(matched, query_params.cursor)
+        limit = query_params.limit if query_params.limit is not None else 20
+        return page_candidates(matched, query_params.cursor, limit + 1)
 
     def _build_comprehensive_sql(
         self,
         query_params: ProductQuerySchema,
         customer_tier: Optional[int] = None,
         store_ids: Optional[List[int]] = None,
+        is_nearby_store: bool = True,
+        candidate_ids: Optional[List[int]] = None,
     ) -> tuple[str, Dict[str, Any]]:
-        """Build comprehensive SQL query with integrated joins and filtering"""
+        """
+        Build comprehensive SQL query with integrated joins and filtering.
+
+        When store_ids is given and query_params.has_inventory is set, the
+        orderability filter is part of the WHERE clause (see
+        _build_inventory_condition) instead of being applied to the page.
+
+        candidate_ids (see _filter_candidates) narrows the category and tag
+        subqueries to one id list; the subqueries stay, as the index of this
+        instance may predate a write made by another.
+        """
 
         # Base SELECT with all needed fields
         select_fields = [
@@ -149,33 +386,17 @@ class ProductQueryService:
 
         # Add category fields if requested
         if query_params.include_categories:
-            select_fields.extend(
-                [
-                    "STRING_AGG(DISTINCT CONCAT(c.id, '|', c.name, '|', COALESCE(c.description, ''), '|', COALESCE(c.sort_order::text, ''), '|', COALESCE(c.image_url, ''), '|', COALESCE(c.parent_category_id::text, '')), ';') as categories_data"
-                ]
-            )
+            select_fields.append(CATEGORIES_JSON_SELECT)
 
         # Add tag fields if requested
         if query_params.include_tags:
-            select_fields.extend(
-                [
-                    "STRING_AGG(DISTINCT CONCAT(t.id::text, '|', COALESCE(t.tag_type, ''), '|', COALESCE(t.name, ''), '|', COALESCE(t.slug, ''), '|', COALESCE(t.description, ''), '|', COALESCE(pt.value, '')), ';') as tags_data"
-                ]
-            )
+            select_fields.append(TAGS_JSON_SELECT)
 
         # Build FROM clause with optimal JOINs
         joins = ["FROM products p"]
         full_cte = ""
         pricing_components = None
 
-        if query_params.include_categories:
-            joins.append("LEFT JOIN product_categories pc ON p.id = pc.product_id")
-            joins.append("LEFT JOIN categories c ON pc.category_id = c.id")
-
-        if query_params.include_tags:
-            joins.append("LEFT JOIN product_tags pt ON p.id = pt.product_id")
-            joins.append("LEFT JOIN tags t ON pt.tag_id = t.id")
-
         if query_params.include_pricing and customer_tier:
             pricing_components = self.pricing_service.get_pricing_sql_components(
                 customer_tier=customer_tier,
@@ -186,16 +407,76 @@ class ProductQueryService:
             joins.extend(pricing_components["joins"])
 
         # Build WHERE conditions
-        where_conditions = []
         params: Dict[str, Any] = {}
         if pricing_components and "params" in pricing_components:
             params.update(pricing_components["params"])
 
-        where_clause = ""
+        where_conditions = self._build_filter_conditions(
+            query_params,
+            params,
+            customer_tier,
+            store_ids,
+            is_nearby_store,
+            candidate_ids,
+        )
+
+        if query_params.cursor is not None:
+            where_conditions.append("p.id > :cursor")
+            params["cursor"] = query_params.cursor
+
+        where_clause = (
+            f"WHERE {' AND '.join(where_conditions)}" if where_conditions else ""
+        )
+
+        limit = query_params.limit if query_params.limit is not None else 20
+        params["limit"] = limit + 1
+
+        group_by_fields = [
+            "p.id",
+        ]
+        if pricing_components:
+            group_by_fields.extend(pricing_components["group_by_fields"])
+
+        sql_query = f"""
+        {full_cte}
+        SELECT {", ".join(select_fields)}
+        {" ".join(joins)}
+        {where_clause}
+        GROUP BY {", ".join(group_by_fields)}
+        ORDER BY p.id
+        LIMIT :limit
+        """
+
+        return sql_query, params
+
+    def _build_filter_conditions(
+        self,
+        query_params: ProductQuerySchema,
+        params: Dict[str, Any],
+        customer_tier: Optional[int] = None,
+        store_ids: Optional[List[int]] = None,
+        is_nearby_store: bool = True,
+        candidate_ids: Optional[List[int]] = None,
+    ) -> List[str]:
+        """WHERE conditions of the listing filters, excluding the cursor
+
+        Shared by the listing and facet queries. The discount condition
+        expects the pricing joins whenever include_pricing and a tier are set.
+        """
+        where_conditions = []
+
+        if candidate_ids is not None:
+            where_conditions.append("p.id = ANY(:candidate_ids)")
+            params["candidate_ids"] = candidate_ids
 
         if query_params.category_ids:
+            # Same subtree semantics as _filter_candidates
             where_conditions.append(
-                "p.id IN (SELECT product_id FROM product_categories WHERE category_id = ANY(:category_ids))"
+                "p.id IN (SELECT product_id FROM product_categories WHERE category_id IN ("
+                "WITH RECURSIVE subtree AS ("
+                "SELECT id FROM categories WHERE id = ANY(:category_ids) "
+                "UNION SELECT c.id FROM categories c JOIN subtree s ON c.parent_category_id = s.id"
+                ") SELECT id FROM subtree))"
             )
             params["category_ids"] = list(query_params.category_ids)
 
@@ -217,9 +498,12 @@ class ProductQueryService:
             where_conditions.append("p.base_price <= :max_price")
             params["max_price"] = int(query_params.max_price)
 
-        if query_params.cursor is not None:
-            where_conditions.append("p.id > :cursor")
-            params["cursor"] = query_params.cursor
+        if query_params.has_inventory is not None and store_ids:
+            where_conditions.append(
+                self._build_inventory_condition(
+                    query_params, store_ids, is_nearby_store, params
+                )
+            )
 
         if (
             query_params.only_discounted
@@ -228,38 +512,51 @@ class ProductQueryService:
         ):
             where_conditions.append("pricing.savings > 0")
 
-        where_clause = (
-            f"WHERE {' AND '.join(where_conditions)}" if where_conditions else ""
-        )
-
-        limit = query_params.limit if query_params.limit is not None else 20
-        params["limit"] = limit + 1
+        return where_conditions
 
-        group_by_fields = [
-            "p.id",
-        ]
-        if pricing_components:
-            group_by_fields.extend(pricing_components["group_by_fields"])
+    def _build_inventory_condition(
+        self,
+        query_params: ProductQuerySchema,
+        store_ids: List[int],
+        is_nearby_store: bool,
+        params: Dict[str, Any],
+    ) -> str:
+        """
+        SQL form of ProductInventoryService's can_order for the given stores.
 
-        sql_query = f"""
-        {full_cte}
-        SELECT {", ".join(select_fields)}
-        {" ".join(joins)}
-        {where_clause}
-        GROUP BY {", ".join(group_by_fields)}
-        ORDER BY p.id
-        LIMIT :limit
+        A product can be ordered when any of the stores has usable stock
+        (quantity_available - safety_stock > 0), unless it is a next-day-only
+        product and there is no location or no nearby store.
         """
+        params["inventory_store_ids"] = list(store_ids)
+        condition = (
+            "EXISTS (SELECT 1 FROM inventory inv"
+            " WHERE inv.product_id = p.id"
+            " AND inv.store_id = ANY(:inventory_store_ids)"
+            " AND inv.quantity_available - COALESCE(inv.safety_stock, 0) > 0)"
+        )
 
-        return sql_query, params
+        has_location = (
+            query_params.latitude is not None and query_params.longitude is not None
+        )
+        if not has_location or not is_nearby_store:
+            params["next_day_tag_id"] = NEXT_DAY_DELIVERY_ONLY_TAG_ID
+            condition = (
+                f"({condition} AND NOT EXISTS (SELECT 1 FROM product_tags ndt"
+                " WHERE ndt.product_id = p.id AND ndt.tag_id = :next_day_tag_id))"
+            )
 
-    async def _process_results_fast(
+        return condition if query_params.has_inventory else f"NOT {condition}"
+
+    def _process_results_fast(
         self,
         rows: Sequence[Any],
         query_params: ProductQuerySchema,
-        is_nearby_store: bool = True,
-    ) -> tuple[List[EnhancedProductSchema], Dict]:
-        """Fast result processing without ORM overhead"""
+    ) -> tuple[List[Dict[str, Any]], Dict]:
+        """Fast result processing without ORM or Pydantic overhead
+
+        Products come back as JSON-ready dicts for the listing cache.
+        """
 
         if not rows:
             return [], {
@@ -273,21 +570,8 @@ class ProductQueryService:
         has_more = len(rows) > limit
         actual_rows = rows[:limit] if has_more else rows
 
-        products = []
-
-        # Process rows in parallel batches for CPU-bound operations
-        batch_size = 50
-        tasks = []
-
-        for i in range(0, len(actual_rows), batch_size):
-            batch = actual_rows[i : i + batch_size]
-            task = self._process_row_batch(batch, query_params, is_nearby_store)
-            tasks.append(task)
-
-        if tasks:
-            batch_results = await asyncio.gather(*tasks)
-            for batch_products in batch_results:
-                products.extend(batch_products)
+        projector = self._row_projector(actual_rows, query_params)
+        products = [projector.to_dict(row) for row in actual_rows]
 
         next_cursor = None
         if has_more and actual_rows:
@@ -302,105 +586,16 @@ class ProductQueryService:
 
         return products, pagination
 
-    async def _process_row_batch(
-        self,
-        rows: Sequence[Any],
-        query_params: ProductQuerySchema,
-        is_nearby_store: bool = True,
-    ) -> List[EnhancedProductSchema]:
-        """Process a batch of rows efficiently"""
-
-        products = []
-
-        for row in rows:
-            product_data = {
-                "id": row.id,
-                "ref": row.ref,
-                "name": row.name,
-                "description": row.description,
-                "brand": row.brand,
-                "base_price": float(row.base_price),
-                "unit_measure": row.unit_measure,
-                "image_urls": row.image_urls or [],
-                "ecommerce_category_id": row.ecommerce_category_id,
-                "ecommerce_subcategory_id": row.ecommerce_subcategory_id,
-                "alternative_product_ids": row.alternative_product_ids or [],
-                "created_at": row.created_at,
-                "updated_at": row.updated_at,
-                "categories": [],
-                "product_tags": [],
-                "pricing": None,
-                "inventory": None,
-                "future_pricing": None,
-            }
-
-            if (
-                query_params.include_categories
-                and hasattr(row, "categories_data")
-                and row.categories_data
-            ):
-                # ... (category parsing logic remains the same)
-                pass
-
-            if (
-                query_params.include_tags
-                and hasattr(row, "tags_data")
-                and row.tags_data
-            ):
-                # ... (tag parsing logic remains the same)
-                pass
-
-            if query_params.include_pricing and hasattr(row, "final_price"):
-                try:
-                    base_price = float(row.base_price)
-                    final_price = (
-                        float(row.final_price)
-                        if row.final_price is not None
-                        else base_price
-                    )
-                    savings = (
-                        float(row.savings)
-                        if hasattr(row, "savings") and row.savings is not None
-                        else 0.0
-                    )
-                    discount_percentage = (
-                        float(row.discount_percentage)
-                        if hasattr(row, "discount_percentage")
-                        and row.discount_percentage is not None
-                        else 0.0
-                    )
-                    price_list_names = (
-                        row.price_list_names.split(";")
-                        if hasattr(row, "price_list_names") and row.price_list_names
-                        else []
-                    )
-
-                    product_data["pricing"] = {
-                        "base_price": base_price,
-                        "final_price": final_price,
-                        "discount_applied": savings,
-                        "discount_percentage": discount_percentage,
-                        "applied_price_lists": price_list_names,
-                    }
-                except (ValueError, TypeError):
-                    product_data["pricing"] = None
-
-            if (
-                query_params.include_pricing
-                and hasattr(row, "future_pricing_data")
-                and row.future_pricing_data
-            ):
-                try:
-                    # The data is already a list of dicts from JSON_AGG
-                    product_data["future_pricing"] = [
-                        FuturePricingSchema(**tier) for tier in row.future_pricing_data
-                    ]
-                except (json.JSONDecodeError, TypeError):
-                    product_data["future_pricing"] = None
-
-            products.append(EnhancedProductSchema(**product_data))
-
-        return products
+    def _row_projector(
+        self, rows: Sequence[Any], query_params: ProductQuerySchema
+    ) -> ProductRowProjector:
+        """Projector compiled for the query's include flags"""
+        return row_projector_for(
+            rows,
+            include_pricing=bool(query_params.include_pricing),
+            include_categories=bool(query_params.include_categories),
+            include_tags=bool(query_params.include_tags),
+        )
 
     async def _get_excluded_products(self, product_ids: List[int]) -> set:
         """Get products that have the NEXT_DAY_DELIVERY_ONLY_TAG_ID"""
@@ -428,6 +623,34 @@ class ProductQueryService:
 
             return {row.product_id for row in result.fetchall()}
 
+    def _generate_facets_cache_key(
+        self,
+        query_params: ProductQuerySchema,
+        customer_tier: Optional[int],
+        store_ids: Optional[List[int]],
+        is_nearby_store: bool = True,
+    ) -> str:
+        """Cache key of the facet counts: the filter signature only"""
+        inventory_filtered = query_params.has_inventory is not None and store_ids
+        discounted = bool(
+            query_params.only_discounted
+            and query_params.include_pricing
+            and customer_tier
+        )
+        key_parts = [
+            "product_facets",
+            f"tier_{customer_tier or 0}",
+            f"cat_ids_{','.join(map(str, query_params.category_ids or []))}",
+            f"tags_{','.join(query_params.tags or [])}",
+            f"min_price_{query_params.min_price or 0}",
+            f"max_price_{query_params.max_price or 0}",
+            f"discounted_{discounted}",
+            f"has_inventory_{query_params.has_inventory if inventory_filtered else None}",
+            f"stores_{','.join(map(str, store_ids or [])) if inventory_filtered else ''}",
+            f"nearby_{is_nearby_store if inventory_filtered else None}",
+        ]
+        return ":".join(key_parts)
+
     def _generate_cache_key(
         self,
         query_params: ProductQuerySchema,
@@ -452,6 +675,7 @@ class ProductQueryService:
             f"min_price_{query_params.min_price or 0}",
             f"max_price_{query_params.max_price or 0}",
             f"discounted_{query_params.only_discounted}",
+            f"has_inventory_{query_params.has_inventory if store_ids else None}",
         ]
         return ":".join(key_parts)
 
@@ -489,11 +713,7 @@ class ProductQueryService:
                 return None
 
             # Process single result using same logic as bulk
-            products = await self._process_single_row(row, query_without_inventory)
-            if not products:
-                return None
-
-            product = products[0]
+            product = self._row_projector([row], query_without_inventory)(row)
 
         # Add real-time inventory if requested
         if query_params.include_inventory and store_ids:
@@ -544,11 +764,7 @@ class ProductQueryService:
                 return None
 
             # Process single result using same logic as bulk
-            products = await self._process_single_row(row, query_without_inventory)
-            if not products:
-                return None
-
-            product = products[0]
+            product = self._row_projector([row], query_without_inventory)(row)
 
         # Add real-time inventory if requested
         if query_params.include_inventory and store_ids:
@@ -596,18 +812,10 @@ class ProductQueryService:
         pricing_components = None
 
         if query_params.include_categories:
-            select_fields.append(
-                "STRING_AGG(DISTINCT CONCAT(c.id, '|', c.name, '|', COALESCE(c.description, ''), '|', COALESCE(c.sort_order::text, ''), '|', COALESCE(c.image_url, ''), '|', COALESCE(c.parent_category_id::text, '')), ';') as categories_data"
-            )
-            joins.append("LEFT JOIN product_categories pc ON p.id = pc.product_id")
-            joins.append("LEFT JOIN categories c ON pc.category_id = c.id")
+            select_fields.append(CATEGORIES_JSON_SELECT)
 
         if query_params.include_tags:
-            select_fields.append(
-                "STRING_AGG(DISTINCT CONCAT(t.id::text, '|', COALESCE(t.tag_type, ''), '|', COALESCE(t.name, ''), '|', COALESCE(t.slug, ''), '|', COALESCE(t.description, ''), '|', COALESCE(pt.value, '')), ';') as tags_data"
-            )
-            joins.append("LEFT JOIN product_tags pt ON p.id = pt.product_id")
-            joins.append("LEFT JOIN tags t ON pt.tag_id = t.id")
+            select_fields.append(TAGS_JSON_SELECT)
 
         if query_params.include_pricing and customer_tier:
             product_ids_for_pricing = [product_id] if product_id else None
@@ -651,12 +859,6 @@ class ProductQueryService:
         """
         return sql_query, params
 
-    async def _process_single_row(
-        self, row: Any, query_params: ProductQuerySchema
-    ) -> List[EnhancedProductSchema]:
-        """Process single row result using same logic as bulk processing"""
-        return await self._process_row_batch([row], query_params)
-
     async def get_products_by_ids(
         self,
         product_ids: List[int],
@@ -695,23 +897,11 @@ class ProductQueryService:
             if not rows:
                 return []
 
-            # Step 3: Process results using existing logic
-            from src.api.products.models import ProductQuerySchema
-
-            query_params = ProductQuerySchema(
-                limit=len(product_ids),
-                cursor=None,
-                store_id=store_ids,
-                include_pricing=include_pricing,
-                include_inventory=False,  # Set to False for processing
-                include_categories=include_categories,
-                include_tags=include_tags,
-                latitude=latitude,
-                longitude=longitude,
+            # Step 3: Process results with the shared row projection
+            products = project_product_rows(
+                rows, include_pricing, include_categories, include_tags
             )
 
-            products = await self._process_row_batch(rows, query_params)
-
             # Step 4: Add inventory if requested (consistent with get_products_with_criteria)
             if include_inventory and store_ids:
                 products = await self.inventory_service.add_inventory_to_products_bulk(
@@ -781,28 +971,11 @@ class ProductQueryService:
             if not rows:
                 return []
 
-            # Step 4: Process results using existing logic
-            from src.api.products.models import ProductQuerySchema
-
-            query_params = ProductQuerySchema(
-                limit=limit,
-                cursor=None,
-                store_id=store_ids,
-                include_pricing=include_pricing,
-                include_inventory=include_inventory,
-                include_categories=include_categories,
-                include_tags=include_tags,
-                category_ids=None,
-                tags=None,
-                min_price=None,
-                max_price=None,
-                only_discounted=False,
-                latitude=latitude,
-                longitude=longitude,
+            # Step 4: Process results with the shared row projection
+            products = project_product_rows(
+                rows, include_pricing, include_categories, include_tags
             )
 
-            products = await self._process_row_batch(rows, query_params)
-
             # Step 5: Add inventory if requested (consistent with get_products_with_criteria)
             if include_inventory and store_ids:
                 products = await self.inventory_service.add_inventory_to_products_bulk(
@@ -851,18 +1024,10 @@ class ProductQueryService:
         pricing_components = None
 
         if include_categories:
-            select_fields.append(
-                "STRING_AGG(DISTINCT CONCAT(c.id, '|', c.name, '|', COALESCE(c.description, ''), '|', COALESCE(c.sort_order::text, ''), '|', COALESCE(c.image_url, ''), '|', COALESCE(c.parent_category_id::text, '')), ';') as categories_data"
-            )
-            joins.append("LEFT JOIN product_categories pc ON p.id = pc.product_id")
-            joins.append("LEFT JOIN categories c ON pc.category_id = c.id")
+            select_fields.append(CATEGORIES_JSON_SELECT)
 
         if include_tags:
-            select_fields.append(
-                "STRING_AGG(DISTINCT CONCAT(t.id::text, '|', COALESCE(t.tag_type, ''), '|', COALESCE(t.name, ''), '|', COALESCE(t.slug, ''), '|', COALESCE(t.description, ''), '|', COALESCE(pt.value, '')), ';') as tags_data"
-            )
-            joins.append("LEFT JOIN product_tags pt ON p.id = pt.product_id")
-            joins.append("LEFT JOIN tags t ON pt.tag_id = t.id")
+            select_fields.append(TAGS_JSON_SELECT)
 
         if include_pricing and customer_tier:
             pricing_components = self.pricing_service.get_pricing_sql_components(
@@ -0,0 +1,205 @@
+"""
+Row to product projection for the product queries
+
+Product SQL (listing, single product, products by id, recent products) all
+select the same base columns plus optional category, tag and pricing
+columns. A projector is compiled once per query shape, i.e. per combination
+of those optional column groups, so per-row work is a single attrgetter call
+and the steps that shape actually needs.
+
+Rows come from our own SQL, so nothing is validated again: the listing path
+takes the JSON-ready dicts as they are, and models for the other paths are
+constructed without validation.
+"""
+
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Sequence, Type, TypeVar
+
+from pydantic import BaseModel
+
+from src.api.products.models import (
+    EnhancedProductSchema,
+    FuturePricingSchema,
+    PricingInfoSchema,
+)
+
+BASE_COLUMNS = (
+    "id",
+    "ref",
+    "name",
+    "description",
+    "brand",
+    "base_price",
+    "unit_measure",
+    "image_urls",
+    "ecommerce_category_id",
+    "ecommerce_subcategory_id",
+    "alternative_product_ids",
+    "created_at",
+    "updated_at",
+)
+
+_base_columns = attrgetter(*BASE_COLUMNS)
+_pricing_columns = attrgetter(
+    "final_price",
+    "savings",
+    "discount_percentage",
+    "price_list_names",
+    "future_pricing_data",
+)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+RowStep = Callable[[Any, Dict[str, Any]], None]
+
+
+def construct(cls: Type[ModelT], data: Dict[str, Any]) -> ModelT:
+    """model_construct for a dict that already holds every field
+
+    model_construct walks all model fields to fill defaults, which on this
+    schema costs more than validating; with a complete dict there is
+    nothing to fill, so the instance state is set directly.
+    """
+    model = cls.__new__(cls)
+    object.__setattr__(model, "__dict__", data)
+    object.__setattr__(model, "__pydantic_fields_set__", set(data))
+    object.__setattr__(model, "__pydantic_extra__", None)
+    object.__setattr__(model, "__pydantic_private__", None)
+    return model
+
+
+def _project_pricing(row: Any, data: Dict[str, Any]) -> None:
+    final_price, savings, discount_percentage, price_list_names, future = (
+        _pricing_columns(row)
+    )
+    base_price = data["base_price"]
+    data["pricing"] = {
+        "base_price": base_price,
+        "final_price": float(final_price) if final_price is not None else base_price,
+        "discount_applied": float(savings) if savings is not None else 0.0,
+        "discount_percentage": (
+            float(discount_percentage) if discount_percentage is not None else 0.0
+        ),
+        "applied_price_lists": price_list_names.split(";") if price_list_names else [],
+    }
+    # The tiers arrive as a list of dicts from JSON_AGG
+    if future and isinstance(future, list):
+        data["future_pricing"] = [
+            {
+                "min_quantity": int(tier["min_quantity"]),
+                "final_price": float(tier["final_price"]),
+                "discount_percentage": float(tier["discount_percentage"]),
+            }
+            for tier in future
+        ]
+
+
+def _project_categories(row: Any, data: Dict[str, Any]) -> None:
+    # Already a list of dicts from JSON_AGG
+    data["categories"] = row.categories_data or []
+
+
+def _project_tags(row: Any, data: Dict[str, Any]) -> None:
+    data["product_tags"] = row.tags_data or []
+
+
+class ProductRowProjector:
+    """Maps rows of one query shape to products"""
+
+    __slots__ = ("_steps",)
+
+    def __init__(self, steps: Sequence[RowStep]):
+        self._steps = tuple(steps)
+
+    def to_dict(self, row: Any) -> Dict[str, Any]:
+        """JSON-ready product, in schema field order (orjson encodes the datetimes)"""
+        (
+            product_id,
+            ref,
+            name,
+            description,
+            brand,
+            base_price,
+            unit_measure,
+            image_urls,
+            ecommerce_category_id,
+            ecommerce_subcategory_id,
+            alternative_product_ids,
+            created_at,
+            updated_at,
+        ) = _base_columns(row)
+        data: Dict[str, Any] = {
+            "id": product_id,
+            "ref": ref,
+            "name": name,
+            "description": description,
+            "brand": brand,
+            "base_price": float(base_price),
+            "unit_measure": unit_measure,
+            "image_urls": image_urls or [],
+            "ecommerce_category_id": ecommerce_category_id,
+            "ecommerce_subcategory_id": ecommerce_subcategory_id,
+            "alternative_product_ids": alternative_product_ids or [],
+            "created_at": created_at,
+            "updated_at": updated_at,
+            "categories": [],
+            "product_tags": [],
+            "pricing": None,
+            "inventory": None,
+            "alternatives": None,
+            "future_pricing": None,
+        }
+        for step in self._steps:
+            step(row, data)
+        return data
+
+    def __call__(self, row: Any) -> EnhancedProductSchema:
+        data = self.to_dict(row)
+        if data["pricing"] is not None:
+            data["pricing"] = construct(PricingInfoSchema, data["pricing"])
+        if data["future_pricing"] is not None:
+            data["future_pricing"] = [
+                construct(FuturePricingSchema, tier) for tier in data["future_pricing"]
+            ]
+        return construct(EnhancedProductSchema, data)
+
+
+@lru_cache(maxsize=16)
+def get_row_projector(
+    include_categories: bool, include_tags: bool, include_pricing: bool
+) -> ProductRowProjector:
+    """Compiled projector for a query shape; the flags say which columns exist"""
+    steps: List[RowStep] = []
+    if include_categories:
+        steps.append(_project_categories)
+    if include_tags:
+        steps.append(_project_tags)
+    if include_pricing:
+        steps.append(_project_pricing)
+    return ProductRowProjector(steps)
+
+
+def row_projector_for(
+    rows: Sequence[Any],
+    include_pricing: bool = True,
+    include_categories: bool = False,
+    include_tags: bool = False,
+) -> ProductRowProjector:
+    # Pricing columns are only selected when a customer tier is known
+    has_pricing = (
+        bool(include_pricing) and bool(rows) and hasattr(rows[0], "final_price")
+    )
+    return get_row_projector(bool(include_categories), bool(include_tags), has_pricing)
+
+
+def project_product_rows(
+    rows: Sequence[Any],
+    include_pricing: bool = True,
+    include_categories: bool = False,
+    include_tags: bool = False,
+) -> List[EnhancedProductSchema]:
+    """Project rows from any of the product queries into models"""
+    projector = row_projector_for(
+        rows, include_pricing, include_categories, include_tags
+    )
+    return [projector(row) for row in rows]
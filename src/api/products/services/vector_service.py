@@ -1,25 +1,18 @@
-import gc
-import json
 import logging
 from typing import List, Optional
-from sqlalchemy import text
 from sqlalchemy.future import select
 
-from src.config.constants import (
-    NEXT_DAY_DELIVERY_ONLY_TAG_ID,
-    SEARCH_TFIDF_MAX_FEATURES,
-    SEARCH_VECTOR_DIM,
-)
 from src.database.connection import AsyncSessionLocal
-from src.database.models.product import Product
 from src.database.models.product_vector import ProductVector
 from src.shared.error_handler import ErrorHandler
 
 
 class VectorService:
     """
-    Service for product search vector placeholders.
-    (Vector search disabled for Vercel deployment)
+    Service for product vectors.
+
+    Vectors live in the semantic index (src/api/search/semantic.py), which
+    embeds the whole catalogue at once; there is no per-product model run.
     """
 
     def __init__(self):
@@ -39,7 +32,7 @@ class VectorService:
         return None
 
     async def vectorize_product(self, product_id: int, version: int = 1) -> bool:
-        """Disabled for Vercel deployment"""
+        """Picked up by the next index rebuild; see vectorize_all_products"""
         return True
 
     async def vectorize_products_batch(
@@ -48,14 +41,29 @@ class VectorService:
         version: int = 1,
         batch_size: int = 8,
     ) -> dict:
-        """Disabled for Vercel deployment"""
+        """Picked up by the next index rebuild; see vectorize_all_products"""
         return {"success": len(product_ids), "failed": 0, "skipped": 0}
 
     async def vectorize_all_products(
         self, version: int = 1, only_missing: bool = False
     ) -> dict:
-        """Disabled for Vercel deployment"""
-        return {"success": 0, "failed": 0, "skipped": 0}
+        """
+        Rebuild the semantic index file from the catalogue.
+
+        Every product is embedded on each rebuild, so only_missing has no
+        effect. This process switches to the new file immediately; other
+        workers pick it up when their snapshot expires.
+        """
+        # Imported here: the search package imports the product services
+        from src.api.search.semantic import rebuild_semantic_index, semantic_index
+
+        try:
+            index = await rebuild_semantic_index()
+            semantic_index.invalidate()
+            return {"success": len(index), "failed": 0, "skipped": 0}
+        except Exception as e:
+            self.logger.error(f"Error rebuilding semantic index: {e}", exc_info=True)
+            return {"success": 0, "failed": 1, "skipped": 0}
 
     async def update_product_vector(self, product_id: int) -> bool:
         """
@@ -105,5 +113,33 @@ class VectorService:
         limit: int = 10,
         min_similarity: float = 0.5,
     ) -> List[tuple]:
-        """Disabled for Vercel deployment"""
-        return []
+        """
+        Products closest to product_id in the semantic index.
+
+        Args:
+            product_id: Product to match
+            limit: Max similar products
+            min_similarity: Minimum cosine similarity
+
+        Returns:
+            List of (product_id, similarity), most similar first
+        """
+        from src.api.search.semantic import semantic_index
+
+        try:
+            index = await semantic_index.get()
+            found, vectors = index.vectors_for([product_id])
+            if not found:
+                return []
+            # One extra, since the product itself is its closest match
+            hits = index.search(vectors[0], limit + 1)
+            return [
+                (similar_id, similarity)
+                for similar_id, similarity in hits
+                if similar_id != product_id and similarity >= min_similarity
+            ][:limit]
+        except Exception as e:
+            self.logger.error(
+                f"Error finding products similar to {product_id}: {e}", exc_info=True
+            )
+            return []
@@ -2,6 +2,7 @@ from typing import List, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+from src.api.products.models import ProductFacetsSchema
 from src.config.constants import (
     SEARCH_DROPDOWN_LIMIT,
     SEARCH_FULL_DEFAULT_LIMIT,
@@ -48,6 +49,13 @@ class SearchMetadataSchema(BaseModel):
         None, description="Filters that were applied"
     )
     error: Optional[str] = Field(None, description="Error message if search failed")
+    corrected_query: Optional[str] = Field(
+        None,
+        description="Spelling-corrected query whose results were returned, when the query itself matched nothing",
+    )
+    did_you_mean: Optional[str] = Field(
+        None, description="Spelling correction that matches more products"
+    )
 
 
 class SearchDropdownResponse(BaseModel):
@@ -70,6 +78,9 @@ class SearchFullResponse(BaseModel):
         default_factory=list, description="Full product details"
     )
     total_results: int = Field(..., description="Total number of products returned")
+    facets: Optional[ProductFacetsSchema] = Field(
+        None, description="Facet counts over all matching products, if requested"
+    )
     search_metadata: SearchMetadataSchema
 
 
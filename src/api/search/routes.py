@@ -17,8 +17,9 @@ from src.config.constants import (
     SearchMode,
 )
 from src.dependencies.auth import get_current_user, get_optional_user
+from src.dependencies.rate_limit import TierRateLimit
 from src.dependencies.tiers import get_user_tier
-from src.shared.responses import success_response
+from src.shared.responses import orjson_success_response, success_response
 
 search_router = APIRouter(prefix="/products/search", tags=["Search"])
 search_service = SearchService()
@@ -28,6 +29,7 @@ search_service = SearchService()
     "",
     summary="Search products with as-you-type support",
     response_model=Union[SearchDropdownResponse, SearchFullResponse],
+    dependencies=[Depends(TierRateLimit("search"))],
 )
 async def search_products(
     q: str = Query(
@@ -58,6 +60,10 @@ async def search_products(
     ),
     min_price: Optional[float] = Query(None, ge=0, description="Minimum price filter"),
     max_price: Optional[float] = Query(None, ge=0, description="Maximum price filter"),
+    include_facets: bool = Query(
+        False,
+        description="Full mode: include facet counts over all matching products",
+    ),
     store_id: Optional[List[int]] = Query(
         None, description="Store IDs for multi-store inventory data"
     ),
@@ -140,12 +146,13 @@ async def search_products(
         category_ids=category_ids,
         min_price=min_price,
         max_price=max_price,
+        include_facets=include_facets,
         store_ids=store_id,
         latitude=latitude,
         longitude=longitude,
     )
 
-    return success_response(result)
+    return orjson_success_response(result)
 
 
 @search_router.post(
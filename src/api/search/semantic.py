@@ -0,0 +1,391 @@
+"""
+Semantic product retrieval without a model download
+
+Products and queries are embedded with feature hashing: the word tokens and
+character trigrams of a text are hashed (crc32, so vectors are stable across
+processes) into SEARCH_VECTOR_DIM signed dimensions, weighted by an IDF
+table over hashed features and L2-normalized. Trigrams make "choc milk" land
+near "Chocolate Milk" and survive typos; IDF keeps common words like "pack"
+from dominating.
+
+Vectors are quantized to int8 with one float scale per product, a quarter of
+float32. They are searched with an inverted file (IVF) index: spherical
+k-means centroids partition the products, each partition is stored
+contiguously, and a query scans only the SEMANTIC_IVF_PROBES partitions
+closest to it.
+
+The whole index is written to a single file and memory-mapped. Gunicorn
+workers on one host share the same pages, and a restart reuses a recent
+file instead of re-embedding the catalogue.
+"""
+
+import asyncio
+import json
+import math
+import os
+import tempfile
+import time
+import zlib
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import text
+
+from src.api.search.spelling import tokenize
+from src.config.constants import (
+    SEARCH_HYBRID_WEIGHT_SEMANTIC,
+    SEARCH_HYBRID_WEIGHT_TFIDF,
+    SEARCH_VECTOR_DIM,
+    SEMANTIC_IDF_BUCKETS,
+    SEMANTIC_INDEX_FILE,
+    SEMANTIC_INDEX_MAX_AGE_SECONDS,
+    SEMANTIC_IVF_PROBES,
+)
+from src.database.connection import AsyncSessionLocal
+from src.shared.snapshot import SnapshotIndex
+from src.shared.utils import get_logger
+
+logger = get_logger(__name__)
+
+SEMANTIC_INDEX_PATH = os.path.join(tempfile.gettempdir(), SEMANTIC_INDEX_FILE)
+
+_MAGIC = b"CSEMIDX1"
+_ALIGN = 64
+_TRIGRAM_WEIGHT = 0.5
+
+# Field weights of the product text; names say what a product is
+PRODUCT_FIELD_WEIGHTS = (("name", 1.0), ("brand", 0.6), ("description", 0.25))
+
+_ARRAYS = ("product_ids", "scales", "vectors", "centroids", "offsets", "idf", "order")
+
+
+def _hashes(value: Optional[str]) -> Tuple[List[int], List[float]]:
+    """crc32 of each word and word trigram, with their weights"""
+    hashes: List[int] = []
+    weights: List[float] = []
+    for word in tokenize(value):
+        hashes.append(zlib.crc32(word.encode()))
+        weights.append(1.0)
+        padded = f" {word} "
+        for i in range(len(padded) - 2):
+            hashes.append(zlib.crc32(padded[i : i + 3].encode()))
+            weights.append(_TRIGRAM_WEIGHT)
+    return hashes, weights
+
+
+def _document_features(
+    fields: Sequence[Tuple[Optional[str], float]],
+) -> Tuple[np.ndarray, np.ndarray]:
+    hashes: List[int] = []
+    weights: List[float] = []
+    for value, field_weight in fields:
+        h, w = _hashes(value)
+        hashes.extend(h)
+        weights.extend(x * field_weight for x in w)
+    return np.asarray(hashes, dtype=np.uint32), np.asarray(weights, dtype=np.float32)
+
+
+def _embed(
+    features: Sequence[Tuple[np.ndarray, np.ndarray]], idf: np.ndarray, dim: int
+) -> np.ndarray:
+    """Unit float32 vectors, one row per (hashes, weights) document"""
+    if not features:
+        return np.zeros((0, dim), dtype=np.float32)
+    lengths = np.fromiter((len(h) for h, _ in features), dtype=np.int64)
+    hashes = np.concatenate([h for h, _ in features])
+    weights = np.concatenate([w for _, w in features])
+    rows = np.repeat(np.arange(len(features)), lengths)
+
+    signs = np.where(hashes & 1, np.float32(-1), np.float32(1))
+    columns = (hashes >> 1) % dim
+    values = weights * signs * idf[hashes % len(idf)]
+    vectors = np.bincount(
+        rows * dim + columns, weights=values, minlength=len(features) * dim
+    ).reshape(len(features), dim)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return (vectors / np.maximum(norms, 1e-12)).astype(np.float32)
+
+
+def _quantize(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """int8 rows and the float scale that restores each one"""
+    scales = np.abs(vectors).max(axis=1) / 127
+    scales[scales == 0] = 1
+    quantized = np.round(vectors / scales[:, None]).astype(np.int8)
+    return quantized, scales.astype(np.float32)
+
+
+def _kmeans(
+    vectors: np.ndarray, n_lists: int, iterations: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Spherical k-means centroids"""
+    centroids = vectors[rng.choice(len(vectors), n_lists, replace=False)].copy()
+    for _ in range(iterations):
+        assign = np.argmax(vectors @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, vectors)
+        norms = np.linalg.norm(sums, axis=1)
+        # An empty list keeps its old centroid
+        filled = norms > 0
+        centroids[filled] = sums[filled] / norms[filled, None]
+    return centroids
+
+
+def _assign(
+    vectors: np.ndarray, centroids: np.ndarray, chunk: int = 8192
+) -> np.ndarray:
+    """Closest centroid of each vector, a chunk at a time to bound memory"""
+    assign = np.zeros(len(vectors), dtype=np.int64)
+    for i in range(0, len(vectors), chunk):
+        assign[i : i + chunk] = np.argmax(vectors[i : i + chunk] @ centroids.T, axis=1)
+    return assign
+
+
+class SemanticIndex:
+    """Immutable int8 IVF index over product embeddings"""
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self.product_ids = arrays["product_ids"]  # IVF list order
+        self.scales = arrays["scales"]
+        self.vectors = arrays["vectors"]
+        self.centroids = arrays["centroids"]
+        self.offsets = arrays["offsets"]  # list i is rows offsets[i]:offsets[i+1]
+        self.idf = arrays["idf"]
+        self.order = arrays["order"]  # rows sorted by product id
+        self.dim = self.vectors.shape[1]
+
+    def __len__(self) -> int:
+        return len(self.product_ids)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, name).nbytes for name in _ARRAYS)
+
+    @classmethod
+    def build(
+        cls,
+        products: Iterable[Tuple[int, Sequence[Optional[str]]]],
+        dim: int = SEARCH_VECTOR_DIM,
+        idf_buckets: int = SEMANTIC_IDF_BUCKETS,
+        n_lists: Optional[int] = None,
+        iterations: int = 10,
+        seed: int = 0,
+    ) -> "SemanticIndex":
+        """
+        Index (product_id, field values) rows; fields follow
+        PRODUCT_FIELD_WEIGHTS. n_lists defaults to sqrt(products).
+        """
+        ids: List[int] = []
+        features: List[Tuple[np.ndarray, np.ndarray]] = []
+        for product_id, values in products:
+            ids.append(product_id)
+            features.append(
+                _document_features(
+                    [(v, w) for v, (_, w) in zip(values, PRODUCT_FIELD_WEIGHTS)]
+                )
+            )
+
+        # Smoothed IDF over the hashed features each product contains
+        df = np.zeros(idf_buckets, dtype=np.int64)
+        for hashes, _ in features:
+            df[np.unique(hashes % idf_buckets)] += 1
+        # float16 halves the table; queries then see the same values
+        idf = (np.log((1 + len(ids)) / (1 + df)) + 1).astype(np.float16)
+
+        vectors = _embed(features, idf, dim)
+        n_lists = n_lists or max(1, round(math.sqrt(len(ids))))
+        n_lists = min(n_lists, max(len(ids), 1))
+        rng = np.random.default_rng(seed)
+        if len(ids):
+            sample = vectors[
+                rng.choice(len(ids), min(len(ids), 64 * n_lists), replace=False)
+            ]
+            centroids = _kmeans(sample, n_lists, iterations, rng)
+        else:
+            centroids = np.zeros((n_lists, dim), dtype=np.float32)
+
+        assign = _assign(vectors, centroids)
+        rows = np.argsort(assign, kind="stable")
+        offsets = np.searchsorted(assign[rows], np.arange(n_lists + 1))
+        quantized, scales = _quantize(vectors[rows])
+        product_ids = np.asarray(ids, dtype=np.int64)[rows]
+        return cls(
+            {
+                "product_ids": product_ids,
+                "scales": scales,
+                "vectors": quantized,
+                "centroids": centroids.astype(np.float32),
+                "offsets": offsets.astype(np.int64),
+                "idf": idf,
+                "order": np.argsort(product_ids, kind="stable"),
+            }
+        )
+
+    def embed(self, query: str) -> np.ndarray:
+        """Unit query vector in the index's space"""
+        hashes, weights = _hashes(query)
+        return _embed(
+            [
+                (
+                    np.asarray(hashes, dtype=np.uint32),
+                    np.asarray(weights, dtype=np.float32),
+                )
+            ],
+            self.idf,
+            self.dim,
+        )[0]
+
+    def _top(
+        self, spans: Sequence[Tuple[int, int]], vector: np.ndarray, k: int
+    ) -> List[Tuple[int, float]]:
+        """Top-k over row spans; lists are contiguous, so these are slices"""
+        if not vector.any():
+            return []
+        rows = np.concatenate(
+            [np.arange(start, end) for start, end in spans] or [np.zeros(0, int)]
+        )
+        if not len(rows):
+            return []
+        scores = np.concatenate(
+            [
+                (self.vectors[start:end].astype(np.float32) @ vector)
+                * self.scales[start:end]
+                for start, end in spans
+            ]
+        )
+        if len(scores) > k:
+            best = np.argpartition(-scores, k - 1)[:k]
+        else:
+            best = np.arange(len(scores))
+        best = best[np.argsort(-scores[best], kind="stable")]
+        return [(int(self.product_ids[rows[i]]), float(scores[i])) for i in best]
+
+    def search(
+        self, vector: np.ndarray, k: int, n_probe: int = SEMANTIC_IVF_PROBES
+    ) -> List[Tuple[int, float]]:
+        """Approximate top-k (product_id, cosine) from the closest lists"""
+        probes = np.argsort(-(self.centroids @ vector))[:n_probe]
+        return self._top(
+            [(int(self.offsets[p]), int(self.offsets[p + 1])) for p in probes],
+            vector,
+            k,
+        )
+
+    def search_exact(self, vector: np.ndarray, k: int) -> List[Tuple[int, float]]:
+        """Brute-force top-k over every product"""
+        return self._top([(0, len(self))], vector, k)
+
+    def vectors_for(self, product_ids: Sequence[int]) -> Tuple[List[int], np.ndarray]:
+        """(indexed ids, their float32 vectors); unknown ids are skipped"""
+        wanted = np.asarray(product_ids, dtype=np.int64)
+        sorted_ids = self.product_ids[self.order]
+        pos = np.searchsorted(sorted_ids, wanted)
+        pos = np.minimum(pos, max(len(sorted_ids) - 1, 0))
+        found = (
+            sorted_ids[pos] == wanted if len(sorted_ids) else np.zeros(0, dtype=bool)
+        )
+        rows = self.order[pos[found]]
+        vectors = self.vectors[rows].astype(np.float32) * self.scales[rows, None]
+        return wanted[found].tolist(), vectors
+
+    def save(self, path: str) -> None:
+        """Write the index file atomically"""
+        header = {}
+        offset = 0
+        for name in _ARRAYS:
+            array = getattr(self, name)
+            header[name] = [array.dtype.str, list(array.shape), offset]
+            offset += -(-array.nbytes // _ALIGN) * _ALIGN
+        encoded = json.dumps(header).encode()
+        data_start = -(-(len(_MAGIC) + 4 + len(encoded)) // _ALIGN) * _ALIGN
+
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_MAGIC + len(encoded).to_bytes(4, "little") + encoded)
+            for name in _ARRAYS:
+                f.seek(data_start + header[name][2])
+                f.write(np.ascontiguousarray(getattr(self, name)).tobytes())
+            f.truncate(data_start + offset)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "SemanticIndex":
+        """Memory-map an index file written by save"""
+        with open(path, "rb") as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f"{path} is not a semantic index file")
+            header = json.loads(f.read(int.from_bytes(f.read(4), "little")))
+            data_start = -(-f.tell() // _ALIGN) * _ALIGN
+        mapped = np.memmap(path, dtype=np.uint8, mode="r")
+        arrays = {}
+        for name, (dtype, shape, offset) in header.items():
+            count = math.prod(shape)
+            start = data_start + offset
+            arrays[name] = (
+                mapped[start : start + count * np.dtype(dtype).itemsize]
+                .view(dtype)
+                .reshape(shape)
+            )
+        return cls(arrays)
+
+
+def _build_and_save(rows: Sequence[Tuple], path: str) -> SemanticIndex:
+    index = SemanticIndex.build((row[0], row[1:]) for row in rows)
+    try:
+        index.save(path)
+        # Serve from the mapping so workers share the pages
+        return SemanticIndex.load(path)
+    except OSError as e:
+        logger.warning(f"Could not write semantic index file {path}: {e}")
+        return index
+
+
+async def rebuild_semantic_index(path: str = SEMANTIC_INDEX_PATH) -> SemanticIndex:
+    """Embed the catalogue and replace the index file"""
+    async with AsyncSessionLocal() as session:
+        products = await session.execute(
+            text("SELECT id, name, brand, description FROM products")
+        )
+        rows = products.tuples().all()
+    # Embedding and clustering are CPU bound; keep them off the event loop
+    return await asyncio.to_thread(_build_and_save, rows, path)
+
+
+async def load_semantic_index(path: str = SEMANTIC_INDEX_PATH) -> SemanticIndex:
+    """The index file if it is recent, else a rebuilt one"""
+    try:
+        if time.time() - os.path.getmtime(path) < SEMANTIC_INDEX_MAX_AGE_SECONDS:
+            return SemanticIndex.load(path)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring semantic index file {path}: {e}")
+    return await rebuild_semantic_index(path)
+
+
+def blend_scores(
+    keyword_scores: Dict[int, float],
+    semantic_scores: Dict[int, float],
+    keyword_weight: float = SEARCH_HYBRID_WEIGHT_TFIDF,
+    semantic_weight: float = SEARCH_HYBRID_WEIGHT_SEMANTIC,
+) -> List[int]:
+    """
+    Product ids by blended score, best first.
+
+    Keyword scores are scaled to the best keyword match so both signals are
+    on a 0-1 range; a product missing from one side scores 0 there.
+    """
+    top_keyword = max(keyword_scores.values(), default=0.0) or 1.0
+    blended = {
+        product_id: keyword_weight * score / top_keyword
+        for product_id, score in keyword_scores.items()
+    }
+    for product_id, similarity in semantic_scores.items():
+        blended[product_id] = (
+            blended.get(product_id, 0.0) + semantic_weight * similarity
+        )
+    return sorted(blended, key=lambda product_id: (-blended[product_id], product_id))
+
+
+semantic_index = SnapshotIndex(
+    "semantic index", load_semantic_index, max_age=SEMANTIC_INDEX_MAX_AGE_SECONDS
+)
@@ -1,21 +1,27 @@
-import asyncio
 import json
 import logging
 from datetime import datetime
-from typing import List, Optional, cast
+from typing import Any, Dict, List, Optional, Tuple, cast
 
+import orjson
 from sqlalchemy import and_, desc, text
 from sqlalchemy.future import select
 
+from src.api.products.facets import build_facet_sql, decode_facet_rows
 from src.api.products.models import EnhancedProductSchema
 from src.api.products.service import ProductService
+from src.api.search.semantic import blend_scores, semantic_index
+from src.api.search.spelling import spelling_index
 from src.api.stores.service import StoreService
+from src.config.cache_config import CacheConfig
 from src.config.constants import (
     MIN_SEARCH_COUNT_FOR_SUGGESTION,
     MIN_SUCCESS_RATE_FOR_SUGGESTION,
     SEARCH_DROPDOWN_LIMIT,
     SEARCH_FULL_DEFAULT_LIMIT,
     SEARCH_MIN_QUERY_LENGTH,
+    SEMANTIC_MIN_SIMILARITY,
+    SPELLING_CORRECTION_MAX_RESULTS,
     InteractionType,
     SearchMode,
 )
@@ -23,15 +29,27 @@ from src.database.connection import AsyncSessionLocal
 from src.database.models.product_interaction import ProductInteraction
 from src.database.models.search_interaction import SearchInteraction
 from src.database.models.search_suggestion import SearchSuggestion
+from src.shared.background_tasks import spawn
+from src.shared.cache_service import cache_service
 from src.shared.error_handler import ErrorHandler
 
 
+# Products a query matches; shared by the result query and the facet counts
+SEARCH_MATCH_CONDITION = """(
+                    p.name ILIKE :fuzzy_query
+                    OR p.brand ILIKE :fuzzy_query
+                    OR p.description ILIKE :fuzzy_query
+                    OR to_tsvector('english', COALESCE(p.name, '') || ' ' || COALESCE(p.brand, '') || ' ' || COALESCE(p.description, '')) @@ plainto_tsquery('english', :query)
+                )"""
+
+
 class SearchService:
     """
     Service for product search functionality.
 
-    Implements keyword search combining:
+    Implements hybrid search combining:
     - PostgreSQL full-text search / ILIKE
+    - Semantic similarity over hashing embeddings (src/api/search/semantic.py)
     - Search tracking and analytics
     - Search suggestions
     """
@@ -70,6 +88,7 @@ class SearchService:
         category_ids: Optional[List[int]] = None,
         min_price: Optional[float] = None,
         max_price: Optional[float] = None,
+        include_facets: bool = False,
         store_ids: Optional[List[int]] = None,
         latitude: Optional[float] = None,
         longitude: Optional[float] = None,
@@ -90,6 +109,7 @@ class SearchService:
             category_ids: Filter by categories
             min_price: Minimum price filter
             max_price: Maximum price filter
+            include_facets: Full mode only; add facet counts over all matches
             store_ids: Store IDs for inventory
             latitude: User latitude for inventory
             longitude: User longitude for inventory
@@ -143,6 +163,7 @@ class SearchService:
                 category_ids=category_ids,
                 min_price=min_price,
                 max_price=max_price,
+                include_facets=include_facets,
                 store_ids=store_ids,
                 latitude=latitude,
                 longitude=longitude,
@@ -153,7 +174,8 @@ class SearchService:
 
         # Track search interaction (async, don't wait)
         if user_id:
-            asyncio.create_task(
+            spawn(
+                "track_search",
                 self._track_search_interaction(
                     user_id=user_id,
                     query=query,
@@ -167,7 +189,7 @@ class SearchService:
                             "max_price": max_price,
                         },
                     },
-                )
+                ),
             )
 
         # Add metadata
@@ -175,6 +197,7 @@ class SearchService:
             "query": query,
             "search_time_ms": round(search_time_ms, 2),
             "mode": mode.value,
+            **result.pop("spelling", {}),
         }
 
         return result
@@ -196,7 +219,7 @@ class SearchService:
         suggestions = await self._get_search_suggestions(query, limit=3)
 
         # Get top matching products (lightweight)
-        products = await self._search_hybrid(
+        products, spelling = await self._search_with_correction(
             query=query,
             limit=limit,
             include_pricing=True,
@@ -227,6 +250,7 @@ class SearchService:
             "suggestions": suggestions,
             "products": lightweight_products,
             "total_results": len(lightweight_products),
+            "spelling": spelling,
         }
 
     async def _search_full(
@@ -242,6 +266,7 @@ class SearchService:
         category_ids: Optional[List[int]] = None,
         min_price: Optional[float] = None,
         max_price: Optional[float] = None,
+        include_facets: bool = False,
         store_ids: Optional[List[int]] = None,
         latitude: Optional[float] = None,
         longitude: Optional[float] = None,
@@ -265,7 +290,7 @@ class SearchService:
             effective_store_ids = cast(List[int], effective_store_ids)
 
         # Perform hybrid search
-        products = await self._search_hybrid(
+        products, spelling = await self._search_with_correction(
             query=query,
             limit=limit,
             include_pricing=include_pricing,
@@ -282,14 +307,57 @@ class SearchService:
             longitude=longitude,
         )
 
-        # Convert Pydantic models to dicts for JSON serialization
-        # mode='json' handles datetime, Decimal, and other special types
-        serialized_products = [p.model_dump(mode="json") for p in products]
+        # Serialize each product straight to JSON bytes; the route embeds the
+        # fragments as-is instead of walking intermediate dicts again
+        serialized_products = [orjson.Fragment(p.model_dump_json()) for p in products]
 
-        return {
+        result = {
             "products": serialized_products,
             "total_results": len(serialized_products),
+            "spelling": spelling,
         }
+        if include_facets:
+            # Facets describe the results returned, corrected or not
+            result["facets"] = await self._get_search_facets(
+                spelling.get("corrected_query", query), customer_tier
+            )
+        return result
+
+    async def _search_with_correction(
+        self, query: str, **search_kwargs: Any
+    ) -> Tuple[List[EnhancedProductSchema], Dict[str, str]]:
+        """
+        _search_hybrid, retried with a spelling correction on low results.
+
+        When the query found nothing and its correction finds products, those
+        are returned instead (``corrected_query``). When the correction only
+        finds more, the original results stay and the correction is offered
+        as ``did_you_mean``.
+        """
+        products = await self._search_hybrid(query=query, **search_kwargs)
+        if len(products) >= SPELLING_CORRECTION_MAX_RESULTS:
+            return products, {}
+
+        corrected = await self._correct_spelling(query)
+        if corrected is None:
+            return products, {}
+        corrected_products = await self._search_hybrid(
+            query=corrected, **search_kwargs
+        )
+        if not products and corrected_products:
+            return corrected_products, {"corrected_query": corrected}
+        if len(corrected_products) > len(products):
+            return products, {"did_you_mean": corrected}
+        return products, {}
+
+    async def _correct_spelling(self, query: str) -> Optional[str]:
+        """Corrected query from the spelling index, or None"""
+        try:
+            index = await spelling_index.get()
+        except Exception as e:
+            self.logger.error(f"Error loading spelling index: {e}")
+            return None
+        return index.correct_query(query)
 
     async def _search_hybrid(
         self,
@@ -309,15 +377,15 @@ class SearchService:
         longitude: Optional[float] = None,
     ) -> List[EnhancedProductSchema]:
         """
-        Basic SQL text search replacement for vector hybrid search.
-        Uses ILIKE and basic keyword matching for Vercel efficiency.
+        Hybrid search: SQL keyword ranking (ILIKE and full-text) blended with
+        semantic similarity from the in-memory hashing-embedding index.
         """
         try:
             async with AsyncSessionLocal() as session:
                 # Basic SQL search on name, description, and brand
                 # We also use the tsvector keyword data from product_vectors if it exists,
                 # fall back to basic products table otherwise.
-                search_query = """
+                search_query = f"""
                 SELECT 
                     p.id,
                     (
@@ -332,10 +400,7 @@ class SearchService:
                         ) * 2.0
                     ) as combined_score
                 FROM products p
-                WHERE p.name ILIKE :fuzzy_query
-                   OR p.brand ILIKE :fuzzy_query
-                   OR p.description ILIKE :fuzzy_query
-                   OR to_tsvector('english', COALESCE(p.name, '') || ' ' || COALESCE(p.brand, '') || ' ' || COALESCE(p.description, '')) @@ plainto_tsquery('english', :query)
+                WHERE {SEARCH_MATCH_CONDITION}
                 ORDER BY combined_score DESC
                 LIMIT :search_limit
                 """
@@ -350,13 +415,17 @@ class SearchService:
                         "search_limit": limit * 2,
                     },
                 )
-                rows = result.fetchall()
+                keyword_scores = {
+                    row.id: float(row.combined_score) for row in result.fetchall()
+                }
+                semantic_scores = self._semantic_scores(query, limit * 2)
+                product_ids = blend_scores(keyword_scores, semantic_scores)[
+                    : limit * 2
+                ]
 
-                if not rows:
+                if not product_ids:
                     return []
 
-                product_ids = [row.id for row in rows]
-
                 # Get full product data using existing ProductQueryService
                 products = await self.product_service.query_service.get_products_by_ids(
                     product_ids=product_ids,
@@ -372,7 +441,9 @@ class SearchService:
                 )
 
                 # Maintain scoring order
-                product_order_map = {pid: idx for idx, pid in enumerate(product_ids)}
+                product_order_map: Dict[Optional[int], int] = {
+                    pid: idx for idx, pid in enumerate(product_ids)
+                }
                 products.sort(key=lambda p: product_order_map.get(p.id, len(product_ids)))
 
                 return products[:limit]
@@ -381,6 +452,54 @@ class SearchService:
             self.logger.error(f"Error in text search: {e}", exc_info=True)
             return []
 
+    def _semantic_scores(self, query: str, k: int) -> Dict[int, float]:
+        """
+        Cosine similarity of the k closest products above SEMANTIC_MIN_SIMILARITY.
+
+        Never waits for the index: until the first build finishes, search is
+        keyword-only.
+        """
+        try:
+            index = semantic_index.peek()
+            if index is None:
+                return {}
+            return {
+                product_id: similarity
+                for product_id, similarity in index.search(index.embed(query), k)
+                if similarity >= SEMANTIC_MIN_SIMILARITY
+            }
+        except Exception as e:
+            self.logger.error(f"Error in semantic search: {e}")
+            return {}
+
+    async def _get_search_facets(
+        self, query: str, customer_tier: Optional[int] = None
+    ) -> dict:
+        """Facet counts over every product the query matches, not just the page"""
+        cache_key = f"search_facets:tier_{customer_tier or 0}:{query.lower()}"
+        cached_facets = await cache_service.get(cache_key)
+        if cached_facets is not None:
+            return cached_facets
+
+        pricing_components = (
+            self.product_service.query_service.pricing_service.get_pricing_sql_components(
+                customer_tier
+            )
+            if customer_tier
+            else None
+        )
+        sql_query, params = build_facet_sql(
+            [SEARCH_MATCH_CONDITION],
+            {"query": query, "fuzzy_query": f"%{query}%"},
+            pricing_components,
+        )
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(text(sql_query), params)
+            facets = decode_facet_rows(result.fetchall())
+
+        await cache_service.set(cache_key, facets, ttl=CacheConfig.PRODUCT_DATA_TTL)
+        return facets
+
     async def _get_search_suggestions(self, query: str, limit: int = 5) -> List[dict]:
         """
         Get search suggestions based on query.
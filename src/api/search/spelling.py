@@ -0,0 +1,253 @@
+"""
+Spelling correction for low-result searches
+
+A symmetric-delete (SymSpell) index over the search vocabulary: product
+name and brand tokens plus the tokens of popular search suggestions. Every
+term is indexed under the strings left by deleting up to max_distance
+characters from its prefix. A misspelled word generates its own deletes, so
+the candidate terms come from a handful of lookups rather than from edits
+against the whole vocabulary. Each candidate is then verified with a
+bounded edit distance.
+
+Deletes are not stored as strings. Each one is packed with its term id into
+a single 64-bit key, ``hash(delete) << TERM_BITS | term_id``, and the keys
+are kept in one sorted ``array("q")`` (8 bytes per delete) that is searched
+with bisect. Two deletes with the same truncated hash only add a candidate,
+and verification drops it.
+
+The index is rebuilt off the event loop at most once per
+SPELLING_INDEX_MAX_AGE_SECONDS, and the previous snapshot keeps serving
+while the rebuild runs. Catalogue writes do not invalidate it; a term added
+since the last build is simply not suggested yet.
+"""
+
+import asyncio
+import re
+import sys
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import text
+
+from src.config.constants import (
+    MIN_SEARCH_COUNT_FOR_SUGGESTION,
+    MIN_SUCCESS_RATE_FOR_SUGGESTION,
+    SPELLING_INDEX_MAX_AGE_SECONDS,
+    SPELLING_MAX_EDIT_DISTANCE,
+    SPELLING_MIN_TERM_LENGTH,
+    SPELLING_PREFIX_LENGTH,
+)
+from src.database.connection import AsyncSessionLocal
+from src.shared.snapshot import SnapshotIndex
+
+TERM_BITS = 23  # up to 8M terms
+HASH_BITS = 63 - TERM_BITS
+_TERM_MASK = (1 << TERM_BITS) - 1
+_HASH_MASK = (1 << HASH_BITS) - 1
+
+_TOKEN = re.compile(r"[^\W_]+")
+
+
+def tokenize(value: Optional[str]) -> List[str]:
+    """Lowercase word tokens of a product name, brand or query"""
+    return _TOKEN.findall(value.lower()) if value else []
+
+
+def _deletes(word: str, max_distance: int) -> Set[str]:
+    """word and every string left by deleting up to max_distance characters"""
+    result = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {
+            candidate[:i] + candidate[i + 1 :]
+            for candidate in frontier
+            if len(candidate) > 1
+            for i in range(len(candidate))
+        }
+        result |= frontier
+    return result
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> Optional[int]:
+    """
+    Optimal string alignment distance, or None when it exceeds max_distance.
+
+    Adjacent transpositions count as one edit, since "choclate" and
+    "chcoolate" are both one slip away from "chocolate".
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return None
+    previous: Optional[List[int]] = None
+    row = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(row[j] + 1, current[j - 1] + 1, row[j - 1] + cost)
+            if (
+                previous is not None
+                and j > 1
+                and a[i - 1] == b[j - 2]
+                and a[i - 2] == b[j - 1]
+            ):
+                current[j] = min(current[j], previous[j - 2] + 1)
+        if min(current) > max_distance:
+            return None
+        previous, row = row, current
+    return row[-1] if row[-1] <= max_distance else None
+
+
+class SpellingIndex:
+    """Immutable symmetric-delete index over a term -> frequency vocabulary"""
+
+    def __init__(
+        self,
+        term_counts: Dict[str, int],
+        max_distance: int = SPELLING_MAX_EDIT_DISTANCE,
+        prefix_length: int = SPELLING_PREFIX_LENGTH,
+        min_term_length: int = SPELLING_MIN_TERM_LENGTH,
+    ):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.min_term_length = min_term_length
+
+        # Most frequent first, so the rarest terms are the ones dropped
+        terms = sorted(term_counts, key=lambda t: (-term_counts[t], t))[
+            : _TERM_MASK + 1
+        ]
+        self._terms = terms
+        self._term_ids = {term: term_id for term_id, term in enumerate(terms)}
+        self._counts = array("q", (term_counts[t] for t in terms))
+
+        keys = []
+        for term_id, term in enumerate(terms):
+            if len(term) < min_term_length:
+                continue
+            for delete in _deletes(term[:prefix_length], max_distance):
+                keys.append((hash(delete) & _HASH_MASK) << TERM_BITS | term_id)
+        keys.sort()
+        self._keys = array("q", keys)
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the index"""
+        term_bytes = sum(sys.getsizeof(t) for t in self._terms)
+        return (
+            self._keys.itemsize * len(self._keys)
+            + self._counts.itemsize * len(self._counts)
+            + sys.getsizeof(self._terms)
+            + sys.getsizeof(self._term_ids)
+            + term_bytes
+        )
+
+    def __contains__(self, term: str) -> bool:
+        return term in self._term_ids
+
+    def _candidates(self, word: str, max_distance: int) -> Iterable[int]:
+        seen: Set[int] = set()
+        for delete in _deletes(word[: self.prefix_length], max_distance):
+            start = (hash(delete) & _HASH_MASK) << TERM_BITS
+            i = bisect_left(self._keys, start)
+            end = start + _TERM_MASK
+            while i < len(self._keys) and self._keys[i] <= end:
+                term_id = self._keys[i] & _TERM_MASK
+                if term_id not in seen:
+                    seen.add(term_id)
+                    yield term_id
+                i += 1
+
+    def correct(self, word: str) -> Optional[str]:
+        """
+        The closest known term to word, preferring frequent terms on ties.
+
+        Returns word itself when it is known, and None when nothing is within
+        the edit distance. Words up to 4 characters allow one edit; with two,
+        almost any short word would "correct" to some other one.
+        """
+        if word in self._term_ids:
+            return word
+        if len(word) < self.min_term_length:
+            return None
+        max_distance = 1 if len(word) <= 4 else self.max_distance
+
+        best: Optional[Tuple[int, int, str]] = None
+        for term_id in self._candidates(word, max_distance):
+            term = self._terms[term_id]
+            distance = edit_distance(word, term, max_distance)
+            if distance is None:
+                continue
+            rank = (distance, -self._counts[term_id], term)
+            if best is None or rank < best:
+                best = rank
+        return best[2] if best else None
+
+    def correct_query(self, query: str) -> Optional[str]:
+        """
+        query with each unknown word replaced by its correction.
+
+        Returns None when no word changes. Numbers and words too short to
+        correct are kept as typed.
+        """
+        corrected = []
+        changed = False
+        for token in tokenize(query):
+            if token.isdigit() or token in self._term_ids:
+                corrected.append(token)
+                continue
+            fix = self.correct(token)
+            changed = changed or fix is not None
+            corrected.append(fix or token)
+        return " ".join(corrected) if changed else None
+
+
+def vocabulary(
+    names: Iterable[Optional[str]], suggestions: Iterable[Tuple[str, int]] = ()
+) -> Dict[str, int]:
+    """
+    Term frequencies over product names and brands plus suggestion queries.
+
+    A suggestion's tokens count once per search, so terms customers actually
+    type win ties against rare catalogue words.
+    """
+    counts: Counter = Counter(chain.from_iterable(tokenize(n) for n in names))
+    for query, search_count in suggestions:
+        for token in tokenize(query):
+            counts[token] += search_count
+    return {term: n for term, n in counts.items() if not term.isdigit()}
+
+
+async def load_spelling_index() -> SpellingIndex:
+    async with AsyncSessionLocal() as session:
+        names = (
+            await session.execute(
+                text("SELECT name FROM products UNION ALL SELECT brand FROM products")
+            )
+        ).scalars()
+        suggestions = (
+            await session.execute(
+                text(
+                    """
+                    SELECT query, search_count FROM search_suggestions
+                    WHERE search_count >= :min_count AND success_rate >= :min_rate
+                    """
+                ),
+                {
+                    "min_count": MIN_SEARCH_COUNT_FOR_SUGGESTION,
+                    "min_rate": MIN_SUCCESS_RATE_FOR_SUGGESTION,
+                },
+            )
+        ).tuples()
+        counts = vocabulary(names, suggestions)
+    # Building is CPU bound; keep it off the event loop
+    return await asyncio.to_thread(SpellingIndex, counts)
+
+
+spelling_index = SnapshotIndex(
+    "spelling index", load_spelling_index, max_age=SPELLING_INDEX_MAX_AGE_SECONDS
+)
@@ -0,0 +1,260 @@
+"""
+Search Suggestion Aggregation
+
+Folds search_interactions into search_suggestions as an incremental
+WatermarkJob (see src/shared/watermark_job.py). Each batch is reduced in
+memory to one row per normalized query, then applied with a single UNNEST
+upsert.
+
+Interactions get clicks attached after they are inserted (track_search_click),
+so the settle window is long enough for those to land as well.
+
+is_trending comes from trending_score, the query's searches each weighted by
+0.5 ** (age / half-life). The score is stored decayed to last_searched, which
+lets an upsert merge two scores without rereading any history. Once the
+batches are applied, flags are refreshed against the score decayed to now.
+"""
+
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Tuple, cast
+
+from sqlalchemy import CursorResult, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.constants import (
+    SEARCH_MIN_QUERY_LENGTH,
+    SEARCH_SUGGESTION_BATCH_SIZE,
+    SEARCH_SUGGESTION_MAX_QUERY_LENGTH,
+    SEARCH_SUGGESTION_SETTLE_MINUTES,
+    SEARCH_TRENDING_HALF_LIFE_HOURS,
+    SEARCH_TRENDING_MIN_SCORE,
+)
+from src.database.connection import AsyncSessionLocal
+from src.shared.watermark_job import WatermarkJob
+
+SEARCH_SUGGESTIONS_JOB = "search_suggestions"
+
+_WHITESPACE = re.compile(r"\s+")
+
+# id, query, clicked, timestamp
+InteractionRow = Tuple[int, str, bool, datetime]
+
+
+def normalize_query(query: Optional[str]) -> Optional[str]:
+    """
+    The suggestion key of a raw query: lowercased with whitespace collapsed.
+
+    Returns None for queries that cannot become suggestions (too short for
+    search, or too long for the query column).
+    """
+    if not query:
+        return None
+    normalized = _WHITESPACE.sub(" ", query).strip().lower()
+    if not (
+        SEARCH_MIN_QUERY_LENGTH <= len(normalized) <= SEARCH_SUGGESTION_MAX_QUERY_LENGTH
+    ):
+        return None
+    return normalized
+
+
+def decay(seconds: float, half_life_seconds: float) -> float:
+    """Weight left after seconds of exponential decay"""
+    return 0.5 ** (max(seconds, 0.0) / half_life_seconds)
+
+
+@dataclass
+class QueryStats:
+    """Searches of one normalized query within a batch"""
+
+    search_count: int = 0
+    clicked_count: int = 0
+    last_searched: Optional[datetime] = None
+    trending_score: float = 0.0  # decayed to last_searched
+
+    @property
+    def success_rate(self) -> float:
+        return self.clicked_count / self.search_count if self.search_count else 0.0
+
+    def add(self, searched_at: datetime, clicked: bool, half_life_seconds: float):
+        self.search_count += 1
+        self.clicked_count += int(clicked)
+        if self.last_searched is None:
+            self.trending_score = 1.0
+            self.last_searched = searched_at
+        elif searched_at >= self.last_searched:
+            elapsed = (searched_at - self.last_searched).total_seconds()
+            self.trending_score = (
+                self.trending_score * decay(elapsed, half_life_seconds) + 1.0
+            )
+            self.last_searched = searched_at
+        else:
+            elapsed = (self.last_searched - searched_at).total_seconds()
+            self.trending_score += decay(elapsed, half_life_seconds)
+
+
+def aggregate_interactions(
+    rows: Iterable[InteractionRow], half_life_seconds: float
+) -> Dict[str, QueryStats]:
+    """Reduce interaction rows to per-query stats, skipping unusable queries"""
+    stats: Dict[str, QueryStats] = {}
+    for _id, query, clicked, searched_at in rows:
+        normalized = normalize_query(query)
+        if normalized is None:
+            continue
+        stats.setdefault(normalized, QueryStats()).add(
+            searched_at, clicked, half_life_seconds
+        )
+    return stats
+
+
+# Counts add up, success rates are weighted by search counts, and the older
+# of the two trending scores is decayed to the newer last_searched
+_UPSERT_SUGGESTIONS_SQL = text(
+    """
+    INSERT INTO search_suggestions
+        (query, search_count, success_rate, last_searched, trending_score, is_trending)
+    SELECT q, n, rate, searched, score, FALSE
+    FROM UNNEST(
+        CAST(:queries AS varchar[]),
+        CAST(:counts AS integer[]),
+        CAST(:rates AS double precision[]),
+        CAST(:last_searched AS timestamptz[]),
+        CAST(:scores AS double precision[])
+    ) AS batch(q, n, rate, searched, score)
+    ON CONFLICT (query) DO UPDATE SET
+        search_count = search_suggestions.search_count + EXCLUDED.search_count,
+        success_rate = (
+            search_suggestions.success_rate * search_suggestions.search_count
+            + EXCLUDED.success_rate * EXCLUDED.search_count
+        ) / NULLIF(search_suggestions.search_count + EXCLUDED.search_count, 0),
+        trending_score = CASE
+            WHEN EXCLUDED.last_searched >= search_suggestions.last_searched THEN
+                EXCLUDED.trending_score + search_suggestions.trending_score * POWER(
+                    0.5,
+                    EXTRACT(EPOCH FROM EXCLUDED.last_searched - search_suggestions.last_searched)
+                    / CAST(:half_life_seconds AS double precision)
+                )
+            ELSE
+                search_suggestions.trending_score + EXCLUDED.trending_score * POWER(
+                    0.5,
+                    EXTRACT(EPOCH FROM search_suggestions.last_searched - EXCLUDED.last_searched)
+                    / CAST(:half_life_seconds AS double precision)
+                )
+        END,
+        last_searched = GREATEST(search_suggestions.last_searched, EXCLUDED.last_searched)
+    """
+)
+
+_INTERACTION_BATCH_SQL = text(
+    """
+    SELECT id, query, COALESCE(CARDINALITY(clicked_product_ids), 0) > 0, timestamp
+    FROM search_interactions
+    WHERE id > :after_id AND id <= :upper_id
+    ORDER BY id
+    LIMIT :batch_size
+    """
+)
+
+# Only rows whose flag flips are written
+_REFRESH_TRENDING_SQL = text(
+    """
+    UPDATE search_suggestions
+    SET is_trending = NOT is_trending
+    WHERE is_trending <> (
+        trending_score * POWER(
+            0.5, GREATEST(EXTRACT(EPOCH FROM NOW() - last_searched), 0) / CAST(:half_life_seconds AS double precision)
+        ) >= CAST(:min_score AS double precision)
+    )
+    """
+)
+
+
+@dataclass
+class AggregationResult:
+    """Outcome of one aggregation run"""
+
+    batches: int = 0
+    interactions: int = 0
+    queries_upserted: int = 0
+    trending_changed: int = 0
+    last_id: int = 0
+
+
+class SearchSuggestionAggregator(WatermarkJob):
+    """Incremental search_interactions -> search_suggestions job"""
+
+    job = SEARCH_SUGGESTIONS_JOB
+    source_table = "search_interactions"
+    target_table = "search_suggestions"
+
+    def __init__(
+        self,
+        batch_size: int = SEARCH_SUGGESTION_BATCH_SIZE,
+        settle_minutes: int = SEARCH_SUGGESTION_SETTLE_MINUTES,
+        half_life_hours: float = SEARCH_TRENDING_HALF_LIFE_HOURS,
+        trending_min_score: float = SEARCH_TRENDING_MIN_SCORE,
+    ):
+        super().__init__(batch_size, settle_minutes)
+        self.half_life_seconds = half_life_hours * 3600
+        self.trending_min_score = trending_min_score
+
+    async def run(self, max_batches: Optional[int] = None) -> AggregationResult:
+        """Apply every settled interaction since the watermark, then refresh flags"""
+        run = await self.run_batches(max_batches)
+        result = AggregationResult(
+            batches=run.batches,
+            interactions=run.rows,
+            queries_upserted=run.written,
+            last_id=run.last_id,
+        )
+
+        async with AsyncSessionLocal() as session:
+            async with session.begin():
+                refreshed = await session.execute(
+                    _REFRESH_TRENDING_SQL,
+                    {
+                        "half_life_seconds": self.half_life_seconds,
+                        "min_score": self.trending_min_score,
+                    },
+                )
+                # text() statements are typed as Result, which has no rowcount
+                result.trending_changed = cast(CursorResult[Any], refreshed).rowcount
+
+        self._error_handler.logger.info(
+            f"Search suggestions: {result.interactions} interactions in "
+            f"{result.batches} batches, {result.queries_upserted} queries upserted, "
+            f"{result.trending_changed} trending flags changed, watermark {result.last_id}"
+        )
+        return result
+
+    async def apply_batch(
+        self, session: AsyncSession, after_id: int, upper_id: int
+    ) -> Tuple[int, int, int]:
+        batch = await session.execute(
+            _INTERACTION_BATCH_SQL,
+            {
+                "after_id": after_id,
+                "upper_id": upper_id,
+                "batch_size": self.batch_size,
+            },
+        )
+        rows = batch.tuples().all()
+        if not rows:
+            return 0, 0, after_id
+
+        stats = aggregate_interactions(rows, self.half_life_seconds)
+        if stats:
+            await session.execute(
+                _UPSERT_SUGGESTIONS_SQL,
+                {
+                    "queries": list(stats),
+                    "counts": [s.search_count for s in stats.values()],
+                    "rates": [s.success_rate for s in stats.values()],
+                    "last_searched": [s.last_searched for s in stats.values()],
+                    "scores": [s.trending_score for s in stats.values()],
+                    "half_life_seconds": self.half_life_seconds,
+                },
+            )
+        return len(rows), len(stats), rows[-1][0]
@@ -24,12 +24,20 @@ from src.config.constants import (
     UserRole,
 )
 from src.dependencies.auth import RoleChecker
+from src.shared.cache_warmup import cache_warmup
 from src.shared.exceptions import ResourceNotFoundException
 from src.shared.responses import success_response
 
 stores_router = APIRouter(prefix="/stores", tags=["Stores"])
 store_service = StoreService()
 
+cache_warmup.register(
+    "stores",
+    lambda: store_service.get_store_rows(active_only=True),
+    cache_prefixes=("stores:",),
+    tables=("stores",),
+)
+
 
 # ===== STORE TAG CRUD ROUTES (must come before /{id} route) =====
 
@@ -5,6 +5,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
+from src.api.stores.cache import stores_cache
 from src.api.stores.models import (
     CreateStoreSchema,
     StoreLocationResponse,
@@ -63,9 +64,60 @@ class StoreService:
         self, query_params: Optional[StoreQuerySchema] = None
     ) -> StoreLocationResponse:
         """Get all stores without location-based filtering or distances"""
+        is_active = query_params.is_active if query_params else None
+        if (
+            query_params and (query_params.include_tags or query_params.tags)
+        ) or is_active is False:
+            rows = await self._query_store_rows(query_params)
+        else:
+            # Plain listings are served from the cached store rows
+            rows = await self.get_store_rows(active_only=bool(is_active))
+            if query_params and query_params.limit:
+                rows = rows[: query_params.limit]
+
+        # Convert to schemas and add dynamic fields
+        stores = []
+        for row in rows:
+            store_dict = dict(row)
+
+            # Add distance if location provided
+            if (
+                query_params
+                and query_params.include_distance
+                and query_params.latitude is not None
+                and query_params.longitude is not None
+            ):
+                distance = GeoUtils.calculate_distance(
+                    query_params.latitude,
+                    query_params.longitude,
+                    store_dict["latitude"],
+                    store_dict["longitude"],
+                )
+                store_dict["distance"] = round(distance, 1)
+
+            stores.append(StoreSchema(**store_dict))
+
+        return self._build_location_response(stores, query_params)
+
+    async def get_store_rows(self, active_only: bool = True) -> List[Dict[str, Any]]:
+        """Columns of all (or all active) stores by id, cached in stores_cache"""
+        rows = stores_cache.get_all_stores(active_only)
+        if rows is None:
+            async with AsyncSessionLocal() as session:
+                query = select(Store).order_by(Store.id)
+                if active_only:
+                    query = query.where(Store.is_active)
+                result = await session.execute(query)
+                rows = [self._store_row(store) for store in result.scalars().all()]
+            stores_cache.set_all_stores(rows, active_only)
+        return rows
+
+    async def _query_store_rows(
+        self, query_params: Optional[StoreQuerySchema]
+    ) -> List[Dict[str, Any]]:
         async with AsyncSessionLocal() as session:
             # Build base query
-            query = select(Store)
+            query = select(Store).order_by(Store.id)
 
             # Include tag relationships if needed
             if query_params and (query_params.include_tags or query_params.tags):
@@ -104,41 +156,13 @@ class StoreService:
             result = await session.execute(query, tag_params)
             store_models = result.scalars().unique().all()
 
-            # Convert to schemas and add dynamic fields
-            stores = []
+            rows = []
             for store_model in store_models:
-                store_dict = {
-                    "id": store_model.id,
-                    "name": store_model.name,
-                    "description": store_model.description,
-                    "address": store_model.address,
-                    "latitude": store_model.latitude,
-                    "longitude": store_model.longitude,
-                    "email": store_model.email,
-                    "phone": store_model.phone,
-                    "is_active": store_model.is_active,
-                    "created_at": store_model.created_at,
-                    "updated_at": store_model.updated_at,
-                }
-
-                # Add distance if location provided
-                if (
-                    query_params
-                    and query_params.include_distance
-                    and query_params.latitude is not None
-                    and query_params.longitude is not None
-                ):
-                    distance = GeoUtils.calculate_distance(
-                        query_params.latitude,
-                        query_params.longitude,
-                        store_model.latitude,
-                        store_model.longitude,
-                    )
-                    store_dict["distance"] = round(distance, 1)
+                row = self._store_row(store_model)
 
                 # Add tags if requested
                 if query_params and query_params.include_tags:
-                    store_dict["store_tags"] = [
+                    row["store_tags"] = [
                         {
                             "id": st.tag.id,
                             "tag_type": st.tag.tag_type,
@@ -150,9 +174,25 @@ class StoreService:
                         for st in store_model.store_tags
                     ]
 
-                stores.append(StoreSchema(**store_dict))
+                rows.append(row)
 
-            return self._build_location_response(stores, query_params)
+            return rows
+
+    @staticmethod
+    def _store_row(store_model: Store) -> Dict[str, Any]:
+        return {
+            "id": store_model.id,
+            "name": store_model.name,
+            "description": store_model.description,
+            "address": store_model.address,
+            "latitude": store_model.latitude,
+            "longitude": store_model.longitude,
+            "email": store_model.email,
+            "phone": store_model.phone,
+            "is_active": store_model.is_active,
+            "created_at": store_model.created_at,
+            "updated_at": store_model.updated_at,
+        }
 
     @handle_service_errors("retrieving store IDs by location")
     async def get_store_ids_by_location(
@@ -360,19 +400,7 @@ class StoreService:
             if not store_model:
                 return None
 
-            store_dict = {
-                "id": store_model.id,
-                "name": store_model.name,
-                "description": store_model.description,
-                "address": store_model.address,
-                "latitude": store_model.latitude,
-                "longitude": store_model.longitude,
-                "email": store_model.email,
-                "phone": store_model.phone,
-                "is_active": store_model.is_active,
-                "created_at": store_model.created_at,
-                "updated_at": store_model.updated_at,
-            }
+            store_dict = self._store_row(store_model)
 
             if include_tags:
                 store_dict["store_tags"] = [
@@ -427,6 +455,7 @@ class StoreService:
 
                 await session.commit()
                 await session.refresh(new_store)
+                stores_cache.invalidate_stores_cache()
 
                 return StoreSchema(
                     id=new_store.id,
@@ -504,6 +533,7 @@ class StoreService:
 
                 await session.commit()
                 await session.refresh(store)
+                stores_cache.invalidate_stores_cache()
 
                 return StoreSchema(
                     id=store.id,
@@ -536,6 +566,7 @@ class StoreService:
 
             await session.delete(store)
             await session.commit()
+            stores_cache.invalidate_stores_cache()
             return True
 
     # Tag management methods
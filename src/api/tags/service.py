@@ -1,5 +1,5 @@
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.future import select
@@ -187,6 +187,7 @@ class TagService:
 
             try:
                 await session.commit()
+                self._invalidate_filter_index()
                 await session.refresh(tag)
                 return tag
             except IntegrityError:
@@ -227,8 +228,16 @@ class TagService:
 
             await session.delete(tag)
             await session.commit()
+            self._invalidate_filter_index()
             return True
 
+    def _invalidate_filter_index(self) -> None:
+        """Tag names, slugs and types are indexed for product filtering"""
+        if self.entity_type == "product":
+            from src.api.products.filter_index import product_filter_index
+
+            product_filter_index.invalidate()
+
     async def get_all_tag_types(self) -> List[str]:
         """Get all unique tag types for this entity"""
         async with AsyncSessionLocal() as session:
@@ -329,6 +338,27 @@ class TagService:
                 raise
 
     # Tag filtering functionality
+    def parse_tag_expression(
+        self, tags_params: Optional[List[str]]
+    ) -> List[List[Tuple[str, Any]]]:
+        """
+        Parse tag filter parameters into OR groups of AND terms.
+
+        Each term is a (key, value) pair with key one of id, name, slug,
+        type or value; type values are already mapped to the full tag_type.
+        See parse_tag_filters for the syntax.
+        """
+        groups = []
+        for tags_param in tags_params or []:
+            if not tags_param or not tags_param.strip():
+                continue
+
+            # Split by comma for AND logic within parameter
+            filter_strings = [f.strip() for f in tags_param.split(",") if f.strip()]
+            if filter_strings:
+                groups.append([self._parse_tag_term(f) for f in filter_strings])
+        return groups
+
     def parse_tag_filters(self, tags_params: Optional[List[str]]) -> Dict[str, Any]:
         """
         Parse tag filter parameters with flexible syntax:
@@ -341,38 +371,26 @@ class TagService:
 
         Logic: AND within each tags parameter, OR between multiple tags parameters
         """
-        if not tags_params:
+        groups = self.parse_tag_expression(tags_params)
+        if not groups:
             return {"conditions": [], "params": {}, "needs_joins": False}
 
-        # No hardcoded mappings - build dynamically
-
         or_conditions = []  # Each element is an AND group
         params = {}
         param_counter = 0
 
-        for tags_param in tags_params:
-            if not tags_param or not tags_param.strip():
-                continue
-
-            # Split by comma for AND logic within parameter
-            filter_strings = [f.strip() for f in tags_param.split(",") if f.strip()]
-            if not filter_strings:
-                continue
-
+        for terms in groups:
             and_conditions = []  # Conditions for this AND group
 
-            for filter_str in filter_strings:
-                condition, filter_params = self._parse_single_tag_filter(
-                    filter_str, param_counter
-                )
+            for term in terms:
+                condition, filter_params = self._tag_term_condition(term, param_counter)
                 and_conditions.append(condition)
                 params.update(filter_params)
                 param_counter += len(filter_params)
 
-            if and_conditions:
-                # Join with AND
-                and_clause = " AND ".join(and_conditions)
-                or_conditions.append(f"({and_clause})")
+            # Join with AND
+            and_clause = " AND ".join(and_conditions)
+            or_conditions.append(f"({and_clause})")
 
         return {
             "conditions": or_conditions,  # Will be joined with OR
@@ -380,20 +398,12 @@ class TagService:
             "needs_joins": True,
         }
 
-    def _parse_single_tag_filter(
-        self, filter_str: str, param_offset: int
-    ) -> tuple[str, Dict[str, Any]]:
-        """Parse a single filter string and return SQL condition"""
-        table_prefix = "pt" if self.entity_type == "product" else "st"
-        tag_alias = "t"
-
+    def _parse_tag_term(self, filter_str: str) -> Tuple[str, Any]:
+        """Parse a single filter string into a (key, value) term"""
         # Check if it contains ':'
         if ":" not in filter_str:
             # Default to name search
-            param_name = f"tag_name_{param_offset}"
-            condition = f"{tag_alias}.name = :{param_name}"
-            params = {param_name: filter_str}
-            return condition, params
+            return "name", filter_str
 
         # Parse key:value format
         try:
@@ -407,46 +417,41 @@ class TagService:
         except ValueError:
             raise ValidationException(f"Invalid filter format: {filter_str}")
 
-        # Build condition based on filter type
         if filter_key == "id":
             try:
-                tag_id = int(filter_value)
-                param_name = f"tag_id_{param_offset}"
-                condition = f"{tag_alias}.id = :{param_name}"
-                params = {param_name: tag_id}
-
+                return "id", int(filter_value)
             except ValueError:
                 raise ValidationException(f"Tag ID must be numeric: {filter_value}")
 
-        elif filter_key == "name":
-            param_name = f"tag_name_{param_offset}"
-            condition = f"{tag_alias}.name = :{param_name}"
-            params = {param_name: filter_value}
-
-        elif filter_key == "slug":
-            param_name = f"tag_slug_{param_offset}"
-            condition = f"{tag_alias}.slug = :{param_name}"
-            params = {param_name: filter_value}
-
-        elif filter_key == "type":
+        if filter_key == "type":
             # Build full type name dynamically (e.g., dietary -> product_dietary)
-            mapped_type = f"{self.entity_type}_{filter_value.lower()}"
-            param_name = f"tag_type_{param_offset}"
-            condition = f"{tag_alias}.tag_type = :{param_name}"
-            params = {param_name: mapped_type}
+            return "type", f"{self.entity_type}_{filter_value.lower()}"
 
-        elif filter_key == "value":
-            param_name = f"tag_value_{param_offset}"
-            condition = f"{table_prefix}.value = :{param_name}"
-            params = {param_name: filter_value}
+        if filter_key in ("name", "slug", "value"):
+            return filter_key, filter_value
 
-        else:
-            valid_keys = ["id", "name", "slug", "type", "value"]
-            raise ValidationException(
-                f"Invalid filter key: {filter_key}. Valid keys: {valid_keys}"
-            )
+        valid_keys = ["id", "name", "slug", "type", "value"]
+        raise ValidationException(
+            f"Invalid filter key: {filter_key}. Valid keys: {valid_keys}"
+        )
+
+    def _tag_term_condition(
+        self, term: Tuple[str, Any], param_offset: int
+    ) -> tuple[str, Dict[str, Any]]:
+        """SQL condition for a parsed term"""
+        table_prefix = "pt" if self.entity_type == "product" else "st"
+        tag_alias = "t"
 
-        return condition, params
+        filter_key, filter_value = term
+        column = {
+            "id": f"{tag_alias}.id",
+            "name": f"{tag_alias}.name",
+            "slug": f"{tag_alias}.slug",
+            "type": f"{tag_alias}.tag_type",
+            "value": f"{table_prefix}.value",
+        }[filter_key]
+        param_name = f"tag_{filter_key}_{param_offset}"
+        return f"{column} = :{param_name}", {param_name: filter_value}
 
     def build_tag_filter_query_conditions(
         self, base_conditions: List[str], tag_filter_result: Dict[str, Any]
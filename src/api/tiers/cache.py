@@ -29,9 +29,9 @@ class TiersCache:
         """Generate cache key for tier data by code"""
         return self.cache.generate_key(self.prefix, f"code:{tier_code}")
 
-    def get_all_tiers_key(self) -> str:
-        """Generate cache key for all tiers"""
-        return self.cache.generate_key(self.prefix, "all")
+    def get_all_tiers_key(self, active_only: bool = False) -> str:
+        """Generate cache key for all (or all active) tiers"""
+        return self.cache.generate_key(self.prefix, "active" if active_only else "all")
 
     def get_default_tier_key(self) -> str:
         """Generate cache key for default tier"""
@@ -60,14 +60,14 @@ class TiersCache:
         ttl = cache_config.get_ttl("tiers")
         return self.cache.set(key, tier_data, ttl_seconds=ttl)
 
-    def get_all_tiers(self) -> Optional[List]:
+    def get_all_tiers(self, active_only: bool = False) -> Optional[List]:
         """Get cached all tiers"""
-        key = self.get_all_tiers_key()
+        key = self.get_all_tiers_key(active_only)
         return self.cache.get(key)
 
-    def set_all_tiers(self, tiers: List) -> bool:
+    def set_all_tiers(self, tiers: List, active_only: bool = False) -> bool:
         """Cache all tiers with configured TTL"""
-        key = self.get_all_tiers_key()
+        key = self.get_all_tiers_key(active_only)
         ttl = cache_config.get_ttl("tiers")
         return self.cache.set(key, tiers, ttl_seconds=ttl)
 
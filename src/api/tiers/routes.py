@@ -3,6 +3,7 @@ from typing import Annotated, List
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from src.api.auth.models import DecodedToken
+from src.api.tiers.cache import tiers_cache
 from src.api.tiers.models import (
     BenefitSchema,
     CreateBenefitSchema,
@@ -18,12 +19,20 @@ from src.api.tiers.service import TierService
 from src.config.constants import UserRole
 from src.dependencies.auth import RoleChecker, get_current_user
 from src.dependencies.environment import dev_mode_only
+from src.shared.cache_warmup import cache_warmup
 from src.shared.exceptions import ResourceNotFoundException
 from src.shared.responses import success_response
 
 router = APIRouter(prefix="/tiers", tags=["Customer Tiers"])
 tier_service = TierService()
 
+cache_warmup.register(
+    "tiers",
+    lambda: tier_service.get_all_tiers(active_only=True),
+    cache_prefixes=(f"{tiers_cache.prefix}:",),
+    tables=("tiers", "benefits", "tier_benefits", "tier_price_lists", "price_lists"),
+)
+
 
 # Public Endpoints (No authentication required)
 @router.get("/", summary="Get all customer tiers", response_model=List[TierSchema])
@@ -6,6 +6,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
+from src.api.tiers.cache import tiers_cache
 from src.api.tiers.models import (
     BenefitSchema,
     CreateBenefitSchema,
@@ -106,6 +107,7 @@ class TierService:
                 session.add(tier_price_list)
 
             await session.commit()
+            tiers_cache.invalidate_tier_cache()
 
             # Load the tier with relationships
             result = await session.execute(
@@ -161,6 +163,16 @@ class TierService:
     @handle_service_errors("retrieving all tiers")
     @async_timer("get_all_tiers")
     async def get_all_tiers(self, active_only: bool = False) -> List[TierSchema]:
+        """Get all tiers with their benefits and price lists, cached in tiers_cache"""
+        cached = tiers_cache.get_all_tiers(active_only)
+        if cached is not None:
+            return [TierSchema.model_validate(tier) for tier in cached]
+
+        tiers = await self._load_all_tiers(active_only)
+        tiers_cache.set_all_tiers([tier.model_dump() for tier in tiers], active_only)
+        return tiers
+
+    async def _load_all_tiers(self, active_only: bool) -> List[TierSchema]:
         """Get all tiers with optimized loading"""
         async with AsyncSessionLocal() as session:
             query = (
@@ -242,6 +254,7 @@ class TierService:
                         session.add(new_association)
 
             await session.commit()
+            tiers_cache.invalidate_tier_cache()
 
             # Load the tier with relationships
             result = await session.execute(
@@ -298,6 +311,7 @@ class TierService:
 
             await session.delete(tier)
             await session.commit()
+            tiers_cache.invalidate_tier_cache()
             return True
 
     async def get_default_tier(self) -> Optional[int]:
@@ -723,6 +737,7 @@ class TierService:
                     setattr(benefit, key, value)
 
             await session.commit()
+            tiers_cache.invalidate_tier_cache()
             await session.refresh(benefit)
 
             from src.shared.sqlalchemy_utils import sqlalchemy_to_dict
@@ -743,6 +758,7 @@ class TierService:
 
             await session.delete(benefit)
             await session.commit()
+            tiers_cache.invalidate_tier_cache()
             return True
 
     async def associate_benefit_to_tier(self, tier_id: int, benefit_id: int) -> bool:
@@ -785,6 +801,7 @@ class TierService:
                     )
                 )
                 await session.commit()
+                tiers_cache.invalidate_tier_cache()
                 return True  # Newly created
             else:
                 # Already exists
@@ -827,6 +844,7 @@ class TierService:
                     )
                 )
                 await session.commit()
+                tiers_cache.invalidate_tier_cache()
                 return True
 
             return False
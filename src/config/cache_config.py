@@ -27,6 +27,10 @@ class CacheConfig:
     CATEGORY_DATA_TTL = int(os.getenv("CACHE_CATEGORY_DATA_TTL", "1800"))  # 30 minutes
     STORE_LOCATION_TTL = int(os.getenv("CACHE_STORE_LOCATION_TTL", "600"))  # 10 minutes
     STATIC_DATA_TTL = int(os.getenv("CACHE_STATIC_DATA_TTL", "3600"))  # 1 hour
+    # Short: other instances only see stock changes once their entry expires
+    INVENTORY_TTL = int(os.getenv("CACHE_INVENTORY_TTL", "30"))  # 30 seconds
+    # Popularity scores change only when the background update runs
+    POPULARITY_TTL = int(os.getenv("CACHE_POPULARITY_TTL", "300"))  # 5 minutes
 
     # Cache cleanup and maintenance
     CLEANUP_INTERVAL_MINUTES = int(
@@ -73,6 +77,7 @@ class CacheConfig:
             "categories": cls.CATEGORY_DATA_TTL,
             "store_location": cls.STORE_LOCATION_TTL,
             "static": cls.STATIC_DATA_TTL,
+            "popularity": cls.POPULARITY_TTL,
             "default": cls.DEFAULT_TTL,
         }
         return ttl_mapping.get(cache_type, cls.DEFAULT_TTL)
@@ -124,6 +124,10 @@ DEFAULT_STORE_IDS = [1]
 # These are typically next-day delivery products that can't serve distant users
 NEXT_DAY_DELIVERY_ONLY_TAG_ID = 1
 
+# Lower bounds of the price facet buckets (final price); the first bucket
+# starts at 0 and the last one is open-ended
+FACET_PRICE_BUCKET_EDGES = [100, 250, 500, 1000, 2500, 5000, 10000]
+
 # Geospatial constants (removed geohash functionality)
 
 # Coordinate validation
@@ -155,6 +159,8 @@ class CartUserRole(str, Enum):
 DELIVERY_PRODUCT_ODOO_ID = 29772
 ODOO_AGGREGATOR_SELECTION = "celeste"
 ODOO_SALESPERSON_ID = 6  # Placeholder ID for salesperson
+CATALOG_CHANGE_BATCH_SIZE = 5000  # catalog_changes rows applied per read
+CATALOG_CHANGE_RETENTION_HOURS = 24  # Far longer than any server lags behind
 
 
 # Cache invalidation scope constants
@@ -177,7 +183,7 @@ class SearchMode(str, Enum):
 
 
 # Search configuration
-SEARCH_VECTOR_DIM = 384  # MiniLM embedding dimension
+SEARCH_VECTOR_DIM = 256  # Hashing embedding dimension
 SEARCH_TFIDF_MAX_FEATURES = 5000  # Maximum features for TF-IDF vectorizer
 SEARCH_MIN_QUERY_LENGTH = 2  # Minimum query length for search
 SEARCH_MAX_QUERY_LENGTH = 200  # Maximum query length
@@ -185,10 +191,24 @@ SEARCH_DROPDOWN_LIMIT = 5  # Max results for dropdown mode
 SEARCH_FULL_DEFAULT_LIMIT = 20  # Default limit for full search
 SEARCH_FULL_MAX_LIMIT = 100  # Max limit for full search
 
+# Spelling correction ("did you mean")
+SPELLING_CORRECTION_MAX_RESULTS = 2  # Try a correction when fewer results than this
+SPELLING_MAX_EDIT_DISTANCE = 2  # Max edits between a word and its correction
+SPELLING_PREFIX_LENGTH = 7  # Leading characters indexed per term
+SPELLING_MIN_TERM_LENGTH = 3  # Shorter words are never corrected
+SPELLING_INDEX_MAX_AGE_SECONDS = 3600  # Rebuild the vocabulary hourly
+
 # Hybrid search weights
 SEARCH_HYBRID_WEIGHT_TFIDF = 0.3  # Weight for TF-IDF score
 SEARCH_HYBRID_WEIGHT_SEMANTIC = 0.7  # Weight for semantic similarity
 
+# Semantic index (hashing embeddings + IVF); see src/api/search/semantic.py
+SEMANTIC_IDF_BUCKETS = 1 << 20  # Hashed feature slots for document frequencies
+SEMANTIC_IVF_PROBES = 16  # Inverted lists scanned per query
+SEMANTIC_MIN_SIMILARITY = 0.15  # Cosine below this is not a semantic match
+SEMANTIC_INDEX_FILE = "celeste-semantic-index.bin"  # In the system temp directory
+SEMANTIC_INDEX_MAX_AGE_SECONDS = 3600  # Rebuild from the catalogue hourly
+
 # Sentence transformer model
 SENTENCE_TRANSFORMER_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
 SENTENCE_TRANSFORMER_BATCH_SIZE = (
@@ -252,6 +272,9 @@ TRENDING_RECENT_DAYS = 7  # Consider last 7 days for trending
 POPULARITY_DEFAULT_LIMIT = 20  # Default number of popular products
 POPULARITY_MAX_LIMIT = 100  # Maximum popular products per request
 POPULARITY_WEIGHT_SEARCHES = 1.0
+POPULARITY_ROLLUP_BATCH_SIZE = 50000  # product_interactions ids per rollup batch
+POPULARITY_ROLLUP_SETTLE_MINUTES = 5  # Wait for in-flight inserts before rolling up
+POPULARITY_ROLLUP_RETENTION_DAYS = 366  # Longest time window plus today
 
 # Trending score decay (exponential decay factor)
 TRENDING_DECAY_HALF_LIFE_HOURS = 72  # Half-life of 3 days
@@ -302,3 +325,8 @@ CACHE_TTL_ITEM_SIMILARITY = 7200  # 2 hours
 # Search suggestions
 MIN_SEARCH_COUNT_FOR_SUGGESTION = 5  # Min times searched to become a suggestion
 MIN_SUCCESS_RATE_FOR_SUGGESTION = 0.1  # Min 10% click-through rate
+SEARCH_SUGGESTION_BATCH_SIZE = 5000  # search_interactions rows per aggregation batch
+SEARCH_SUGGESTION_SETTLE_MINUTES = 30  # Let clicks land on a search before counting it
+SEARCH_SUGGESTION_MAX_QUERY_LENGTH = 255  # search_suggestions.query column size
+SEARCH_TRENDING_HALF_LIFE_HOURS = 24  # Half-life of a search's trending weight
+SEARCH_TRENDING_MIN_SCORE = 10.0  # Decayed search count needed to be trending
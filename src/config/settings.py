@@ -49,10 +49,92 @@ class Settings:
     RATE_LIMIT_EXEMPT_IPS = os.getenv("RATE_LIMIT_EXEMPT_IPS", "").split(",")
     # Clean up IPs
     RATE_LIMIT_EXEMPT_IPS = [ip.strip() for ip in RATE_LIMIT_EXEMPT_IPS if ip.strip()]
+    RATE_LIMIT_DEFAULT = os.getenv("RATE_LIMIT_DEFAULT", "100/minute")
+    # Per path prefix and per customer tier, e.g. "/orders=20/minute;/auth=10/minute"
+    # and "1=60/minute;3=300/minute". Tier limits only apply to routes using
+    # the TierRateLimit dependency; RATE_LIMIT_TIER_DEFAULT covers unlisted tiers.
+    RATE_LIMIT_ROUTES = os.getenv("RATE_LIMIT_ROUTES", "")
+    RATE_LIMIT_TIERS = os.getenv("RATE_LIMIT_TIERS", "")
+    RATE_LIMIT_TIER_DEFAULT = os.getenv("RATE_LIMIT_TIER_DEFAULT", None)
+    # Optional shared counters (any Redis-protocol server), synced periodically
+    RATE_LIMIT_SHARED_URL = os.getenv("RATE_LIMIT_SHARED_URL", None)
+    RATE_LIMIT_SYNC_INTERVAL_SECONDS = float(
+        os.getenv("RATE_LIMIT_SYNC_INTERVAL_SECONDS", "1.0")
+    )
+
+    # Prometheus scrapes of /metrics: a bearer token and/or client IPs
+    # allowed without one. The edge source check does not apply to /metrics.
+    METRICS_TOKEN = os.getenv("METRICS_TOKEN", None)
+    METRICS_ALLOWED_IPS = os.getenv("METRICS_ALLOWED_IPS", "").split(",")
+    METRICS_ALLOWED_IPS = [ip.strip() for ip in METRICS_ALLOWED_IPS if ip.strip()]
+
+    # Per-request SQL tracing (Server-Timing header, query metrics) and the
+    # N+1 detector, which is on in development unless set explicitly
+    QUERY_TRACING_ENABLED = os.getenv("QUERY_TRACING_ENABLED", "true").lower() == "true"
+    N_PLUS_ONE_DETECTION = (
+        os.getenv(
+            "N_PLUS_ONE_DETECTION", "true" if ENVIRONMENT == "development" else "false"
+        ).lower()
+        == "true"
+    )
+    N_PLUS_ONE_THRESHOLD = int(os.getenv("N_PLUS_ONE_THRESHOLD", "5"))
 
     # API
     API_V1_STR = "/api/v1"
 
+    # Startup: LAZY_STARTUP initializes Firebase in the lifespan rather than
+    # at import. DISABLED_ROUTERS names routers from main.ROUTERS (e.g.
+    # "riders,payments") that are neither imported nor mounted.
+    LAZY_STARTUP = os.getenv("LAZY_STARTUP", "false").lower() == "true"
+    DISABLED_ROUTERS = {
+        name.strip()
+        for name in os.getenv("DISABLED_ROUTERS", "").split(",")
+        if name.strip()
+    }
+
+    # Cache warm-up: the lifespan preloads registered reference data (see
+    # src/shared/cache_warmup.py) in the background while the app already
+    # serves; loaders still running after CACHE_WARMUP_TIMEOUT_SECONDS are
+    # logged. CACHE_SNAPSHOT_PATH, when set, is restored before the
+    # warm-up and rewritten at shutdown; instances sharing the path pick up
+    # each other's snapshots.
+    CACHE_WARMUP_ENABLED = os.getenv("CACHE_WARMUP_ENABLED", "true").lower() == "true"
+    CACHE_WARMUP_TIMEOUT_SECONDS = float(
+        os.getenv("CACHE_WARMUP_TIMEOUT_SECONDS", "10")
+    )
+    CACHE_SNAPSHOT_PATH = os.getenv("CACHE_SNAPSHOT_PATH", "")
+
+    # Inventory holds placed at checkout; unpaid orders release them on expiry
+    INVENTORY_HOLD_TTL_MINUTES = int(os.getenv("INVENTORY_HOLD_TTL_MINUTES", "30"))
+    INVENTORY_HOLD_SWEEPER_ENABLED = (
+        os.getenv("INVENTORY_HOLD_SWEEPER_ENABLED", "true").lower() == "true"
+    )
+    INVENTORY_HOLD_SWEEP_INTERVAL_SECONDS = int(
+        os.getenv("INVENTORY_HOLD_SWEEP_INTERVAL_SECONDS", "60")
+    )
+    INVENTORY_HOLD_SWEEP_BATCH_SIZE = int(
+        os.getenv("INVENTORY_HOLD_SWEEP_BATCH_SIZE", "200")
+    )
+
+    # Periodic rollup of product_interactions into product_interaction_daily,
+    # which time-windowed popularity ranks from. Instances running it at the
+    # same time take turns on the watermark row lock.
+    POPULARITY_ROLLUP_ENABLED = (
+        os.getenv("POPULARITY_ROLLUP_ENABLED", "true").lower() == "true"
+    )
+    POPULARITY_ROLLUP_INTERVAL_SECONDS = int(
+        os.getenv("POPULARITY_ROLLUP_INTERVAL_SECONDS", "300")
+    )
+
+    # Each API server polls catalog_changes for products the Odoo catalog
+    # sync job changed and drops its own cached copies
+    CATALOG_CHANGE_LISTENER_ENABLED = (
+        os.getenv("CATALOG_CHANGE_LISTENER_ENABLED", "true").lower() == "true"
+    )
+    CATALOG_CHANGE_POLL_INTERVAL_SECONDS = int(
+        os.getenv("CATALOG_CHANGE_POLL_INTERVAL_SECONDS", "10")
+    )
+
     # Odoo ERP Integration
     _odoo_url = os.getenv("ODOO_URL", None)
     ODOO_URL = _odoo_url.strip() if _odoo_url else None
@@ -1,12 +1,17 @@
 import json
 import os
+import time
+from typing import Dict
 
 import firebase_admin
 import google.auth
 from firebase_admin import credentials
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from src.config.settings import settings
+from src.shared.metrics import DB_POOL_WAIT, LabelValues, metrics
+from src.shared.query_tracing import instrument_engine
 from src.shared.utils import LOG_LEVEL
 
 DATABASE_URL = settings.DATABASE_URL
@@ -53,9 +58,21 @@ def initialize_firebase():
                 print(f"Failed to initialize Firebase from ADC: {e}. You may need to set FIREBASE_SERVICE_ACCOUNT_JSON.")
 
 
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Default async queue pool that records how long checkouts wait"""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_WAIT.observe((), time.perf_counter() - start)
+
+
 engine = create_async_engine(
     DATABASE_URL,
     echo=LOG_LEVEL == "DEBUG",
+    poolclass=TimedQueuePool,
     # Connection pool settings
     pool_size=settings.DB_POOL_SIZE,  # Number of permanent connections
     max_overflow=settings.DB_MAX_OVERFLOW,  # Additional connections that can be created
@@ -72,6 +89,29 @@ engine = create_async_engine(
     },
 )
 
+if settings.QUERY_TRACING_ENABLED:
+    instrument_engine(engine.sync_engine)
+
+
+def _pool_connections() -> Dict[LabelValues, float]:
+    pool = engine.pool
+    if not isinstance(pool, AsyncAdaptedQueuePool):
+        return {}
+    return {
+        ("checked_out",): pool.checkedout(),
+        ("checked_in",): pool.checkedin(),
+        ("overflow",): max(pool.overflow(), 0),
+        ("size",): pool.size(),
+    }
+
+
+metrics.gauge(
+    "db_pool_connections",
+    "Database pool connections by state",
+    ("state",),
+    collect=_pool_connections,
+)
+
 AsyncSessionLocal = async_sessionmaker(
     engine, expire_on_commit=False, class_=AsyncSession
 )
@@ -7,6 +7,7 @@ from .cart import Cart, CartItem, CartUser
 from .category import Category
 from .favorite import Favorite
 from .inventory import Inventory
+from .inventory_hold import InventoryHold
 from .order import Order, OrderItem
 from .price_list import PriceList
 from .price_list_line import PriceListLine
@@ -24,11 +25,15 @@ from .search_interaction import SearchInteraction
 from .user_preference import UserPreference
 from .product_interaction import ProductInteraction
 from .product_popularity import ProductPopularity
+from .product_interaction_daily import ProductInteractionDaily
 from .search_suggestion import SearchSuggestion
 from .webhook_notification import WebhookNotification
 from .promotion import Promotion
 from .rider import RiderProfile, StoreRider
 from .ecommerce_category import EcommerceCategory
+from .odoo_sync_watermark import OdooSyncWatermark
+from .aggregation_watermark import AggregationWatermark
+from .catalog_change import CatalogChange
 
 __all__ = [
     "User",
@@ -51,6 +56,7 @@ __all__ = [
     "Store",
     "StoreTag",
     "Inventory",
+    "InventoryHold",
     "Order",
     "OrderItem",
     "PaymentTransaction",
@@ -60,10 +66,14 @@ __all__ = [
     "UserPreference",
     "ProductInteraction",
     "ProductPopularity",
+    "ProductInteractionDaily",
     "SearchSuggestion",
     "WebhookNotification",
     "Promotion",
     "RiderProfile",
     "StoreRider",
     "EcommerceCategory",
+    "OdooSyncWatermark",
+    "AggregationWatermark",
+    "CatalogChange",
 ]
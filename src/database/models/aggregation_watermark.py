@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, String, text
+from sqlalchemy.dialects.postgresql import TIMESTAMP
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database.base import Base
+
+
+class AggregationWatermark(Base):
+    """
+    High-water mark of an incremental aggregation job.
+
+    One row per job (e.g. search_suggestions). last_id is the id of the last
+    source row folded into the aggregate, so the next run only reads rows
+    inserted after it.
+    """
+
+    __tablename__ = "aggregation_watermarks"
+
+    job: Mapped[str] = mapped_column(String(100), primary_key=True)
+    last_id: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    rows_processed: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        server_default=text("NOW()"),
+        onupdate=text("NOW()"),
+        nullable=False,
+    )
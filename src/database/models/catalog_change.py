@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Boolean, Index, Integer, text
+from sqlalchemy.dialects.postgresql import TIMESTAMP
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database.base import Base
+
+
+class CatalogChange(Base):
+    """
+    Product changed by a process other than the API servers.
+
+    The Odoo catalog sync runs as a separate job, so it records the products
+    it changed here in the same transaction as the change. Every API server
+    reads the rows after the last id it has seen and drops its cached copies
+    of those products (see CatalogChangeListener).
+    """
+
+    __tablename__ = "catalog_changes"
+    __table_args__ = (Index("idx_catalog_changes_changed_at", "changed_at"),)
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    product_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    price_changed: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    changed_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), server_default=text("NOW()"), nullable=False
+    )
@@ -0,0 +1,48 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import ForeignKey, Index, Integer, String, text
+from sqlalchemy.dialects.postgresql import TIMESTAMP
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database.base import Base
+
+
+class InventoryHold(Base):
+    """
+    Stock held for a pending order.
+
+    One row per (order, product, store). A hold is active while released_at
+    is NULL; it is closed when the order is confirmed or cancelled, or by the
+    hold sweeper once expires_at has passed without payment.
+    """
+
+    __tablename__ = "inventory_holds"
+    __table_args__ = (
+        Index("idx_inventory_holds_order", "order_id"),
+        # Sweeper scan: only active holds, oldest expiry first
+        Index(
+            "idx_inventory_holds_active_expiry",
+            "expires_at",
+            postgresql_where=text("released_at IS NULL"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    order_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("orders.id", ondelete="CASCADE"), nullable=False
+    )
+    product_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    store_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    quantity: Mapped[int] = mapped_column(Integer, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=False
+    )
+    released_at: Mapped[Optional[datetime]] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=True
+    )
+    # confirmed | cancelled | expired
+    release_reason: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), server_default=text("NOW()"), nullable=False
+    )
@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Integer, String, text
+from sqlalchemy.dialects.postgresql import TIMESTAMP
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database.base import Base
+
+
+class OdooSyncWatermark(Base):
+    """
+    High-water mark of an incremental Odoo → Celeste pull sync.
+
+    One row per Odoo model (e.g. product.product, stock.quant). The pair
+    (last_write_date, last_odoo_id) is the keyset position of the last record
+    applied, so the next run only pages through records changed after it.
+    """
+
+    __tablename__ = "odoo_sync_watermarks"
+
+    odoo_model: Mapped[str] = mapped_column(String(100), primary_key=True)
+    last_write_date: Mapped[Optional[datetime]] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=True
+    )
+    last_odoo_id: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    records_synced: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        server_default=text("NOW()"),
+        onupdate=text("NOW()"),
+        nullable=False,
+    )
@@ -0,0 +1,58 @@
+from datetime import date, datetime
+
+from sqlalchemy import Date, Float, ForeignKey, Index, Integer, String
+from sqlalchemy.dialects.postgresql import TIMESTAMP
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database.base import Base
+
+
+class ProductInteractionDaily(Base):
+    """
+    Daily rollup of product interactions, one row per product, type and day.
+
+    Maintained incrementally from product_interactions (see
+    src/api/products/services/popularity_rollup.py) and used for time-windowed
+    popularity rankings.
+    """
+
+    __tablename__ = "product_interaction_daily"
+    __table_args__ = (
+        # Covers windowed rankings without touching the table
+        Index(
+            "idx_product_interaction_daily_day",
+            "day",
+            "product_id",
+            postgresql_include=[
+                "interaction_type",
+                "interaction_count",
+                "weighted_score",
+                "last_interaction",
+            ],
+        ),
+    )
+
+    # Primary key leads with product_id for category-filtered rankings, which
+    # start from the category's products
+    product_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("products.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    # Interaction type: search_click, view, cart_add, order, wishlist_add
+    interaction_type: Mapped[str] = mapped_column(String(50), primary_key=True)
+
+    # UTC day of the interactions
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    # Number of interactions
+    interaction_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Sum of the interactions' interaction_score
+    weighted_score: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+    # Latest interaction timestamp of the day
+    last_interaction: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=False
+    )
@@ -42,3 +42,8 @@ class SearchSuggestion(Base):
 
     # Flag for trending queries (updated by background task)
     is_trending: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+
+    # Searches weighted by recency, decayed to last_searched
+    trending_score: Mapped[float] = mapped_column(
+        Float, nullable=False, default=0.0, server_default=text("0")
+    )
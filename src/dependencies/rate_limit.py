@@ -0,0 +1,46 @@
+import math
+from typing import Optional
+
+from fastapi import Depends, Request
+
+from src.api.auth.models import DecodedToken
+from src.dependencies.auth import get_optional_user
+from src.dependencies.tiers import get_user_tier
+from src.middleware.rate_limit import rate_limiter
+from src.shared.exceptions import TooManyRequestsException
+
+
+class TierRateLimit:
+    """
+    Per-tier rate limit for a group of routes, keyed by user (or client IP for
+    anonymous callers). Limits come from RATE_LIMIT_TIERS and
+    RATE_LIMIT_TIER_DEFAULT; with neither set the dependency is a no-op.
+    get_user_tier is cached per request, so routes that already depend on it
+    pay no extra lookup.
+    """
+
+    def __init__(self, scope: str):
+        self.scope = scope
+
+    async def __call__(
+        self,
+        request: Request,
+        current_user: Optional[DecodedToken] = Depends(get_optional_user),
+        user_tier: Optional[int] = Depends(get_user_tier),
+    ) -> None:
+        limit = rate_limiter.tier_limit(user_tier)
+        if limit is None:
+            return
+
+        if current_user:
+            caller = current_user.uid
+        else:
+            caller = request.client.host if request.client else "unknown"
+        decision = rate_limiter.check(
+            f"tier:{self.scope}|{caller}", limit, f"tier:{self.scope}:{user_tier}"
+        )
+        if not decision.allowed:
+            raise TooManyRequestsException(
+                detail=f"Rate limit exceeded: {limit}",
+                retry_after=max(math.ceil(decision.retry_after), 1),
+            )
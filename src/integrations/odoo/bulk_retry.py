@@ -0,0 +1,364 @@
+"""
+Odoo Bulk Retry Engine
+
+Drains orders whose Odoo sync failed (e.g. after an Odoo outage) without
+walking them one at a time. Orders are claimed in id-ordered chunks, synced
+concurrently through OdooOrderSync, and every Odoo RPC passes through a shared
+token bucket so the retry storm cannot overload Odoo. A checkpoint file is
+written after each chunk so an interrupted run resumes where it stopped.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.config.constants import OdooSyncStatus
+from src.database.connection import AsyncSessionLocal, engine
+from src.integrations.odoo.order_sync import OdooOrderSync
+from src.integrations.odoo.service import OdooService
+from src.shared.error_handler import ErrorHandler
+
+# Namespace for pg advisory locks taken on claimed orders (two-key form),
+# so claims never collide with other advisory lock users.
+ODOO_RETRY_LOCK_NAMESPACE = 26001
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    acquire() blocks the calling thread until a token is available. It is
+    called from the executor threads that perform the blocking XML-RPC calls,
+    so waiting never stalls the event loop.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens if available.
+
+        Returns:
+            0.0 when the tokens were taken, otherwise the seconds to wait
+            before enough tokens will have accumulated
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Block until the requested tokens have been taken"""
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+
+@dataclass
+class BulkRetryConfig:
+    """Tuning knobs for a bulk retry run"""
+
+    concurrency: int = 8
+    # Odoo RPCs per second across all workers; None disables throttling
+    rate_limit: Optional[float] = 20.0
+    chunk_size: int = 200
+    dry_run: bool = False
+    checkpoint_path: Optional[str] = None
+    max_orders: Optional[int] = None
+    progress_interval_seconds: float = 2.0
+
+
+@dataclass
+class BulkRetryCheckpoint:
+    """Resumable position of a bulk retry run"""
+
+    last_order_id: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    updated_at: Optional[str] = None
+
+    @classmethod
+    def load(cls, path: Optional[str]) -> "BulkRetryCheckpoint":
+        if not path or not os.path.exists(path):
+            return cls()
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(
+            last_order_id=int(data.get("last_order_id", 0)),
+            succeeded=int(data.get("succeeded", 0)),
+            failed=int(data.get("failed", 0)),
+            updated_at=data.get("updated_at"),
+        )
+
+    def save(self, path: Optional[str]) -> None:
+        """Atomically persist the checkpoint (write temp file, then rename)"""
+        if not path:
+            return
+        self.updated_at = datetime.now(timezone.utc).isoformat()
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(asdict(self), f)
+        os.replace(tmp_path, path)
+
+
+@dataclass
+class BulkRetryProgress:
+    """Live counters for a bulk retry run"""
+
+    total: int = 0
+    processed: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+    errors: Dict[int, str] = field(default_factory=dict)
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def orders_per_second(self) -> float:
+        elapsed = self.elapsed_seconds
+        return self.processed / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        rate = self.orders_per_second
+        if rate <= 0:
+            return None
+        return max(0, self.total - self.processed) / rate
+
+    def format(self) -> str:
+        percent = (self.processed / self.total * 100) if self.total else 100.0
+        eta = self.eta_seconds
+        eta_str = f"{int(eta // 60)}m{int(eta % 60):02d}s" if eta is not None else "?"
+        return (
+            f"{self.processed}/{self.total} ({percent:.1f}%) | "
+            f"ok {self.succeeded} | failed {self.failed} | "
+            f"{self.orders_per_second:.1f} orders/s | ETA {eta_str}"
+        )
+
+
+class OdooBulkRetryEngine:
+    """
+    Concurrent, rate-limited retry of failed Odoo order syncs.
+
+    Claiming: each chunk is read in order-id order after the checkpoint and
+    every order is claimed with a session-level advisory lock on a dedicated
+    connection. Parallel runners therefore skip each other's orders, and the
+    order rows themselves stay unlocked so OdooOrderSync can update them.
+    """
+
+    def __init__(
+        self,
+        config: Optional[BulkRetryConfig] = None,
+        odoo_sync: Optional[OdooOrderSync] = None,
+        sync_fn: Optional[Callable[[int], Awaitable[Dict[str, Any]]]] = None,
+        on_progress: Optional[Callable[[BulkRetryProgress], None]] = None,
+    ):
+        self.config = config or BulkRetryConfig()
+        self._error_handler = ErrorHandler(__name__)
+        self._on_progress = on_progress
+        self._lock_conn: Optional[AsyncConnection] = None
+
+        if sync_fn is None and not self.config.dry_run:
+            # One executor thread per worker so RPCs never queue behind each other
+            odoo_sync = odoo_sync or OdooOrderSync(
+                max_workers=max(4, self.config.concurrency)
+            )
+            sync_fn = odoo_sync.sync_order_to_odoo
+        self._sync_fn = sync_fn
+
+    async def count_pending(self, after_order_id: int = 0) -> int:
+        """Count failed orders still ahead of the given order id"""
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                text(
+                    "SELECT COUNT(*) FROM orders "
+                    "WHERE odoo_sync_status = :status AND id > :after_id"
+                ),
+                {"status": OdooSyncStatus.FAILED.value, "after_id": after_order_id},
+            )
+            return int(result.scalar() or 0)
+
+    async def claim_chunk(self, after_order_id: int) -> Tuple[List[int], int]:
+        """
+        Claim the next chunk of failed orders.
+
+        Returns:
+            (claimed order ids, highest order id scanned). The scan position
+            also advances past orders that another runner holds.
+        """
+        params = {
+            "status": OdooSyncStatus.FAILED.value,
+            "after_id": after_order_id,
+            "limit": self.config.chunk_size,
+            "ns": ODOO_RETRY_LOCK_NAMESPACE,
+        }
+
+        if self.config.dry_run:
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(
+                    text(
+                        "SELECT id, TRUE FROM orders "
+                        "WHERE odoo_sync_status = :status AND id > :after_id "
+                        "ORDER BY id LIMIT :limit"
+                    ),
+                    params,
+                )
+                rows = result.fetchall()
+        else:
+            conn = await self._get_lock_connection()
+            result = await conn.execute(
+                text(
+                    "SELECT c.id, pg_try_advisory_lock(:ns, c.id) AS claimed "
+                    "FROM ("
+                    "  SELECT id FROM orders "
+                    "  WHERE odoo_sync_status = :status AND id > :after_id "
+                    "  ORDER BY id LIMIT :limit"
+                    ") c ORDER BY c.id"
+                ),
+                params,
+            )
+            rows = result.fetchall()
+
+        if not rows:
+            return [], after_order_id
+        claimed = [row[0] for row in rows if row[1]]
+        return claimed, rows[-1][0]
+
+    async def release_chunk(self, order_ids: List[int]) -> None:
+        """Release the advisory locks taken by claim_chunk"""
+        if self.config.dry_run or not order_ids or self._lock_conn is None:
+            return
+        await self._lock_conn.execute(
+            text(
+                "SELECT pg_advisory_unlock(:ns, id) "
+                "FROM unnest(CAST(:ids AS INTEGER[])) AS id"
+            ),
+            {"ns": ODOO_RETRY_LOCK_NAMESPACE, "ids": order_ids},
+        )
+
+    async def close(self) -> None:
+        if self._lock_conn is not None:
+            # Closing the session drops any advisory locks still held
+            await self._lock_conn.close()
+            self._lock_conn = None
+
+    async def _get_lock_connection(self) -> AsyncConnection:
+        if self._lock_conn is None:
+            self._lock_conn = await engine.connect()
+            # Autocommit: advisory locks are session-scoped, no open transaction
+            await self._lock_conn.execution_options(isolation_level="AUTOCOMMIT")
+        return self._lock_conn
+
+    async def run(self) -> BulkRetryProgress:
+        """
+        Retry failed orders until none remain after the checkpoint.
+
+        Returns:
+            Final progress counters for this run
+        """
+        config = self.config
+        checkpoint = BulkRetryCheckpoint.load(config.checkpoint_path)
+        progress = BulkRetryProgress(
+            total=await self.count_pending(checkpoint.last_order_id)
+        )
+        if config.max_orders is not None:
+            progress.total = min(progress.total, config.max_orders)
+
+        if config.rate_limit and not config.dry_run:
+            OdooService.set_rate_limiter(TokenBucket(config.rate_limit))
+
+        semaphore = asyncio.Semaphore(max(1, config.concurrency))
+        last_report = 0.0
+
+        async def retry_one(order_id: int) -> None:
+            nonlocal last_report
+            async with semaphore:
+                if not config.dry_run and self._sync_fn is not None:
+                    try:
+                        result = await self._sync_fn(order_id)
+                        if result.get("success"):
+                            progress.succeeded += 1
+                        else:
+                            progress.failed += 1
+                            progress.errors[order_id] = str(result.get("error"))
+                    except Exception as e:
+                        progress.failed += 1
+                        progress.errors[order_id] = str(e)
+                        self._error_handler.logger.error(
+                            f"Bulk retry of order {order_id} raised: {e}"
+                        )
+                progress.processed += 1
+
+            now = time.monotonic()
+            if (
+                self._on_progress
+                and now - last_report >= config.progress_interval_seconds
+            ):
+                last_report = now
+                self._on_progress(progress)
+
+        try:
+            cursor = checkpoint.last_order_id
+            while config.max_orders is None or progress.processed < config.max_orders:
+                order_ids, cursor_after = await self.claim_chunk(cursor)
+                if cursor_after == cursor:
+                    break
+
+                if config.max_orders is not None:
+                    remaining = config.max_orders - progress.processed
+                    if len(order_ids) > remaining:
+                        await self.release_chunk(order_ids[remaining:])
+                        order_ids = order_ids[:remaining]
+                        cursor_after = order_ids[-1]
+
+                try:
+                    await asyncio.gather(*(retry_one(oid) for oid in order_ids))
+                finally:
+                    await self.release_chunk(order_ids)
+
+                cursor = cursor_after
+                if not config.dry_run:
+                    checkpoint.last_order_id = cursor
+                    checkpoint.succeeded += sum(
+                        1 for oid in order_ids if oid not in progress.errors
+                    )
+                    checkpoint.failed += sum(
+                        1 for oid in order_ids if oid in progress.errors
+                    )
+                    checkpoint.save(config.checkpoint_path)
+        finally:
+            if config.rate_limit and not config.dry_run:
+                OdooService.set_rate_limiter(None)
+            await self.close()
+
+        if self._on_progress:
+            self._on_progress(progress)
+        return progress
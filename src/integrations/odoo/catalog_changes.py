@@ -0,0 +1,187 @@
+"""
+Catalog Change Feed
+
+The Odoo catalog sync runs as its own job (scripts/db/sync_odoo_catalog.py),
+so dropping cache entries in that process never reaches the API servers. The
+sync therefore records the products it changed in catalog_changes, in the
+same transaction as the change, and every API server runs a
+CatalogChangeListener that reads the rows after the last id it has seen and
+drops its own cached copies of those products.
+
+Writers take a transaction-level advisory lock before inserting, so change
+ids commit in id order and a listener never steps past an id that is still
+uncommitted. Rows older than CATALOG_CHANGE_RETENTION_HOURS are pruned by
+the sync.
+"""
+
+import asyncio
+from typing import Iterable, List, Optional, Set
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.pricing.cache import pricing_cache
+from src.api.products.cache import products_cache
+from src.config.constants import (
+    CATALOG_CHANGE_BATCH_SIZE,
+    CATALOG_CHANGE_RETENTION_HOURS,
+)
+from src.config.settings import settings
+from src.database.connection import AsyncSessionLocal
+from src.shared.error_handler import ErrorHandler
+
+# Arbitrary application-wide key serialising catalog_changes writers
+CATALOG_CHANGE_LOCK_KEY = 72201
+
+PUBLISH_CHANGES_SQL = text(
+    """
+    INSERT INTO catalog_changes (product_id, price_changed)
+    SELECT * FROM unnest(
+        CAST(:product_ids AS INTEGER[]),
+        CAST(:price_changed AS BOOLEAN[])
+    )
+    """
+)
+
+READ_CHANGES_SQL = text(
+    """
+    SELECT id, product_id, price_changed
+    FROM catalog_changes
+    WHERE id > :last_id
+    ORDER BY id
+    LIMIT :batch_size
+    """
+)
+
+PRUNE_CHANGES_SQL = text(
+    """
+    DELETE FROM catalog_changes
+    WHERE changed_at < NOW() - make_interval(hours => :hours)
+    """
+)
+
+
+def invalidate_catalog_caches(
+    product_ids: Iterable[int], price_changed_product_ids: Iterable[int]
+) -> None:
+    """Invalidate only the cache entries of products that changed"""
+    for product_id in set(product_ids):
+        products_cache.invalidate_product_cache(str(product_id))
+    # Computed prices depend on base_price; price lists are untouched
+    pricing_cache.invalidate_product_pricing(price_changed_product_ids)
+
+
+async def publish_catalog_changes(
+    session: AsyncSession,
+    product_ids: Iterable[int],
+    price_changed_product_ids: Iterable[int],
+) -> None:
+    """Record changed products in the caller's transaction"""
+    price_changed = set(price_changed_product_ids)
+    ids = sorted(set(product_ids) | price_changed)
+    if not ids:
+        return
+    await session.execute(
+        text("SELECT pg_advisory_xact_lock(:key)"), {"key": CATALOG_CHANGE_LOCK_KEY}
+    )
+    await session.execute(
+        PUBLISH_CHANGES_SQL,
+        {
+            "product_ids": ids,
+            "price_changed": [pid in price_changed for pid in ids],
+        },
+    )
+
+
+async def prune_catalog_changes() -> None:
+    """Delete changes every listener has long since read"""
+    async with AsyncSessionLocal() as session:
+        async with session.begin():
+            await session.execute(
+                PRUNE_CHANGES_SQL, {"hours": CATALOG_CHANGE_RETENTION_HOURS}
+            )
+
+
+class CatalogChangeListener:
+    """Applies catalog changes made by other processes to this process' caches"""
+
+    def __init__(self, batch_size: int = CATALOG_CHANGE_BATCH_SIZE):
+        self.batch_size = batch_size
+        self.interval_seconds = settings.CATALOG_CHANGE_POLL_INTERVAL_SECONDS
+        self.last_id: Optional[int] = None
+        self._error_handler = ErrorHandler(__name__)
+        self._task: Optional[asyncio.Task] = None
+
+    async def poll_once(self) -> int:
+        """
+        Invalidate the products changed since the last poll.
+
+        The first poll only records the newest id: this process' caches
+        were filled after those changes were committed.
+
+        Returns:
+            Number of change rows applied
+        """
+        async with AsyncSessionLocal() as session:
+            if self.last_id is None:
+                self.last_id = (
+                    await session.execute(
+                        text("SELECT COALESCE(MAX(id), 0) FROM catalog_changes")
+                    )
+                ).scalar_one()
+                return 0
+
+            applied = 0
+            while True:
+                rows = (
+                    await session.execute(
+                        READ_CHANGES_SQL,
+                        {"last_id": self.last_id, "batch_size": self.batch_size},
+                    )
+                ).all()
+                if not rows:
+                    break
+
+                product_ids: List[int] = [row.product_id for row in rows]
+                price_changed: Set[int] = {
+                    row.product_id for row in rows if row.price_changed
+                }
+                invalidate_catalog_caches(product_ids, price_changed)
+                self.last_id = rows[-1].id
+                applied += len(rows)
+
+                if len(rows) < self.batch_size:
+                    break
+            return applied
+
+    async def run_forever(self) -> None:
+        """Poll every interval until cancelled; errors are logged, not raised."""
+        while True:
+            try:
+                applied = await self.poll_once()
+                if applied:
+                    self._error_handler.logger.info(
+                        f"Applied {applied} catalog changes to the local caches"
+                    )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._error_handler.logger.error(f"Catalog change poll failed: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run_forever())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# Global listener instance, started from the application lifespan
+catalog_change_listener = CatalogChangeListener()
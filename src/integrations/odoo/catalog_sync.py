@@ -0,0 +1,687 @@
+"""
+Odoo Catalog Pull Sync
+
+Incrementally pulls product (name, list price) and stock data from Odoo into
+Celeste. Each Odoo model keeps a (write_date, id) watermark in
+odoo_sync_watermarks, so a run pages through only the records changed since
+the previous run with keyset-paged search_read calls. Each page is diffed
+against local rows, only real changes are written as batched upserts, and
+cache invalidation is limited to the products that actually changed. The
+changed products are also published to catalog_changes, so API servers in
+other processes drop their cached copies (see catalog_changes).
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.connection import AsyncSessionLocal
+from src.database.models.odoo_sync_watermark import OdooSyncWatermark
+from src.database.models.product import Product
+from src.integrations.odoo.catalog_changes import (
+    invalidate_catalog_caches,
+    prune_catalog_changes,
+    publish_catalog_changes,
+)
+from src.integrations.odoo.service import OdooService
+from src.shared.error_handler import ErrorHandler
+
+ODOO_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+ODOO_PRODUCT_MODEL = "product.product"
+ODOO_STOCK_MODEL = "stock.quant"
+
+DEFAULT_PAGE_SIZE = 2000
+DEFAULT_WRITE_BATCH_SIZE = 1000
+DEFAULT_UNIT_MEASURE = "Units"
+
+PRODUCT_FIELDS = ["id", "default_code", "name", "list_price", "uom_id", "write_date"]
+QUANT_FIELDS = ["id", "product_id", "write_date"]
+QUANT_SUM_FIELDS = ["quantity:sum", "reserved_quantity:sum"]
+QUANT_GROUP_BY = ["product_id", "location_id"]
+
+
+@dataclass
+class PullSyncResult:
+    """Outcome of pulling one Odoo model"""
+
+    odoo_model: str
+    fetched: int = 0
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    skipped: int = 0
+    pages: int = 0
+    changed_product_ids: Set[int] = field(default_factory=set)
+    price_changed_product_ids: Set[int] = field(default_factory=set)
+    changed_stock: Set[Tuple[int, int]] = field(default_factory=set)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "odoo_model": self.odoo_model,
+            "fetched": self.fetched,
+            "created": self.created,
+            "updated": self.updated,
+            "unchanged": self.unchanged,
+            "skipped": self.skipped,
+            "pages": self.pages,
+            "changed_products": len(self.changed_product_ids),
+        }
+
+
+def canonical_code(code: Any) -> Optional[str]:
+    """
+    Canonical product code for matching Odoo default_code to Product.ref.
+
+    Odoo pads codes to six digits ("000123") while local refs may not be
+    padded, so leading zeros are ignored on both sides.
+    """
+    if not code or not isinstance(code, str):
+        return None
+    code = code.strip()
+    if not code:
+        return None
+    return code.lstrip("0") or "0"
+
+
+def ref_candidates(codes: Iterable[str]) -> List[str]:
+    """All local ref spellings that may match the given Odoo codes"""
+    candidates: Set[str] = set()
+    for code in codes:
+        code = code.strip()
+        candidates.add(code)
+        candidates.add(code.lstrip("0") or "0")
+    return list(candidates)
+
+
+def keyset_domain(last_write_date: Optional[datetime], last_odoo_id: int) -> List[Any]:
+    """Odoo domain selecting records strictly after the (write_date, id) watermark"""
+    if last_write_date is None:
+        return []
+    write_date = last_write_date.astimezone(timezone.utc).strftime(ODOO_DATETIME_FORMAT)
+    return [
+        "|",
+        ("write_date", ">", write_date),
+        "&",
+        ("write_date", "=", write_date),
+        ("id", ">", last_odoo_id),
+    ]
+
+
+def parse_odoo_datetime(value: Any) -> Optional[datetime]:
+    """Parse an Odoo UTC datetime string"""
+    if not value or not isinstance(value, str):
+        return None
+    return datetime.strptime(value, ODOO_DATETIME_FORMAT).replace(tzinfo=timezone.utc)
+
+
+def _to_price(value: Any) -> Decimal:
+    return Decimal(str(value or 0)).quantize(Decimal("0.01"))
+
+
+def diff_products(
+    odoo_rows: List[Dict[str, Any]], local_by_code: Dict[str, Dict[str, Any]]
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], int, int]:
+    """
+    Diff a page of Odoo products against local rows.
+
+    Args:
+        odoo_rows: product.product records (PRODUCT_FIELDS)
+        local_by_code: Local {"id", "name", "base_price"} keyed by canonical code
+
+    Returns:
+        (rows to insert, rows to update by id, unchanged count, skipped count)
+    """
+    inserts: List[Dict[str, Any]] = []
+    updates: List[Dict[str, Any]] = []
+    unchanged = 0
+    skipped = 0
+    seen: Set[str] = set()
+
+    # Later rows of the same code win: pages are ordered by write_date
+    for row in reversed(odoo_rows):
+        code = canonical_code(row.get("default_code"))
+        if code is None or code in seen or not row.get("name"):
+            skipped += 1
+            continue
+        seen.add(code)
+
+        name = str(row["name"])[:255]
+        base_price = _to_price(row.get("list_price"))
+        local = local_by_code.get(code)
+
+        if local is None:
+            uom = row.get("uom_id")
+            inserts.append(
+                {
+                    "ref": row["default_code"].strip(),
+                    "name": name,
+                    "base_price": base_price,
+                    "unit_measure": (
+                        str(uom[1])[:20]
+                        if isinstance(uom, list) and len(uom) > 1
+                        else DEFAULT_UNIT_MEASURE
+                    ),
+                    "image_urls": [],
+                    "alternative_product_ids": [],
+                }
+            )
+        elif local["name"] != name or _to_price(local["base_price"]) != base_price:
+            updates.append(
+                {
+                    "id": local["id"],
+                    "name": name,
+                    "base_price": base_price,
+                    "price_changed": _to_price(local["base_price"]) != base_price,
+                }
+            )
+        else:
+            unchanged += 1
+
+    return inserts, updates, unchanged, skipped
+
+
+def aggregate_stock(
+    groups: List[Dict[str, Any]], warehouse_by_location: Dict[int, Optional[int]]
+) -> Dict[Tuple[int, int], int]:
+    """
+    Sum sellable quantity per (odoo product id, odoo warehouse id).
+
+    Args:
+        groups: stock.quant read_group rows grouped by product_id, location_id
+        warehouse_by_location: Odoo location id → warehouse id
+
+    Sellable = on hand minus what Odoo has already reserved for its own
+    pickings, floored at zero.
+    """
+    totals: Dict[Tuple[int, int], float] = {}
+    for group in groups:
+        product = group.get("product_id")
+        location = group.get("location_id")
+        if not product or not location:
+            continue
+        warehouse_id = warehouse_by_location.get(location[0])
+        if not warehouse_id:
+            continue
+        key = (product[0], warehouse_id)
+        totals[key] = (
+            totals.get(key, 0.0)
+            + float(group.get("quantity") or 0)
+            - float(group.get("reserved_quantity") or 0)
+        )
+    return {key: max(0, int(qty)) for key, qty in totals.items()}
+
+
+class OdooCatalogSync:
+    """
+    Incremental Odoo → Celeste pull synchronizer for products and stock.
+
+    Pages are fetched in a worker thread while the previous page is being
+    applied, so Odoo latency and database writes overlap.
+    """
+
+    def __init__(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        write_batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+    ):
+        self.odoo = OdooService()
+        self.page_size = page_size
+        self.write_batch_size = write_batch_size
+        self._error_handler = ErrorHandler(__name__)
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._odoo_product_codes: Dict[int, Optional[str]] = {}
+        self._location_warehouses: Dict[int, Optional[int]] = {}
+
+    async def _call(self, fn, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, lambda: fn(*args, **kwargs))
+
+    async def sync_all(self, reset: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Pull products first (so new SKUs exist), then stock"""
+        products = await self.sync_products(reset=reset)
+        stock = await self.sync_stock(reset=reset)
+        return {"products": products.to_dict(), "stock": stock.to_dict()}
+
+    # ------------------------------------------------------------------
+    # Watermarks
+    # ------------------------------------------------------------------
+
+    async def _load_watermark(
+        self, odoo_model: str, reset: bool
+    ) -> Tuple[Optional[datetime], int]:
+        if reset:
+            return None, 0
+        async with AsyncSessionLocal() as session:
+            watermark = await session.get(OdooSyncWatermark, odoo_model)
+            if watermark is None:
+                return None, 0
+            return watermark.last_write_date, watermark.last_odoo_id
+
+    async def _save_watermark(
+        self,
+        session: AsyncSession,
+        odoo_model: str,
+        last_write_date: Optional[datetime],
+        last_odoo_id: int,
+        records: int,
+    ) -> None:
+        stmt = insert(OdooSyncWatermark).values(
+            odoo_model=odoo_model,
+            last_write_date=last_write_date,
+            last_odoo_id=last_odoo_id,
+            records_synced=records,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[OdooSyncWatermark.odoo_model],
+            set_={
+                "last_write_date": stmt.excluded.last_write_date,
+                "last_odoo_id": stmt.excluded.last_odoo_id,
+                "records_synced": OdooSyncWatermark.records_synced
+                + stmt.excluded.records_synced,
+                "updated_at": text("NOW()"),
+            },
+        )
+        await session.execute(stmt)
+
+    # ------------------------------------------------------------------
+    # Paging
+    # ------------------------------------------------------------------
+
+    async def _fetch_page(
+        self,
+        odoo_model: str,
+        fields: List[str],
+        base_domain: List[Any],
+        last_write_date: Optional[datetime],
+        last_odoo_id: int,
+    ) -> List[Dict[str, Any]]:
+        if self.odoo._uid is None:
+            await self._call(self.odoo.authenticate)
+        domain = base_domain + keyset_domain(last_write_date, last_odoo_id)
+        return await self._call(
+            self.odoo.search_read,
+            odoo_model,
+            domain,
+            fields=fields,
+            limit=self.page_size,
+            order="write_date asc, id asc",
+        )
+
+    async def _iterate_changes(
+        self,
+        odoo_model: str,
+        fields: List[str],
+        base_domain: List[Any],
+        last_write_date: Optional[datetime],
+        last_odoo_id: int,
+    ):
+        """Yield pages of changed records, prefetching the next page"""
+        page = await self._fetch_page(
+            odoo_model, fields, base_domain, last_write_date, last_odoo_id
+        )
+        while page:
+            last = page[-1]
+            last_write_date = parse_odoo_datetime(last.get("write_date"))
+            last_odoo_id = last["id"]
+
+            next_page_task = None
+            if len(page) == self.page_size:
+                next_page_task = asyncio.create_task(
+                    self._fetch_page(
+                        odoo_model, fields, base_domain, last_write_date, last_odoo_id
+                    )
+                )
+            try:
+                yield page, last_write_date, last_odoo_id
+            except BaseException:
+                if next_page_task:
+                    next_page_task.cancel()
+                raise
+            page = await next_page_task if next_page_task else []
+
+    # ------------------------------------------------------------------
+    # Products and prices
+    # ------------------------------------------------------------------
+
+    async def sync_products(self, reset: bool = False) -> PullSyncResult:
+        """
+        Pull product names and list prices changed since the last run.
+
+        Odoo list_price maps to Product.base_price; unknown SKUs are created.
+        """
+        result = PullSyncResult(odoo_model=ODOO_PRODUCT_MODEL)
+        last_write_date, last_odoo_id = await self._load_watermark(
+            ODOO_PRODUCT_MODEL, reset
+        )
+
+        async for page, page_write_date, page_odoo_id in self._iterate_changes(
+            ODOO_PRODUCT_MODEL,
+            PRODUCT_FIELDS,
+            [("default_code", "!=", False)],
+            last_write_date,
+            last_odoo_id,
+        ):
+            result.pages += 1
+            result.fetched += len(page)
+            for row in page:
+                code = canonical_code(row.get("default_code"))
+                self._odoo_product_codes[row["id"]] = code
+
+            async with AsyncSessionLocal() as session:
+                async with session.begin():
+                    local_by_code = await self._load_local_products(
+                        session,
+                        [
+                            row["default_code"]
+                            for row in page
+                            if row.get("default_code")
+                        ],
+                    )
+                    inserts, updates, unchanged, skipped = diff_products(
+                        page, local_by_code
+                    )
+                    created_ids = await self._insert_products(session, inserts)
+                    await self._update_products(session, updates)
+                    await self._save_watermark(
+                        session,
+                        ODOO_PRODUCT_MODEL,
+                        page_write_date,
+                        page_odoo_id,
+                        len(inserts) + len(updates),
+                    )
+                    await publish_catalog_changes(
+                        session,
+                        created_ids + [u["id"] for u in updates],
+                        [u["id"] for u in updates if u["price_changed"]],
+                    )
+
+            result.created += len(created_ids)
+            result.updated += len(updates)
+            result.unchanged += unchanged
+            result.skipped += skipped
+            result.changed_product_ids.update(created_ids)
+            result.changed_product_ids.update(u["id"] for u in updates)
+            result.price_changed_product_ids.update(
+                u["id"] for u in updates if u["price_changed"]
+            )
+
+        await self._finish(result)
+        self._error_handler.logger.info(
+            f"Odoo product pull complete | {result.to_dict()}"
+        )
+        return result
+
+    async def _load_local_products(
+        self, session: AsyncSession, codes: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        if not codes:
+            return {}
+        rows = await session.execute(
+            text(
+                "SELECT id, ref, name, base_price FROM products WHERE ref = ANY(:refs)"
+            ),
+            {"refs": ref_candidates(codes)},
+        )
+        local_by_code: Dict[str, Dict[str, Any]] = {}
+        for row in rows.mappings():
+            code = canonical_code(row["ref"])
+            if code is not None:
+                local_by_code[code] = dict(row)
+        return local_by_code
+
+    async def _insert_products(
+        self, session: AsyncSession, rows: List[Dict[str, Any]]
+    ) -> List[int]:
+        created: List[int] = []
+        for start in range(0, len(rows), self.write_batch_size):
+            batch = rows[start : start + self.write_batch_size]
+            stmt = (
+                insert(Product)
+                .values(batch)
+                .on_conflict_do_nothing(index_elements=[Product.ref])
+                .returning(Product.id)
+            )
+            created.extend((await session.execute(stmt)).scalars().all())
+        return created
+
+    async def _update_products(
+        self, session: AsyncSession, rows: List[Dict[str, Any]]
+    ) -> None:
+        for start in range(0, len(rows), self.write_batch_size):
+            batch = [
+                {"id": r["id"], "name": r["name"], "base_price": r["base_price"]}
+                for r in rows[start : start + self.write_batch_size]
+            ]
+            # ORM bulk UPDATE by primary key (executemany)
+            await session.execute(update(Product), batch)
+
+    # ------------------------------------------------------------------
+    # Stock
+    # ------------------------------------------------------------------
+
+    async def sync_stock(self, reset: bool = False) -> PullSyncResult:
+        """
+        Pull stock levels for products whose quants changed since the last run.
+
+        A changed quant triggers a recount of all internal quants of that
+        product (one read_group call per page), summed per warehouse and
+        written to the stores mapped through Store.odoo_warehouse_id.
+        """
+        result = PullSyncResult(odoo_model=ODOO_STOCK_MODEL)
+        last_write_date, last_odoo_id = await self._load_watermark(
+            ODOO_STOCK_MODEL, reset
+        )
+        stores_by_warehouse = await self._load_stores_by_warehouse()
+        if not stores_by_warehouse:
+            self._error_handler.logger.warning(
+                "No stores have an odoo_warehouse_id; skipping stock pull"
+            )
+            return result
+
+        internal = [("location_id.usage", "=", "internal")]
+        async for page, page_write_date, page_odoo_id in self._iterate_changes(
+            ODOO_STOCK_MODEL, QUANT_FIELDS, internal, last_write_date, last_odoo_id
+        ):
+            result.pages += 1
+            result.fetched += len(page)
+            odoo_product_ids = sorted(
+                {q["product_id"][0] for q in page if q.get("product_id")}
+            )
+
+            codes = await self._resolve_product_codes(odoo_product_ids)
+            # One grouped row per (product, location) instead of every quant
+            groups = await self._call(
+                self.odoo.execute_kw,
+                ODOO_STOCK_MODEL,
+                "read_group",
+                [
+                    internal + [("product_id", "in", odoo_product_ids)],
+                    QUANT_SUM_FIELDS,
+                    QUANT_GROUP_BY,
+                ],
+                {"lazy": False},
+            )
+            warehouse_by_location = await self._resolve_location_warehouses(
+                [g["location_id"][0] for g in groups if g.get("location_id")]
+            )
+            totals = aggregate_stock(groups, warehouse_by_location)
+
+            async with AsyncSessionLocal() as session:
+                async with session.begin():
+                    local_by_code = await self._load_local_products(
+                        session, [c for c in codes.values() if c]
+                    )
+                    levels: Dict[Tuple[int, int], int] = {}
+                    for odoo_product_id in odoo_product_ids:
+                        local = local_by_code.get(codes.get(odoo_product_id) or "")
+                        if local is None:
+                            result.skipped += 1
+                            continue
+                        for warehouse_id, store_ids in stores_by_warehouse.items():
+                            qty = totals.get((odoo_product_id, warehouse_id), 0)
+                            for store_id in store_ids:
+                                levels[(local["id"], store_id)] = qty
+
+                    changed = await self._apply_stock_levels(session, levels)
+                    await self._save_watermark(
+                        session,
+                        ODOO_STOCK_MODEL,
+                        page_write_date,
+                        page_odoo_id,
+                        len(changed),
+                    )
+                    await publish_catalog_changes(
+                        session, [pid for pid, _ in changed], []
+                    )
+
+            result.updated += len(changed)
+            result.unchanged += len(levels) - len(changed)
+            result.changed_product_ids.update(pid for pid, _ in changed)
+            result.changed_stock.update(changed)
+
+        await self._finish(result)
+        self._error_handler.logger.info(
+            f"Odoo stock pull complete | {result.to_dict()}"
+        )
+        return result
+
+    async def _load_stores_by_warehouse(self) -> Dict[int, List[int]]:
+        async with AsyncSessionLocal() as session:
+            rows = await session.execute(
+                text(
+                    "SELECT id, odoo_warehouse_id FROM stores "
+                    "WHERE odoo_warehouse_id IS NOT NULL"
+                )
+            )
+            stores: Dict[int, List[int]] = {}
+            for store_id, warehouse_id in rows.all():
+                stores.setdefault(warehouse_id, []).append(store_id)
+            return stores
+
+    async def _resolve_product_codes(
+        self, odoo_product_ids: List[int]
+    ) -> Dict[int, Optional[str]]:
+        missing = [
+            pid for pid in odoo_product_ids if pid not in self._odoo_product_codes
+        ]
+        if missing:
+            records = await self._call(
+                self.odoo.read, ODOO_PRODUCT_MODEL, missing, ["id", "default_code"]
+            )
+            for record in records:
+                self._odoo_product_codes[record["id"]] = canonical_code(
+                    record.get("default_code")
+                )
+        return {pid: self._odoo_product_codes.get(pid) for pid in odoo_product_ids}
+
+    async def _resolve_location_warehouses(
+        self, location_ids: List[int]
+    ) -> Dict[int, Optional[int]]:
+        missing = sorted(
+            {lid for lid in location_ids if lid not in self._location_warehouses}
+        )
+        if missing:
+            records = await self._call(
+                self.odoo.read, "stock.location", missing, ["id", "warehouse_id"]
+            )
+            for record in records:
+                warehouse = record.get("warehouse_id")
+                self._location_warehouses[record["id"]] = (
+                    warehouse[0] if warehouse else None
+                )
+        return self._location_warehouses
+
+    async def _apply_stock_levels(
+        self, session: AsyncSession, levels: Dict[Tuple[int, int], int]
+    ) -> List[Tuple[int, int]]:
+        """
+        Upsert quantity_available, touching only rows whose value differs.
+
+        Odoo reports on-hand stock, which still includes units held or
+        reserved for local orders not yet synced; those are subtracted so
+        they cannot be sold twice. Zero levels never create new inventory
+        rows; they only zero out existing ones.
+
+        Returns:
+            (product_id, store_id) pairs that actually changed
+        """
+        changed: List[Tuple[int, int]] = []
+        items = list(levels.items())
+        for start in range(0, len(items), self.write_batch_size):
+            batch = items[start : start + self.write_batch_size]
+            product_ids = [pid for (pid, _), _ in batch]
+            store_ids = [sid for (_, sid), _ in batch]
+            quantities = [qty for _, qty in batch]
+            rows = await session.execute(
+                text(
+                    """
+                    WITH levels AS (
+                        SELECT * FROM unnest(
+                            CAST(:product_ids AS INTEGER[]),
+                            CAST(:store_ids AS INTEGER[]),
+                            CAST(:quantities AS INTEGER[])
+                        ) AS l(product_id, store_id, quantity)
+                    ),
+                    updated AS (
+                        UPDATE inventory i
+                        SET quantity_available = GREATEST(
+                                l.quantity - i.quantity_on_hold - i.quantity_reserved,
+                                0
+                            ),
+                            updated_at = NOW()
+                        FROM levels l
+                        WHERE i.product_id = l.product_id
+                          AND i.store_id = l.store_id
+                          AND i.quantity_available <> GREATEST(
+                              l.quantity - i.quantity_on_hold - i.quantity_reserved,
+                              0
+                          )
+                        RETURNING i.product_id, i.store_id
+                    ),
+                    inserted AS (
+                        INSERT INTO inventory (
+                            product_id, store_id, quantity_available,
+                            quantity_reserved, quantity_on_hold, safety_stock
+                        )
+                        SELECT l.product_id, l.store_id, l.quantity, 0, 0, 0
+                        FROM levels l
+                        WHERE l.quantity > 0
+                          AND NOT EXISTS (
+                              SELECT 1 FROM inventory i
+                              WHERE i.product_id = l.product_id
+                                AND i.store_id = l.store_id
+                          )
+                        ON CONFLICT (product_id, store_id) DO NOTHING
+                        RETURNING product_id, store_id
+                    )
+                    SELECT product_id, store_id FROM updated
+                    UNION ALL
+                    SELECT product_id, store_id FROM inserted
+                    """
+                ),
+                {
+                    "product_ids": product_ids,
+                    "store_ids": store_ids,
+                    "quantities": quantities,
+                },
+            )
+            changed.extend((row[0], row[1]) for row in rows.all())
+        return changed
+
+    # ------------------------------------------------------------------
+    # Cache invalidation
+    # ------------------------------------------------------------------
+
+    async def _finish(self, result: PullSyncResult) -> None:
+        """Drop this process' cached copies and prune the change feed"""
+        invalidate_catalog_caches(
+            result.changed_product_ids, result.price_changed_product_ids
+        )
+        await prune_catalog_changes()
@@ -48,11 +48,11 @@ class OdooOrderSync:
     - Error handling and retry logic
     """
 
-    def __init__(self):
+    def __init__(self, max_workers: int = 4):
         self.odoo = OdooService()
         self._error_handler = ErrorHandler(__name__)
         # Thread pool for blocking Odoo RPC calls
-        self._executor = ThreadPoolExecutor(max_workers=4)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
 
     @retry(
         retry=retry_if_exception_type((OdooConnectionError, OdooAuthenticationError)),
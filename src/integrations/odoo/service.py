@@ -5,8 +5,9 @@ Provides integration with Odoo ERP system using XML-RPC API.
 Handles authentication, CRUD operations, and error handling.
 """
 
+import threading
 import xmlrpc.client
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Protocol
 
 from src.config.settings import settings
 from src.integrations.odoo.exceptions import (
@@ -16,11 +17,20 @@ from src.integrations.odoo.exceptions import (
 from src.shared.error_handler import ErrorHandler
 
 
+class OdooRateLimiter(Protocol):
+    """Anything that can block until another Odoo call is allowed."""
+
+    def acquire(self) -> None: ...
+
+
 class OdooService:
     _instance = None
     _uid = None
-    _models = None
     _common = None
+    # xmlrpc ServerProxy keeps one HTTP connection and is not thread-safe,
+    # so every executor thread gets its own models proxy.
+    _thread_local = threading.local()
+    _rate_limiter: Optional[OdooRateLimiter] = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -66,15 +76,28 @@ class OdooService:
         return self._common
 
     def _get_models_proxy(self) -> xmlrpc.client.ServerProxy:
-        """Get or create models API proxy"""
-        if self._models is None:
+        """Get or create the models API proxy for the current thread"""
+        models = getattr(self._thread_local, "models", None)
+        if models is None:
             try:
-                self._models = xmlrpc.client.ServerProxy(self.object_endpoint)
+                models = xmlrpc.client.ServerProxy(self.object_endpoint)
+                self._thread_local.models = models
                 self._error_handler.logger.debug("Models proxy created")
             except Exception as e:
                 self._error_handler.logger.error(f"Failed to create models proxy: {e}")
                 raise OdooConnectionError(f"Failed to connect to Odoo models: {e}")
-        return self._models
+        return models
+
+    @classmethod
+    def set_rate_limiter(cls, limiter: Optional[OdooRateLimiter]) -> None:
+        """
+        Throttle every subsequent execute_kw call through the given limiter.
+
+        Args:
+            limiter: Object whose blocking acquire() is called before each
+                RPC, or None to remove throttling
+        """
+        cls._rate_limiter = limiter
 
     def authenticate(self) -> int:
         """
@@ -152,6 +175,9 @@ class OdooService:
                 "Not authenticated - call authenticate() first"
             )
 
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+
         try:
             models = self._get_models_proxy()
             kwargs = kwargs or {}
@@ -428,6 +454,8 @@ class OdooService:
         domain: List[Any],
         fields: Optional[List[str]] = None,
         limit: int = 100,
+        order: Optional[str] = None,
+        offset: int = 0,
     ) -> List[Dict[str, Any]]:
         """
         Search and read records in one call
@@ -437,13 +465,19 @@ class OdooService:
             domain: Search domain
             fields: List of fields to retrieve
             limit: Maximum number of records
+            order: Sort specification (e.g. "write_date asc, id asc")
+            offset: Number of matching records to skip
 
         Returns:
             List of record dictionaries
         """
-        kwargs = {"limit": limit}
+        kwargs: Dict[str, Any] = {"limit": limit}
         if fields is not None:
-            kwargs["fields"] = fields  # type: ignore
+            kwargs["fields"] = fields
+        if order:
+            kwargs["order"] = order
+        if offset:
+            kwargs["offset"] = offset
 
         return self.execute_kw(model, "search_read", [domain], kwargs)
 
@@ -0,0 +1,254 @@
+"""
+Edge middleware
+
+One pure-ASGI layer in front of the application that does, in a single pass:
+
+1. Trusted-source check (mobile secret, allowed web origins, local access)
+2. Rate-limit admission (per client IP and route, see RateLimiter.route_limit)
+   Neither applies to /metrics, which authenticates scrapes itself.
+3. ``X-Process-Time`` header, the access log line and the request latency
+   histogram (labelled by route template, see src/shared/metrics.py)
+4. Per-request SQL tracing: ``Server-Timing`` header, query metrics and the
+   development N+1 warning (see src/shared/query_tracing.py)
+
+It replaces the previous stack of TrustedSourceMiddleware, SlowAPIMiddleware
+and the ``add_process_time_header`` http middleware. Each of those was a
+BaseHTTPMiddleware, which builds a Request per layer and streams the response
+body through an extra task and queue. Here the response is passed through
+untouched; the timing header is added to the ``http.response.start`` message.
+"""
+
+import json
+import math
+import time
+from typing import FrozenSet, Iterable, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config.settings import settings
+from src.middleware.rate_limit import rate_limiter as default_rate_limiter
+from src.shared.metrics import observe_request
+from src.shared.query_tracing import (
+    DB_QUERIES_PER_REQUEST,
+    DB_TIME_PER_REQUEST,
+    N_PLUS_ONE_DETECTIONS,
+    RequestQueryStats,
+    start_request_tracing,
+    stop_request_tracing,
+)
+from src.shared.rate_limiter import RateLimiter
+from src.shared.utils import get_logger
+
+logger = get_logger(__name__)
+
+# Always allowed, as with the previous TrustedSourceMiddleware
+LOCAL_ORIGINS = (
+    "http://localhost:3000",
+    "http://127.0.0.1:3000",
+    "http://localhost:8000",  # Sometimes used for testing
+    "http://127.0.0.1:8000",
+)
+LOCAL_IPS = frozenset({"127.0.0.1", "::1", "localhost"})
+DOCS_PREFIXES = ("/docs", "/openapi.json", "/redoc")
+# Scraped by Prometheus, which sends neither an origin nor the app secret;
+# the route checks its own bearer token / IP allowlist
+METRICS_PATH = "/metrics"
+
+
+def _response(
+    status: int,
+    body: bytes,
+    content_type: bytes = b"text/plain; charset=utf-8",
+    extra_headers: Iterable[Tuple[bytes, bytes]] = (),
+) -> Tuple[Message, Message]:
+    start: Message = {
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", content_type),
+            (b"content-length", str(len(body)).encode()),
+            *extra_headers,
+        ],
+    }
+    return start, {"type": "http.response.body", "body": body}
+
+
+class EdgeMiddleware:
+    """Trusted-source check, rate-limit admission and timing in one ASGI layer"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        environment: Optional[str] = None,
+        mobile_secret: Optional[str] = None,
+        allowed_origins: Optional[Iterable[str]] = None,
+        exempt_ips: Optional[Iterable[str]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        query_tracing: Optional[bool] = None,
+        n_plus_one_threshold: Optional[int] = None,
+    ):
+        self.app = app
+        self.environment = environment or settings.ENVIRONMENT
+        self.development = self.environment == "development"
+        self.mobile_secret = (
+            mobile_secret if mobile_secret is not None else settings.MOBILE_APP_SECRET
+        )
+        self.allowed_origins: FrozenSet[str] = frozenset(
+            [
+                *(
+                    allowed_origins
+                    if allowed_origins is not None
+                    else settings.ALLOWED_ORIGINS
+                ),
+                *LOCAL_ORIGINS,
+            ]
+        )
+        self.exempt_ips: FrozenSet[str] = frozenset(
+            exempt_ips if exempt_ips is not None else settings.RATE_LIMIT_EXEMPT_IPS
+        )
+        self.rate_limiter = rate_limiter or default_rate_limiter
+        self.query_tracing = (
+            settings.QUERY_TRACING_ENABLED if query_tracing is None else query_tracing
+        )
+        # 0 disables the N+1 detector
+        if n_plus_one_threshold is None:
+            n_plus_one_threshold = (
+                settings.N_PLUS_ONE_THRESHOLD if settings.N_PLUS_ONE_DETECTION else 0
+            )
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        path: str = scope["path"]
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        status_code = 500
+        tracing = (
+            start_request_tracing(self.n_plus_one_threshold > 0)
+            if self.query_tracing
+            else None
+        )
+        stats = tracing[0] if tracing is not None else None
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                process_time = time.perf_counter() - start_time
+                headers: List[Tuple[bytes, bytes]] = list(message.get("headers", []))
+                headers.append((b"x-process-time", str(process_time).encode()))
+                if stats is not None:
+                    headers.append(
+                        (b"server-timing", stats.server_timing(process_time).encode())
+                    )
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            rejection = None
+            if not self.development and path != METRICS_PATH:
+                rejection = self._check_source(scope, path, client_ip)
+                if rejection is None and client_ip not in self.exempt_ips:
+                    rejection = self._admit(path, client_ip)
+
+            if rejection is not None:
+                for message in rejection:
+                    await send_with_timing(message)
+            else:
+                await self.app(scope, receive, send_with_timing)
+        finally:
+            process_time = time.perf_counter() - start_time
+            # Set by the router once a route matched; rejected and unknown
+            # paths share one label so raw paths never become label values
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            observe_request(route_path, scope["method"], status_code, process_time)
+            if tracing is not None:
+                stop_request_tracing(*tracing)
+                self._record_queries(tracing[0], route_path, scope["method"], path)
+            query = scope.get("query_string", b"")
+            target = f"{path}?{query.decode('latin-1')}" if query else path
+            logger.info(
+                f"Request: {scope['method']} {target} - Status: {status_code} - Process Time: {process_time:.4f}s"
+            )
+
+    def _record_queries(
+        self, stats: RequestQueryStats, route_path: str, method: str, path: str
+    ) -> None:
+        DB_QUERIES_PER_REQUEST.observe((route_path,), stats.count)
+        DB_TIME_PER_REQUEST.observe((route_path,), stats.total_seconds)
+        if not self.n_plus_one_threshold:
+            return
+        repeated = stats.repeated_statements(self.n_plus_one_threshold)
+        if not repeated:
+            return
+        N_PLUS_ONE_DETECTIONS.inc((route_path,))
+        statement, count = repeated[0]
+        logger.warning(
+            f"Possible N+1: {method} {path} ran the same statement {count} times "
+            f"({stats.count} queries in total): {' '.join(statement.split())[:300]}"
+        )
+
+    def _check_source(
+        self, scope: Scope, path: str, client_ip: str
+    ) -> Optional[Tuple[Message, Message]]:
+        """Returns a 403 response for untrusted requests, None if trusted."""
+        if path.startswith(DOCS_PREFIXES):
+            logger.warning(f"Access DENIED: Documentation (IP: {client_ip})")
+            return _response(403, b"Forbidden: Documentation access not allowed")
+
+        client_secret = origin = None
+        for name, value in scope["headers"]:
+            if name == b"x-client-secret":
+                client_secret = value.decode("latin-1")
+            elif name == b"origin":
+                origin = value.decode("latin-1")
+
+        # 1. Mobile app secret
+        if client_secret and self.mobile_secret:
+            if client_secret == self.mobile_secret:
+                logger.debug(f"Access ALLOWED: Mobile App (IP: {client_ip})")
+                return None
+            logger.warning(f"Access DENIED: Invalid Mobile Secret (IP: {client_ip})")
+
+        # 2. Web origin
+        if origin:
+            if origin in self.allowed_origins:
+                logger.debug(f"Access ALLOWED: Web Origin {origin} (IP: {client_ip})")
+                return None
+            logger.warning(
+                f"Access DENIED: Unauthorized Origin {origin} (IP: {client_ip})"
+            )
+
+        # 3. Direct local access (e.g. curl from the server itself)
+        if client_ip in LOCAL_IPS:
+            logger.debug(f"Access ALLOWED: Localhost Direct Access (IP: {client_ip})")
+            return None
+
+        logger.warning(
+            f"Access BLOCKED: Untrusted Source (IP: {client_ip}, Origin: {origin})"
+        )
+        return _response(403, b"Forbidden: Untrusted Source")
+
+    def _admit(self, path: str, client_ip: str) -> Optional[Tuple[Message, Message]]:
+        """Takes a token for the client on the path's route limit; 429 if none."""
+        rule, limit = self.rate_limiter.route_limit(path)
+        decision = self.rate_limiter.check(f"{rule}|{client_ip}", limit, rule)
+        if decision.allowed:
+            return None
+
+        logger.warning(
+            f"Rate limit exceeded ({decision.reason}): {path} (IP: {client_ip})"
+        )
+        body = json.dumps({"error": f"Rate limit exceeded: {limit}"}).encode()
+        retry_after = max(math.ceil(decision.retry_after), 1)
+        return _response(
+            429,
+            body,
+            content_type=b"application/json",
+            extra_headers=((b"retry-after", str(retry_after).encode()),),
+        )
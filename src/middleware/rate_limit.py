@@ -1,34 +1,28 @@
-from typing import Optional
-
-from fastapi import Request
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-
-from src.config.settings import settings
-
-
-def get_ip_key(request: Request) -> Optional[str]:
-    """
-    Custom key function for rate limiting.
-    Returns the IP address to rate limit by.
-    Returns None if the IP is exempt (bypassing rate limits).
-    """
-    # Check for exempt IPs
-    remote_addr = get_remote_address(request)
-
-    # Bypass if in development mode
-    if settings.ENVIRONMENT == "development":
-        return None
-
-    if remote_addr and remote_addr in settings.RATE_LIMIT_EXEMPT_IPS:
-        return None  # Return None to skip rate limiting
-
-    return remote_addr
-
-
-# Initialize limiter with our custom key function
-# default_limits can be overridden per route
-limiter = Limiter(
-    key_func=get_ip_key,  # type: ignore
-    default_limits=["100/minute"],  # Default "minimum effort" global limit
+from src.shared.metrics import metrics
+from src.shared.rate_limiter import RateLimiter
+
+# Process-wide limiter used by EdgeMiddleware and the TierRateLimit dependency.
+# Limits and the optional shared backend come from the RATE_LIMIT_* settings.
+rate_limiter = RateLimiter.from_settings()
+
+metrics.counter(
+    "rate_limit_decisions_total",
+    "Rate limit admissions and rejections by rule and result",
+    ("rule", "result"),
+    collect=lambda: {
+        **{(rule, "allowed"): n for rule, n in rate_limiter.allowed.items()},
+        **{
+            (rule, f"rejected_{reason}"): n
+            for (rule, reason), n in rate_limiter.rejected.items()
+        },
+    },
+)
+metrics.counter(
+    "rate_limit_sync_total",
+    "Shared rate limit syncs by result",
+    ("result",),
+    collect=lambda: {
+        ("ok",): rate_limiter.syncs,
+        ("failed",): rate_limiter.sync_failures,
+    },
 )
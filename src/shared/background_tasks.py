@@ -0,0 +1,35 @@
+import asyncio
+from typing import Any, Coroutine, Set
+
+from src.shared.metrics import BACKGROUND_TASKS, BACKGROUND_TASKS_IN_FLIGHT
+from src.shared.utils import get_logger
+
+logger = get_logger(__name__)
+
+# Strong references; the event loop only keeps weak ones to running tasks
+_running: Set[asyncio.Task] = set()
+
+
+def spawn(name: str, coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+    """
+    Start a fire-and-forget task and track it in the background task metrics.
+    ``name`` labels the metrics, so it should be a fixed string per call site.
+    """
+    task = asyncio.create_task(coro)
+    _running.add(task)
+    BACKGROUND_TASKS_IN_FLIGHT.inc((name,))
+
+    def _done(finished: asyncio.Task) -> None:
+        _running.discard(finished)
+        BACKGROUND_TASKS_IN_FLIGHT.dec((name,))
+        if finished.cancelled():
+            result = "cancelled"
+        elif finished.exception() is not None:
+            result = "error"
+            logger.error(f"Background task {name} failed: {finished.exception()}")
+        else:
+            result = "ok"
+        BACKGROUND_TASKS.inc((name, result))
+
+    task.add_done_callback(_done)
+    return task
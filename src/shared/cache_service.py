@@ -5,6 +5,8 @@ import time
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
+from src.shared.metrics import record_cache_lookup
+
 
 @dataclass
 class CacheItem:
@@ -29,6 +31,7 @@ class CacheService:
         """Get item from cache"""
         async with self._lock:
             if key not in self._cache:
+                record_cache_lookup(key, False)
                 return None
 
             item = self._cache[key]
@@ -38,8 +41,11 @@ class CacheService:
                 del self._cache[key]
                 if key in self._access_order:
                     del self._access_order[key]
+                record_cache_lookup(key, False)
                 return None
 
+            record_cache_lookup(key, True)
+
             # Update access order and hit count
             self._access_order[key] = time.time()
             item.hits += 1
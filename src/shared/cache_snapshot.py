@@ -0,0 +1,153 @@
+"""
+On-disk snapshot of core_cache entries
+
+A snapshot holds the reference data caches (tiers, price lists, stores,
+popular products) so a new instance starts with them filled instead of
+querying for each. The file is msgpack: a header map followed by one
+[group, key, expires_at, value] array per entry, read through a memory map.
+
+Entries belong to groups (one per warm-up registration), and the header
+records a data version per group. On load, a group whose version differs
+from the current one is discarded, as is the whole file when its format
+differs from SNAPSHOT_FORMAT. Entries keep their absolute expiry, so a
+restored entry is never served longer than it would have been by the
+process that wrote it.
+"""
+
+import mmap
+import os
+import time
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, Mapping, Sequence, Tuple
+
+import msgpack
+
+from src.shared.core_cache import core_cache
+from src.shared.utils import get_logger
+
+logger = get_logger(__name__)
+
+# Bump when the encoding or the shape of a cached value changes
+SNAPSHOT_FORMAT = 1
+
+# msgpack extension type codes
+_EXT_DATETIME = 1
+_EXT_DATE = 2
+_EXT_DECIMAL = 3
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return msgpack.ExtType(_EXT_DATETIME, value.isoformat().encode())
+    if isinstance(value, date):
+        return msgpack.ExtType(_EXT_DATE, value.isoformat().encode())
+    if isinstance(value, Decimal):
+        return msgpack.ExtType(_EXT_DECIMAL, str(value).encode())
+    if isinstance(value, Enum):
+        # Cached values are revalidated into schemas, which restore the enum
+        return value.value
+    raise TypeError(f"Cannot snapshot {type(value).__name__}")
+
+
+def _decode(code: int, data: bytes) -> Any:
+    if code == _EXT_DATETIME:
+        return datetime.fromisoformat(data.decode())
+    if code == _EXT_DATE:
+        return date.fromisoformat(data.decode())
+    if code == _EXT_DECIMAL:
+        return Decimal(data.decode())
+    return msgpack.ExtType(code, data)
+
+
+def write_cache_snapshot(
+    path: str,
+    groups: Mapping[str, Tuple[str, Sequence[str]]],
+) -> int:
+    """
+    Write the live core_cache entries of each group to path.
+
+    ``groups`` maps a group name to (data version, cache key prefixes). The
+    file is written next to path and renamed over it, so readers never see
+    a partial snapshot. Returns the number of entries written.
+    """
+    packer = msgpack.Packer(default=_encode)
+    now = time.time()
+    header = {
+        "format": SNAPSHOT_FORMAT,
+        "written_at": now,
+        "versions": {name: version for name, (version, _) in groups.items()},
+    }
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    written = 0
+    try:
+        with open(tmp_path, "wb") as snapshot:
+            snapshot.write(packer.pack(header))
+            for name, (_, prefixes) in groups.items():
+                for key, value, ttl in core_cache.entries(prefixes):
+                    try:
+                        snapshot.write(packer.pack([name, key, now + ttl, value]))
+                    except (TypeError, ValueError) as e:
+                        logger.debug(f"Skipping cache snapshot entry {key}: {e}")
+                        continue
+                    written += 1
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    logger.info(f"Wrote cache snapshot {path} with {written} entries")
+    return written
+
+
+def load_cache_snapshot(path: str, versions: Dict[str, str]) -> int:
+    """
+    Restore the entries of groups whose version matches ``versions``.
+
+    Groups missing from ``versions`` are skipped, and so are entries that
+    expire within a second. Returns the number of entries restored.
+    """
+    try:
+        snapshot = open(path, "rb")
+    except FileNotFoundError:
+        logger.info(f"No cache snapshot at {path}")
+        return 0
+
+    restored = 0
+    with snapshot:
+        if os.fstat(snapshot.fileno()).st_size == 0:
+            return 0
+        with mmap.mmap(snapshot.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            unpacker = msgpack.Unpacker(mapped, ext_hook=_decode, strict_map_key=False)
+            header = next(unpacker, None)
+            if not isinstance(header, dict) or header.get("format") != SNAPSHOT_FORMAT:
+                logger.warning(f"Discarding cache snapshot {path}: unknown format")
+                return 0
+
+            current = {
+                name
+                for name, version in header.get("versions", {}).items()
+                if versions.get(name) == version
+            }
+            stale = set(header.get("versions", {})) - current
+            if stale:
+                logger.info(
+                    f"Discarding stale cache snapshot groups: {', '.join(sorted(stale))}"
+                )
+            if not current:
+                return 0
+
+            now = time.time()
+            for name, key, expires_at, value in unpacker:
+                ttl = int(expires_at - now)
+                if name in current and ttl >= 1:
+                    core_cache.set(key, value, ttl_seconds=ttl)
+                    restored += 1
+
+    age = time.time() - header["written_at"]
+    logger.info(
+        f"Restored {restored} cache entries from snapshot {path} ({age:.0f}s old)"
+    )
+    return restored
@@ -0,0 +1,183 @@
+"""
+Startup cache warm-up
+
+Domains register loaders for their hot reference data (category trees,
+tiers, price lists, stores, popular products). At startup the lifespan
+runs them concurrently in the background, so the app serves right away and
+the caches fill within moments of a deploy or scale-out. Registration happens where the domain's service
+or snapshot is created, so a router left out by DISABLED_ROUTERS is not
+warmed either.
+
+With a snapshot path, the core_cache entries under each registration's
+cache prefixes are restored from the file before the loaders run (the
+loaders then hit the cache) and written back at shutdown. A registration's
+data version is derived from the write counters PostgreSQL keeps for its
+tables (pg_stat_user_tables). It is read once, before the loaders fill the
+cache, and that version is the one written at shutdown: any insert, update
+or delete after the entries were loaded discards them on the next restore.
+Entries refilled later are at least as new, so the worst case is a
+discarded snapshot, never a stale one. Only registrations with tables are
+snapshotted; the others rely on a fresh load.
+"""
+
+import asyncio
+import hashlib
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Sequence
+
+from sqlalchemy import text
+
+from src.database.connection import AsyncSessionLocal
+from src.shared.background_tasks import spawn
+from src.shared.cache_snapshot import load_cache_snapshot, write_cache_snapshot
+from src.shared.utils import get_logger
+
+logger = get_logger(__name__)
+
+_TABLE_WRITES_SQL = text(
+    """
+    SELECT relname, n_tup_ins + n_tup_upd + n_tup_del AS writes
+    FROM pg_stat_user_tables
+    WHERE relname = ANY(:tables)
+    """
+)
+
+
+@dataclass(frozen=True)
+class WarmupLoader:
+    """One registered warm-up step"""
+
+    name: str
+    load: Callable[[], Coroutine[Any, Any, Any]]
+    # core_cache key prefixes the loader fills (persisted in snapshots)
+    cache_prefixes: Sequence[str] = ()
+    # Tables the cached data is read from (their writes version the snapshot)
+    tables: Sequence[str] = ()
+
+
+class CacheWarmup:
+    """Registry of warm-up loaders and the cache snapshot around them"""
+
+    def __init__(self):
+        self._loaders: Dict[str, WarmupLoader] = {}
+        # Data versions read before the loaders ran, written with the snapshot
+        self._loaded_versions: Dict[str, str] = {}
+
+    def register(
+        self,
+        name: str,
+        load: Callable[[], Coroutine[Any, Any, Any]],
+        cache_prefixes: Sequence[str] = (),
+        tables: Sequence[str] = (),
+    ) -> None:
+        self._loaders[name] = WarmupLoader(name, load, cache_prefixes, tables)
+
+    @property
+    def loaders(self) -> List[WarmupLoader]:
+        return list(self._loaders.values())
+
+    async def run(
+        self, timeout: float, snapshot_path: Optional[str] = None
+    ) -> Dict[str, bool]:
+        """
+        Restore the snapshot (if any), then run every loader concurrently.
+
+        Waits at most ``timeout`` seconds; loaders still running carry on in
+        the background. A failing loader is logged and does not stop the
+        others. Returns whether each loader finished in time and succeeded.
+        """
+        started = time.perf_counter()
+        if snapshot_path:
+            try:
+                await asyncio.wait_for(self.restore_snapshot(snapshot_path), timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Cache snapshot restore timed out")
+
+        tasks = {
+            spawn("cache_warmup", loader.load()): loader.name
+            for loader in self._loaders.values()
+        }
+        if not tasks:
+            return {}
+        remaining = max(timeout - (time.perf_counter() - started), 0.0)
+        done, pending = await asyncio.wait(tasks, timeout=remaining)
+
+        results = {}
+        for task, name in tasks.items():
+            results[name] = (
+                task in done and not task.cancelled() and task.exception() is None
+            )
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"Cache warm-up: {sum(results.values())}/{len(results)} loaders "
+            f"in {elapsed:.2f}s"
+            + (
+                f", still running: {', '.join(sorted(tasks[t] for t in pending))}"
+                if pending
+                else ""
+            )
+        )
+        return results
+
+    async def data_versions(self) -> Dict[str, str]:
+        """Current data version of every registration"""
+        tables = sorted({table for loader in self.loaders for table in loader.tables})
+        writes: Dict[str, int] = {}
+        if tables:
+            async with AsyncSessionLocal() as session:
+                result = await session.execute(_TABLE_WRITES_SQL, {"tables": tables})
+                writes = {relname: count for relname, count in result}
+
+        versions = {}
+        for loader in self.loaders:
+            fingerprint = ",".join(
+                f"{table}:{writes.get(table, 'missing')}"
+                for table in sorted(loader.tables)
+            )
+            versions[loader.name] = hashlib.md5(fingerprint.encode()).hexdigest()
+        return versions
+
+    async def restore_snapshot(self, path: str) -> int:
+        """
+        Restore the entries whose data is unchanged since the snapshot.
+
+        The versions read here precede every loader run, so they are also
+        the versions save_snapshot writes for what the loaders cache.
+        """
+        try:
+            versions = await self.data_versions()
+        except Exception as e:
+            # Without versions the snapshot cannot be checked for staleness
+            logger.warning(f"Skipping cache snapshot, data versions unavailable: {e}")
+            return 0
+        self._loaded_versions = versions
+        try:
+            return load_cache_snapshot(path, versions)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache snapshot {path}: {e}")
+            return 0
+
+    async def save_snapshot(self, path: str) -> int:
+        """Write the cached entries under the versions they were loaded at"""
+        try:
+            groups = {
+                loader.name: (
+                    self._loaded_versions[loader.name],
+                    loader.cache_prefixes,
+                )
+                for loader in self.loaders
+                if loader.cache_prefixes
+                and loader.tables
+                and loader.name in self._loaded_versions
+            }
+            if not groups:
+                return 0
+            return write_cache_snapshot(path, groups)
+        except Exception as e:
+            logger.warning(f"Could not write cache snapshot {path}: {e}")
+            return 0
+
+
+# Global cache warm-up registry
+cache_warmup = CacheWarmup()
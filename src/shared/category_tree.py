@@ -0,0 +1,215 @@
+"""
+Immutable in-memory category tree
+
+Categories are few and read on almost every catalogue request, so each
+category domain keeps one snapshot of the whole tree instead of caching
+every filter view separately. A snapshot is built once from a flat list of
+rows and never modified; a SnapshotIndex holds the current one.
+
+Nodes are numbered in depth-first order, so a node and its descendants hold
+a contiguous run of ordinals. A node's descendant set is therefore an int
+bitmap over those ordinals, and expanding several categories to their
+subtrees is an OR of bitmaps.
+"""
+
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from pydantic import BaseModel
+
+from src.shared.utils import get_logger
+
+logger = get_logger(__name__)
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+
+@dataclass(frozen=True)
+class CategoryNode:
+    id: int
+    parent_id: Optional[int]
+    depth: int
+    ancestors: Tuple[int, ...]  # root first, parent last
+    children: Tuple[int, ...]  # in display order
+    descendant_mask: int  # this node and its whole subtree, by ordinal
+
+
+class CategoryTree(Generic[SchemaT]):
+    """One snapshot of a category table with every filter view precomputed
+
+    Returned schemas are shared between callers and must be treated as
+    read-only.
+    """
+
+    def __init__(
+        self,
+        rows: Iterable[Mapping[str, Any]],
+        schema: Type[SchemaT],
+        sort_key: Callable[[Mapping[str, Any]], Any] = lambda row: row["id"],
+    ):
+        by_id: Dict[int, Mapping[str, Any]] = {row["id"]: row for row in rows}
+        ordered = sorted(by_id.values(), key=lambda row: (sort_key(row), row["id"]))
+
+        children: Dict[Optional[int], List[int]] = {}
+        for row in ordered:
+            parent_id = row["parent_category_id"]
+            # A dangling parent makes the category a root rather than hiding it
+            if parent_id not in by_id:
+                parent_id = None
+            children.setdefault(parent_id, []).append(row["id"])
+
+        # Depth-first numbering; subtree of a node = ordinals [start, end)
+        ordinals: Dict[int, int] = {}
+        spans: Dict[int, Tuple[int, int]] = {}
+        depths: Dict[int, int] = {}
+        ancestors: Dict[int, Tuple[int, ...]] = {}
+
+        def visit(root_id: int) -> None:
+            stack: List[Tuple[int, int, Tuple[int, ...], bool]] = [
+                (root_id, 0, (), False)
+            ]
+            while stack:
+                node_id, depth, path, done = stack.pop()
+                if done:
+                    spans[node_id] = (spans[node_id][0], len(ordinals))
+                    continue
+                if node_id in ordinals:
+                    continue
+                spans[node_id] = (len(ordinals), 0)
+                ordinals[node_id] = len(ordinals)
+                depths[node_id] = depth
+                ancestors[node_id] = path
+                stack.append((node_id, depth, path, True))
+                for child_id in reversed(children.get(node_id, [])):
+                    stack.append((child_id, depth + 1, path + (node_id,), False))
+
+        for root_id in children.get(None, []):
+            visit(root_id)
+        # Parent cycles are unreachable from the roots; break them at the
+        # first member so every category stays visible
+        for row in ordered:
+            if row["id"] not in ordinals:
+                logger.warning(
+                    f"Category {row['id']} is in a parent cycle; treating it as a root"
+                )
+                children[row["parent_category_id"]].remove(row["id"])
+                children.setdefault(None, []).append(row["id"])
+                visit(row["id"])
+
+        self._ids_by_ordinal: Tuple[int, ...] = tuple(
+            sorted(ordinals, key=ordinals.__getitem__)
+        )
+        self._nodes: Dict[int, CategoryNode] = {}
+        for node_id, (start, end) in spans.items():
+            parent_id = ancestors[node_id][-1] if ancestors[node_id] else None
+            self._nodes[node_id] = CategoryNode(
+                id=node_id,
+                parent_id=parent_id,
+                depth=depths[node_id],
+                ancestors=ancestors[node_id],
+                children=tuple(children.get(node_id, [])),
+                descendant_mask=((1 << (end - start)) - 1) << start,
+            )
+
+        # Schemas: flat (subcategories=None) and with direct children
+        self._flat: Dict[int, SchemaT] = {
+            row["id"]: schema.model_validate({**row, "subcategories": None})
+            for row in ordered
+        }
+        self._nested: Dict[int, SchemaT] = {
+            node_id: schema.model_validate(
+                {
+                    **by_id[node_id],
+                    "subcategories": [self._flat[c] for c in node.children],
+                }
+            )
+            for node_id, node in self._nodes.items()
+        }
+
+        self._sorted_ids: Tuple[int, ...] = tuple(row["id"] for row in ordered)
+        self._root_ids: Tuple[int, ...] = tuple(children.get(None, []))
+        self._child_ids: Dict[int, Tuple[int, ...]] = {
+            node_id: node.children for node_id, node in self._nodes.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, category_id: object) -> bool:
+        return category_id in self._nodes
+
+    def _schemas(
+        self, ids: Iterable[int], include_subcategories: bool
+    ) -> List[SchemaT]:
+        source = self._nested if include_subcategories else self._flat
+        return [source[category_id] for category_id in ids]
+
+    # Filter views
+    def all(self, include_subcategories: bool = True) -> List[SchemaT]:
+        return self._schemas(self._sorted_ids, include_subcategories)
+
+    def roots(self, include_subcategories: bool = True) -> List[SchemaT]:
+        return self._schemas(self._root_ids, include_subcategories)
+
+    def non_roots(self, include_subcategories: bool = True) -> List[SchemaT]:
+        root_ids = set(self._root_ids)
+        return self._schemas(
+            (i for i in self._sorted_ids if i not in root_ids), include_subcategories
+        )
+
+    def children(
+        self, parent_id: int, include_subcategories: bool = True
+    ) -> List[SchemaT]:
+        return self._schemas(self._child_ids.get(parent_id, ()), include_subcategories)
+
+    # Lookups
+    def node(self, category_id: int) -> Optional[CategoryNode]:
+        return self._nodes.get(category_id)
+
+    def get(
+        self, category_id: int, include_subcategories: bool = True
+    ) -> Optional[SchemaT]:
+        source = self._nested if include_subcategories else self._flat
+        return source.get(category_id)
+
+    def get_many(
+        self, category_ids: Iterable[int], include_subcategories: bool = True
+    ) -> List[SchemaT]:
+        """Known categories among category_ids, in display order"""
+        wanted = {i for i in category_ids if i in self._nodes}
+        return self._schemas(
+            (i for i in self._sorted_ids if i in wanted), include_subcategories
+        )
+
+    # Subtrees
+    def descendant_mask(self, category_ids: Iterable[int]) -> int:
+        mask = 0
+        for category_id in category_ids:
+            node = self._nodes.get(category_id)
+            if node is not None:
+                mask |= node.descendant_mask
+        return mask
+
+    def ids_from_mask(self, mask: int) -> List[int]:
+        ids = []
+        while mask:
+            low_bit = mask & -mask
+            ids.append(self._ids_by_ordinal[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return ids
+
+    def expand(self, category_ids: Iterable[int]) -> List[int]:
+        """The given categories plus all their descendants, in tree order"""
+        return self.ids_from_mask(self.descendant_mask(category_ids))
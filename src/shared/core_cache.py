@@ -1,9 +1,10 @@
 import hashlib
 import threading
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from src.config.cache_config import cache_config
+from src.shared.metrics import record_cache_lookup
 from src.shared.utils import get_logger
 
 logger = get_logger(__name__)
@@ -62,8 +63,11 @@ class CoreCacheClient:
                 entry = self._cache[key]
                 if entry.is_expired():
                     del self._cache[key]
+                    record_cache_lookup(key, False)
                     return None
+                record_cache_lookup(key, True)
                 return entry.value
+            record_cache_lookup(key, False)
             return None
 
     def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> bool:
@@ -97,6 +101,17 @@ class CoreCacheClient:
 
             return deleted
 
+    def entries(self, prefixes: Iterable[str]) -> List[Tuple[str, Any, float]]:
+        """Live entries under the prefixes as (key, value, seconds left)"""
+        prefixes = tuple(prefixes)
+        now = datetime.now()
+        with self._lock:
+            return [
+                (key, entry.value, (entry.expires_at - now).total_seconds())
+                for key, entry in self._cache.items()
+                if key.startswith(prefixes) and entry.expires_at > now
+            ]
+
     def _match_pattern(self, key: str, pattern: str) -> bool:
         """Simple pattern matching for in-memory cache"""
         if pattern.endswith("*"):
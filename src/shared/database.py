@@ -5,11 +5,14 @@ Unified async database client with connection pooling and Firebase integration
 import asyncio
 import threading
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from dotenv import load_dotenv
-from firebase_admin import auth
-from google.cloud import firestore
+
+# The Firestore and Firebase Auth clients are imported on first use; importing
+# them is a noticeable share of startup time
+if TYPE_CHECKING:
+    from google.cloud import firestore
 
 load_dotenv()
 
@@ -37,27 +40,27 @@ class AsyncDatabaseClient:
         self._initialized = True
 
         # Async Firestore client
-        self._async_client: Optional[firestore.AsyncClient] = None
+        self._async_client: Optional["firestore.AsyncClient"] = None
 
         # Sync Firestore client for admin operations
-        self._sync_client: Optional[firestore.Client] = None
+        self._sync_client: Optional["firestore.Client"] = None
 
-        # Thread pool for sync operations in async context
-        self._executor = ThreadPoolExecutor(
-            max_workers=20, thread_name_prefix="firestore_pool"
-        )
+        # Thread pool for sync operations in async context, created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
 
         # Collection references cache
         self._collections: Dict[str, Any] = {}
         self._async_collections: Dict[str, Any] = {}
 
-    async def get_async_client(self) -> firestore.AsyncClient:
+    async def get_async_client(self) -> "firestore.AsyncClient":
         """Get async Firestore client"""
         if self._async_client is None:
+            from google.cloud import firestore
+
             self._async_client = firestore.AsyncClient()
         return self._async_client
 
-    def get_sync_client(self) -> firestore.Client:
+    def get_sync_client(self) -> "firestore.Client":
         """Get sync Firestore client for admin operations"""
         if self._sync_client is None:
             from firebase_admin import firestore as admin_firestore
@@ -67,6 +70,8 @@ class AsyncDatabaseClient:
 
     def get_firebase_auth(self):
         """Get Firebase Auth instance"""
+        from firebase_admin import auth
+
         return auth
 
     async def get_async_collection(self, collection_name: str):
@@ -109,6 +114,12 @@ class AsyncDatabaseClient:
 
     async def run_sync_in_executor(self, func, *args):
         """Run sync operations in thread pool"""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=20, thread_name_prefix="firestore_pool"
+                    )
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(self._executor, func, *args)
 
@@ -131,7 +142,7 @@ db_client = AsyncDatabaseClient()
 
 
 # Async functions (preferred)
-async def get_async_db() -> firestore.AsyncClient:
+async def get_async_db() -> "firestore.AsyncClient":
     """Get the async Firestore client"""
     return await db_client.get_async_client()
 
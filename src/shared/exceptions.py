@@ -35,3 +35,12 @@ class ValidationException(HTTPException):
 class ServiceUnavailableException(HTTPException):
     def __init__(self, detail: str = "Service temporarily unavailable"):
         super().__init__(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=detail)
+
+
+class TooManyRequestsException(HTTPException):
+    def __init__(self, detail: str = "Rate limit exceeded", retry_after: int = 1):
+        super().__init__(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=detail,
+            headers={"Retry-After": str(retry_after)},
+        )
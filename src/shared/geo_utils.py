@@ -2,10 +2,9 @@
 Geospatial utilities for location-based operations using geopy
 """
 
-from typing import Any, List, Tuple
+from typing import Any, List, Optional, Tuple
 
 from geopy.distance import geodesic
-from geopy.geocoders import Nominatim
 
 from src.config.constants import (
     MAX_LATITUDE,
@@ -18,8 +17,16 @@ from src.config.constants import (
 class GeoUtils:
     """Utility class for geospatial operations using geopy"""
 
-    # Initialize geocoder with a user agent for geopy
-    _geolocator = Nominatim(user_agent="celeste_ecommerce_app")
+    # Geocoder, created on first use (building it costs startup time)
+    _geolocator: Optional[Any] = None
+
+    @staticmethod
+    def _get_geolocator() -> Any:
+        if GeoUtils._geolocator is None:
+            from geopy.geocoders import Nominatim
+
+            GeoUtils._geolocator = Nominatim(user_agent="celeste_ecommerce_app")
+        return GeoUtils._geolocator
 
     @staticmethod
     def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -68,7 +75,7 @@ class GeoUtils:
         """
         try:
             # Use Any type to avoid async/coroutine type issues
-            location: Any = GeoUtils._geolocator.geocode(address)
+            location: Any = GeoUtils._get_geolocator().geocode(address)
             if (
                 location is not None
                 and hasattr(location, "latitude")
@@ -97,7 +104,9 @@ class GeoUtils:
         """
         try:
             # Use Any type to avoid async/coroutine type issues
-            location: Any = GeoUtils._geolocator.reverse(f"{latitude}, {longitude}")
+            location: Any = GeoUtils._get_geolocator().reverse(
+                f"{latitude}, {longitude}"
+            )
             if location is not None and hasattr(location, "address"):
                 return str(location.address)
             else:
@@ -0,0 +1,250 @@
+"""
+Process metrics in the Prometheus text exposition format
+
+Fixed-bucket histograms and labelled counters/gauges. Recording is a dict
+lookup plus a bisect over a handful of bucket bounds, and memory only grows
+with the number of label combinations (route templates, cache prefixes),
+never with traffic. Values owned by other components (DB pool, rate limiter,
+hold sweeper) are read through collector callbacks at scrape time.
+
+Everything is recorded from the event loop; the few callers on worker
+threads only bump counters, where a rare lost increment is acceptable.
+"""
+
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+Collect = Callable[[], Dict[LabelValues, float]]
+
+# Seconds; covers cache hits (~1ms) up to slow listing queries
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Seconds spent waiting for a pooled DB connection
+POOL_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+
+class Histogram:
+    """Counts per bucket plus sum and count; the last bucket is +Inf"""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate by linear interpolation inside the bucket holding ``q``."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= rank and bucket_count:
+                if index == len(self.bounds):
+                    return self.bounds[-1]
+                lower = self.bounds[index - 1] if index else 0.0
+                upper = self.bounds[index]
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.bounds[-1]
+
+
+class MetricFamily:
+    """One named metric with a fixed set of label names"""
+
+    def __init__(
+        self,
+        name: str,
+        kind: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        collect: Optional[Collect] = None,
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.kind = kind
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.collect = collect
+        self.buckets = tuple(buckets)
+        self.values: Dict[LabelValues, float] = {}
+        self.histograms: Dict[LabelValues, Histogram] = {}
+
+    def inc(self, labels: LabelValues = (), amount: float = 1) -> None:
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def dec(self, labels: LabelValues = (), amount: float = 1) -> None:
+        self.values[labels] = self.values.get(labels, 0) - amount
+
+    def set(self, labels: LabelValues, value: float) -> None:
+        self.values[labels] = value
+
+    def observe(self, labels: LabelValues, value: float) -> None:
+        histogram = self.histograms.get(labels)
+        if histogram is None:
+            histogram = self.histograms[labels] = Histogram(self.buckets)
+        histogram.observe(value)
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        if self.kind == "histogram":
+            for labels, histogram in sorted(self.histograms.items()):
+                base = self._labels(labels)
+                cumulative = 0
+                for bound, bucket_count in zip(
+                    (*histogram.bounds, "+Inf"), histogram.counts
+                ):
+                    cumulative += bucket_count
+                    le = _label_pair("le", _format_value(bound))
+                    bucket_labels = f"{base[:-1]},{le}}}" if base else f"{{{le}}}"
+                    lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+                lines.append(f"{self.name}_sum{base} {_format_value(histogram.sum)}")
+                lines.append(f"{self.name}_count{base} {histogram.count}")
+            return lines
+
+        values = self.collect() if self.collect is not None else self.values
+        for labels, value in sorted(values.items()):
+            lines.append(f"{self.name}{self._labels(labels)} {_format_value(value)}")
+        return lines
+
+    def _labels(self, values: LabelValues) -> str:
+        if not self.label_names:
+            return ""
+        pairs = ",".join(
+            _label_pair(name, str(value))
+            for name, value in zip(self.label_names, values)
+        )
+        return f"{{{pairs}}}"
+
+
+def _label_pair(name: str, value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+    return f'{name}="{escaped}"'
+
+
+def _format_value(value) -> str:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+class MetricsRegistry:
+    """Named metric families, rendered together for the scrape endpoint"""
+
+    def __init__(self):
+        self._families: Dict[str, MetricFamily] = {}
+
+    def _register(self, family: MetricFamily) -> MetricFamily:
+        existing = self._families.get(family.name)
+        if existing is not None:
+            # Re-registration (e.g. a module reloaded in tests) keeps one family
+            existing.collect = family.collect
+            return existing
+        self._families[family.name] = family
+        return family
+
+    def counter(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        collect: Optional[Collect] = None,
+    ) -> MetricFamily:
+        return self._register(
+            MetricFamily(name, "counter", documentation, label_names, collect)
+        )
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        collect: Optional[Collect] = None,
+    ) -> MetricFamily:
+        return self._register(
+            MetricFamily(name, "gauge", documentation, label_names, collect)
+        )
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> MetricFamily:
+        return self._register(
+            MetricFamily(name, "histogram", documentation, label_names, buckets=buckets)
+        )
+
+    def get(self, name: str) -> Optional[MetricFamily]:
+        return self._families.get(name)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for family in self._families.values():
+            lines.extend(family.render())
+        return "\n".join(lines) + "\n"
+
+    def clear(self, names: Optional[Iterable[str]] = None) -> None:
+        """Drops recorded values (all families or ``names``); collectors stay."""
+        for name in names if names is not None else list(self._families):
+            family = self._families.get(name)
+            if family is not None:
+                family.values.clear()
+                family.histograms.clear()
+
+
+# Global registry, rendered by GET /metrics
+metrics = MetricsRegistry()
+
+REQUEST_DURATION = metrics.histogram(
+    "http_request_duration_seconds",
+    "Request latency by route template, method and status class",
+    ("route", "method", "status"),
+)
+CACHE_REQUESTS = metrics.counter(
+    "cache_requests_total",
+    "Cache lookups by key prefix and result (hit or miss)",
+    ("prefix", "result"),
+)
+DB_POOL_WAIT = metrics.histogram(
+    "db_pool_wait_seconds",
+    "Time spent waiting for a pooled database connection",
+    buckets=POOL_WAIT_BUCKETS,
+)
+BACKGROUND_TASKS_IN_FLIGHT = metrics.gauge(
+    "background_tasks_in_flight",
+    "Fire-and-forget tasks started and not yet finished",
+    ("task",),
+)
+BACKGROUND_TASKS = metrics.counter(
+    "background_tasks_total",
+    "Finished fire-and-forget tasks by result",
+    ("task", "result"),
+)
+
+STATUS_CLASSES = {code: f"{code // 100}xx" for code in range(100, 600)}
+
+
+def observe_request(route: str, method: str, status_code: int, seconds: float):
+    REQUEST_DURATION.observe(
+        (route, method, STATUS_CLASSES.get(status_code, "other")), seconds
+    )
+
+
+def record_cache_lookup(key: str, hit: bool) -> None:
+    # Keys without a "prefix:" part are not labelled one by one
+    prefix = key.split(":", 1)[0] if ":" in key else "other"
+    CACHE_REQUESTS.inc((prefix, "hit" if hit else "miss"))
@@ -0,0 +1,140 @@
+"""
+Per-request SQL statement tracing
+
+Cursor-level hooks on the engine count statements and time spent in the
+database for the request that issued them. The request is found through a
+context variable set by EdgeMiddleware, which also turns the totals into a
+``Server-Timing`` header. Statements outside a request (background jobs,
+scripts) are not traced.
+
+In development an N+1 detector also counts identical statement texts per
+request. SQLAlchemy sends bound parameters separately, so a loop that loads
+one row at a time shows up as the same text repeated.
+"""
+
+import time
+from contextvars import ContextVar, Token
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.shared.metrics import LATENCY_BUCKETS, metrics
+
+DB_QUERIES_PER_REQUEST = metrics.histogram(
+    "db_queries_per_request",
+    "SQL statements issued per request, by route template",
+    ("route",),
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89),
+)
+DB_TIME_PER_REQUEST = metrics.histogram(
+    "db_time_per_request_seconds",
+    "Time spent in SQL statements per request, by route template",
+    ("route",),
+    buckets=LATENCY_BUCKETS,
+)
+N_PLUS_ONE_DETECTIONS = metrics.counter(
+    "db_n_plus_one_detections_total",
+    "Requests that repeated one statement at least the N+1 threshold",
+    ("route",),
+)
+
+
+class RequestQueryStats:
+    """Statement totals for one request"""
+
+    __slots__ = (
+        "count",
+        "total_seconds",
+        "slowest_seconds",
+        "slowest_statement",
+        "statement_counts",
+        "closed",
+    )
+
+    def __init__(self, track_statements: bool = False):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.slowest_seconds = 0.0
+        self.slowest_statement: Optional[str] = None
+        # Only filled for the N+1 detector
+        self.statement_counts: Optional[Dict[str, int]] = (
+            {} if track_statements else None
+        )
+        # Set once the response went out; later statements (e.g. from tasks
+        # spawned by the request, which inherit the context) are not counted
+        self.closed = False
+
+    def record(self, statement: str, seconds: float) -> None:
+        if self.closed:
+            return
+        self.count += 1
+        self.total_seconds += seconds
+        if seconds > self.slowest_seconds:
+            self.slowest_seconds = seconds
+            self.slowest_statement = statement
+        if self.statement_counts is not None:
+            self.statement_counts[statement] = (
+                self.statement_counts.get(statement, 0) + 1
+            )
+
+    def repeated_statements(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statements executed at least ``threshold`` times, most repeated first."""
+        if not self.statement_counts:
+            return []
+        repeated = [
+            (statement, count)
+            for statement, count in self.statement_counts.items()
+            if count >= threshold
+        ]
+        return sorted(repeated, key=lambda item: item[1], reverse=True)
+
+    def server_timing(self, app_seconds: float) -> str:
+        return (
+            f'db;dur={self.total_seconds * 1000:.2f};desc="{self.count} queries", '
+            f"db-slowest;dur={self.slowest_seconds * 1000:.2f}, "
+            f"app;dur={app_seconds * 1000:.2f}"
+        )
+
+
+_current_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar(
+    "request_query_stats", default=None
+)
+
+
+def start_request_tracing(
+    track_statements: bool = False,
+) -> Tuple[RequestQueryStats, Token]:
+    stats = RequestQueryStats(track_statements)
+    return stats, _current_stats.set(stats)
+
+
+def stop_request_tracing(stats: RequestQueryStats, token: Token) -> None:
+    stats.closed = True
+    _current_stats.reset(token)
+
+
+def get_request_stats() -> Optional[RequestQueryStats]:
+    return _current_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, many):
+    # Statements on one connection run one after another, so one slot is enough
+    if _current_stats.get() is not None:
+        conn.info["query_start"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, many):
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    start = conn.info.pop("query_start", None)
+    if start is not None:
+        stats.record(statement, time.perf_counter() - start)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attach the tracing hooks; for an AsyncEngine pass ``engine.sync_engine``."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,311 @@
+"""
+Rate limiting engine
+
+Admission is decided in-process from per-key token buckets, so a check is a
+dict lookup and a few float operations with no I/O. Checks never await, so
+within one event loop they run one at a time and need no lock.
+
+With a shared backend (any Redis-protocol server) each process also pushes
+the hits it admitted to a per-key fixed-window counter every sync interval
+and reads back the global total for that window. A key whose global total
+has reached its limit is rejected everywhere until the window rolls over.
+Between syncs a process only sees its own new hits, so the global view can
+overshoot by what the other processes admit within one sync interval. If the
+backend is unreachable the local buckets keep working on their own.
+"""
+
+import asyncio
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from src.shared.resp_client import Command, RespClient
+from src.shared.utils import get_logger
+
+logger = get_logger(__name__)
+
+PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+_LIMIT_PATTERN = re.compile(
+    r"^\s*(\d+)\s*(?:/|per)\s*(\d+)?\s*(second|minute|hour|day)s?\s*$"
+)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """``amount`` requests per ``multiple`` ``unit``s, e.g. 100 per 1 minute"""
+
+    amount: int
+    multiple: int
+    unit: str
+    # Derived once; both are read on every check
+    period: float = field(init=False, repr=False, compare=False)
+    rate: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        period = float(self.multiple * PERIODS[self.unit])
+        object.__setattr__(self, "period", period)
+        # Tokens refilled per second
+        object.__setattr__(self, "rate", self.amount / period)
+
+    def __str__(self) -> str:
+        return f"{self.amount} per {self.multiple} {self.unit}"
+
+
+def parse_rate_limit(value: str) -> RateLimit:
+    """Parses "100/minute", "10/5minutes" or "100 per 1 hour"."""
+    match = _LIMIT_PATTERN.match(value.lower())
+    if not match:
+        raise ValueError(f"Invalid rate limit: {value!r}")
+    amount, multiple, unit = match.groups()
+    if int(amount) <= 0:
+        raise ValueError(f"Rate limit amount must be positive: {value!r}")
+    return RateLimit(int(amount), int(multiple or 1), unit)
+
+
+def parse_limit_map(value: Optional[str]) -> Dict[str, RateLimit]:
+    """Parses "key=limit;key=limit" as used by the RATE_LIMIT_* settings."""
+    limits: Dict[str, RateLimit] = {}
+    for entry in (value or "").split(";"):
+        if not entry.strip():
+            continue
+        key, _, limit = entry.partition("=")
+        limits[key.strip()] = parse_rate_limit(limit)
+    return limits
+
+
+class RateLimitDecision(NamedTuple):
+    allowed: bool
+    retry_after: float = 0.0
+    # "local" (token bucket empty) or "global" (shared window used up)
+    reason: Optional[str] = None
+
+
+class _Bucket:
+    __slots__ = ("limit", "tokens", "stamp", "pending", "window", "global_count")
+
+    def __init__(self, limit: RateLimit, now: float):
+        self.limit = limit
+        self.tokens = float(limit.amount)
+        self.stamp = now
+        # Hits admitted here and not yet pushed to the shared backend
+        self.pending = 0
+        # Shared window index and its global total as of the last sync
+        self.window = -1
+        self.global_count = 0
+
+
+ALLOWED = RateLimitDecision(True)
+
+
+class RateLimiter:
+    """Token-bucket rate limiter with an optional shared backend"""
+
+    def __init__(
+        self,
+        default_limit: RateLimit,
+        route_limits: Optional[Dict[str, RateLimit]] = None,
+        tier_limits: Optional[Dict[int, RateLimit]] = None,
+        tier_default: Optional[RateLimit] = None,
+        backend: Optional[RespClient] = None,
+        sync_interval: float = 1.0,
+        key_prefix: str = "ratelimit:",
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ):
+        self.default_limit = default_limit
+        # Longest prefix first, so "/products/search" wins over "/products"
+        self.route_limits: List[Tuple[str, RateLimit]] = sorted(
+            (route_limits or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+        self.tier_limits = tier_limits or {}
+        self.tier_default = tier_default
+        self.backend = backend
+        self.sync_interval = sync_interval
+        self.key_prefix = key_prefix
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._buckets: Dict[str, _Bucket] = {}
+        self._task: Optional[asyncio.Task] = None
+
+        self.allowed: Dict[str, int] = {}
+        self.rejected: Dict[Tuple[str, str], int] = {}
+        self.syncs = 0
+        self.sync_failures = 0
+        self.last_sync_at: Optional[float] = None
+
+    @classmethod
+    def from_settings(cls) -> "RateLimiter":
+        from src.config.settings import settings
+
+        return cls(
+            default_limit=parse_rate_limit(settings.RATE_LIMIT_DEFAULT),
+            route_limits=parse_limit_map(settings.RATE_LIMIT_ROUTES),
+            tier_limits={
+                int(tier): limit
+                for tier, limit in parse_limit_map(settings.RATE_LIMIT_TIERS).items()
+            },
+            tier_default=(
+                parse_rate_limit(settings.RATE_LIMIT_TIER_DEFAULT)
+                if settings.RATE_LIMIT_TIER_DEFAULT
+                else None
+            ),
+            backend=(
+                RespClient.from_url(settings.RATE_LIMIT_SHARED_URL)
+                if settings.RATE_LIMIT_SHARED_URL
+                else None
+            ),
+            sync_interval=settings.RATE_LIMIT_SYNC_INTERVAL_SECONDS,
+        )
+
+    def route_limit(self, path: str) -> Tuple[str, RateLimit]:
+        """
+        Returns (rule, limit) for a request path. Configured prefixes win;
+        otherwise the default limit is scoped to the top-level path segment
+        (/products, /orders, ...) so ids in the path cannot reset a counter.
+        """
+        for prefix, limit in self.route_limits:
+            if path.startswith(prefix):
+                return prefix, limit
+        segment = "/" + path.split("/", 2)[1] if path.count("/") else path
+        return segment, self.default_limit
+
+    def tier_limit(self, tier_id: Optional[int]) -> Optional[RateLimit]:
+        if tier_id is not None and tier_id in self.tier_limits:
+            return self.tier_limits[tier_id]
+        return self.tier_default
+
+    def check(self, key: str, limit: RateLimit, rule: str) -> RateLimitDecision:
+        """Takes one token for ``key``; ``rule`` only labels the metrics."""
+        now = self._clock()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(limit, now)
+        else:
+            bucket.tokens = min(
+                bucket.tokens + (now - bucket.stamp) * limit.rate, limit.amount
+            )
+            bucket.stamp = now
+
+        if bucket.tokens < 1:
+            return self._reject(rule, "local", (1 - bucket.tokens) / limit.rate)
+
+        if self.backend is not None:
+            wall = self._wall_clock()
+            window = int(wall // limit.period)
+            if bucket.window != window:
+                bucket.window = window
+                bucket.global_count = 0
+                bucket.pending = 0
+            if bucket.global_count + bucket.pending >= limit.amount:
+                return self._reject(rule, "global", (window + 1) * limit.period - wall)
+            bucket.pending += 1
+
+        bucket.tokens -= 1
+        self.allowed[rule] = self.allowed.get(rule, 0) + 1
+        return ALLOWED
+
+    def _reject(self, rule: str, reason: str, retry_after: float) -> RateLimitDecision:
+        self.rejected[(rule, reason)] = self.rejected.get((rule, reason), 0) + 1
+        return RateLimitDecision(False, max(retry_after, 0.0), reason)
+
+    async def sync(self) -> int:
+        """Pushes pending hits to the shared backend; returns keys synced."""
+        if self.backend is None:
+            return 0
+        batch = [
+            (key, bucket, bucket.window, bucket.pending)
+            for key, bucket in self._buckets.items()
+            if bucket.pending
+        ]
+        if not batch:
+            return 0
+
+        commands: List[Command] = []
+        for key, bucket, window, pending in batch:
+            shared_key = f"{self.key_prefix}{key}:{window}"
+            # Keep the counter a little past the end of its window
+            ttl_ms = int(bucket.limit.period * 1000) + 1000
+            commands.append(("INCRBY", shared_key, pending))
+            commands.append(("PEXPIRE", shared_key, ttl_ms))
+            # Hits admitted while the pipeline is in flight stay pending
+            bucket.pending = 0
+
+        try:
+            replies = await self.backend.pipeline(commands)
+        except Exception as e:
+            for _, bucket, window, pending in batch:
+                if bucket.window == window:
+                    bucket.pending += pending
+            self.sync_failures += 1
+            logger.warning(f"Rate limit sync failed: {e}")
+            return 0
+
+        for index, (_, bucket, window, _) in enumerate(batch):
+            if bucket.window == window:
+                bucket.global_count = int(replies[index * 2])
+        self.syncs += 1
+        self.last_sync_at = self._wall_clock()
+        return len(batch)
+
+    def prune(self) -> int:
+        """Drops buckets that have refilled completely; they behave like new ones."""
+        now = self._clock()
+        idle = [
+            key
+            for key, bucket in self._buckets.items()
+            if not bucket.pending
+            and bucket.tokens + (now - bucket.stamp) * bucket.limit.rate
+            >= bucket.limit.amount
+        ]
+        for key in idle:
+            del self._buckets[key]
+        return len(idle)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "buckets": len(self._buckets),
+            "allowed": dict(self.allowed),
+            "rejected": {
+                f"{rule}:{reason}": count
+                for (rule, reason), count in self.rejected.items()
+            },
+            "shared": {
+                "enabled": self.backend is not None,
+                "syncs": self.syncs,
+                "sync_failures": self.sync_failures,
+                "last_sync_at": self.last_sync_at,
+            },
+        }
+
+    async def run_forever(self, prune_interval: float = 60.0) -> None:
+        """Syncs every interval (when shared) and prunes idle buckets."""
+        interval = self.sync_interval if self.backend is not None else prune_interval
+        last_prune = self._clock()
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.sync()
+                if self._clock() - last_prune >= prune_interval:
+                    self.prune()
+                    last_prune = self._clock()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Rate limiter maintenance failed: {e}")
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run_forever())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.backend is not None:
+            await self.sync()
+            await self.backend.close()
@@ -0,0 +1,135 @@
+"""
+Minimal asyncio client for the Redis serialization protocol (RESP2).
+
+Only what the shared rate limiter needs: one connection, pipelined commands
+and the reply types Redis sends back for them. Works against Redis, Valkey,
+KeyDB or any other server speaking the protocol.
+"""
+
+import asyncio
+from typing import Any, List, Optional, Sequence, Union
+from urllib.parse import unquote, urlparse
+
+Command = Sequence[Union[str, bytes, int]]
+
+
+class RespError(Exception):
+    """Error reply (``-ERR ...``) sent by the server"""
+
+
+class RespClient:
+    """Single-connection RESP client; reconnects lazily after a failure"""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        timeout: float = 1.0,
+    ):
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.timeout = timeout
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def from_url(cls, url: str, timeout: float = 1.0) -> "RespClient":
+        """redis://[:password@]host[:port][/db]"""
+        parsed = urlparse(url)
+        db = parsed.path.lstrip("/")
+        return cls(
+            host=parsed.hostname or "127.0.0.1",
+            port=parsed.port or 6379,
+            db=int(db) if db else 0,
+            password=unquote(parsed.password) if parsed.password else None,
+            timeout=timeout,
+        )
+
+    async def pipeline(self, commands: List[Command]) -> List[Any]:
+        """Send all commands in one write and read their replies in order."""
+        async with self._lock:
+            try:
+                if self._writer is None:
+                    await self._connect()
+                return await asyncio.wait_for(
+                    self._send(commands), timeout=self.timeout
+                )
+            except (OSError, asyncio.TimeoutError, ConnectionError):
+                await self.close()
+                raise
+
+    async def execute(self, *command: Union[str, bytes, int]) -> Any:
+        return (await self.pipeline([command]))[0]
+
+    async def close(self) -> None:
+        writer, self._reader, self._writer = self._writer, None, None
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (OSError, ConnectionError):
+                pass
+
+    async def _connect(self) -> None:
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), timeout=self.timeout
+        )
+        setup: List[Command] = []
+        if self.password:
+            setup.append(("AUTH", self.password))
+        if self.db:
+            setup.append(("SELECT", self.db))
+        if setup:
+            await asyncio.wait_for(self._send(setup), timeout=self.timeout)
+
+    async def _send(self, commands: List[Command]) -> List[Any]:
+        assert self._reader is not None and self._writer is not None
+        self._writer.write(b"".join(encode_command(c) for c in commands))
+        await self._writer.drain()
+        replies = [await read_reply(self._reader) for _ in commands]
+        for reply in replies:
+            if isinstance(reply, RespError):
+                raise reply
+        return replies
+
+
+def encode_command(command: Command) -> bytes:
+    parts = [b"*%d\r\n" % len(command)]
+    for arg in command:
+        if isinstance(arg, int):
+            data = str(arg).encode()
+        elif isinstance(arg, str):
+            data = arg.encode()
+        else:
+            data = arg
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+async def read_reply(reader: asyncio.StreamReader) -> Any:
+    line = await reader.readline()
+    if not line.endswith(b"\r\n"):
+        raise ConnectionError("Connection closed by RESP server")
+    kind, payload = line[:1], line[1:-2]
+    if kind == b"+":
+        return payload.decode()
+    if kind == b"-":
+        return RespError(payload.decode())
+    if kind == b":":
+        return int(payload)
+    if kind == b"$":
+        length = int(payload)
+        if length < 0:
+            return None
+        return (await reader.readexactly(length + 2))[:-2]
+    if kind == b"*":
+        count = int(payload)
+        if count < 0:
+            return None
+        return [await read_reply(reader) for _ in range(count)]
+    raise ConnectionError(f"Unexpected RESP reply: {line!r}")
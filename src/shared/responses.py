@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Any
 
 from fastapi import HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 
 def success_response(
@@ -18,6 +18,20 @@ def success_response(
     )
 
 
+def orjson_success_response(
+    data: Any, message: str = "Success", status_code: int = status.HTTP_200_OK
+):
+    """success_response encoded with orjson; ``data`` may hold orjson.Fragment"""
+    return ORJSONResponse(
+        status_code=status_code,
+        content={
+            "statusCode": status_code,
+            "message": message,
+            "data": data,
+        },
+    )
+
+
 async def http_exception_handler(request: Request, exc: Exception):
     if isinstance(exc, HTTPException):
         return JSONResponse(
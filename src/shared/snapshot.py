@@ -0,0 +1,99 @@
+"""
+Lazily built, immutable in-process snapshots
+
+Read-mostly reference data (category trees, the product filter index) is
+held as one immutable object per process. Readers share the current
+snapshot without locking; invalidation drops it and the next reader builds
+a new one, which replaces the old reference in one assignment.
+
+Snapshots that are not invalidated on writes can set max_age instead: an
+expired snapshot keeps serving while one background rebuild replaces it.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Generic, Optional, Sized, TypeVar
+
+from src.shared.background_tasks import spawn
+from src.shared.utils import get_logger
+
+logger = get_logger(__name__)
+
+SnapshotT = TypeVar("SnapshotT", bound=Sized)
+
+
+class SnapshotIndex(Generic[SnapshotT]):
+    """Holds the current snapshot and rebuilds it after invalidation"""
+
+    def __init__(
+        self,
+        name: str,
+        load: Callable[[], Awaitable[SnapshotT]],
+        max_age: Optional[float] = None,
+    ):
+        self._name = name
+        self._load = load
+        self._max_age = max_age
+        self._snapshot: Optional[SnapshotT] = None
+        self._built_at = 0.0
+        self._generation = 0
+        self._refreshing = False
+        self._lock = asyncio.Lock()
+
+    async def get(self) -> SnapshotT:
+        snapshot = self._snapshot
+        if snapshot is not None:
+            self._refresh_if_expired()
+            return snapshot
+
+        async with self._lock:
+            while self._snapshot is None:
+                generation = self._generation
+                snapshot = await self._load()
+                # A write landed while loading; that snapshot may predate it
+                if generation != self._generation:
+                    continue
+                self._set(snapshot)
+            return self._snapshot
+
+    def peek(self) -> Optional[SnapshotT]:
+        """The current snapshot without waiting; a missing one is built in the background"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            if not self._lock.locked():
+                spawn("snapshot_build", self.get())
+            return None
+        self._refresh_if_expired()
+        return snapshot
+
+    def _refresh_if_expired(self) -> None:
+        if (
+            self._max_age is not None
+            and not self._refreshing
+            and time.monotonic() - self._built_at > self._max_age
+        ):
+            self._refreshing = True
+            spawn("snapshot_refresh", self._refresh())
+
+    async def _refresh(self) -> None:
+        """Rebuild an expired snapshot while the old one keeps serving"""
+        try:
+            async with self._lock:
+                generation = self._generation
+                snapshot = await self._load()
+                if generation == self._generation:
+                    self._set(snapshot)
+        finally:
+            self._refreshing = False
+
+    def _set(self, snapshot: SnapshotT) -> None:
+        self._snapshot = snapshot
+        self._built_at = time.monotonic()
+        logger.info(f"Built {self._name} snapshot with {len(snapshot)} entries")
+
+    def invalidate(self, *_: Any) -> int:
+        """Drop the snapshot; usable as a cache invalidation hook"""
+        self._generation += 1
+        had_snapshot = self._snapshot is not None
+        self._snapshot = None
+        return int(had_snapshot)
@@ -0,0 +1,169 @@
+"""
+Incremental aggregation jobs over an append-only table
+
+A job folds the rows of a source table (search_interactions,
+product_interactions) into an aggregate table. Each run reads only the rows
+inserted since the previous run: the id of the last row applied is kept per
+job in aggregation_watermarks, and rows are keyset-paged by id. Each batch
+is applied in the same transaction as the watermark, so a crash never
+double counts a batch, and a second runner waits on the watermark row lock.
+
+Source ids are assigned before their transactions commit, so a run stops
+short of rows younger than the job's settle window; a row below the
+watermark that commits late would otherwise never be read.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.connection import AsyncSessionLocal
+from src.database.models.aggregation_watermark import AggregationWatermark
+from src.shared.error_handler import ErrorHandler
+
+# Last source id every insert up to which has settled
+_SETTLED_UPPER_BOUND_SQL = """
+    SELECT COALESCE(
+        (
+            SELECT MIN(id) - 1 FROM {source_table}
+            WHERE id > :after_id
+              AND timestamp > NOW() - make_interval(mins => :settle_minutes)
+        ),
+        (SELECT MAX(id) FROM {source_table}),
+        :after_id
+    )
+"""
+
+
+@dataclass
+class WatermarkRun:
+    """Batches applied by one run"""
+
+    batches: int = 0
+    rows: int = 0  # source rows read
+    written: int = 0  # aggregate rows written
+    last_id: int = 0
+
+
+class WatermarkJob:
+    """
+    Base for incremental source table -> aggregate table jobs.
+
+    Subclasses name the job, its source and aggregate tables, and apply one
+    batch of source rows in apply_batch.
+    """
+
+    job: str
+    source_table: str
+    target_table: str
+
+    def __init__(self, batch_size: int, settle_minutes: int):
+        self.batch_size = batch_size
+        self.settle_minutes = settle_minutes
+        self._error_handler = ErrorHandler(type(self).__module__)
+
+    async def apply_batch(
+        self, session: AsyncSession, after_id: int, upper_id: int
+    ) -> Tuple[int, int, int]:
+        """
+        Apply the next batch after after_id, up to upper_id.
+
+        Returns:
+            (source rows read, aggregate rows written, last id read)
+        """
+        raise NotImplementedError
+
+    async def run_batches(self, max_batches: Optional[int] = None) -> WatermarkRun:
+        """Apply every settled source row since the watermark"""
+        run = WatermarkRun()
+        async with AsyncSessionLocal() as session:
+            async with session.begin():
+                run.last_id = await self._lock_watermark(session)
+                upper_id = (
+                    await session.execute(
+                        text(
+                            _SETTLED_UPPER_BOUND_SQL.format(
+                                source_table=self.source_table
+                            )
+                        ),
+                        {
+                            "after_id": run.last_id,
+                            "settle_minutes": self.settle_minutes,
+                        },
+                    )
+                ).scalar_one()
+
+        while max_batches is None or run.batches < max_batches:
+            rows, written, last_id = await self._apply_batch(upper_id)
+            if not rows:
+                break
+            run.batches += 1
+            run.rows += rows
+            run.written += written
+            run.last_id = last_id
+        return run
+
+    async def _apply_batch(self, upper_id: int) -> Tuple[int, int, int]:
+        """One batch after the watermark; returns (rows, written, new watermark)"""
+        async with AsyncSessionLocal() as session:
+            async with session.begin():
+                # Re-read under the row lock: a concurrent run may have moved it
+                after_id = await self._lock_watermark(session)
+                if after_id >= upper_id:
+                    return 0, 0, after_id
+                rows, written, last_id = await self.apply_batch(
+                    session, after_id, upper_id
+                )
+                if not rows:
+                    return 0, 0, after_id
+                await self._save_watermark(session, last_id, rows)
+        return rows, written, last_id
+
+    async def _lock_watermark(self, session: AsyncSession) -> int:
+        await session.execute(
+            insert(AggregationWatermark)
+            .values(job=self.job, last_id=0, rows_processed=0)
+            .on_conflict_do_nothing(index_elements=[AggregationWatermark.job])
+        )
+        return (
+            await session.execute(
+                text(
+                    "SELECT last_id FROM aggregation_watermarks "
+                    "WHERE job = :job FOR UPDATE"
+                ),
+                {"job": self.job},
+            )
+        ).scalar_one()
+
+    async def _save_watermark(
+        self, session: AsyncSession, last_id: int, rows: int
+    ) -> None:
+        await session.execute(
+            text(
+                """
+                UPDATE aggregation_watermarks
+                SET last_id = :last_id,
+                    rows_processed = rows_processed + :rows,
+                    updated_at = NOW()
+                WHERE job = :job
+                """
+            ),
+            {"job": self.job, "last_id": last_id, "rows": rows},
+        )
+
+    async def reset(self) -> None:
+        """Clear the watermark and the aggregate built from it
+
+        Aggregates are cumulative, so a rebuild from the first source row has
+        to start from an empty aggregate table.
+        """
+        async with AsyncSessionLocal() as session:
+            async with session.begin():
+                await session.execute(
+                    text("DELETE FROM aggregation_watermarks WHERE job = :job"),
+                    {"job": self.job},
+                )
+                await session.execute(text(f"DELETE FROM {self.target_table}"))
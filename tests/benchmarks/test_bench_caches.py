@@ -0,0 +1,59 @@
+from src.shared.cache_service import CacheService
+from src.shared.core_cache import CoreCacheClient
+
+KEYS = [f"products:list:{index}" for index in range(200)]
+
+
+def test_core_cache_get_hit(benchmark, product_rows):
+    cache = CoreCacheClient()
+    for key in KEYS:
+        cache.set(key, product_rows, ttl_seconds=300)
+
+    def get_all():
+        return [cache.get(key) for key in KEYS]
+
+    values = benchmark(get_all)
+
+    assert all(value is product_rows for value in values)
+
+
+def test_core_cache_set(benchmark, product_rows):
+    cache = CoreCacheClient()
+
+    def set_all():
+        for key in KEYS:
+            cache.set(key, product_rows, ttl_seconds=300)
+
+    benchmark(set_all)
+
+    assert cache.get(KEYS[-1]) is product_rows
+
+
+def test_cache_service_get_hit(benchmark, event_loop_runner, product_rows):
+    cache = CacheService(max_size=len(KEYS))
+
+    async def fill():
+        for key in KEYS:
+            await cache.set(key, product_rows)
+
+    async def get_all():
+        return [await cache.get(key) for key in KEYS]
+
+    event_loop_runner(fill())
+    values = benchmark(lambda: event_loop_runner(get_all()))
+
+    assert all(value is product_rows for value in values)
+
+
+def test_cache_service_set_with_eviction(benchmark, event_loop_runner, product_rows):
+    # Half the capacity, so every round evicts least recently used entries
+    cache = CacheService(max_size=len(KEYS) // 2)
+
+    async def set_all():
+        for key in KEYS:
+            await cache.set(key, product_rows)
+
+    benchmark(lambda: event_loop_runner(set_all()))
+
+    stats = event_loop_runner(cache.get_stats())
+    assert stats["total_items"] == len(KEYS) // 2
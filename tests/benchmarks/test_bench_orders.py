@@ -0,0 +1,76 @@
+from decimal import Decimal
+from types import SimpleNamespace
+
+from src.api.carts.service import CartService
+from src.api.orders.service import OrderService
+from src.api.personalization.service import PersonalizationService
+
+
+def test_build_cart_groups(benchmark, rng, product_rows):
+    products_dict = {
+        row.id: SimpleNamespace(
+            name=row.name,
+            base_price=float(row.base_price),
+            pricing=SimpleNamespace(
+                final_price=float(row.final_price),
+                discount_percentage=float(row.discount_percentage),
+                applied_price_lists=(
+                    [row.price_list_names] if row.price_list_names else []
+                ),
+            ),
+        )
+        for row in product_rows
+    }
+    cart_item_mapping = {
+        cart_id: {
+            "cart": SimpleNamespace(
+                id=cart_id,
+                name=f"Cart {cart_id}",
+                items=[
+                    SimpleNamespace(product_id=product_id, quantity=rng.randint(1, 5))
+                    for product_id in rng.sample(sorted(products_dict), 15)
+                ],
+            )
+        }
+        for cart_id in range(1, 5)
+    }
+
+    groups = benchmark(
+        CartService.build_cart_groups,
+        {"cart_item_mapping": cart_item_mapping},
+        {"products_dict": products_dict},
+    )
+
+    assert len(groups) == 4
+    assert sum(len(group.items) for group in groups) == 60
+
+
+def test_calculate_delivery_charge(benchmark, rng):
+    service = OrderService()
+    store_deliveries = [
+        {
+            "store_id": store_id,
+            "store_lat": 6.9 + rng.uniform(-0.1, 0.1),
+            "store_lng": 79.86 + rng.uniform(-0.1, 0.1),
+            "delivery_lat": 6.92,
+            "delivery_lng": 79.85,
+        }
+        for store_id in range(1, 4)
+    ]
+
+    charge = benchmark(service.calculate_delivery_charge, store_deliveries, True)
+
+    assert charge > Decimal("50.00")
+
+
+def test_apply_diversity_filter(benchmark, rng, product_rows):
+    service = PersonalizationService()
+    products = [
+        SimpleNamespace(id=row.id, categories=[{"id": row.ecommerce_category_id}])
+        for row in product_rows
+    ]
+    scores = {row.id: rng.random() for row in product_rows}
+
+    ranked = benchmark(service.apply_diversity_filter, products, scores)
+
+    assert sorted(p.id for p in ranked) == [row.id for row in product_rows]
@@ -0,0 +1,73 @@
+from src.api.pricing.cache import pricing_cache
+from src.api.pricing.service import PricingService
+
+
+def test_apply_discount(benchmark, price_lines, product_rows):
+    service = PricingService()
+    prices = [row.base_price for row in product_rows]
+
+    def apply_all():
+        return [
+            service._apply_discount(price, line, 1)
+            for price in prices
+            for line in price_lines[:10]
+        ]
+
+    results = benchmark(apply_all)
+
+    assert len(results) == len(prices) * 10
+
+
+def _product_data(product_rows):
+    return [
+        {"id": row.id, "price": float(row.base_price), "quantity": 2}
+        for row in product_rows
+    ]
+
+
+def test_bulk_pricing_without_tier(benchmark, event_loop_runner, product_rows):
+    service = PricingService()
+    product_data = _product_data(product_rows)
+
+    results = benchmark(
+        lambda: event_loop_runner(
+            service.calculate_bulk_product_pricing(product_data, None)
+        )
+    )
+
+    assert len(results) == len(product_rows)
+
+
+def test_bulk_pricing_cache_hit(benchmark, event_loop_runner, product_rows):
+    service = PricingService()
+    product_data = _product_data(product_rows)
+    cached = [
+        {
+            "product_id": row.id,
+            "quantity": 1,
+            "base_price": float(row.base_price),
+            "final_price": float(row.final_price),
+            "total_price": float(row.final_price),
+            "savings": float(row.savings),
+            "applied_discounts": [],
+        }
+        for row in product_rows
+    ]
+    pricing_cache.set_bulk_pricing("2", [str(row.id) for row in product_rows], cached)
+
+    results = benchmark(
+        lambda: event_loop_runner(
+            service.calculate_bulk_product_pricing(product_data, 2)
+        )
+    )
+
+    assert [r.product_id for r in results] == [row.id for row in product_rows]
+
+
+def test_pricing_sql_components(benchmark, product_rows):
+    service = PricingService()
+    product_ids = [row.id for row in product_rows]
+
+    components = benchmark(service.get_pricing_sql_components, 2, 1, product_ids)
+
+    assert components["params"]["product_ids"] == product_ids
@@ -0,0 +1,61 @@
+from src.api.products.models import ProductQuerySchema
+from src.api.products.services.inventory_service import ProductInventoryService
+from src.api.products.services.query_service import ProductQueryService
+
+
+def test_build_comprehensive_sql(benchmark):
+    service = ProductQueryService()
+    query = ProductQuerySchema(
+        limit=40,
+        category_ids=[3, 7, 12],
+        tags=["organic", "local"],
+        min_price=100,
+        max_price=2500,
+        has_inventory=True,
+    )
+
+    sql, params = benchmark(service._build_comprehensive_sql, query, 2, [1, 4, 9], True)
+
+    assert "FROM products" in sql
+    # One extra row tells the caller whether there is a next page
+    assert params["limit"] == 41
+
+
+def test_project_rows(benchmark, product_rows):
+    service = ProductQueryService()
+    query = ProductQuerySchema(limit=100)
+
+    def project():
+        projector = service._row_projector(product_rows, query)
+        return [projector(row) for row in product_rows]
+
+    products = benchmark(project)
+
+    assert len(products) == len(product_rows)
+    assert products[0].pricing is not None
+
+
+def test_calculate_aggregated_inventory(benchmark, rng):
+    service = ProductInventoryService()
+    inventories = [
+        [
+            {
+                "store_id": store_id,
+                "quantity_available": rng.randint(0, 200),
+                "safety_stock": rng.randint(0, 10),
+                "quantity_reserved": 0,
+            }
+            for store_id in range(1, rng.randint(2, 6))
+        ]
+        for _ in range(100)
+    ]
+
+    def aggregate():
+        return [
+            service._calculate_aggregated_inventory(rows, True, False, True)
+            for rows in inventories
+        ]
+
+    results = benchmark(aggregate)
+
+    assert len(results) == 100
@@ -0,0 +1,71 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+# Time to first request in a fresh interpreter: import the app, run the
+# lifespan startup and answer GET / in process. BENCH_SLOW_WARMUP_SECONDS
+# adds a warm-up loader that takes that long, like a slow database would.
+FIRST_REQUEST = """
+import asyncio
+import os
+import httpx
+import main
+from src.shared.cache_warmup import cache_warmup
+
+slow = float(os.environ.get("BENCH_SLOW_WARMUP_SECONDS", "0"))
+if slow:
+    cache_warmup.register("bench_slow", lambda: asyncio.sleep(slow))
+
+async def first_request():
+    async with main.app.router.lifespan_context(main.app):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/")
+    assert response.status_code == 200, response.text
+
+asyncio.run(first_request())
+"""
+
+STARTUP_MODES = {
+    "eager": {"LAZY_STARTUP": "false"},
+    "lazy": {"LAZY_STARTUP": "true"},
+    "lazy_minimal": {
+        "LAZY_STARTUP": "true",
+        "DISABLED_ROUTERS": "riders,payments,promotions,metrics",
+    },
+    # The warm-up runs in the background, so this should match eager
+    "eager_slow_warmup": {
+        "LAZY_STARTUP": "false",
+        "BENCH_SLOW_WARMUP_SECONDS": "5",
+    },
+}
+
+
+def _start(env):
+    subprocess.run(
+        [sys.executable, "-c", FIRST_REQUEST],
+        cwd=PROJECT_ROOT,
+        env=env,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.mark.parametrize("mode", sorted(STARTUP_MODES))
+def test_time_to_first_request(benchmark, mode):
+    env = {
+        **os.environ,
+        "INVENTORY_HOLD_SWEEPER_ENABLED": "false",
+        "POPULARITY_ROLLUP_ENABLED": "false",
+        "CATALOG_CHANGE_LISTENER_ENABLED": "false",
+        "DISABLED_ROUTERS": "",
+        **STARTUP_MODES[mode],
+    }
+
+    # Warm the bytecode and OS file caches so rounds time the startup only
+    _start(env)
+    benchmark.pedantic(_start, args=(env,), rounds=5, iterations=1)
@@ -0,0 +1,133 @@
+"""
+Latency of facet counts for product listings.
+
+Compares two ways of answering "how many products per category, ecommerce
+category, brand, tag and price bucket" for a filtered listing:
+
+- per-facet: one COUNT query per facet, the way clients had to assemble it
+  from separate calls
+- single: build_facet_sql, one statement with a GROUPING SETS aggregate for
+  the single-valued facets and association joins for the rest
+
+Each filter in ``--filters`` is timed ``--repeat`` times with both shapes.
+Runs read-only against the catalogue behind DATABASE_URL; for the 100k
+product case load one with ``python -m scripts.db.generate_dataset --scale 1``.
+
+Usage:
+    python -m tests.load_tests.bench_facets --tier 1 --repeat 20
+"""
+
+import argparse
+import asyncio
+import math
+import statistics
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.api.products.facets import build_facet_sql
+from src.api.products.models import ProductQuerySchema
+from src.api.products.services.query_service import ProductQueryService
+from src.config.constants import FACET_PRICE_BUCKET_EDGES
+from src.config.settings import settings
+
+FILTERS = {
+    "all": {},
+    "category": {"category_ids": [1]},
+    "tag": {"tags": ["type:dietary"]},
+    "price": {"min_price": 100, "max_price": 2000},
+}
+
+
+def filter_sql(
+    service: ProductQueryService, query: Dict[str, Any], tier: Optional[int]
+) -> Tuple[List[str], Dict[str, Any], Optional[Dict[str, Any]]]:
+    params: Dict[str, Any] = {}
+    conditions = service._build_filter_conditions(
+        ProductQuerySchema(**query), params, tier
+    )
+    pricing = service.pricing_service.get_pricing_sql_components(tier) if tier else None
+    return conditions, params, pricing
+
+
+def per_facet_sql(
+    conditions: List[str], params: Dict[str, Any], pricing: Optional[Dict[str, Any]]
+) -> List[Tuple[str, Dict[str, Any]]]:
+    """One count query per facet over the same filtered products"""
+    cte = f"WITH {', '.join(pricing['ctes'])} " if pricing else ""
+    joins = " ".join(pricing["joins"]) if pricing else ""
+    price = "COALESCE(pricing.final_price, p.base_price)" if pricing else "p.base_price"
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    params = {**params, **(pricing["params"] if pricing else {})}
+    matched = f"SELECT p.id FROM products p {joins} {where}"
+    queries = [
+        f"{cte}SELECT p.brand, COUNT(*) FROM products p {joins} {where} GROUP BY 1",
+        f"{cte}SELECT p.ecommerce_category_id, COUNT(*) FROM products p {joins} {where} GROUP BY 1",
+        f"{cte}SELECT WIDTH_BUCKET({price}, CAST(:edges AS numeric[])), COUNT(*) "
+        f"FROM products p {joins} {where} GROUP BY 1",
+        f"{cte}SELECT pc.category_id, COUNT(*) FROM product_categories pc "
+        f"WHERE pc.product_id IN ({matched}) GROUP BY 1",
+        f"{cte}SELECT t.tag_type, pt.value, COUNT(DISTINCT pt.product_id) "
+        f"FROM product_tags pt JOIN tags t ON t.id = pt.tag_id "
+        f"WHERE pt.product_id IN ({matched}) GROUP BY 1, 2",
+    ]
+    return [(q, {**params, "edges": FACET_PRICE_BUCKET_EDGES}) for q in queries]
+
+
+async def timed(conn, statements: List[Tuple[str, Dict[str, Any]]]) -> float:
+    start = time.perf_counter()
+    for sql, params in statements:
+        (await conn.execute(text(sql), params)).fetchall()
+    return (time.perf_counter() - start) * 1000
+
+
+async def main(args):
+    database_url = settings.DATABASE_URL
+    if not database_url:
+        raise SystemExit("DATABASE_URL is not set")
+
+    service = ProductQueryService()
+    engine = create_async_engine(database_url)
+    try:
+        async with engine.connect() as conn:
+            products = (
+                await conn.execute(text("SELECT COUNT(*) FROM products"))
+            ).scalar()
+            print("--- Facet Count Benchmark ---")
+            print(f"Products: {products} | Tier: {args.tier} | Repeat: {args.repeat}")
+            print(
+                f"{'filter':>9} {'shape':>10} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}"
+            )
+            for name in args.filters:
+                conditions, params, pricing = filter_sql(
+                    service, FILTERS[name], args.tier
+                )
+                shapes = (
+                    ("per-facet", per_facet_sql(conditions, params, pricing)),
+                    ("single", [build_facet_sql(conditions, params, pricing)]),
+                )
+                for shape, statements in shapes:
+                    # Warm the buffer cache so both shapes read the same pages
+                    await timed(conn, statements)
+                    latencies = sorted(
+                        [await timed(conn, statements) for _ in range(args.repeat)]
+                    )
+                    p95 = latencies[math.ceil(len(latencies) * 0.95) - 1]
+                    print(
+                        f"{name:>9} {shape:>10} {statistics.median(latencies):>8.2f} "
+                        f"{p95:>8.2f} {latencies[-1]:>8.2f}"
+                    )
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark listing facet counts")
+    parser.add_argument("--tier", type=int, default=None)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument(
+        "--filters", nargs="+", choices=sorted(FILTERS), default=list(FILTERS)
+    )
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,187 @@
+"""
+Contention benchmark for inventory hold placement on a single hot SKU.
+
+Compares the previous per-row path (SELECT ... FOR UPDATE, check in Python,
+then UPDATE - two round trips while the row lock is held) with the
+set-based PLACE_HOLDS_SQL statement used by InventoryTransactionService.
+Every worker keeps placing 1-unit holds on the same inventory row until the
+stock is gone, so the row lock is the bottleneck being measured.
+
+The run happens in a scratch schema (``bench_inventory_holds``) holding
+copies of the inventory and inventory_holds tables, so production rows are
+never touched. Needs a real Postgres reachable through DATABASE_URL.
+
+Usage:
+    python -m tests.load_tests.bench_inventory_holds --workers 1 8 32 --stock 2000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.api.inventory.services.transaction_service import PLACE_HOLDS_SQL
+from src.config.settings import settings
+
+SCHEMA = "bench_inventory_holds"
+PRODUCT_ID = 1
+STORE_ID = 1
+SAFETY_STOCK = 5
+
+LEGACY_LOCK_SQL = text(
+    "SELECT id, quantity_available FROM inventory "
+    "WHERE product_id = :product_id AND store_id = :store_id FOR UPDATE"
+)
+LEGACY_UPDATE_SQL = text(
+    "UPDATE inventory SET quantity_available = :available, "
+    "quantity_on_hold = quantity_on_hold + :quantity, updated_at = NOW() "
+    "WHERE id = :id"
+)
+
+
+async def legacy_hold(conn) -> bool:
+    row = (
+        await conn.execute(
+            LEGACY_LOCK_SQL, {"product_id": PRODUCT_ID, "store_id": STORE_ID}
+        )
+    ).first()
+    if row is None or row.quantity_available - SAFETY_STOCK < 1:
+        return False
+    await conn.execute(
+        LEGACY_UPDATE_SQL,
+        {"id": row.id, "available": row.quantity_available - 1, "quantity": 1},
+    )
+    return True
+
+
+async def atomic_hold(conn) -> bool:
+    result = await conn.execute(
+        PLACE_HOLDS_SQL,
+        {
+            "product_ids": [PRODUCT_ID],
+            "store_ids": [STORE_ID],
+            "quantities": [1],
+            "order_id": None,
+            "ttl_seconds": 0,
+        },
+    )
+    return result.first() is not None
+
+
+async def reset(engine, stock: int) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(
+                "UPDATE inventory SET quantity_available = :stock, quantity_on_hold = 0"
+            ),
+            {"stock": stock},
+        )
+
+
+async def run_once(
+    engine, hold_fn, workers: int, stock: int
+) -> Tuple[float, int, List[float]]:
+    await reset(engine, stock)
+    latencies: List[float] = []
+    placed = 0
+
+    async def worker() -> None:
+        nonlocal placed
+        while True:
+            started = time.perf_counter()
+            async with engine.begin() as conn:
+                ok = await hold_fn(conn)
+            if not ok:
+                return
+            latencies.append(time.perf_counter() - started)
+            placed += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    elapsed = time.perf_counter() - start
+
+    async with engine.connect() as conn:
+        available, on_hold = (
+            await conn.execute(
+                text("SELECT quantity_available, quantity_on_hold FROM inventory")
+            )
+        ).one()
+    # No oversell: every unit above safety stock was held exactly once
+    assert placed == on_hold == stock - SAFETY_STOCK, (placed, on_hold)
+    assert available == SAFETY_STOCK, available
+    return elapsed, placed, latencies
+
+
+async def main(args):
+    database_url = settings.DATABASE_URL
+    if not database_url:
+        raise SystemExit("DATABASE_URL is not set")
+
+    setup_engine = create_async_engine(database_url)
+    async with setup_engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        # LIKE copies columns, defaults and checks but not the foreign keys
+        await conn.execute(
+            text(
+                f"CREATE TABLE {SCHEMA}.inventory (LIKE public.inventory INCLUDING ALL)"
+            )
+        )
+        await conn.execute(
+            text(
+                f"CREATE TABLE {SCHEMA}.inventory_holds "
+                "(LIKE public.inventory_holds INCLUDING ALL)"
+            )
+        )
+        await conn.execute(
+            text(
+                f"INSERT INTO {SCHEMA}.inventory (product_id, store_id, safety_stock) "
+                "VALUES (:product_id, :store_id, :safety_stock)"
+            ),
+            {
+                "product_id": PRODUCT_ID,
+                "store_id": STORE_ID,
+                "safety_stock": SAFETY_STOCK,
+            },
+        )
+    await setup_engine.dispose()
+
+    engine = create_async_engine(
+        database_url,
+        pool_size=max(args.workers),
+        max_overflow=0,
+        connect_args={"server_settings": {"search_path": SCHEMA}},
+    )
+    try:
+        print("--- Hot SKU Inventory Hold Benchmark ---")
+        print(f"Stock: {args.stock} | Safety stock: {SAFETY_STOCK}")
+        print(f"{'path':>8} {'workers':>7} {'holds/s':>9} {'p50 ms':>8} {'p99 ms':>8}")
+        for workers in args.workers:
+            for name, hold_fn in (("legacy", legacy_hold), ("atomic", atomic_hold)):
+                elapsed, placed, latencies = await run_once(
+                    engine, hold_fn, workers, args.stock
+                )
+                cuts = statistics.quantiles(latencies, n=100)
+                print(
+                    f"{name:>8} {workers:>7} {placed / elapsed:>9.1f} "
+                    f"{cuts[49] * 1000:>8.2f} {cuts[98] * 1000:>8.2f}"
+                )
+    finally:
+        await engine.dispose()
+        if not args.keep_schema:
+            cleanup_engine = create_async_engine(database_url)
+            async with cleanup_engine.begin() as conn:
+                await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+            await cleanup_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark hot-SKU hold placement")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--stock", type=int, default=2000)
+    parser.add_argument("--keep-schema", action="store_true")
+    asyncio.run(main(parser.parse_args()))
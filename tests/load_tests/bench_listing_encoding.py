@@ -0,0 +1,188 @@
+"""
+CPU cost of answering a cached product listing, before and after pre-encoding.
+
+Compares, for one page of products served from the listing cache with a
+fresh inventory overlay:
+
+- models: the previous path. Cached dicts are re-validated through
+  EnhancedProductSchema, wrapped in PaginatedProductsResponse, dumped with
+  model_dump(mode="json") and encoded by JSONResponse
+- encoded: cached products are JSON bytes; ProductListingResponse splices
+  them with the encoded inventory of each product
+
+It also times the full-search serialization (model_dump + JSONResponse
+against model_dump_json fragments + ORJSONResponse). Rows are generated
+offline and nothing touches the database, so the numbers are the Python work
+per request. CPU time is measured with time.process_time.
+
+Usage:
+    python -m tests.load_tests.bench_listing_encoding --page-size 20 --requests 2000
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+import orjson
+
+from src.api.products.listing import (
+    ListingProduct,
+    ProductListing,
+    ProductListingResponse,
+)
+from src.api.products.models import (
+    EnhancedProductSchema,
+    InventoryInfoSchema,
+    PaginatedProductsResponse,
+    PricingInfoSchema,
+)
+from src.shared.responses import orjson_success_response, success_response
+
+
+def make_products(rng: random.Random, count: int) -> list[EnhancedProductSchema]:
+    created = datetime(2024, 1, 1)
+    products = []
+    for product_id in range(1, count + 1):
+        base_price = float(rng.randint(50, 5000))
+        discount = rng.choice((0, 0, 5, 10, 20))
+        final_price = round(base_price * (100 - discount) / 100, 2)
+        products.append(
+            EnhancedProductSchema(
+                id=product_id,
+                ref=f"SKU-{product_id:06d}",
+                name=f"Product {product_id}",
+                description=f"Description for product {product_id}",
+                brand=rng.choice(("Anchor", "Maliban", "Munchee")),
+                base_price=base_price,
+                unit_measure=rng.choice(("kg", "g", "l", "pcs")),
+                image_urls=[f"https://cdn.example.com/p/{product_id}.jpg"],
+                ecommerce_category_id=rng.randint(1, 20),
+                ecommerce_subcategory_id=rng.randint(21, 80),
+                alternative_product_ids=rng.sample(range(1, count + 1), 3),
+                created_at=created,
+                updated_at=created + timedelta(days=rng.randint(0, 300)),
+                categories=[
+                    {"id": c, "name": f"Category {c}", "parent_category_id": None}
+                    for c in rng.sample(range(1, 40), 2)
+                ],
+                product_tags=[
+                    {"id": t, "name": f"tag-{t}", "tag_type": "product_dietary"}
+                    for t in rng.sample(range(1, 60), 3)
+                ],
+                pricing=PricingInfoSchema(
+                    base_price=base_price,
+                    final_price=final_price,
+                    discount_applied=round(base_price - final_price, 2),
+                    discount_percentage=float(discount),
+                    applied_price_lists=["Weekend Deals"] if discount else [],
+                ),
+            )
+        )
+    return products
+
+
+def make_inventory(rng: random.Random, count: int) -> list[InventoryInfoSchema]:
+    inventory = []
+    for _ in range(count):
+        available = rng.choice((0, 3, 12, 40))
+        inventory.append(
+            InventoryInfoSchema(
+                can_order=available > 0,
+                max_available=available,
+                in_stock=available > 0,
+                ondemand_delivery_available=available > 0,
+                reason_unavailable=None if available else "out_of_stock",
+            )
+        )
+    return inventory
+
+
+def serve_models(cached: dict, inventory: list) -> bytes:
+    products = [EnhancedProductSchema(**p) for p in cached["products"]]
+    for product, info in zip(products, inventory):
+        product.inventory = info
+    result = PaginatedProductsResponse(
+        products=products, pagination=dict(cached["pagination"])
+    )
+    return bytes(success_response(result.model_dump(mode="json")).body)
+
+
+def serve_encoded(cached: dict, inventory: list) -> bytes:
+    products = [ListingProduct.from_cache_entry(e) for e in cached["products"]]
+    for product, info in zip(products, inventory):
+        product.inventory = info
+    listing = ProductListing(products, dict(cached["pagination"]))
+    return bytes(ProductListingResponse(listing).body)
+
+
+def search_models(products: list) -> bytes:
+    serialized = [p.model_dump(mode="json") for p in products]
+    return bytes(
+        success_response(
+            {"products": serialized, "total_results": len(serialized)}
+        ).body
+    )
+
+
+def search_encoded(products: list) -> bytes:
+    serialized = [orjson.Fragment(p.model_dump_json()) for p in products]
+    return bytes(
+        orjson_success_response(
+            {"products": serialized, "total_results": len(serialized)}
+        ).body
+    )
+
+
+def cpu_per_call(fn, args: tuple, requests: int) -> float:
+    fn(*args)
+    start = time.process_time()
+    for _ in range(requests):
+        fn(*args)
+    return (time.process_time() - start) / requests
+
+
+def main(args):
+    rng = random.Random(args.seed)
+    products = make_products(rng, args.page_size)
+    inventory = make_inventory(rng, args.page_size)
+    pagination = {"current_cursor": None, "next_cursor": args.page_size}
+
+    cached_models = {
+        "products": [p.model_dump(mode="json") for p in products],
+        "pagination": pagination,
+    }
+    cached_encoded = {
+        "products": [ListingProduct.cache_entry(p.model_dump()) for p in products],
+        "pagination": pagination,
+    }
+    assert orjson.loads(serve_models(cached_models, inventory)) == orjson.loads(
+        serve_encoded(cached_encoded, inventory)
+    )
+
+    print("--- Cached Listing Encoding Benchmark ---")
+    print(f"Page size: {args.page_size} | Requests: {args.requests}")
+    print(f"{'path':>16} {'cpu us/req':>11} {'speedup':>8}")
+    cases = (
+        (
+            "listing",
+            (serve_models, (cached_models, inventory)),
+            (serve_encoded, (cached_encoded, inventory)),
+        ),
+        ("search", (search_models, (products,)), (search_encoded, (products,))),
+    )
+    for name, (before, before_args), (after, after_args) in cases:
+        old = cpu_per_call(before, before_args, args.requests)
+        new = cpu_per_call(after, after_args, args.requests)
+        print(f"{name + ' models':>16} {old * 1e6:>11.1f} {'':>8}")
+        print(f"{name + ' encoded':>16} {new * 1e6:>11.1f} {old / new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark cached listing serialization"
+    )
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=20240611)
+    main(parser.parse_args())
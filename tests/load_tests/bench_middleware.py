@@ -0,0 +1,183 @@
+"""
+Requests-per-second microbenchmark for the middleware stack.
+
+Compares, on a trivial route:
+
+- legacy: the previous stack of three BaseHTTPMiddleware layers
+  (add_process_time_header, TrustedSourceMiddleware, SlowAPIMiddleware),
+  reproduced here as they were registered in main.py
+- edge: the fused pure-ASGI EdgeMiddleware
+- bare: the route with no middleware, as the floor
+
+Requests are driven straight into the ASGI app (no sockets, no HTTP client),
+so the numbers measure middleware overhead only. Rate limiting is on for both
+stacks, with a limit high enough never to reject.
+
+Usage:
+    python -m tests.load_tests.bench_middleware --requests 20000
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from fastapi import FastAPI, Request, Response
+from slowapi import Limiter, _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
+from slowapi.middleware import SlowAPIMiddleware
+from slowapi.util import get_remote_address
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.middleware.edge import LOCAL_ORIGINS, EdgeMiddleware
+from src.shared.rate_limiter import RateLimiter, parse_rate_limit
+
+MOBILE_SECRET = "bench-secret"
+LIMIT = "100000000/minute"
+
+
+class LegacyTrustedSourceMiddleware(BaseHTTPMiddleware):
+    """The checks of the previous TrustedSourceMiddleware (production path)"""
+
+    def __init__(self, app):
+        super().__init__(app)
+        self.allowed_origins = ["https://shop.example.com", *LOCAL_ORIGINS]
+
+    async def dispatch(self, request: Request, call_next):
+        path = request.url.path
+        client_ip = request.client.host if request.client else "unknown"
+        if (
+            path.startswith("/docs")
+            or path.startswith("/openapi.json")
+            or path.startswith("/redoc")
+        ):
+            return Response("Forbidden: Documentation access not allowed", 403)
+        client_secret = request.headers.get("X-Client-Secret")
+        if client_secret and client_secret == MOBILE_SECRET:
+            logging.getLogger(__name__).info(
+                f"Access ALLOWED: Mobile App ({client_ip})"
+            )
+            return await call_next(request)
+        origin = request.headers.get("Origin")
+        if origin and origin in self.allowed_origins:
+            return await call_next(request)
+        if client_ip in ["127.0.0.1", "::1", "localhost"]:
+            return await call_next(request)
+        return Response("Forbidden: Untrusted Source", 403)
+
+
+async def legacy_process_time(request: Request, call_next):
+    start_time = time.time()
+    response = await call_next(request)
+    process_time = time.time() - start_time
+    response.headers["X-Process-Time"] = str(process_time)
+    logging.getLogger(__name__).info(
+        f"Request: {request.method} {request.url} - Status: {response.status_code}"
+    )
+    return response
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return "pong"
+
+    return app
+
+
+def build_legacy() -> FastAPI:
+    app = _app()
+    app.state.limiter = Limiter(key_func=get_remote_address, default_limits=[LIMIT])
+    app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)  # type: ignore
+    app.add_middleware(SlowAPIMiddleware)
+    app.add_middleware(LegacyTrustedSourceMiddleware)
+    app.middleware("http")(legacy_process_time)
+    return app
+
+
+def build_edge() -> FastAPI:
+    app = _app()
+    app.add_middleware(
+        EdgeMiddleware,
+        environment="production",
+        mobile_secret=MOBILE_SECRET,
+        allowed_origins=["https://shop.example.com"],
+        exempt_ips=[],
+        rate_limiter=RateLimiter(parse_rate_limit(LIMIT)),
+    )
+    return app
+
+
+SCOPE = {
+    "type": "http",
+    "asgi": {"version": "3.0"},
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "path": "/ping",
+    "raw_path": b"/ping",
+    "root_path": "",
+    "query_string": b"",
+    "headers": [
+        (b"host", b"api.example.com"),
+        (b"x-client-secret", MOBILE_SECRET.encode()),
+    ],
+    "client": ("203.0.113.7", 50000),
+    "server": ("api.example.com", 80),
+}
+
+
+async def call(app) -> int:
+    status = 0
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if sent:
+            await asyncio.sleep(3600)
+        sent = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(dict(SCOPE), receive, send)
+    return status
+
+
+async def measure(app, requests: int, concurrency: int) -> float:
+    # Warm up: builds the middleware stack and the route cache
+    assert await call(app) == 200
+    remaining = requests
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            await call(app)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return requests / (time.perf_counter() - start)
+
+
+async def main(args):
+    # Keep log handlers out of the numbers for both stacks
+    logging.disable(logging.WARNING)
+    print("--- Middleware Stack Benchmark (GET /ping) ---")
+    print(f"Requests: {args.requests} | Concurrency: {args.concurrency}")
+    print(f"{'stack':>8} {'req/s':>10} {'us/req':>8}")
+    for name, build in (("bare", _app), ("legacy", build_legacy), ("edge", build_edge)):
+        rps = await measure(build(), args.requests, args.concurrency)
+        print(f"{name:>8} {rps:>10.0f} {1e6 / rps:>8.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the middleware stack")
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,194 @@
+"""
+Benchmark for has_inventory product listings on out-of-stock-heavy catalogues.
+
+Walks the whole catalogue in screens of ``--limit`` orderable products with
+two strategies:
+
+- post-filter: the previous behaviour. Fetch a page of ``limit`` products,
+  load their inventory, drop the unorderable ones in Python and keep paging
+  until the screen is full.
+- pushdown: ProductQueryService._build_comprehensive_sql with store_ids, so
+  the stock condition is part of the WHERE clause and every page is full.
+
+The data lives in a scratch schema (``bench_products_has_inventory``) holding
+copies of the products, product_tags and inventory tables. Needs a real
+Postgres reachable through DATABASE_URL.
+
+Usage:
+    python -m tests.load_tests.bench_products_has_inventory --products 20000 --in-stock 0.05 0.2 0.5
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from typing import List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.api.products.models import ProductQuerySchema
+from src.api.products.services.query_service import ProductQueryService
+from src.config.settings import settings
+
+SCHEMA = "bench_products_has_inventory"
+STORE_IDS = [1, 2, 3]
+
+INVENTORY_SQL = text(
+    "SELECT product_id, quantity_available - COALESCE(safety_stock, 0) AS usable "
+    "FROM inventory WHERE product_id = ANY(:product_ids) "
+    "AND store_id = ANY(:store_ids)"
+)
+
+
+async def seed(engine, products: int, in_stock: float, seed_value: int) -> None:
+    rng = random.Random(seed_value)
+    async with engine.begin() as conn:
+        await conn.execute(text("TRUNCATE products, product_tags, inventory"))
+        await conn.execute(
+            text(
+                "INSERT INTO products (id, name, base_price, unit_measure) "
+                "SELECT g, 'Product ' || g, 100, 'pcs' "
+                "FROM generate_series(1, :n) AS g"
+            ),
+            {"n": products},
+        )
+        product_ids, store_ids, quantities = [], [], []
+        for product_id in range(1, products + 1):
+            stocked = rng.random() < in_stock
+            for store_id in STORE_IDS:
+                product_ids.append(product_id)
+                store_ids.append(store_id)
+                # Out-of-stock products still have rows, at or below safety stock
+                quantities.append(rng.randint(3, 50) if stocked else rng.randint(0, 2))
+        await conn.execute(
+            text(
+                "INSERT INTO inventory (product_id, store_id, quantity_available, "
+                "safety_stock) SELECT p, s, q, 2 FROM unnest("
+                "CAST(:p AS INTEGER[]), CAST(:s AS INTEGER[]), CAST(:q AS INTEGER[])"
+                ") AS t(p, s, q)"
+            ),
+            {"p": product_ids, "s": store_ids, "q": quantities},
+        )
+        await conn.execute(text("ANALYZE products"))
+        await conn.execute(text("ANALYZE inventory"))
+
+
+async def walk_post_filter(engine, service, limit: int) -> Tuple[int, int, float]:
+    """Returns (screens, queries, seconds) for the previous behaviour"""
+    screens = queries = 0
+    cursor = None
+    start = time.perf_counter()
+    async with engine.connect() as conn:
+        while True:
+            screen: List[int] = []
+            while len(screen) < limit:
+                params = ProductQuerySchema(
+                    limit=limit, cursor=cursor, include_pricing=False
+                )
+                sql, bind = service._build_comprehensive_sql(params)
+                rows = (await conn.execute(text(sql), bind)).fetchall()
+                page = [row.id for row in rows[:limit]]
+                stock = (
+                    await conn.execute(
+                        INVENTORY_SQL, {"product_ids": page, "store_ids": STORE_IDS}
+                    )
+                ).fetchall()
+                queries += 2
+                orderable = {r.product_id for r in stock if r.usable > 0}
+                screen.extend(pid for pid in page if pid in orderable)
+                if len(rows) <= limit:
+                    cursor = None
+                    break
+                cursor = page[-1]
+            screens += 1
+            if cursor is None:
+                break
+    return screens, queries, time.perf_counter() - start
+
+
+async def walk_pushdown(engine, service, limit: int) -> Tuple[int, int, float]:
+    """Returns (screens, queries, seconds) with the filter inside the SQL"""
+    screens = queries = 0
+    cursor = None
+    start = time.perf_counter()
+    async with engine.connect() as conn:
+        while True:
+            params = ProductQuerySchema(
+                limit=limit,
+                cursor=cursor,
+                include_pricing=False,
+                has_inventory=True,
+                latitude=0.0,
+                longitude=0.0,
+            )
+            sql, bind = service._build_comprehensive_sql(params, None, STORE_IDS)
+            rows = (await conn.execute(text(sql), bind)).fetchall()
+            queries += 1
+            screens += 1
+            if len(rows) <= limit:
+                break
+            cursor = rows[limit - 1].id
+    return screens, queries, time.perf_counter() - start
+
+
+async def main(args):
+    database_url = settings.DATABASE_URL
+    if not database_url:
+        raise SystemExit("DATABASE_URL is not set")
+
+    setup_engine = create_async_engine(database_url)
+    async with setup_engine.begin() as conn:
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        # LIKE copies columns, defaults and indexes but not the foreign keys
+        for table in ("products", "product_tags", "inventory"):
+            await conn.execute(
+                text(
+                    f"CREATE TABLE {SCHEMA}.{table} (LIKE public.{table} INCLUDING ALL)"
+                )
+            )
+    await setup_engine.dispose()
+
+    engine = create_async_engine(
+        database_url,
+        connect_args={"server_settings": {"search_path": SCHEMA}},
+    )
+    service = ProductQueryService()
+    try:
+        print("--- has_inventory Listing Benchmark ---")
+        print(
+            f"Products: {args.products} | Stores: {len(STORE_IDS)} | Screen: {args.limit}"
+        )
+        print(
+            f"{'in stock':>8} {'strategy':>12} {'screens':>8} {'queries':>8} "
+            f"{'q/screen':>9} {'ms/screen':>10}"
+        )
+        for in_stock in args.in_stock:
+            await seed(engine, args.products, in_stock, args.seed)
+            for name, walk in (
+                ("post-filter", walk_post_filter),
+                ("pushdown", walk_pushdown),
+            ):
+                screens, queries, seconds = await walk(engine, service, args.limit)
+                print(
+                    f"{in_stock:>8.0%} {name:>12} {screens:>8} {queries:>8} "
+                    f"{queries / screens:>9.1f} {seconds * 1000 / screens:>10.2f}"
+                )
+    finally:
+        await engine.dispose()
+        if not args.keep_schema:
+            cleanup_engine = create_async_engine(database_url)
+            async with cleanup_engine.begin() as conn:
+                await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+            await cleanup_engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark has_inventory listings")
+    parser.add_argument("--products", type=int, default=20000)
+    parser.add_argument("--in-stock", type=float, nargs="+", default=[0.05, 0.2, 0.5])
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--keep-schema", action="store_true")
+    asyncio.run(main(parser.parse_args()))
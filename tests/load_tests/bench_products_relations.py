@@ -0,0 +1,151 @@
+"""
+Row fan-out and latency of product listings that include categories and tags.
+
+Compares two shapes of the listing query with include_categories and
+include_tags set:
+
+- string-agg: the previous query. product_categories, categories,
+  product_tags and tags are LEFT JOINed onto the products and folded back
+  with STRING_AGG(DISTINCT ...) under GROUP BY p.id, so every product is
+  repeated categories x tags times before grouping
+- json-agg: ProductQueryService._build_comprehensive_sql, where each relation
+  is a per-product JSON_AGG subquery and products are never multiplied
+
+For each shape it reports the widest intermediate row count in the plan
+(EXPLAIN ANALYZE, the join output the GROUP BY has to fold) and the latency
+per page while walking ``--pages`` pages by cursor. Runs read-only against
+the catalogue behind DATABASE_URL; load one first with
+``python -m scripts.db.generate_dataset --scale 1``.
+
+Usage:
+    python -m tests.load_tests.bench_products_relations --limit 20 --pages 50
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import statistics
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.api.products.models import ProductQuerySchema
+from src.api.products.services.query_service import ProductQueryService
+from src.config.settings import settings
+
+
+def string_agg_sql(cursor: Optional[int], limit: int) -> Tuple[str, Dict[str, Any]]:
+    """The listing query as it was built before the JSON_AGG subqueries"""
+    where = "WHERE p.id > :cursor" if cursor is not None else ""
+    sql = f"""
+        SELECT p.id, p.ref, p.name, p.description, p.brand, p.base_price,
+            p.unit_measure, p.image_urls, p.ecommerce_category_id,
+            p.ecommerce_subcategory_id, p.alternative_product_ids,
+            p.created_at, p.updated_at,
+            STRING_AGG(DISTINCT CONCAT(c.id, '|', c.name, '|', COALESCE(c.description, ''), '|', COALESCE(c.sort_order::text, ''), '|', COALESCE(c.image_url, ''), '|', COALESCE(c.parent_category_id::text, '')), ';') as categories_data,
+            STRING_AGG(DISTINCT CONCAT(t.id::text, '|', COALESCE(t.tag_type, ''), '|', COALESCE(t.name, ''), '|', COALESCE(t.slug, ''), '|', COALESCE(t.description, ''), '|', COALESCE(pt.value, '')), ';') as tags_data
+        FROM products p
+        LEFT JOIN product_categories pc ON p.id = pc.product_id
+        LEFT JOIN categories c ON pc.category_id = c.id
+        LEFT JOIN product_tags pt ON p.id = pt.product_id
+        LEFT JOIN tags t ON pt.tag_id = t.id
+        {where}
+        GROUP BY p.id
+        ORDER BY p.id
+        LIMIT :limit
+    """
+    return sql, {"cursor": cursor, "limit": limit + 1}
+
+
+def json_agg_sql(
+    service: ProductQueryService, cursor: Optional[int], limit: int
+) -> Tuple[str, Dict[str, Any]]:
+    params = ProductQuerySchema(
+        limit=limit,
+        cursor=cursor,
+        include_pricing=False,
+        include_categories=True,
+        include_tags=True,
+    )
+    return service._build_comprehensive_sql(params)
+
+
+def peak_rows(plan: Dict[str, Any]) -> int:
+    """Largest actual row count of any node (rows times loops)"""
+    rows = int(plan.get("Actual Rows", 0) * plan.get("Actual Loops", 1))
+    return max([rows, *(peak_rows(child) for child in plan.get("Plans", []))])
+
+
+async def explain(conn, sql: str, params: Dict[str, Any]) -> Tuple[int, float]:
+    result = await conn.execute(text(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}"), params)
+    document = result.scalar()
+    if isinstance(document, str):
+        document = json.loads(document)
+    return peak_rows(document[0]["Plan"]), document[0]["Execution Time"]
+
+
+async def walk(conn, build, pages: int, limit: int) -> List[float]:
+    """Latency (ms) of each page while paging by cursor"""
+    latencies = []
+    cursor = None
+    for _ in range(pages):
+        sql, params = build(cursor)
+        start = time.perf_counter()
+        rows = (await conn.execute(text(sql), params)).fetchall()
+        latencies.append((time.perf_counter() - start) * 1000)
+        if len(rows) <= limit:
+            cursor = None
+        else:
+            cursor = rows[limit - 1].id
+    return latencies
+
+
+async def main(args):
+    database_url = settings.DATABASE_URL
+    if not database_url:
+        raise SystemExit("DATABASE_URL is not set")
+
+    service = ProductQueryService()
+    shapes = (
+        ("string-agg", lambda cursor: string_agg_sql(cursor, args.limit)),
+        ("json-agg", lambda cursor: json_agg_sql(service, cursor, args.limit)),
+    )
+    engine = create_async_engine(database_url)
+    try:
+        async with engine.connect() as conn:
+            products = (
+                await conn.execute(text("SELECT COUNT(*) FROM products"))
+            ).scalar()
+            print("--- Listing Relations Benchmark (categories + tags) ---")
+            print(f"Products: {products} | Page: {args.limit} | Pages: {args.pages}")
+            print(
+                f"{'shape':>11} {'page rows':>10} {'peak rows':>10} "
+                f"{'fan-out':>8} {'exec ms':>8} {'p50 ms':>7} {'p95 ms':>7}"
+            )
+            for name, build in shapes:
+                # Warm the buffer cache so both shapes read the same pages
+                await walk(conn, build, 1, args.limit)
+                sql, params = build(None)
+                page_rows = len((await conn.execute(text(sql), params)).fetchall())
+                peak, exec_ms = await explain(conn, sql, params)
+                latencies = sorted(await walk(conn, build, args.pages, args.limit))
+                p95 = latencies[math.ceil(len(latencies) * 0.95) - 1]
+                print(
+                    f"{name:>11} {page_rows:>10} {peak:>10} "
+                    f"{peak / max(page_rows, 1):>7.1f}x {exec_ms:>8.2f} "
+                    f"{statistics.median(latencies):>7.2f} {p95:>7.2f}"
+                )
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark category/tag loading in product listings"
+    )
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=50)
+    asyncio.run(main(parser.parse_args()))
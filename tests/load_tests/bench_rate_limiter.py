@@ -0,0 +1,94 @@
+"""
+Per-request overhead of rate-limit admission.
+
+Times one admission check, the work done on every request, for:
+
+- limits: the limits MemoryStorage + FixedWindowRateLimiter that slowapi used
+  under the previous middleware stack
+- local: RateLimiter token buckets, no shared backend
+- shared: RateLimiter with a shared backend attached (the check itself stays
+  in-process; the sync cost is reported separately)
+
+The shared backend is the in-process FakeRedisServer unless --redis-url
+points at a real server. Each run spreads checks over --keys client keys.
+
+Usage:
+    python -m tests.load_tests.bench_rate_limiter --checks 200000 --keys 1 1000 100000
+"""
+
+import argparse
+import asyncio
+import time
+
+from limits import parse
+from limits.storage import MemoryStorage
+from limits.strategies import FixedWindowRateLimiter
+
+from src.shared.rate_limiter import RateLimiter, parse_rate_limit
+from src.shared.resp_client import RespClient
+from tests.load_tests.fake_redis_server import FakeRedisServer
+
+# High enough that nothing is rejected; rejections are cheaper than admits
+LIMIT = "100000000/minute"
+
+
+def time_checks(check, keys: list, checks: int) -> float:
+    """Returns nanoseconds per check"""
+    key_count = len(keys)
+    start = time.perf_counter_ns()
+    for i in range(checks):
+        check(keys[i % key_count])
+    return (time.perf_counter_ns() - start) / checks
+
+
+async def run(args) -> None:
+    print("--- Rate Limit Admission Overhead ---")
+    print(f"Checks per run: {args.checks}")
+    print(f"{'engine':>8} {'keys':>8} {'ns/check':>10} {'sync ms':>9} {'synced':>8}")
+
+    server = None
+    url = args.redis_url
+    if url is None:
+        server = FakeRedisServer().start()
+        url = server.url
+
+    try:
+        for key_count in args.keys:
+            keys = [f"/products|10.0.{i // 256}.{i % 256}" for i in range(key_count)]
+
+            item = parse(LIMIT)
+            legacy = FixedWindowRateLimiter(MemoryStorage())
+            ns = time_checks(lambda key: legacy.hit(item, key), keys, args.checks)
+            print(f"{'limits':>8} {key_count:>8} {ns:>10.0f} {'-':>9} {'-':>8}")
+
+            limit = parse_rate_limit(LIMIT)
+            local = RateLimiter(limit)
+            ns = time_checks(
+                lambda key: local.check(key, limit, "/products"), keys, args.checks
+            )
+            print(f"{'local':>8} {key_count:>8} {ns:>10.0f} {'-':>9} {'-':>8}")
+
+            backend = RespClient.from_url(url)
+            shared = RateLimiter(limit, backend=backend)
+            ns = time_checks(
+                lambda key: shared.check(key, limit, "/products"), keys, args.checks
+            )
+            # One sync pushes every key touched since the previous sync
+            start = time.perf_counter()
+            synced = await shared.sync()
+            sync_ms = (time.perf_counter() - start) * 1000
+            await backend.close()
+            print(
+                f"{'shared':>8} {key_count:>8} {ns:>10.0f} {sync_ms:>9.1f} {synced:>8}"
+            )
+    finally:
+        if server is not None:
+            server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark rate-limit admission")
+    parser.add_argument("--checks", type=int, default=200000)
+    parser.add_argument("--keys", type=int, nargs="+", default=[1, 1000, 100000])
+    parser.add_argument("--redis-url", default=None)
+    asyncio.run(run(parser.parse_args()))
@@ -0,0 +1,118 @@
+"""
+Recall and latency of the semantic index against brute-force search.
+
+Builds a SemanticIndex over ``--products`` synthetic products (the
+bench_spelling name generator), writes it to a temporary file and
+memory-maps it back, as the service does. Queries are product names with one
+word dropped and one typo. For each ``--probes`` value the IVF search is
+compared with exact search over every vector:
+
+- recall@k: share of the exact top-k that the IVF search also returns
+- score: summed cosine of the IVF top-k over that of the exact top-k; synthetic
+  names barely cluster and tie often, so this is the fairer quality measure
+- p50 / p95: per-query latency, embedding included
+
+Usage:
+    python -m tests.load_tests.bench_semantic --products 100000 --queries 500
+"""
+
+import argparse
+import math
+import os
+import random
+import statistics
+import tempfile
+import time
+from typing import Callable, List, Tuple
+
+from src.api.search.semantic import SemanticIndex
+from tests.load_tests.bench_spelling import synthetic_names, typo
+
+
+def query_from(name: str, rng: random.Random) -> str:
+    words = name.split()
+    if len(words) > 2:
+        words.pop(rng.randrange(len(words)))
+    i = rng.randrange(len(words))
+    if len(words[i]) > 3:
+        words[i] = typo(words[i].lower(), 1, rng)
+    return " ".join(words)
+
+
+def timed(
+    search: Callable[[str], List[Tuple[int, float]]], queries: List[str]
+) -> Tuple[List[List[Tuple[int, float]]], List[float]]:
+    results = []
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        results.append(search(query))
+        latencies.append((time.perf_counter() - start) * 1000)
+    return results, sorted(latencies)
+
+
+def main(args):
+    rng = random.Random(args.seed)
+    names = synthetic_names(args.products, args.vocab, rng)[: args.products]
+    products = [(i + 1, (name, name.split()[0], None)) for i, name in enumerate(names)]
+
+    start = time.perf_counter()
+    built = SemanticIndex.build(products)
+    build_s = time.perf_counter() - start
+    path = os.path.join(tempfile.mkdtemp(), "semantic.bin")
+    built.save(path)
+    index = SemanticIndex.load(path)
+
+    print("--- Semantic Index Benchmark ---")
+    print(
+        f"Products: {len(index)} | Dim: {index.dim} | Lists: {len(index.centroids)}"
+        f" | Build: {build_s:.1f}s"
+    )
+    print(
+        f"File: {os.path.getsize(path) / 2**20:.1f} MiB"
+        f" (int8 vectors {index.vectors.nbytes / 2**20:.1f} MiB,"
+        f" float32 would be {index.vectors.nbytes * 4 / 2**20:.1f} MiB)"
+    )
+
+    queries = [query_from(name, rng) for name in rng.sample(names, args.queries)]
+    k = args.k
+    exact, latencies = timed(lambda q: index.search_exact(index.embed(q), k), queries)
+
+    print(
+        f"{'search':>10} {'recall@' + str(k):>10} {'score':>7} "
+        f"{'p50 ms':>8} {'p95 ms':>8}"
+    )
+
+    def report(label: str, results, latencies: List[float]) -> None:
+        pairs = [(a, e) for a, e in zip(results, exact) if e]
+        recall = statistics.mean(
+            len({p for p, _ in a} & {p for p, _ in e}) / len(e) for a, e in pairs
+        )
+        score = sum(s for a, _ in pairs for _, s in a) / sum(
+            s for _, e in pairs for _, s in e
+        )
+        p95 = latencies[math.ceil(len(latencies) * 0.95) - 1]
+        print(
+            f"{label:>10} {recall:>10.3f} {score:>7.3f} "
+            f"{statistics.median(latencies):>8.2f} {p95:>8.2f}"
+        )
+
+    report("exact", exact, latencies)
+    for n_probe in args.probes:
+        results, latencies = timed(
+            lambda q: index.search(index.embed(q), k, n_probe=n_probe), queries
+        )
+        report(f"ivf/{n_probe}", results, latencies)
+
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the semantic index")
+    parser.add_argument("--products", type=int, default=100_000)
+    parser.add_argument("--vocab", type=int, default=40_000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--probes", type=int, nargs="+", default=[1, 4, 8, 16, 32])
+    parser.add_argument("--seed", type=int, default=7)
+    main(parser.parse_args())
@@ -0,0 +1,136 @@
+"""
+Memory and latency of the spelling correction index.
+
+Builds a SpellingIndex over ``--products`` product names and times
+SpellingIndex.correct for three kinds of query word:
+
+- typo1 / typo2: a catalogue word with one or two random edits (delete,
+  insert, substitute, transpose); also reports how often the original word
+  comes back
+- unknown: random letters that match nothing, the worst case since every
+  candidate has to be rejected
+
+By default names are synthetic: the generate_dataset brands, adjectives and
+nouns plus ``--vocab`` random pronounceable words, so the vocabulary is as
+large as a real 100k product catalogue. ``--source db`` loads the real
+vocabulary behind DATABASE_URL instead.
+
+Usage:
+    python -m tests.load_tests.bench_spelling --products 100000 --lookups 2000
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import statistics
+import string
+import time
+import tracemalloc
+from itertools import accumulate
+from typing import Callable, List, Tuple
+
+from scripts.db.generate_dataset import ADJECTIVES, BRANDS, NOUNS
+from src.api.search.spelling import SpellingIndex, load_spelling_index, vocabulary
+
+CONSONANTS = "bcdfghjklmnprstvwy"
+VOWELS = "aeiou"
+
+
+def pseudo_word(rng: random.Random) -> str:
+    return "".join(
+        rng.choice(CONSONANTS) + rng.choice(VOWELS) for _ in range(rng.randint(2, 5))
+    )
+
+
+def synthetic_names(products: int, vocab: int, rng: random.Random) -> List[str]:
+    words = [pseudo_word(rng) for _ in range(vocab)]
+    # Word use in product names is heavily skewed; a few words are everywhere
+    cum_weights = list(accumulate(1 / (rank + 1) for rank in range(len(words))))
+    names = []
+    for _ in range(products):
+        extra = " ".join(
+            rng.choices(words, cum_weights=cum_weights, k=rng.randint(1, 3))
+        )
+        names.append(
+            f"{rng.choice(BRANDS)} {rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {extra}"
+        )
+    return names + BRANDS
+
+
+def typo(word: str, edits: int, rng: random.Random) -> str:
+    for _ in range(edits):
+        i = rng.randrange(len(word))
+        kind = rng.choice(("delete", "insert", "substitute", "transpose"))
+        if kind == "delete" and len(word) > 3:
+            word = word[:i] + word[i + 1 :]
+        elif kind == "insert":
+            word = word[:i] + rng.choice(string.ascii_lowercase) + word[i:]
+        elif kind == "transpose" and i < len(word) - 1:
+            word = word[:i] + word[i + 1] + word[i] + word[i + 2 :]
+        else:
+            word = word[:i] + rng.choice(string.ascii_lowercase) + word[i + 1 :]
+    return word
+
+
+def time_lookups(
+    correct: Callable[[str], object], words: List[str]
+) -> Tuple[float, float, float]:
+    latencies = []
+    for word in words:
+        start = time.perf_counter()
+        correct(word)
+        latencies.append((time.perf_counter() - start) * 1_000_000)
+    latencies.sort()
+    p95 = latencies[math.ceil(len(latencies) * 0.95) - 1]
+    return statistics.median(latencies), p95, latencies[-1]
+
+
+def main(args):
+    rng = random.Random(args.seed)
+    counts = None
+    if args.source == "synthetic":
+        counts = vocabulary(synthetic_names(args.products, args.vocab, rng))
+
+    # Traced from here on, so only the index (and for db, the load) counts
+    tracemalloc.start()
+    start = time.perf_counter()
+    if counts is None:
+        index = asyncio.run(load_spelling_index())
+    else:
+        index = SpellingIndex(counts)
+    build_s = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print("--- Spelling Index Benchmark ---")
+    print(f"Source: {args.source} | Terms: {len(index)} | Deletes: {len(index._keys)}")
+    print(f"Build (traced): {build_s:.2f}s | nbytes: {index.nbytes / 2**20:.1f} MiB")
+    print(
+        f"Traced memory: {retained / 2**20:.1f} MiB retained, "
+        f"{peak / 2**20:.1f} MiB peak while building"
+    )
+
+    terms = [t for t in index._terms if len(t) >= 5 and not t.isdigit()]
+    samples = rng.sample(terms, min(args.lookups, len(terms)))
+    cases = {
+        "typo1": [(typo(t, 1, rng), t) for t in samples],
+        "typo2": [(typo(t, 2, rng), t) for t in samples],
+        "unknown": [("".join(rng.choices("qxzj", k=8)), None) for _ in samples],
+    }
+
+    print(f"{'case':>8} {'p50 us':>8} {'p95 us':>8} {'max us':>9} {'restored':>9}")
+    for name, pairs in cases.items():
+        p50, p95, worst = time_lookups(index.correct, [w for w, _ in pairs])
+        restored = sum(index.correct(w) == t for w, t in pairs if t) / len(pairs)
+        print(f"{name:>8} {p50:>8.1f} {p95:>8.1f} {worst:>9.1f} {restored:>9.1%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the spelling index")
+    parser.add_argument("--source", choices=("synthetic", "db"), default="synthetic")
+    parser.add_argument("--products", type=int, default=100_000)
+    parser.add_argument("--vocab", type=int, default=40_000)
+    parser.add_argument("--lookups", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    main(parser.parse_args())
@@ -0,0 +1,150 @@
+"""
+Minimal in-process fake of the Odoo XML-RPC API.
+
+Implements just enough of /xmlrpc/2/common and /xmlrpc/2/object for
+OdooService/OdooOrderSync (version, authenticate, execute_kw search_read,
+search, read, create, write and action_mark_order_received) with a
+configurable per-call latency, so Odoo-bound throughput can be measured
+locally without a real Odoo instance.
+"""
+
+import threading
+import time
+from socketserver import ThreadingMixIn
+from typing import Any, Dict, List
+from xmlrpc.server import SimpleXMLRPCRequestHandler, SimpleXMLRPCServer
+
+
+class _RequestHandler(SimpleXMLRPCRequestHandler):
+    rpc_paths = ("/xmlrpc/2/common", "/xmlrpc/2/object")
+
+    def log_message(self, format, *args):  # noqa: A002 - silence access log
+        pass
+
+
+class _ThreadingXMLRPCServer(ThreadingMixIn, SimpleXMLRPCServer):
+    daemon_threads = True
+
+
+class FakeOdooServer:
+    """
+    Fake Odoo server running in a background thread.
+
+    Usage:
+        with FakeOdooServer(latency_ms=40) as server:
+            settings.ODOO_URL = server.url
+            ...
+            print(server.calls, server.peak_concurrency)
+    """
+
+    def __init__(self, latency_ms: float = 30.0, host: str = "127.0.0.1"):
+        self.latency = latency_ms / 1000.0
+        self._server = _ThreadingXMLRPCServer(
+            (host, 0),
+            requestHandler=_RequestHandler,
+            allow_none=True,
+            logRequests=False,
+        )
+        self._server.register_function(self._version, "version")
+        self._server.register_function(self._authenticate, "authenticate")
+        self._server.register_function(self._execute_kw, "execute_kw")
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+        self._lock = threading.Lock()
+        self._next_id = 1000
+        self._in_flight = 0
+        self.calls = 0
+        self.peak_concurrency = 0
+        self.records: Dict[str, Dict[int, Dict[str, Any]]] = {}
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeOdooServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeOdooServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _version(self) -> Dict[str, Any]:
+        return {"server_version": "17.0-fake", "protocol_version": 1}
+
+    def _authenticate(self, *params: Any) -> int:
+        # (db, username, password, user_agent_env)
+        return 2
+
+    def _execute_kw(self, *params: Any) -> Any:
+        # (db, uid, password, model, method, args[, kwargs])
+        model, method, args = params[3:6]
+        kwargs = params[6] if len(params) > 6 else {}
+        with self._lock:
+            self.calls += 1
+            self._in_flight += 1
+            self.peak_concurrency = max(self.peak_concurrency, self._in_flight)
+        try:
+            time.sleep(self.latency)
+            return self._dispatch(model, method, args, kwargs or {})
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _dispatch(
+        self, model: str, method: str, args: List[Any], kwargs: Dict[str, Any]
+    ) -> Any:
+        table = self.records.setdefault(model, {})
+        if method == "create":
+            with self._lock:
+                self._next_id += 1
+                record_id = self._next_id
+            table[record_id] = {"id": record_id, "state": "draft", **args[0]}
+            return record_id
+        if method == "write":
+            for record_id in args[0]:
+                table.setdefault(record_id, {"id": record_id}).update(args[1])
+            return True
+        if method in ("search", "search_read"):
+            matches = [r for r in table.values() if _matches(r, args[0])]
+            if model == "product.product":
+                # Every requested SKU exists in the fake catalogue
+                matches = _fake_products(args[0])
+            limit = kwargs.get("limit")
+            matches = matches[:limit] if limit else matches
+            if method == "search":
+                return [r["id"] for r in matches]
+            return matches
+        if method == "read":
+            return [table[i] for i in args[0] if i in table]
+        # Workflow buttons such as action_confirm / action_mark_order_received
+        for record_id in args[0] if args and isinstance(args[0], list) else []:
+            table.setdefault(record_id, {"id": record_id})["state"] = "received"
+        return True
+
+
+def _matches(record: Dict[str, Any], domain: List[Any]) -> bool:
+    for term in domain:
+        field_name, operator, value = term
+        if operator == "=" and record.get(field_name) != value:
+            return False
+        if operator == "in" and record.get(field_name) not in value:
+            return False
+    return True
+
+
+def _fake_products(domain: List[Any]) -> List[Dict[str, Any]]:
+    for field_name, operator, value in domain:
+        if field_name == "default_code" and operator == "in":
+            return [
+                {"id": int(code), "name": f"Product {code}", "default_code": code}
+                for code in value
+            ]
+    return []
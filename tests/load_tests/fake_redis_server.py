@@ -0,0 +1,173 @@
+"""
+Minimal in-process stand-in for a Redis server.
+
+Speaks enough RESP2 for the shared rate limiter (PING, AUTH, SELECT, GET,
+SET, INCRBY, PEXPIRE, PTTL, DEL, FLUSHALL) with key expiry, so shared rate
+limiting can be tested and benchmarked without a real Redis. Runs in a
+background thread and counts commands and connections.
+"""
+
+import socketserver
+import threading
+import time
+from typing import Dict, List, Optional, Tuple, cast
+
+
+class _RespHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        fake = cast("_ThreadingRespServer", self.server).fake
+        with fake._lock:
+            fake.connections += 1
+        while True:
+            try:
+                command = self._read_command()
+            except (ConnectionError, ValueError):
+                return
+            if command is None:
+                return
+            self.wfile.write(fake.execute(command))
+
+    def _read_command(self) -> Optional[List[bytes]]:
+        line = self.rfile.readline()
+        if not line:
+            return None
+        if not line.startswith(b"*"):
+            # Inline command, e.g. "PING\r\n" from redis-cli or nc
+            return line.strip().split()
+        args = []
+        for _ in range(int(line[1:-2])):
+            header = self.rfile.readline()
+            if not header.startswith(b"$"):
+                raise ValueError(f"Expected bulk string, got {header!r}")
+            args.append(self.rfile.read(int(header[1:-2]) + 2)[:-2])
+        return args
+
+
+class _ThreadingRespServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    fake: "FakeRedisServer"
+
+
+class FakeRedisServer:
+    """
+    Usage:
+        with FakeRedisServer() as server:
+            client = RespClient(port=server.port)
+            ...
+            print(server.commands, server.data)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", latency_ms: float = 0.0):
+        self.latency = latency_ms / 1000.0
+        self._host = host
+        self._server = _ThreadingRespServer((host, 0), _RespHandler)
+        self._server.fake = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._lock = threading.Lock()
+        self.data: Dict[bytes, Tuple[bytes, Optional[float]]] = {}
+        self.commands = 0
+        self.connections = 0
+
+    @property
+    def host(self) -> str:
+        return self._host
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    @property
+    def url(self) -> str:
+        return f"redis://{self.host}:{self.port}/0"
+
+    def start(self) -> "FakeRedisServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeRedisServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def execute(self, command: List[bytes]) -> bytes:
+        if self.latency:
+            time.sleep(self.latency)
+        name = command[0].upper().decode()
+        args = command[1:]
+        with self._lock:
+            self.commands += 1
+            handler = getattr(self, f"_cmd_{name.lower()}", None)
+            if handler is None:
+                return b"-ERR unknown command '%s'\r\n" % name.encode()
+            try:
+                return handler(*args)
+            except (TypeError, ValueError):
+                return b"-ERR wrong number of arguments or invalid value\r\n"
+
+    def _live(self, key: bytes) -> Optional[bytes]:
+        entry = self.data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+    @staticmethod
+    def _bulk(value: Optional[bytes]) -> bytes:
+        if value is None:
+            return b"$-1\r\n"
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+
+    def _cmd_ping(self, *args: bytes) -> bytes:
+        return self._bulk(args[0]) if args else b"+PONG\r\n"
+
+    def _cmd_auth(self, *args: bytes) -> bytes:
+        return b"+OK\r\n"
+
+    def _cmd_select(self, db: bytes) -> bytes:
+        return b"+OK\r\n"
+
+    def _cmd_get(self, key: bytes) -> bytes:
+        return self._bulk(self._live(key))
+
+    def _cmd_set(self, key: bytes, value: bytes) -> bytes:
+        self.data[key] = (value, None)
+        return b"+OK\r\n"
+
+    def _cmd_incrby(self, key: bytes, amount: bytes) -> bytes:
+        current = self._live(key)
+        value = int(current or 0) + int(amount)
+        expires_at = self.data[key][1] if current is not None else None
+        self.data[key] = (str(value).encode(), expires_at)
+        return b":%d\r\n" % value
+
+    def _cmd_pexpire(self, key: bytes, ttl_ms: bytes) -> bytes:
+        value = self._live(key)
+        if value is None:
+            return b":0\r\n"
+        self.data[key] = (value, time.monotonic() + int(ttl_ms) / 1000.0)
+        return b":1\r\n"
+
+    def _cmd_pttl(self, key: bytes) -> bytes:
+        if self._live(key) is None:
+            return b":-2\r\n"
+        expires_at = self.data[key][1]
+        if expires_at is None:
+            return b":-1\r\n"
+        return b":%d\r\n" % int((expires_at - time.monotonic()) * 1000)
+
+    def _cmd_del(self, *keys: bytes) -> bytes:
+        removed = sum(1 for key in keys if self.data.pop(key, None) is not None)
+        return b":%d\r\n" % removed
+
+    def _cmd_flushall(self) -> bytes:
+        self.data.clear()
+        return b"+OK\r\n"
@@ -0,0 +1,441 @@
+"""
+Open-loop load harness for the customer-facing API.
+
+Sessions arrive as a Poisson process at ``--rate`` per second, whatever the
+server is doing, and each session runs one scenario picked from a weighted
+mix:
+
+    browse            product listing, sometimes followed by the next page
+    search_typing     a typing burst of dropdown searches, one per keystroke
+    product_detail    GET /products/{id}
+    cart_add          add one unit of a random product to the load-test cart
+    checkout_preview  checkout preview of the load-test cart (pickup)
+    order_placement   fresh cart + item + order (initiates a payment)
+
+Latency is measured from the time a request was *scheduled*, not from when
+the client got around to sending it. If the server (or this process) falls
+behind, the waiting time shows up in the percentiles instead of silently
+lowering the offered load (coordinated omission). The gap between the two
+clocks is reported as ``schedule_lag``.
+
+Results are printed per request name (p50/p95/p99) and can be written as
+JSON with ``--output``; ``--compare`` prints the change against a previous
+JSON file, so builds can be compared on the same machine.
+
+Needs the app running locally against a local Postgres with seeded data and
+the dev token route enabled. Either run it with ENVIRONMENT=development or
+add 127.0.0.1 to RATE_LIMIT_EXEMPT_IPS, otherwise the edge rate limiter
+rejects most of the load. order_placement initiates a real payment session,
+so keep its weight at 0 unless the payment gateway points at a sandbox.
+
+Usage:
+    python -m tests.load_tests.load_harness --rate 20 --duration 60
+    python -m tests.load_tests.load_harness --rate 50 --mix browse=5,search_typing=3 \\
+        --output after.json --compare before.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import platform
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Coroutine, Dict, List, Optional
+
+import httpx
+
+from tests.constants import BASE_URL
+from tests.get_dev_token import get_dev_token
+
+DEFAULT_MIX = {
+    "browse": 40,
+    "search_typing": 25,
+    "product_detail": 20,
+    "cart_add": 8,
+    "checkout_preview": 5,
+    "order_placement": 0,
+}
+# Delay between keystrokes in a typing burst, and the shortest query sent
+KEYSTROKE_INTERVAL = 0.12
+MIN_QUERY_LENGTH = 2
+PERCENTILES = (50, 95, 99)
+
+
+@dataclass
+class Samples:
+    """Latencies (seconds from scheduled start) for one request name"""
+
+    latencies: List[float] = field(default_factory=list)
+    statuses: Dict[str, int] = field(default_factory=dict)
+    errors: int = 0
+    schedule_lag: float = 0.0
+
+
+class Recorder:
+    def __init__(self):
+        self.samples: Dict[str, Samples] = {}
+
+    def record(
+        self,
+        name: str,
+        scheduled: float,
+        sent: float,
+        status: Optional[int],
+    ) -> None:
+        samples = self.samples.setdefault(name, Samples())
+        samples.latencies.append(time.perf_counter() - scheduled)
+        samples.schedule_lag = max(samples.schedule_lag, sent - scheduled)
+        label = str(status) if status is not None else "error"
+        samples.statuses[label] = samples.statuses.get(label, 0) + 1
+        if status is None or status >= 400:
+            samples.errors += 1
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+class LoadSession:
+    """Shared state for one run: HTTP client, seeded data and the recorder"""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        rng: random.Random,
+        product_ids: List[int],
+        search_terms: List[str],
+        store_id: int,
+    ):
+        self.client = client
+        self.rng = rng
+        self.product_ids = product_ids
+        self.search_terms = search_terms
+        self.store_id = store_id
+        self.cart_id: Optional[int] = None
+        self.recorder = Recorder()
+
+    async def request(
+        self,
+        name: str,
+        method: str,
+        url: str,
+        scheduled: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Optional[httpx.Response]:
+        """Sends one request and records it under ``name``; None on transport errors."""
+        sent = time.perf_counter()
+        if scheduled is None:
+            scheduled = sent
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.recorder.record(name, scheduled, sent, None)
+            return None
+        self.recorder.record(name, scheduled, sent, response.status_code)
+        return response
+
+    def checkout_body(self, cart_id: Optional[int]) -> Dict[str, Any]:
+        return {
+            "cart_ids": [cart_id],
+            "location": {"mode": "pickup", "store_id": self.store_id},
+            "platform": "web",
+        }
+
+    async def create_cart(self, name: str, scheduled: Optional[float] = None):
+        response = await self.request(
+            name, "POST", "/users/me/carts", scheduled, json={"name": "Load test"}
+        )
+        if response is None or response.status_code != 201:
+            return None
+        return response.json()["data"]["id"]
+
+
+async def browse(session: LoadSession, scheduled: float) -> None:
+    response = await session.request(
+        "browse", "GET", "/products/", scheduled, params={"limit": 20}
+    )
+    if response is None or response.status_code != 200 or session.rng.random() > 0.3:
+        return
+    cursor = response.json()["data"]["pagination"].get("next_cursor")
+    if cursor:
+        await session.request(
+            "browse.next_page",
+            "GET",
+            "/products/",
+            params={"limit": 20, "cursor": cursor},
+        )
+
+
+async def search_typing(session: LoadSession, scheduled: float) -> None:
+    # Keystrokes fire on a fixed schedule and do not wait for each other,
+    # like a search box that sends a request per keystroke
+    term = session.rng.choice(session.search_terms)
+
+    async def keystroke(index: int, length: int) -> None:
+        at = scheduled + index * KEYSTROKE_INTERVAL
+        await asyncio.sleep(max(0.0, at - time.perf_counter()))
+        await session.request(
+            "search_typing",
+            "GET",
+            "/products/search",
+            at,
+            params={"q": term[:length], "mode": "dropdown"},
+        )
+
+    await asyncio.gather(
+        *(
+            keystroke(index, length)
+            for index, length in enumerate(range(MIN_QUERY_LENGTH, len(term) + 1))
+        )
+    )
+
+
+async def product_detail(session: LoadSession, scheduled: float) -> None:
+    product_id = session.rng.choice(session.product_ids)
+    await session.request("product_detail", "GET", f"/products/{product_id}", scheduled)
+
+
+async def cart_add(session: LoadSession, scheduled: float) -> None:
+    await session.request(
+        "cart_add",
+        "POST",
+        f"/users/me/carts/{session.cart_id}/items",
+        scheduled,
+        json={"product_id": session.rng.choice(session.product_ids), "quantity": 1},
+    )
+
+
+async def checkout_preview(session: LoadSession, scheduled: float) -> None:
+    await session.request(
+        "checkout_preview",
+        "POST",
+        "/users/me/checkout/preview",
+        scheduled,
+        json=session.checkout_body(session.cart_id),
+    )
+
+
+async def order_placement(session: LoadSession, scheduled: float) -> None:
+    # Each order consumes its cart, so it gets a fresh one
+    cart_id = await session.create_cart("order_placement.create_cart", scheduled)
+    if cart_id is None:
+        return
+    added = await session.request(
+        "order_placement.add_item",
+        "POST",
+        f"/users/me/carts/{cart_id}/items",
+        json={"product_id": session.rng.choice(session.product_ids), "quantity": 1},
+    )
+    if added is None or added.status_code != 201:
+        return
+    await session.request(
+        "order_placement",
+        "POST",
+        "/users/me/checkout/order",
+        json=session.checkout_body(cart_id),
+    )
+
+
+SCENARIOS: Dict[str, Callable[[LoadSession, float], Coroutine[Any, Any, None]]] = {
+    "browse": browse,
+    "search_typing": search_typing,
+    "product_detail": product_detail,
+    "cart_add": cart_add,
+    "checkout_preview": checkout_preview,
+    "order_placement": order_placement,
+}
+
+
+def parse_mix(value: Optional[str]) -> Dict[str, int]:
+    """ "browse=5,search_typing=3" overrides the default weights."""
+    mix = dict(DEFAULT_MIX)
+    for entry in (value or "").split(","):
+        if not entry.strip():
+            continue
+        name, _, weight = entry.partition("=")
+        if name.strip() not in SCENARIOS:
+            raise ValueError(f"Unknown scenario: {name.strip()!r}")
+        mix[name.strip()] = int(weight)
+    return mix
+
+
+async def prepare(session: LoadSession) -> None:
+    """Loads real product ids and search terms, and fills the load-test cart."""
+    response = await session.client.get("/products/", params={"limit": 100})
+    response.raise_for_status()
+    products = response.json()["data"]["products"]
+    if not products:
+        raise RuntimeError("No products returned; seed the database first")
+    session.product_ids = [product["id"] for product in products]
+    words = {
+        word.lower()
+        for product in products
+        for word in product["name"].split()
+        if len(word) > MIN_QUERY_LENGTH and word.isalpha()
+    }
+    session.search_terms = sorted(words) or ["milk", "bread", "rice"]
+
+    session.cart_id = await session.create_cart("setup.create_cart")
+    if session.cart_id is None:
+        raise RuntimeError("Could not create the load-test cart")
+    for product_id in session.rng.sample(
+        session.product_ids, min(3, len(session.product_ids))
+    ):
+        await session.request(
+            "setup.add_item",
+            "POST",
+            f"/users/me/carts/{session.cart_id}/items",
+            json={"product_id": product_id, "quantity": 1},
+        )
+    session.recorder = Recorder()
+
+
+async def run_open_loop(
+    session: LoadSession, mix: Dict[str, int], rate: float, duration: float
+) -> int:
+    """Starts sessions at Poisson arrival times for ``duration`` seconds."""
+    names = [name for name, weight in mix.items() if weight > 0]
+    weights = [mix[name] for name in names]
+    tasks: List[asyncio.Task] = []
+    start = time.perf_counter()
+    next_arrival = start
+
+    while True:
+        next_arrival += session.rng.expovariate(rate)
+        if next_arrival - start >= duration:
+            break
+        delay = next_arrival - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        scenario = SCENARIOS[session.rng.choices(names, weights)[0]]
+        # The arrival time, not "now", is the scheduled start
+        tasks.append(asyncio.create_task(scenario(session, next_arrival)))
+
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return len(tasks)
+
+
+def summarize(recorder: Recorder, elapsed: float) -> Dict[str, Dict[str, Any]]:
+    summary: Dict[str, Dict[str, Any]] = {}
+    for name, samples in sorted(recorder.samples.items()):
+        latencies = sorted(samples.latencies)
+        summary[name] = {
+            "count": len(latencies),
+            "errors": samples.errors,
+            "throughput": len(latencies) / elapsed if elapsed else 0.0,
+            "mean_ms": sum(latencies) / len(latencies) * 1000 if latencies else 0.0,
+            **{f"p{pct}_ms": percentile(latencies, pct) * 1000 for pct in PERCENTILES},
+            "max_ms": latencies[-1] * 1000 if latencies else 0.0,
+            "schedule_lag_ms": samples.schedule_lag * 1000,
+            "statuses": samples.statuses,
+        }
+    return summary
+
+
+def print_summary(summary: Dict[str, Dict[str, Any]], previous: Optional[Dict]) -> None:
+    print(
+        f"{'request':<30} {'count':>7} {'errors':>7} {'req/s':>8} "
+        f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}"
+    )
+    for name, row in summary.items():
+        print(
+            f"{name:<30} {row['count']:>7} {row['errors']:>7} "
+            f"{row['throughput']:>8.1f} {row['p50_ms']:>9.1f} "
+            f"{row['p95_ms']:>9.1f} {row['p99_ms']:>9.1f} {row['max_ms']:>9.1f}"
+        )
+
+    if not previous:
+        return
+    print("\nChange against the previous run (positive = slower):")
+    print(f"{'request':<30} {'p50':>9} {'p95':>9} {'p99':>9}")
+    for name, row in summary.items():
+        before = previous.get("requests", {}).get(name)
+        if not before:
+            continue
+        deltas = [
+            (row[key] - before[key]) / before[key] * 100 if before[key] else 0.0
+            for key in ("p50_ms", "p95_ms", "p99_ms")
+        ]
+        print(f"{name:<30} " + " ".join(f"{delta:>+8.1f}%" for delta in deltas))
+
+
+async def main(args: argparse.Namespace) -> None:
+    mix = parse_mix(args.mix)
+    token = await get_dev_token()
+    rng = random.Random(args.seed)
+    limits = httpx.Limits(max_connections=args.max_connections)
+
+    async with httpx.AsyncClient(
+        base_url=args.base_url,
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=args.timeout,
+        limits=limits,
+    ) as client:
+        session = LoadSession(client, rng, [], [], args.store_id)
+        await prepare(session)
+
+        print(
+            f"Offering {args.rate}/s sessions for {args.duration}s against "
+            f"{args.base_url} (mix: {', '.join(f'{k}={v}' for k, v in mix.items() if v)})"
+        )
+        started_at = datetime.now(timezone.utc)
+        start = time.perf_counter()
+        sessions = await run_open_loop(session, mix, args.rate, args.duration)
+        elapsed = time.perf_counter() - start
+
+    summary = summarize(session.recorder, elapsed)
+    previous = None
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)
+    print(f"\n{sessions} sessions in {elapsed:.1f}s\n")
+    print_summary(summary, previous)
+
+    if args.output:
+        report = {
+            "started_at": started_at.isoformat(),
+            "elapsed_seconds": elapsed,
+            "sessions": sessions,
+            "config": {
+                "base_url": args.base_url,
+                "rate": args.rate,
+                "duration": args.duration,
+                "seed": args.seed,
+                "mix": mix,
+                "max_connections": args.max_connections,
+            },
+            "machine": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+            },
+            "requests": summary,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nWrote {args.output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=(__doc__ or "").split("\n\n")[0])
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument(
+        "--rate", type=float, default=20.0, help="Session arrivals per second"
+    )
+    parser.add_argument("--duration", type=float, default=60.0, help="Seconds")
+    parser.add_argument(
+        "--mix", help="Scenario weights, e.g. browse=5,order_placement=1"
+    )
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--store-id", type=int, default=1, help="Pickup store")
+    parser.add_argument("--max-connections", type=int, default=200)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--output", help="Write the report as JSON")
+    parser.add_argument("--compare", help="Previous JSON report to compare with")
+    asyncio.run(main(parser.parse_args()))
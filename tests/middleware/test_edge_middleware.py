@@ -0,0 +1,110 @@
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.metrics.routes import metrics_router
+from src.config.settings import settings
+from src.middleware.edge import EdgeMiddleware
+from src.shared.rate_limiter import RateLimiter, parse_rate_limit
+
+
+def _client(default_limit: str = "100/minute", **kwargs) -> TestClient:
+    app = FastAPI()
+    app.include_router(metrics_router)
+
+    @app.get("/ping")
+    async def ping():
+        return "pong"
+
+    app.add_middleware(
+        EdgeMiddleware,
+        environment="production",
+        mobile_secret="test-secret",
+        allowed_origins=["https://prod.example.com"],
+        rate_limiter=RateLimiter(parse_rate_limit(default_limit)),
+        **kwargs,
+    )
+    # TestClient connects as "testclient", which is not a local IP
+    return TestClient(app)
+
+
+def test_trusted_sources_pass_and_others_are_blocked():
+    client = _client()
+
+    assert client.get("/ping").status_code == 403
+    assert client.get("/ping", headers={"X-Client-Secret": "wrong"}).status_code == 403
+    assert client.get("/ping", headers={"X-Client-Secret": "test-secret"}).text == (
+        '"pong"'
+    )
+    assert (
+        client.get("/ping", headers={"Origin": "https://prod.example.com"}).status_code
+        == 200
+    )
+    assert (
+        client.get("/ping", headers={"Origin": "http://localhost:3000"}).status_code
+        == 200
+    )
+    assert (
+        client.get("/docs", headers={"X-Client-Secret": "test-secret"}).status_code
+        == 403
+    )
+
+
+def test_timing_header_is_added_to_every_response():
+    client = _client()
+
+    allowed = client.get("/ping", headers={"X-Client-Secret": "test-secret"})
+    blocked = client.get("/ping")
+
+    assert float(allowed.headers["X-Process-Time"]) >= 0
+    assert "X-Process-Time" in blocked.headers
+
+
+def test_default_limit_rejects_with_429_and_exempt_ips_pass():
+    headers = {"X-Client-Secret": "test-secret"}
+    client = _client(default_limit="2/hour")
+
+    statuses = [client.get("/ping", headers=headers).status_code for _ in range(3)]
+
+    assert statuses == [200, 200, 429]
+    rejected = client.get("/ping", headers=headers)
+    assert rejected.json() == {"error": "Rate limit exceeded: 2 per 1 hour"}
+    assert int(rejected.headers["Retry-After"]) >= 1
+
+    exempt = _client(default_limit="1/hour", exempt_ips=["testclient"])
+    assert [exempt.get("/ping", headers=headers).status_code for _ in range(3)] == [
+        200,
+        200,
+        200,
+    ]
+
+
+def test_metrics_scrape_needs_token_or_allowed_ip(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-token")
+    monkeypatch.setattr(settings, "METRICS_ALLOWED_IPS", [])
+    client = _client(default_limit="1/hour")
+
+    # Prometheus sends no origin or app secret; the token alone is enough
+    scrape = {"Authorization": "Bearer scrape-token"}
+    assert [client.get("/metrics", headers=scrape).status_code for _ in range(2)] == [
+        200,
+        200,
+    ]
+    assert client.get("/metrics").status_code == 401
+    assert (
+        client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code
+        == 401
+    )
+    # The app secret does not grant scrapes
+    assert (
+        client.get("/metrics", headers={"X-Client-Secret": "test-secret"}).status_code
+        == 401
+    )
+
+    monkeypatch.setattr(settings, "METRICS_ALLOWED_IPS", ["testclient"])
+    assert client.get("/metrics").status_code == 200
@@ -0,0 +1,125 @@
+import asyncio
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+import pytest
+
+from src.shared.rate_limiter import RateLimiter, parse_limit_map, parse_rate_limit
+from src.shared.resp_client import RespClient
+from tests.load_tests.fake_redis_server import FakeRedisServer
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_parse_limits():
+    assert str(parse_rate_limit("100/minute")) == "100 per 1 minute"
+    assert parse_rate_limit("10/5minutes").period == 300
+    assert parse_rate_limit("2 per 1 hour").rate == pytest.approx(2 / 3600)
+    assert parse_limit_map("/orders=20/minute; /auth = 5/second") == {
+        "/orders": parse_rate_limit("20/minute"),
+        "/auth": parse_rate_limit("5/second"),
+    }
+    with pytest.raises(ValueError):
+        parse_rate_limit("fast")
+
+
+def test_token_bucket_refills_at_the_limit_rate():
+    clock = FakeClock()
+    limiter = RateLimiter(parse_rate_limit("2/second"), clock=clock)
+    limit = limiter.default_limit
+
+    assert [limiter.check("ip", limit, "/x").allowed for _ in range(3)] == [
+        True,
+        True,
+        False,
+    ]
+    decision = limiter.check("ip", limit, "/x")
+    assert decision.reason == "local"
+    assert decision.retry_after == pytest.approx(0.5)
+
+    clock.now += 0.5
+    assert limiter.check("ip", limit, "/x").allowed
+    assert not limiter.check("ip", limit, "/x").allowed
+    assert limiter.get_stats()["allowed"] == {"/x": 3}
+    assert limiter.get_stats()["rejected"] == {"/x:local": 3}
+
+    clock.now += 10
+    assert limiter.prune() == 1
+    assert limiter.get_stats()["buckets"] == 0
+
+
+def test_route_and_tier_limits_resolve():
+    limiter = RateLimiter(
+        parse_rate_limit("100/minute"),
+        route_limits=parse_limit_map("/products=50/minute;/products/search=10/minute"),
+        tier_limits={3: parse_rate_limit("300/minute")},
+    )
+
+    assert limiter.route_limit("/products/search?q=milk")[0] == "/products/search"
+    assert limiter.route_limit("/products/42") == (
+        "/products",
+        parse_rate_limit("50/minute"),
+    )
+    assert limiter.route_limit("/orders/7") == ("/orders", limiter.default_limit)
+    assert limiter.route_limit("/") == ("/", limiter.default_limit)
+    assert limiter.tier_limit(3) == parse_rate_limit("300/minute")
+    assert limiter.tier_limit(1) is None
+
+
+def test_shared_backend_enforces_the_limit_across_processes():
+    async def scenario(server: FakeRedisServer):
+        wall = FakeClock(60_000.0)
+        limit = parse_rate_limit("10/minute")
+        workers = [
+            RateLimiter(limit, backend=RespClient(port=server.port), wall_clock=wall)
+            for _ in range(2)
+        ]
+        # Each process alone would admit all 10; together they used 12
+        for worker in workers:
+            for _ in range(6):
+                worker.check("ip", limit, "/x")
+        for worker in workers:
+            await worker.sync()
+
+        # The second process synced last and already sees the global total
+        decision = workers[1].check("ip", limit, "/x")
+        assert (decision.allowed, decision.reason) == (False, "global")
+        assert decision.retry_after == pytest.approx(60.0)
+
+        # The first one still has a stale view until its next sync
+        assert workers[0].check("ip", limit, "/x").allowed
+        await workers[0].sync()
+        assert workers[0].check("ip", limit, "/x").reason == "global"
+        assert server.data[b"ratelimit:ip:1000"][0] == b"13"
+
+        # A new window starts from zero everywhere
+        wall.now += 60
+        assert workers[1].check("ip", limit, "/x").allowed
+        for worker in workers:
+            await worker.stop()
+
+    with FakeRedisServer() as server:
+        asyncio.run(scenario(server))
+
+
+def test_backend_outage_keeps_pending_hits_and_local_limits():
+    async def scenario():
+        limit = parse_rate_limit("5/minute")
+        limiter = RateLimiter(limit, backend=RespClient(port=1, timeout=0.2))
+        assert limiter.check("ip", limit, "/x").allowed
+
+        assert await limiter.sync() == 0
+        assert limiter.sync_failures == 1
+        assert limiter._buckets["ip"].pending == 1
+        assert limiter.check("ip", limit, "/x").allowed
+
+    asyncio.run(scenario())
@@ -0,0 +1 @@
+# Pricing tests
@@ -0,0 +1,96 @@
+import json
+import os
+import sys
+from datetime import datetime
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.api.products.listing import (
+    ListingProduct,
+    ProductListing,
+    ProductListingResponse,
+)
+from src.api.products.models import (
+    EnhancedProductSchema,
+    InventoryInfoSchema,
+    PaginatedProductsResponse,
+    PricingInfoSchema,
+)
+from src.shared.responses import success_response
+
+
+def _product(product_id: int) -> EnhancedProductSchema:
+    return EnhancedProductSchema(
+        id=product_id,
+        ref=f"SKU-{product_id}",
+        name=f"Product {product_id}",
+        brand="Anchor",
+        base_price=120.5,
+        unit_measure="kg",
+        image_urls=[f"https://cdn.example.com/p/{product_id}.jpg"],
+        created_at=datetime(2024, 1, 1, 8, 30),
+        categories=[{"id": 3, "name": "Dairy"}],
+        pricing=PricingInfoSchema(
+            base_price=120.5,
+            final_price=100.0,
+            discount_applied=20.5,
+            discount_percentage=17.01,
+            applied_price_lists=["Gold Members"],
+        ),
+    )
+
+
+def _inventory(can_order: bool) -> InventoryInfoSchema:
+    return InventoryInfoSchema(
+        can_order=can_order,
+        max_available=5 if can_order else 0,
+        in_stock=can_order,
+        ondemand_delivery_available=can_order,
+        reason_unavailable=None if can_order else "out_of_stock",
+    )
+
+
+def test_listing_body_matches_model_response():
+    models = [_product(1), _product(2)]
+    pagination = {"current_cursor": None, "next_cursor": 2, "has_more": True}
+    entries = [ListingProduct.cache_entry(p.model_dump()) for p in models]
+
+    products = [ListingProduct.from_cache_entry(e) for e in entries]
+    products[0].inventory = _inventory(True)
+    models[0].inventory = _inventory(True)
+
+    fast = ProductListingResponse(ProductListing(products, pagination))
+    slow = success_response(
+        PaginatedProductsResponse(products=models, pagination=pagination).model_dump(
+            mode="json"
+        )
+    )
+
+    assert fast.headers["content-type"] == "application/json"
+    assert json.loads(bytes(fast.body)) == json.loads(bytes(slow.body))
+
+
+def test_inventory_overlay_does_not_leak_into_cache_entry():
+    entry = ListingProduct.cache_entry(_product(7).model_dump())
+
+    first = ListingProduct.from_cache_entry(entry)
+    first.inventory = _inventory(False)
+    second = ListingProduct.from_cache_entry(entry)
+
+    assert json.loads(first.encode())["inventory"]["can_order"] is False
+    assert json.loads(second.encode())["inventory"] is None
+
+
+def test_to_response_model_round_trips():
+    model = _product(9)
+    listing = ProductListing(
+        [
+            ListingProduct.from_cache_entry(
+                ListingProduct.cache_entry(model.model_dump())
+            )
+        ],
+        {"has_more": False},
+    )
+
+    assert listing.to_response_model().products == [model]
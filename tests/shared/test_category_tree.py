@@ -0,0 +1,101 @@
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.api.categories.models import CategorySchema
+from src.shared.category_tree import CategoryTree
+
+
+def _row(id, parent=None, sort_order=0):
+    return {
+        "id": id,
+        "name": f"Category {id}",
+        "sort_order": sort_order,
+        "description": None,
+        "image_url": None,
+        "parent_category_id": parent,
+    }
+
+
+# 1 Food          2 Drinks
+# ├─ 10 Dairy     └─ 20 Juice
+# │  └─ 100 Milk
+# └─ 11 Bakery
+ROWS = [
+    _row(2, sort_order=2),
+    _row(1, sort_order=1),
+    _row(11, 1, sort_order=2),
+    _row(10, 1, sort_order=1),
+    _row(20, 2),
+    _row(100, 10),
+]
+
+
+def _tree(rows=ROWS):
+    return CategoryTree(rows, CategorySchema, sort_key=lambda row: row["sort_order"])
+
+
+def _ids(categories):
+    return [c.id for c in categories]
+
+
+def test_filter_views_follow_sort_order():
+    tree = _tree()
+
+    assert _ids(tree.all()) == [20, 100, 1, 10, 2, 11]
+    assert _ids(tree.roots()) == [1, 2]
+    assert _ids(tree.non_roots()) == [20, 100, 10, 11]
+    assert _ids(tree.children(1)) == [10, 11]
+    assert tree.children(999) == []
+
+
+def test_subcategories_are_direct_children_only():
+    tree = _tree()
+
+    food = tree.get(1)
+    assert food is not None and food.subcategories is not None
+    assert _ids(food.subcategories) == [10, 11]
+    assert food.subcategories[0].subcategories is None
+    milk = tree.get(100)
+    assert milk is not None and milk.subcategories == []
+    flat_food = tree.get(1, include_subcategories=False)
+    assert flat_food is not None and flat_food.subcategories is None
+    assert all(c.subcategories is None for c in tree.all(False))
+
+
+def test_get_many_skips_unknown_ids():
+    tree = _tree()
+
+    assert _ids(tree.get_many([11, 999, 2])) == [2, 11]
+
+
+def test_expand_returns_whole_subtrees():
+    tree = _tree()
+
+    assert tree.expand([1]) == [1, 10, 100, 11]
+    assert tree.expand([10, 20]) == [10, 100, 20]
+    assert tree.expand([100, 10]) == [10, 100]
+    assert tree.expand([999]) == []
+
+
+def test_nodes_record_depth_and_ancestors():
+    tree = _tree()
+
+    milk = tree.node(100)
+    assert milk is not None
+    assert milk.depth == 2
+    assert milk.ancestors == (1, 10)
+    assert milk.parent_id == 10
+    food = tree.node(1)
+    assert food is not None and food.children == (10, 11)
+
+
+def test_dangling_parents_and_cycles_stay_visible():
+    rows = [_row(1), _row(2, parent=404), _row(3, parent=4), _row(4, parent=3)]
+    tree = _tree(rows)
+
+    assert len(tree) == 4
+    assert set(_ids(tree.roots())) == {1, 2, 3}
+    assert tree.expand([3]) == [3, 4]
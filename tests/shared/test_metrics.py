@@ -0,0 +1,96 @@
+import asyncio
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.middleware.edge import EdgeMiddleware
+from src.shared.background_tasks import spawn
+from src.shared.metrics import (
+    BACKGROUND_TASKS,
+    BACKGROUND_TASKS_IN_FLIGHT,
+    REQUEST_DURATION,
+    Histogram,
+    MetricsRegistry,
+    metrics,
+)
+
+
+def test_histogram_buckets_and_quantiles():
+    histogram = Histogram((0.1, 0.5, 1.0))
+    for value in (0.05, 0.1, 0.3, 0.7, 2.0):
+        histogram.observe(value)
+
+    # bisect_left puts a value equal to a bound in that bound's bucket (le)
+    assert histogram.counts == [2, 1, 1, 1]
+    assert histogram.count == 5
+    assert histogram.sum == pytest.approx(3.15)
+    assert histogram.quantile(0.5) == pytest.approx(0.3)
+    assert histogram.quantile(0.99) == 1.0
+
+
+def test_render_uses_the_prometheus_text_format():
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency", ("route",), (0.1, 1.0))
+    registry.counter("hits_total", "Hits", ("prefix",)).inc(("products",), 3)
+    registry.gauge("pool", "Pool", ("state",), collect=lambda: {("size",): 5})
+    latency.observe(('/a/{id}"',), 0.05)
+    latency.observe(('/a/{id}"',), 2.0)
+
+    lines = registry.render().splitlines()
+
+    assert "# TYPE latency_seconds histogram" in lines
+    assert 'latency_seconds_bucket{route="/a/{id}\\"",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{route="/a/{id}\\"",le="+Inf"} 2' in lines
+    assert 'latency_seconds_count{route="/a/{id}\\""} 2' in lines
+    assert 'hits_total{prefix="products"} 3' in lines
+    assert 'pool{state="size"} 5' in lines
+
+
+def test_edge_middleware_records_route_templates_not_raw_paths():
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int):
+        return item_id
+
+    app.add_middleware(EdgeMiddleware, environment="development")
+    client = TestClient(app)
+    metrics.clear([REQUEST_DURATION.name])
+
+    for item_id in (1, 2, 3):
+        client.get(f"/items/{item_id}")
+    client.get("/missing")
+
+    assert REQUEST_DURATION.histograms[("/items/{item_id}", "GET", "2xx")].count == 3
+    assert REQUEST_DURATION.histograms[("unmatched", "GET", "4xx")].count == 1
+
+
+def test_spawn_tracks_in_flight_and_finished_tasks():
+    async def scenario():
+        release = asyncio.Event()
+
+        async def job():
+            await release.wait()
+
+        async def failing():
+            raise RuntimeError("boom")
+
+        spawn("test_job", job())
+        spawn("test_failing", failing())
+        await asyncio.sleep(0)
+        assert BACKGROUND_TASKS_IN_FLIGHT.values[("test_job",)] == 1
+
+        release.set()
+        await asyncio.sleep(0.01)
+        assert BACKGROUND_TASKS_IN_FLIGHT.values[("test_job",)] == 0
+        assert BACKGROUND_TASKS.values[("test_job", "ok")] == 1
+        assert BACKGROUND_TASKS.values[("test_failing", "error")] == 1
+
+    metrics.clear([BACKGROUND_TASKS.name, BACKGROUND_TASKS_IN_FLIGHT.name])
+    asyncio.run(scenario())
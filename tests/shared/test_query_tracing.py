@@ -0,0 +1,69 @@
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from src.middleware.edge import EdgeMiddleware
+from src.shared.query_tracing import (
+    N_PLUS_ONE_DETECTIONS,
+    instrument_engine,
+    start_request_tracing,
+    stop_request_tracing,
+)
+
+engine = create_engine("sqlite://")
+instrument_engine(engine)
+
+
+def test_statements_are_attributed_only_while_tracing():
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+        stats, token = start_request_tracing(track_statements=True)
+        for value in (1, 2, 3):
+            conn.execute(text("SELECT :value"), {"value": value})
+        conn.execute(text("SELECT 2"))
+        stop_request_tracing(stats, token)
+
+        conn.execute(text("SELECT 1"))
+
+    assert stats.count == 4
+    assert stats.total_seconds >= stats.slowest_seconds > 0
+    assert stats.repeated_statements(3) == [("SELECT ?", 3)]
+    assert stats.repeated_statements(4) == []
+
+
+def test_server_timing_header_and_n_plus_one_warning(caplog):
+    app = FastAPI()
+
+    @app.get("/orders")
+    def orders():
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            # One lookup per order instead of one batched query
+            for order_id in range(6):
+                conn.execute(text("SELECT :id"), {"id": order_id})
+        return []
+
+    app.add_middleware(
+        EdgeMiddleware,
+        environment="development",
+        query_tracing=True,
+        n_plus_one_threshold=5,
+    )
+    before = N_PLUS_ONE_DETECTIONS.values.get(("/orders",), 0)
+
+    with caplog.at_level("WARNING", logger="src.middleware.edge"):
+        response = TestClient(app).get("/orders")
+
+    timing = response.headers["Server-Timing"]
+    assert timing.startswith("db;dur=")
+    assert 'desc="7 queries"' in timing
+    assert "app;dur=" in timing
+    assert N_PLUS_ONE_DETECTIONS.values[("/orders",)] == before + 1
+    assert "ran the same statement 6 times" in caplog.text
@@ -0,0 +1,69 @@
+import asyncio
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from src.shared.snapshot import SnapshotIndex
+
+
+def test_index_discards_snapshots_taken_before_a_write():
+    loads = []
+
+    async def load():
+        loads.append(len(loads))
+        if len(loads) == 1:
+            # A write lands while the first snapshot is being read
+            index.invalidate()
+        return [len(loads)]
+
+    index = SnapshotIndex("test", load)
+
+    async def scenario():
+        first = await index.get()
+        assert await index.get() is first
+        assert index.invalidate() == 1
+        assert index.invalidate() == 0
+        assert await index.get() is not first
+
+    asyncio.run(scenario())
+    assert len(loads) == 3
+
+
+def test_expired_snapshot_serves_while_it_rebuilds():
+    loads = []
+
+    async def load():
+        loads.append(len(loads))
+        return [len(loads)]
+
+    index = SnapshotIndex("test", load, max_age=0)
+
+    async def scenario():
+        first = await index.get()
+        # Expired immediately: still served, one rebuild in the background
+        assert await index.get() is first
+        assert await index.get() is first
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert await index.get() is not first
+
+    asyncio.run(scenario())
+    assert len(loads) >= 2
+
+
+def test_peek_never_waits_for_a_build():
+    async def load():
+        return ["snapshot"]
+
+    index = SnapshotIndex("test", load)
+
+    async def scenario():
+        assert index.peek() is None
+        # The build runs in the background
+        for _ in range(3):
+            await asyncio.sleep(0)
+        assert index.peek() is await index.get()
+
+    asyncio.run(scenario())